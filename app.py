@@ -1,15 +1,29 @@
 import os
 import json
 import gc
-from flask import Flask, render_template, request, redirect, url_for, session, flash, jsonify, send_file, make_response, send_from_directory, abort
+import hashlib
+import bisect
+import threading
+import time
+_STARTUP_STARTED_AT = time.perf_counter()  # Başlangıç profili için referans zamanı
+from flask import Flask, render_template, request, redirect, url_for, session, flash, jsonify, send_file, make_response, send_from_directory, abort, g
 from werkzeug.utils import secure_filename
-import requests
 import uuid
 from uuid import uuid4
 import tempfile
 from datetime import datetime
 from io import BytesIO
 from copy import deepcopy
+from contextlib import contextmanager
+from functools import wraps
+
+try:
+    import fcntl  # Süreçler arası dosya kilidi (Linux/Fly); Windows'ta yok
+except ImportError:
+    fcntl = None
+
+from backup_store import BackupStore, RetentionPolicy, COLLECTION_FILES
+import storage_gate
 
 # Lazy loading - sadece gerektiğinde yükle
 pandas_loaded = False
@@ -56,6 +70,123 @@ def load_docx():
         print(f"HATA: python-docx kütüphanesi yüklü değil: {e}")
         return None, None, None, None, None, None, None
 
+# Başlangıç profili ve gecikmeli başlatma
+# Import sırasında ağ erişimi veya ağır iş yapılmaz. İl-ilçe tablosu, migration'lar ve
+# opsiyonel kütüphaneler ilk kullanımda ya da worker açıldıktan sonra arka plan ısınma
+# thread'inde hazırlanır; böylece scale-from-zero sonrası ilk istek beklemez.
+STARTUP_WARMUP_ENABLED = os.environ.get('STARTUP_WARMUP', '1') != '0'
+# Başarısız bir başlatma adımı en erken bu kadar saniye sonra yeniden denenir
+LAZY_INIT_RETRY_SECONDS = float(os.environ.get('LAZY_INIT_RETRY_SECONDS', '30'))
+_startup_phases = []
+_startup_last_mark = _STARTUP_STARTED_AT
+_startup_first_request_ms = None
+_lazy_inits = {}
+
+def mark_startup_phase(name):
+    """Import süresini aşamalara böler (önceki işaretten bu yana geçen süre)"""
+    global _startup_last_mark
+    now = time.perf_counter()
+    _startup_phases.append({'phase': name, 'ms': round((now - _startup_last_mark) * 1000, 2)})
+    _startup_last_mark = now
+
+class LazyInit:
+    """Bir kez başarıyla çalışan başlatma adımı: ilk get() çağrısında veya ısınma thread'inde çalışır.
+
+    Başarısız olursa done işaretlenmez; LAZY_INIT_RETRY_SECONDS sonra gelen get() yeniden dener.
+    """
+
+    def __init__(self, name, func, warm=True):
+        self.name = name
+        self.func = func
+        self.warm = warm
+        self.value = None
+        self.done = False
+        self.error = None
+        self.failed_at = None
+        self.attempts = 0
+        self.trigger = None
+        self.duration_ms = None
+        self._lock = threading.Lock()
+
+    def get(self, trigger='first_use'):
+        if self.done:
+            return self.value
+        with self._lock:
+            if self.done:
+                return self.value
+            # Art arda başarısız denemelerle her isteği yavaşlatma
+            if self.failed_at is not None and time.monotonic() - self.failed_at < LAZY_INIT_RETRY_SECONDS:
+                return None
+            started = time.perf_counter()
+            self.attempts += 1
+            try:
+                self.value = self.func()
+            except Exception as e:
+                self.error = str(e)
+                self.failed_at = time.monotonic()
+                print(f"Başlatma adımı başarısız ({self.name}, deneme {self.attempts}): {e}")
+            else:
+                self.error = None
+                self.failed_at = None
+                self.done = True
+            self.duration_ms = round((time.perf_counter() - started) * 1000, 2)
+            self.trigger = trigger
+        return self.value
+
+    def reset(self):
+        """Kaynak veri değiştiğinde (ör. geri yükleme) bir sonraki kullanımda yeniden hazırlanır"""
+        with self._lock:
+            self.value = None
+            self.done = False
+            self.error = None
+            self.failed_at = None
+
+    def status(self):
+        return {
+            'name': self.name,
+            'done': self.done,
+            'warm': self.warm,
+            'trigger': self.trigger,
+            'duration_ms': self.duration_ms,
+            'attempts': self.attempts,
+            'error': self.error
+        }
+
+def lazy_init(name, warm=True):
+    """Fonksiyonu adlandırılmış bir LazyInit olarak kaydeder; warm=True ise ısınmada çalışır"""
+    def decorator(func):
+        item = LazyInit(name, func, warm=warm)
+        _lazy_inits[name] = item
+        return item
+    return decorator
+
+def run_warmup(names=None):
+    """Kayıtlı başlatma adımlarını sırayla çalıştırır (names verilmezse warm=True olanlar)"""
+    for name, item in list(_lazy_inits.items()):
+        if (names is None and item.warm) or (names is not None and name in names):
+            item.get(trigger='warmup')
+
+def start_background_warmup():
+    """Isınmayı arka plan thread'inde başlatır. Fork'tan sonra (worker içinde) çağrılmalıdır."""
+    if not STARTUP_WARMUP_ENABLED:
+        return None
+    thread = threading.Thread(target=run_warmup, name='startup-warmup', daemon=True)
+    thread.start()
+    return thread
+
+def startup_profile_report():
+    """Import aşamaları, başlatma adımları ve ilk isteğe kadar geçen süre"""
+    return {
+        'pid': os.getpid(),
+        'import_phases': list(_startup_phases),
+        'import_total_ms': round(sum(p['ms'] for p in _startup_phases), 2),
+        'first_request_ms': _startup_first_request_ms,
+        'warmup_enabled': STARTUP_WARMUP_ENABLED,
+        'lazy_inits': [item.status() for item in _lazy_inits.values()]
+    }
+
+mark_startup_phase('imports')
+
 app = Flask(__name__, template_folder='templates', static_folder='static')
 app.secret_key = os.environ.get('SECRET_KEY', 'your_secret_key_development')  # Production'da ortam değişkeninden al
 
@@ -66,6 +197,524 @@ app.config['TEMPLATES_AUTO_RELOAD'] = True if is_dev else False
 app.config['DEBUG'] = True if is_dev else (os.environ.get('FLASK_DEBUG', 'false').lower() == 'true')
 app.jinja_env.auto_reload = True if is_dev else False
 
+# Jinja bytecode önbelleği: derlenmiş şablonlar diske yazılır, yeni worker'lar tekrar derlemez.
+# Docker imajında precompile_templates() ile önceden doldurulur. Şablon kaynağı değişirse
+# sağlama toplamı tutmadığı için eski kayıt kullanılmaz.
+JINJA_CACHE_DIR = os.environ.get('JINJA_CACHE_DIR') or os.path.join(app.root_path, '.jinja_cache')
+
+def init_jinja_bytecode_cache():
+    from jinja2 import FileSystemBytecodeCache
+    for cache_dir in (JINJA_CACHE_DIR, os.path.join(tempfile.gettempdir(), 'emisyon_jinja_cache')):
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            if os.access(cache_dir, os.W_OK):
+                app.jinja_env.bytecode_cache = FileSystemBytecodeCache(cache_dir)
+                return cache_dir
+        except OSError as e:
+            print(f"Jinja önbellek klasörü kullanılamıyor ({cache_dir}): {e}")
+    return None
+
+init_jinja_bytecode_cache()
+
+def precompile_templates():
+    """templates/ altındaki tüm şablonları derleyip bytecode önbelleğine yazar (imaj derlemesinde)"""
+    compiled = 0
+    for name in app.jinja_env.list_templates(extensions=['html']):
+        try:
+            app.jinja_env.get_template(name)
+            compiled += 1
+        except Exception as e:
+            print(f"Şablon derlenemedi ({name}): {e}")
+    print(f"{compiled} şablon derlendi: {JINJA_CACHE_DIR}")
+    return compiled
+
+# Prometheus metrikleri (/metrics). Harici bağımlılık yoktur; sayaçlar süreç içinde bir sözlükte
+# tutulur. gunicorn worker'ları belleği paylaşmadığı için her worker, yalnızca yakın zamanda
+# /metrics okunduysa, METRICS_FLUSH_INTERVAL saniyede bir anlık görüntüsünü METRICS_DIR'e yazar;
+# /metrics bu dosyaları toplayıp Prometheus metin formatında döner. Kimse okumuyorsa istek
+# başına maliyet birkaç sözlük güncellemesidir.
+# Erişim: METRICS_PORT verilirse /metrics sadece o porttan gelen isteklere açıktır ve o port
+# /metrics ile /health dışında bir şey sunmaz (gunicorn.conf.py portu ayrıca dinler; Fly'da
+# yalnızca özel ağdan erişilir). METRICS_TOKEN verilirse ayrıca Bearer token istenir. İkisi de
+# verilmezse /metrics uygulama portunda herkese açıktır (endpoint adları ve istek sayıları görünür).
+METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'true').lower() == 'true'
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+METRICS_PORT = os.environ.get('METRICS_PORT', '')
+METRICS_DIR = os.environ.get('METRICS_DIR') or os.path.join(
+    '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir(), 'emisyon_metrics')
+METRICS_FLUSH_INTERVAL = 5.0
+# Son okumadan bu kadar süre sonra worker'lar anlık görüntü yazmayı bırakır
+METRICS_SCRAPE_IDLE_SECONDS = 300.0
+METRICS_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+METRICS_REPORT_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+_METRIC_HELP = {
+    'emisyon_http_requests_total': ('counter', 'Endpoint, metot ve durum koduna göre HTTP istekleri'),
+    'emisyon_http_request_duration_seconds': ('histogram', 'Endpoint başına istek süresi'),
+    'emisyon_json_load_total': ('counter', 'Koleksiyon başına JSON okuma sayısı'),
+    'emisyon_json_load_bytes_total': ('counter', 'Koleksiyon başına okunan JSON baytı'),
+    'emisyon_json_save_total': ('counter', 'Koleksiyon başına JSON yazma sayısı (sonuca göre)'),
+    'emisyon_json_save_bytes_total': ('counter', 'Koleksiyon başına yazılan JSON baytı'),
+    'emisyon_cache_requests_total': ('counter', 'Önbellek başına isabet (hit) / ıskalama (miss) sayısı'),
+    'emisyon_report_duration_seconds': ('histogram', 'Rapor/belge üretim süresi'),
+}
+
+_metrics_lock = threading.Lock()
+_metrics_counters = {}
+_metrics_histograms = {}
+_metrics_last_flush_check = 0.0
+
+def metric_inc(name, labels, value=1):
+    """Sayaç artırır; labels (etiket adı, değer) çiftlerinden oluşan tuple'dır"""
+    if not METRICS_ENABLED:
+        return
+    key = (name, labels)
+    with _metrics_lock:
+        _metrics_counters[key] = _metrics_counters.get(key, 0) + value
+
+def metric_observe(name, labels, seconds, buckets=METRICS_LATENCY_BUCKETS):
+    """Histograma gözlem ekler (kova sayıları birikimli değil, /metrics'te birikimli yazılır)"""
+    if not METRICS_ENABLED:
+        return
+    key = (name, labels)
+    slot = bisect.bisect_left(buckets, seconds)
+    with _metrics_lock:
+        hist = _metrics_histograms.get(key)
+        if hist is None:
+            hist = _metrics_histograms[key] = {'buckets': list(buckets), 'counts': [0] * (len(buckets) + 1), 'sum': 0.0}
+        hist['counts'][slot] += 1
+        hist['sum'] += seconds
+
+def metric_cache(cache, hit):
+    metric_inc('emisyon_cache_requests_total', (('cache', cache), ('result', 'hit' if hit else 'miss')))
+
+def _collection_label(file_path):
+    return os.path.splitext(os.path.basename(file_path or ''))[0] or 'unknown'
+
+def metered_json_load(f):
+    """json.load yerine kullanılır: koleksiyon başına okuma sayısı ve baytı sayar"""
+    data = json.load(f)
+    if METRICS_ENABLED:
+        labels = (('collection', _collection_label(getattr(f, 'name', ''))),)
+        metric_inc('emisyon_json_load_total', labels)
+        try:
+            metric_inc('emisyon_json_load_bytes_total', labels, os.fstat(f.fileno()).st_size)
+        except (OSError, AttributeError, ValueError):
+            pass
+    return data
+
+def report_timer(report):
+    """Rapor üreten fonksiyonun süresini emisyon_report_duration_seconds'a yazar"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                metric_observe('emisyon_report_duration_seconds', (('report', report),),
+                               time.perf_counter() - started, METRICS_REPORT_BUCKETS)
+        return wrapper
+    return decorator
+
+def _metrics_snapshot():
+    with _metrics_lock:
+        return {
+            'counters': [[name, [list(l) for l in labels], value] for (name, labels), value in _metrics_counters.items()],
+            'histograms': [[name, [list(l) for l in labels], dict(hist, counts=list(hist['counts']))]
+                           for (name, labels), hist in _metrics_histograms.items()]
+        }
+
+def _metrics_snapshot_path(pid=None):
+    return os.path.join(METRICS_DIR, f"worker-{pid or os.getpid()}.json")
+
+def _metrics_scrape_marker():
+    return os.path.join(METRICS_DIR, 'last_scrape')
+
+def flush_metrics(only_if_scraped=False):
+    """Bu worker'ın metriklerini paylaşılan klasöre yazar (gunicorn worker_exit'te de çağrılır); yazıldıysa True"""
+    if not METRICS_ENABLED:
+        return False
+    if only_if_scraped and not os.path.exists(_metrics_scrape_marker()):
+        return False
+    try:
+        os.makedirs(METRICS_DIR, exist_ok=True)
+        tmp_path = _metrics_snapshot_path() + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(_metrics_snapshot(), f)
+        os.replace(tmp_path, _metrics_snapshot_path())
+        return True
+    except OSError as e:
+        print(f"Metrikler yazılamadı ({METRICS_DIR}): {e}")
+        return False
+
+def _maybe_flush_metrics():
+    """En fazla METRICS_FLUSH_INTERVAL'de bir bakar; yakın zamanda okuma olduysa yazar"""
+    global _metrics_last_flush_check
+    now = time.time()
+    if now - _metrics_last_flush_check < METRICS_FLUSH_INTERVAL:
+        return
+    _metrics_last_flush_check = now
+    try:
+        if now - os.path.getmtime(_metrics_scrape_marker()) > METRICS_SCRAPE_IDLE_SECONDS:
+            return
+    except OSError:
+        return
+    flush_metrics()
+
+def _merge_metric_snapshot(counters, histograms, snapshot):
+    for name, labels, value in snapshot.get('counters', []):
+        key = (name, tuple(tuple(l) for l in labels))
+        counters[key] = counters.get(key, 0) + value
+    for name, labels, hist in snapshot.get('histograms', []):
+        key = (name, tuple(tuple(l) for l in labels))
+        merged = histograms.get(key)
+        if merged is None or merged['buckets'] != hist['buckets']:
+            histograms[key] = {'buckets': list(hist['buckets']), 'counts': list(hist['counts']), 'sum': hist['sum']}
+        else:
+            merged['counts'] = [a + b for a, b in zip(merged['counts'], hist['counts'])]
+            merged['sum'] += hist['sum']
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        pass
+    return True
+
+def collect_metrics():
+    """Canlı worker'ların anlık görüntüleri + kapanmış worker'ların arşivi.
+
+    Bu worker önce kendi anlık görüntüsünü yazar, sonra kendisi dahil her worker dosyadan okunur.
+    Hangi worker'a denk gelirse gelsin her okuma aynı dosyaları görür; dosyalar sadece büyüdüğü
+    için toplam sayaçlar ardışık okumalarda azalmaz. Kapanan worker'ların (max_requests ile
+    yeniden başlatma) son değerleri archive.json'a eklenir, klasör büyümez.
+    """
+    counters, histograms = {}, {}
+    own_flushed = False
+    try:
+        os.makedirs(METRICS_DIR, exist_ok=True)
+        with open(_metrics_scrape_marker(), 'a'):
+            pass
+        os.utime(_metrics_scrape_marker(), None)
+        own_flushed = flush_metrics()
+        archive_path = os.path.join(METRICS_DIR, 'archive.json')
+        with collection_lock(archive_path):
+            archive = _read_json_for_update(archive_path, dict)
+            archive_counters, archive_histograms = {}, {}
+            _merge_metric_snapshot(archive_counters, archive_histograms, archive)
+            archive_changed = False
+            for fname in os.listdir(METRICS_DIR):
+                if not (fname.startswith('worker-') and fname.endswith('.json')):
+                    continue
+                try:
+                    pid = int(fname[len('worker-'):-len('.json')])
+                except ValueError:
+                    continue
+                if pid == os.getpid() and not own_flushed:
+                    continue
+                path = os.path.join(METRICS_DIR, fname)
+                try:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        snapshot = json.load(f)
+                except (OSError, ValueError):
+                    continue
+                if _pid_alive(pid):
+                    _merge_metric_snapshot(counters, histograms, snapshot)
+                else:
+                    _merge_metric_snapshot(archive_counters, archive_histograms, snapshot)
+                    archive_changed = True
+                    os.unlink(path)
+            if archive_changed:
+                archive = {
+                    'counters': [[n, [list(l) for l in lb], v] for (n, lb), v in archive_counters.items()],
+                    'histograms': [[n, [list(l) for l in lb], h] for (n, lb), h in archive_histograms.items()]
+                }
+                _atomic_write_json_unlocked(archive_path, archive, indent=None)
+            _merge_metric_snapshot(counters, histograms, archive)
+    except OSError as e:
+        print(f"Metrik klasörü okunamadı ({METRICS_DIR}): {e}")
+    if not own_flushed:
+        # Klasör yazılamıyorsa en azından bu worker'ın canlı değerleri döner
+        _merge_metric_snapshot(counters, histograms, _metrics_snapshot())
+    return counters, histograms
+
+def _prometheus_labels(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ''
+    escaped = (f'{k}="{str(v).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34)).replace(chr(10), chr(92) + "n")}"'
+               for k, v in pairs)
+    return '{' + ','.join(escaped) + '}'
+
+def render_prometheus_metrics():
+    counters, histograms = collect_metrics()
+    lines = []
+    for name, (kind, help_text) in _METRIC_HELP.items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        if kind == 'counter':
+            for (metric, labels), value in sorted(counters.items()):
+                if metric == name:
+                    lines.append(f"{name}{_prometheus_labels(labels)} {value}")
+        else:
+            for (metric, labels), hist in sorted(histograms.items()):
+                if metric != name:
+                    continue
+                cumulative = 0
+                for bound, count in zip(hist['buckets'], hist['counts']):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{_prometheus_labels(labels, [('le', repr(float(bound)))])} {cumulative}")
+                cumulative += hist['counts'][-1]
+                lines.append(f"{name}_bucket{_prometheus_labels(labels, [('le', '+Inf')])} {cumulative}")
+                lines.append(f"{name}_sum{_prometheus_labels(labels)} {hist['sum']:.6f}")
+                lines.append(f"{name}_count{_prometheus_labels(labels)} {cumulative}")
+    return '\n'.join(lines) + '\n'
+
+@app.before_request
+def metrics_start_timer():
+    g.metrics_started_at = time.perf_counter()
+
+# Sıkıştırma hook'undan önce kaydedilir: Flask after_request'leri ters sırada çalıştırdığı için
+# ölçülen süre sıkıştırmayı da kapsar.
+@app.after_request
+def metrics_record_request(response):
+    started = g.get('metrics_started_at')
+    if METRICS_ENABLED and started is not None and request.endpoint != 'metrics':
+        endpoint = request.endpoint or 'unmatched'
+        metric_inc('emisyon_http_requests_total',
+                   (('endpoint', endpoint), ('method', request.method), ('status', str(response.status_code))))
+        metric_observe('emisyon_http_request_duration_seconds',
+                       (('endpoint', endpoint), ('method', request.method)), time.perf_counter() - started)
+        _maybe_flush_metrics()
+    return response
+
+def _on_metrics_port():
+    return bool(METRICS_PORT) and request.environ.get('SERVER_PORT') == METRICS_PORT
+
+@app.before_request
+def restrict_metrics_port():
+    """Metrik portu uygulamayı sunmaz: orada sadece /metrics ve /health yanıt verir"""
+    if _on_metrics_port() and request.endpoint not in ('metrics', 'health'):
+        return 'not found\n', 404, {'Content-Type': 'text/plain; charset=utf-8'}
+
+@app.route('/metrics')
+def metrics():
+    """Prometheus metin formatında metrikler. METRICS_PORT verilmişse sadece o porttan,
+    METRICS_TOKEN verilmişse Bearer token ile sunulur."""
+    if not METRICS_ENABLED or (METRICS_PORT and not _on_metrics_port()):
+        return 'metrics disabled\n', 404, {'Content-Type': 'text/plain; charset=utf-8'}
+    if METRICS_TOKEN and request.headers.get('Authorization', '') != f'Bearer {METRICS_TOKEN}':
+        return 'unauthorized\n', 401, {'Content-Type': 'text/plain; charset=utf-8'}
+    response = app.response_class(render_prometheus_metrics(), mimetype='text/plain')
+    response.headers['Content-Type'] = 'text/plain; version=0.0.4; charset=utf-8'
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
+# HTTP yanıt sıkıştırma (gzip / brotli)
+COMPRESS_ENABLED = os.environ.get('COMPRESS_ENABLED', 'true').lower() == 'true'
+COMPRESS_MIN_SIZE = int(os.environ.get('COMPRESS_MIN_SIZE', '500'))
+COMPRESS_LEVEL_GZIP = 6
+COMPRESS_LEVEL_BROTLI = 5
+COMPRESS_STATIC_CACHE_MAX_BYTES = 32 * 1024 * 1024
+# Sadece metin tabanlı içerik sıkıştırılır; zip/docx/xlsx/png gibi zaten sıkıştırılmış türler atlanır
+COMPRESSIBLE_MIMETYPES = {
+    'text/html', 'text/css', 'text/plain', 'text/xml', 'text/csv', 'text/javascript',
+    'application/javascript', 'application/json', 'application/xml', 'image/svg+xml'
+}
+_compressed_static_cache = {}
+_compressed_static_cache_size = 0
+_compressed_static_cache_lock = threading.Lock()
+
+def load_brotli():
+    """brotli kütüphanesini yükler; kurulu değilse None döner (sadece gzip kullanılır)"""
+    try:
+        import brotli
+        return brotli
+    except ImportError:
+        return None
+
+def _negotiate_encoding():
+    accept = request.accept_encodings
+    if load_brotli() is not None and accept['br'] > 0:
+        return 'br'
+    if accept['gzip'] > 0:
+        return 'gzip'
+    return None
+
+def _compress_bytes(data, encoding, static=False):
+    if encoding == 'br':
+        return load_brotli().compress(data, quality=11 if static else COMPRESS_LEVEL_BROTLI)
+    import gzip
+    return gzip.compress(data, compresslevel=9 if static else COMPRESS_LEVEL_GZIP, mtime=0)
+
+def _compress_stream(original, chunks, encoding):
+    """Akışlı yanıtları parça parça sıkıştırır; bitince asıl iterable'ı kapatır"""
+    try:
+        if encoding == 'br':
+            compressor = load_brotli().Compressor(quality=COMPRESS_LEVEL_BROTLI)
+            for chunk in chunks:
+                out = compressor.process(chunk) + compressor.flush()
+                if out:
+                    yield out
+            yield compressor.finish()
+        else:
+            import zlib
+            compressor = zlib.compressobj(COMPRESS_LEVEL_GZIP, zlib.DEFLATED, 31)
+            for chunk in chunks:
+                out = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+                if out:
+                    yield out
+            yield compressor.flush()
+    finally:
+        if hasattr(original, 'close'):
+            original.close()
+
+def _compressed_static_asset(file_path, encoding):
+    """Statik dosyanın sıkıştırılmış halini (mtime/boyut anahtarlı) bellekte önbellekler"""
+    global _compressed_static_cache_size
+    st = os.stat(file_path)
+    key = (file_path, st.st_mtime_ns, st.st_size, encoding)
+    with _compressed_static_cache_lock:
+        cached = _compressed_static_cache.get(key)
+    metric_cache('static_compress', cached is not None)
+    if cached is not None:
+        return cached
+    with open(file_path, 'rb') as f:
+        compressed = _compress_bytes(f.read(), encoding, static=True)
+    with _compressed_static_cache_lock:
+        # Dosya değiştiyse eski sürümleri bırak; sınır aşılırsa önbelleği sıfırla
+        for old_key in [k for k in _compressed_static_cache if k[0] == file_path and k[3] == encoding]:
+            _compressed_static_cache_size -= len(_compressed_static_cache.pop(old_key))
+        if _compressed_static_cache_size + len(compressed) > COMPRESS_STATIC_CACHE_MAX_BYTES:
+            _compressed_static_cache.clear()
+            _compressed_static_cache_size = 0
+        _compressed_static_cache[key] = compressed
+        _compressed_static_cache_size += len(compressed)
+    return compressed
+
+@app.after_request
+def compress_response(response):
+    if not COMPRESS_ENABLED or request.method == 'HEAD':
+        return response
+    if response.status_code != 200 or 'Content-Encoding' in response.headers:
+        return response
+    if response.mimetype not in COMPRESSIBLE_MIMETYPES:
+        return response
+    response.vary.add('Accept-Encoding')
+    encoding = _negotiate_encoding()
+    if encoding is None:
+        return response
+
+    if request.endpoint == 'static' and response.direct_passthrough:
+        file_path = os.path.join(app.static_folder, resolve_static_filename(request.view_args.get('filename', ''))[0])
+        if not os.path.isfile(file_path) or os.path.getsize(file_path) < COMPRESS_MIN_SIZE:
+            return response
+        response.close()
+        response.direct_passthrough = False
+        response.set_data(_compressed_static_asset(file_path, encoding))
+    elif response.is_streamed or response.direct_passthrough:
+        response.direct_passthrough = False
+        response.response = _compress_stream(response.response, response.iter_encoded(), encoding)
+        response.headers.pop('Content-Length', None)
+    else:
+        data = response.get_data()
+        if len(data) < COMPRESS_MIN_SIZE:
+            return response
+        response.set_data(_compress_bytes(data, encoding))
+
+    response.headers['Content-Encoding'] = encoding
+    # Sıkıştırılmış gösterim farklı bayt dizisidir; ETag zayıf olarak işaretlenir
+    etag, is_weak = response.get_etag()
+    if etag and not is_weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+# İçerik özetli (fingerprint) statik dosya adları: css/style.css -> css/style.<hash>.css
+STATIC_FINGERPRINT_ENABLED = os.environ.get('STATIC_FINGERPRINT', 'true').lower() == 'true'
+STATIC_IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+STATIC_HASH_LENGTH = 10
+_HASHED_STATIC_RE = None
+_static_asset_manifest = {}
+_static_asset_manifest_lock = threading.Lock()
+
+def static_asset_hash(filename):
+    """Statik dosyanın içerik özetini döndürür; mtime/boyut değişmedikçe manifestten okunur"""
+    file_path = os.path.join(app.static_folder, filename)
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    with _static_asset_manifest_lock:
+        entry = _static_asset_manifest.get(filename)
+    if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+        return entry[2]
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(64 * 1024), b''):
+            digest.update(chunk)
+    asset_hash = digest.hexdigest()[:STATIC_HASH_LENGTH]
+    with _static_asset_manifest_lock:
+        _static_asset_manifest[filename] = (st.st_mtime_ns, st.st_size, asset_hash)
+    return asset_hash
+
+def build_static_manifest():
+    """static/ altındaki tüm dosyalar için {dosya: özetli dosya adı} manifestini üretir"""
+    manifest = {}
+    for root, _dirs, files in os.walk(app.static_folder):
+        for fname in files:
+            rel = os.path.relpath(os.path.join(root, fname), app.static_folder).replace(os.sep, '/')
+            manifest[rel] = fingerprinted_static_filename(rel)
+    return manifest
+
+def fingerprinted_static_filename(filename):
+    """url_for('static') için özetli dosya adı; dosya yoksa adı değiştirmez"""
+    asset_hash = static_asset_hash(filename)
+    if not asset_hash:
+        return filename
+    head, tail = os.path.split(filename)
+    base, ext = os.path.splitext(tail)
+    hashed = f"{base}.{asset_hash}{ext}"
+    return f"{head}/{hashed}" if head else hashed
+
+def resolve_static_filename(filename):
+    """İstek yolundaki özetli adı gerçek dosya adına çevirir: (dosya adı, istenen özet)"""
+    global _HASHED_STATIC_RE
+    if os.path.isfile(os.path.join(app.static_folder, filename)):
+        return filename, None
+    if _HASHED_STATIC_RE is None:
+        import re
+        _HASHED_STATIC_RE = re.compile(r'^(.*)\.([0-9a-f]{%d})(\.[^./]+)?$' % STATIC_HASH_LENGTH)
+    m = _HASHED_STATIC_RE.match(filename)
+    if not m:
+        return filename, None
+    return m.group(1) + (m.group(3) or ''), m.group(2)
+
+@app.url_defaults
+def fingerprint_static_urls(endpoint, values):
+    if STATIC_FINGERPRINT_ENABLED and endpoint == 'static' and values.get('filename'):
+        values['filename'] = fingerprinted_static_filename(values['filename'])
+
+def serve_static_asset(filename):
+    """Flask'ın static görünümü; özetli adlar bir yıl, değişmez (immutable) olarak önbelleklenir"""
+    # Baca fotoğraflarının orijinalleri EXIF/GPS taşıyabilir: sadece oturum açmış kullanıcılara
+    if os.path.normpath(filename).replace('\\', '/').startswith(PHOTO_URL_PREFIX) and not session.get('logged_in'):
+        abort(401)
+    real_name, requested_hash = resolve_static_filename(filename)
+    if not requested_hash:
+        return app.send_static_file(filename)
+    response = send_from_directory(app.static_folder, real_name)
+    if requested_hash == static_asset_hash(real_name):
+        response.headers['Cache-Control'] = f'public, max-age={STATIC_IMMUTABLE_MAX_AGE}, immutable'
+    else:
+        # Eski sürüme ait bağlantı: güncel içeriği ver ama önbelleğe alma
+        response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+app.view_functions['static'] = serve_static_asset
+
 def allowed_file(filename, allowed_extensions):
     """Dosya uzantısının izin verilen uzantılar arasında olup olmadığını kontrol eder."""
     return '.' in filename and \
@@ -74,19 +723,8 @@ def allowed_file(filename, allowed_extensions):
 def allowed_image_file(filename):
     return allowed_file(filename, {'png', 'jpg', 'jpeg', 'gif', 'bmp', 'webp', 'svg'})
 
-DATA_DIR = os.environ.get('DATA_DIR')
-if not DATA_DIR:
-    try:
-        if os.path.isdir('/data'):
-            DATA_DIR = '/data'
-    except Exception:
-        DATA_DIR = None
-if not DATA_DIR:
-    try:
-        import tempfile
-        DATA_DIR = os.path.join(tempfile.gettempdir(), 'emisyon_data')
-    except Exception:
-        DATA_DIR = None
+# DATA_DIR, /data, <geçici dizin>/emisyon_data; auto_backup.py aynı çözümü kullanır
+DATA_DIR = storage_gate.resolve_data_dir()
 if DATA_DIR:
     try:
         os.makedirs(DATA_DIR, exist_ok=True)
@@ -146,25 +784,213 @@ def ensure_data_files():
     except Exception as e:
         print(f"DATA_DIR başlangıç kopyalama hatası: {e}")
 
+# Başlangıçta tek seferlik kontrol (yalnızca dosya varlık kontrolü; kopyalama sadece ilk açılışta)
+ensure_data_files()
+mark_startup_phase('data_files')
+
+IMAGES_DIR = os.path.join(app.root_path, 'static', 'images')
+os.makedirs(IMAGES_DIR, exist_ok=True)
+
+# Dinamik resimler için klasör
+IMAGES_DIR = data_path('images')
+os.makedirs(IMAGES_DIR, exist_ok=True)
+
 # Image assets handling
+# Görsel kataloğu: liste her istekte diskten taranmaz. Katalog IMAGES_DIR'in sürümüyle
+# (dizin mtime'ı; ekleme/silme/değiştirme ile değişir, tüm süreçlerde aynıdır) eşleştiği sürece
+# bellekte tutulur; yükleme ve silme kataloğu doğrudan günceller. Küçük resimler yüklemede
+# üretilir (Pillow'un açamadığı dosyalar reddedilir; eski görseller için ısınmada) ve sürüm
+# parametreli URL ile uzun süre önbelleklenir.
+IMAGE_THUMBS_DIR = data_path('image_thumbs')
+IMAGE_THUMB_SIZE = 320
+IMAGE_THUMB_QUALITY = 80
+IMAGE_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
+
+def image_thumb_file(name):
+    return os.path.join(IMAGE_THUMBS_DIR, f'{name}.jpg')
+
+def render_image_thumb(source_path):
+    """Küçük resim görüntüsü (kaydedilmemiş). Pillow yoksa ImportError, okunamazsa OSError."""
+    from PIL import Image
+
+    img = open_oriented_rgb_image(source_path)
+    img.thumbnail((IMAGE_THUMB_SIZE, IMAGE_THUMB_SIZE), Image.LANCZOS)
+    return img
+
+def generate_image_thumb(name):
+    """Görselin küçük resmini (yoksa veya eskiyse) üretir; üretilemiyorsa None döner"""
+    source_path = os.path.join(IMAGES_DIR, name)
+    thumb_path = image_thumb_file(name)
+    if os.path.exists(thumb_path) and os.path.getmtime(thumb_path) >= os.path.getmtime(source_path):
+        return thumb_path
+    try:
+        save_jpeg_atomic(render_image_thumb(source_path), thumb_path, IMAGE_THUMB_QUALITY)
+        return thumb_path
+    except Exception as e:
+        print(f"Küçük resim üretilemedi ({name}): {e}")
+        return None
+
+@lazy_init('image_thumbs')
+def warm_image_thumbs():
+    """Küçük resmi olmayan/eski kalmış görsellerin küçük resimlerini üretir; üretilen sayıyı döner"""
+    generated = 0
+    with os.scandir(IMAGES_DIR) as it:
+        names = [item.name for item in it
+                 if item.is_file() and not item.name.startswith('.') and allowed_file(item.name, IMAGE_EXTENSIONS)]
+    for name in names:
+        thumb_path = image_thumb_file(name)
+        try:
+            if os.path.getmtime(thumb_path) >= os.path.getmtime(os.path.join(IMAGES_DIR, name)):
+                continue
+        except OSError:
+            pass
+        if generate_image_thumb(name):
+            generated += 1
+    return generated
+
+class ImageCatalog:
+    """IMAGES_DIR'deki dosyaların bellekteki listesi (ad, boyut, değiştirilme zamanı)"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._entries = {}
+        self._version = None
+        self._lock = threading.Lock()
+        self.scans = 0
+
+    @staticmethod
+    def _entry(name, st):
+        from urllib.parse import quote
+        entry = {
+            'name': name,
+            'size': st.st_size,
+            'modified': datetime.fromtimestamp(st.st_mtime).strftime('%d.%m.%Y %H:%M:%S'),
+            'thumb_url': None
+        }
+        if allowed_file(name, IMAGE_EXTENSIONS):
+            entry['thumb_url'] = f"/images/thumb/{quote(name)}?v={st.st_mtime_ns:x}"
+        return entry
+
+    def _scan(self):
+        entries = {}
+        with os.scandir(self.directory) as it:
+            for item in it:
+                # Yarım kalmış yüklemeler (.upload-*) listelenmez
+                if item.is_file() and not item.name.startswith('.'):
+                    entries[item.name] = self._entry(item.name, item.stat())
+        self._entries = entries
+        self.scans += 1
+
+    def images(self):
+        """Güncel liste (ada göre sıralı); dizin başka süreçte değiştiyse yeniden taranır"""
+        with self._lock:
+            version = collection_version(self.directory)
+            if version != self._version:
+                self._scan()
+                self._version = version
+            return [self._entries[name] for name in sorted(self._entries)]
+
+    # Yükleme/silme sonrası liste yerinde güncellenmez, sadece geçersiz kılınır: o anki dizin
+    # sürümünü kaydetmek arada başka bir worker'ın yaptığı değişikliği gizleyebilir. Yeniden
+    # tarama tek bir scandir'dir. Dizin mtime'ı son 1 sn içindeyse collection_version her çağrıda
+    # farklıdır, aynı saat tikindeki ikinci değişiklik de kaçmaz.
+    def upsert(self, name):
+        with self._lock:
+            self._version = None
+
+    def remove(self, name):
+        with self._lock:
+            self._version = None
+
+image_catalog = ImageCatalog(IMAGES_DIR)
+
 @app.route('/api/images/list', methods=['GET'])
 def api_images_list():
     try:
-        files = []
-        for fname in sorted(os.listdir(IMAGES_DIR)):
-            path = os.path.join(IMAGES_DIR, fname)
-            if not os.path.isfile(path):
-                continue
-            modified_ts = os.path.getmtime(path)
-            files.append({
-                'name': fname,
-                'size': os.path.getsize(path),
-                'modified': datetime.fromtimestamp(modified_ts).strftime('%d.%m.%Y %H:%M:%S')
-            })
-        return jsonify({'success': True, 'images': files})
+        return etag_json_response([IMAGES_DIR], lambda: jsonify({'success': True, 'images': image_catalog.images()}))
     except Exception as e:
         return jsonify({'success': False, 'message': f'Görsel listelenirken hata oluştu: {e}'}), 500
 
+@app.route('/api/images/upload', methods=['POST'])
+def api_images_upload():
+    """Admin: görsel yükler (aynı ad varsa değiştirir), küçük resmini üretir"""
+    if not session.get('logged_in'):
+        return jsonify({'success': False, 'error': 'Oturum açmanız gerekiyor'}), 401
+    
+    if session.get('username') != 'admin':
+        return jsonify({'success': False, 'error': 'Bu işlem için admin yetkisi gerekiyor'}), 403
+    
+    import shutil
+    uploaded, errors = [], []
+    for upload in request.files.getlist('images'):
+        name = secure_filename(upload.filename or '')
+        if not name or not allowed_file(name, IMAGE_EXTENSIONS):
+            errors.append(f'{upload.filename}: desteklenmeyen dosya türü')
+            continue
+        fd, tmp_path = tempfile.mkstemp(dir=IMAGES_DIR, prefix='.upload-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                shutil.copyfileobj(upload.stream, f, 1024 * 1024)
+            # Uzantı yetmez: Pillow'un açıp küçük resmini üretemediği dosya kaydedilmez
+            try:
+                thumb = render_image_thumb(tmp_path)
+            except Exception as e:
+                print(f"Yüklenen görsel okunamadı ({name}): {e}")
+                errors.append(f'{name}: geçerli bir görsel değil')
+                continue
+            os.replace(tmp_path, os.path.join(IMAGES_DIR, name))
+            save_jpeg_atomic(thumb, image_thumb_file(name), IMAGE_THUMB_QUALITY)
+        except OSError as e:
+            print(f"Görsel kaydedilemedi ({name}): {e}")
+            errors.append(f'{name}: kaydedilemedi')
+            continue
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+        image_catalog.upsert(name)
+        uploaded.append(name)
+    if not uploaded:
+        return jsonify({'success': False, 'error': 'Görsel yüklenemedi', 'errors': errors}), 400
+    return jsonify({'success': True, 'uploaded': uploaded, 'errors': errors})
+
+@app.route('/api/images/<path:filename>', methods=['DELETE'])
+def api_images_delete(filename):
+    """Admin: görseli ve küçük resmini siler"""
+    if not session.get('logged_in'):
+        return jsonify({'success': False, 'error': 'Oturum açmanız gerekiyor'}), 401
+    
+    if session.get('username') != 'admin':
+        return jsonify({'success': False, 'error': 'Bu işlem için admin yetkisi gerekiyor'}), 403
+    
+    safe_name = secure_filename(filename)
+    file_path = os.path.join(IMAGES_DIR, safe_name) if safe_name else None
+    if not file_path or not os.path.isfile(file_path):
+        return jsonify({'success': False, 'error': 'Görsel bulunamadı'}), 404
+    os.unlink(file_path)
+    try:
+        os.unlink(image_thumb_file(safe_name))
+    except OSError:
+        pass
+    image_catalog.remove(safe_name)
+    return jsonify({'success': True})
+
+@app.route('/images/thumb/<path:filename>')
+def serve_image_thumb(filename):
+    """Görselin küçük resmi; URL'deki ?v= sürümü sayesinde bir yıl önbelleklenir"""
+    safe_name = secure_filename(filename)
+    if not safe_name or not os.path.isfile(os.path.join(IMAGES_DIR, safe_name)):
+        abort(404)
+    thumb_path = generate_image_thumb(safe_name)
+    if not thumb_path:
+        # Küçük resmi üretilemeyen eski dosya: orijinal verilir ama uzun süre önbelleğe alınmaz
+        response = send_from_directory(IMAGES_DIR, safe_name)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+    response = send_file(thumb_path, mimetype='image/jpeg', conditional=True)
+    if request.args.get('v'):
+        response.headers['Cache-Control'] = f'public, max-age={STATIC_IMMUTABLE_MAX_AGE}, immutable'
+    return response
+
 @app.route('/images/<path:filename>')
 def serve_image_asset(filename):
     safe_name = secure_filename(filename)
@@ -175,16 +1001,6 @@ def serve_image_asset(filename):
         abort(404)
     return send_from_directory(IMAGES_DIR, safe_name)
 
-# Başlangıçta tek seferlik kontrol
-ensure_data_files()
-
-IMAGES_DIR = os.path.join(app.root_path, 'static', 'images')
-os.makedirs(IMAGES_DIR, exist_ok=True)
-
-# Dinamik resimler için klasör
-IMAGES_DIR = data_path('images')
-os.makedirs(IMAGES_DIR, exist_ok=True)
-
 def load_users():
     """Kullanıcıları JSON dosyasından yükler."""
     if not os.path.exists(USERS_FILE):
@@ -193,24 +1009,22 @@ def load_users():
         save_users(default_users)
         return default_users
     with open(USERS_FILE, 'r', encoding='utf-8') as f:
-        return json.load(f)
+        return metered_json_load(f)
 
 def save_users(users_data):
     """Kullanıcıları JSON dosyasına kaydeder."""
-    with open(USERS_FILE, 'w', encoding='utf-8') as f:
-        json.dump(users_data, f, indent=4, ensure_ascii=False)
+    _atomic_write_json(USERS_FILE, users_data, indent=4, ensure_ascii=False)
 
 def load_emissions():
     """Emisyon verilerini JSON dosyasından yükler."""
     if not os.path.exists(EMISSIONS_FILE):
         return []
     with open(EMISSIONS_FILE, 'r', encoding='utf-8') as f:
-        return json.load(f)
+        return metered_json_load(f)
 
 def save_emissions(emissions_data):
     """Emisyon verilerini JSON dosyasına kaydeder."""
-    with open(EMISSIONS_FILE, 'w', encoding='utf-8') as f:
-        json.dump(emissions_data, f, indent=4, ensure_ascii=False)
+    _atomic_write_json(EMISSIONS_FILE, emissions_data, indent=4, ensure_ascii=False)
 
 
 
@@ -221,7 +1035,7 @@ def load_parameters():
             print(f"load_parameters: file not found: {PARAMETERS_FILE}")
             return []
         with open(PARAMETERS_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+            data = metered_json_load(f)
         try:
             print(f"load_parameters: loaded {len(data) if isinstance(data, list) else 'n/a'} items from {PARAMETERS_FILE}")
         except Exception:
@@ -231,7 +1045,186 @@ def load_parameters():
         print(f"load_parameters error: {e} file={PARAMETERS_FILE}")
         return []
 
+# Koleksiyon kilitleri: aynı süreçteki thread'ler için RLock, gunicorn worker'ları arasında fcntl.flock
+_collection_thread_locks = {}
+_collection_thread_locks_guard = threading.Lock()
+_collection_lock_depth = threading.local()
+
+# Anlık görüntü kapısı (bkz. storage_gate.py): yazıcılar (collection_lock) ilk kilitten son
+# kilide kadar kapıyı paylaşımlı tutar, storage_snapshot özel alır. auto_backup.py aynı kilit
+# dosyalarını aynı modülle kullanır. Thread başına iç içe sayım burada tutulur.
+
+def _collection_lock_path(file_path: str) -> str:
+    lock_dir = os.path.join(os.path.dirname(file_path) or '.', '.locks')
+    os.makedirs(lock_dir, exist_ok=True)
+    return os.path.join(lock_dir, os.path.basename(file_path) + '.lock')
+
+def _enter_snapshot_gate(directory: str):
+    gates = getattr(_collection_lock_depth, 'gates', None)
+    if gates is None:
+        gates = _collection_lock_depth.gates = {}
+    entry = gates.get(directory)
+    if entry:
+        if entry[1] is None:
+            raise RuntimeError('Anlık görüntü (storage_snapshot) sırasında koleksiyon yazılamaz')
+        entry[0] += 1
+        return
+    gates[directory] = [1, storage_gate.enter_shared(directory)]
+
+def _exit_snapshot_gate(directory: str):
+    entry = _collection_lock_depth.gates[directory]
+    entry[0] -= 1
+    if entry[0] == 0:
+        del _collection_lock_depth.gates[directory]
+        storage_gate.leave_shared(entry[1])
+
+@contextmanager
+def collection_lock(file_path: str):
+    """Koleksiyon dosyası için özel (exclusive) kilit; aynı thread içinde iç içe alınabilir."""
+    key = os.path.abspath(file_path)
+    with _collection_thread_locks_guard:
+        rlock = _collection_thread_locks.setdefault(key, threading.RLock())
+    # Kapıya RLock ve flock'tan önce girilir: bekleyen bir anlık görüntü yüzünden intent kilidinde
+    # beklerken elde hiçbir koleksiyon kilidi tutulmaz. Aksi halde kapıyı tutan başka bir thread
+    # bu RLock'u beklerken görüntü de onu bekler ve tüm yazıcılar kilitlenir.
+    directory = os.path.dirname(key)
+    _enter_snapshot_gate(directory)
+    try:
+        with rlock:
+            depths = getattr(_collection_lock_depth, 'depths', None)
+            if depths is None:
+                depths = _collection_lock_depth.depths = {}
+            if depths.get(key):
+                depths[key] += 1
+                try:
+                    yield
+                finally:
+                    depths[key] -= 1
+                return
+            lock_fh = open(_collection_lock_path(key), 'a')
+            try:
+                if fcntl is not None:
+                    fcntl.flock(lock_fh.fileno(), fcntl.LOCK_EX)
+                depths[key] = 1
+                try:
+                    yield
+                finally:
+                    depths[key] = 0
+                    if fcntl is not None:
+                        fcntl.flock(lock_fh.fileno(), fcntl.LOCK_UN)
+            finally:
+                lock_fh.close()
+    finally:
+        _exit_snapshot_gate(directory)
+
+@contextmanager
+def storage_snapshot(directory: str = None):
+    """Dizindeki tüm koleksiyonlar için tutarlı an: blok süresince yazıcılar bekler.
+
+    with storage_snapshot():
+        icerik = {ad: open(data_path(ad), 'rb').read() for ad in BACKUP_DATA_FILES}
+
+    Devam eden çok dosyalı güncellemeler (ör. teklif + kullanılan numaralar) bitene kadar
+    beklenir, yeni yazımlar blok bitene kadar başlamaz. Blok kısa tutulmalı (sadece okuma);
+    blok içinde yazma ya da bu thread'de koleksiyon kilidi tutarken çağırma kilitlenmeye
+    yol açacağı için RuntimeError verilir.
+    """
+    directory = os.path.abspath(directory or DATA_DIR or app.root_path)
+    if getattr(_collection_lock_depth, 'gates', None):
+        raise RuntimeError('Koleksiyon kilidi tutulurken anlık görüntü alınamaz')
+    started = time.perf_counter()
+    with storage_gate.exclusive(directory):
+        _collection_lock_depth.gates = {directory: [1, None]}
+        waited_ms = (time.perf_counter() - started) * 1000
+        try:
+            yield {'directory': directory, 'waited_ms': round(waited_ms, 2)}
+        finally:
+            _collection_lock_depth.gates = {}
+
+@contextmanager
+def collection_group(directory: str = None):
+    """Birden çok koleksiyonu sırayla güncelleyen işlem; storage_snapshot ya hepsini ya hiçbirini görür.
+
+    Koleksiyon kilidi almaz (diğer yazıcılar çalışmaya devam eder), sadece anlık görüntü kapısını
+    blok boyunca paylaşımlı tutar.
+    """
+    directory = os.path.abspath(directory or DATA_DIR or app.root_path)
+    _enter_snapshot_gate(directory)
+    try:
+        yield
+    finally:
+        _exit_snapshot_gate(directory)
+
+def read_storage_snapshot(file_names, directory: str = None):
+    """Dosyaların tutarlı bir andaki içerikleri: {ad: bayt}; olmayan dosyalar atlanır"""
+    contents = {}
+    with storage_snapshot(directory) as snap:
+        for name in file_names:
+            try:
+                with open(os.path.join(snap['directory'], name), 'rb') as f:
+                    contents[name] = f.read()
+            except FileNotFoundError:
+                continue
+    return contents
+
+def _read_json_for_update(file_path: str, default_factory):
+    if not os.path.exists(file_path):
+        return default_factory()
+    with open(file_path, 'r', encoding='utf-8') as f:
+        data = metered_json_load(f)
+    if not isinstance(data, type(default_factory())):
+        return default_factory()
+    return data
+
+class RecordNotFound(LookupError):
+    """collection_transaction bloğunda aranan kayıt yok: blok iptal edilir, dosya yazılmaz"""
+
+class TransactionRejected(Exception):
+    """collection_transaction bloğunda doğrulama hatası: dosya yazılmaz, response aynen döndürülür"""
+
+    def __init__(self, response):
+        super().__init__(response)
+        self.response = response
+
+@contextmanager
+def collection_transaction(file_path: str, default_factory=list, indent: int = 4):
+    """Kilit altında oku-değiştir-yaz işlemi.
+
+    with collection_transaction(PARAMETRE_OLCUM_FILE) as kayitlar:
+        kayitlar.append(yeni_kayit)
+
+    Blok içinde veri kilit alındıktan sonra diskten yeniden okunur, böylece başka
+    worker'ların yazdıkları kaybolmaz. Blok hatasız biterse _atomic_write_json ile
+    yazılır; blokta hata olursa hiçbir şey yazılmaz. Yazma başarısızsa OSError fırlatır.
+    Bozuk (parse edilemeyen) dosyanın üzerine yazılmaz, hata yukarı iletilir.
+
+    İki koleksiyon birlikte değişiyorsa kilitler iç içe ve hep aynı sırayla alınır:
+    teklif → used_teklif_numbers, baca_bilgileri → baca_paralar.
+    """
+    with collection_lock(file_path):
+        data = _read_json_for_update(file_path, default_factory)
+        yield data
+        if not _atomic_write_json(file_path, data, indent=indent, ensure_ascii=False):
+            raise OSError(f"Koleksiyon kaydedilemedi: {file_path}")
+
 def _atomic_write_json(file_path: str, data_obj, indent: int = 4, ensure_ascii: bool = False) -> bool:
+    try:
+        with collection_lock(file_path):
+            ok = _atomic_write_json_unlocked(file_path, data_obj, indent, ensure_ascii)
+    except Exception as e:
+        print(f"atomic_write_json error: {e} file={file_path}")
+        ok = False
+    if METRICS_ENABLED:
+        collection = _collection_label(file_path)
+        metric_inc('emisyon_json_save_total', (('collection', collection), ('result', 'ok' if ok else 'error')))
+        if ok:
+            try:
+                metric_inc('emisyon_json_save_bytes_total', (('collection', collection),), os.path.getsize(file_path))
+            except OSError:
+                pass
+    return ok
+
+def _atomic_write_json_unlocked(file_path: str, data_obj, indent: int = 4, ensure_ascii: bool = False) -> bool:
     try:
         dir_name = os.path.dirname(file_path)
         if dir_name:
@@ -259,6 +1252,49 @@ def _atomic_write_json(file_path: str, data_obj, indent: int = 4, ensure_ascii:
         print(f"atomic_write_json error: {e} file={file_path}")
         return False
 
+# Son bu kadar süre içinde değişmiş dosyanın mtime'ına güvenilmez (dosya sisteminin zaman
+# çözünürlüğü içinde aynı boyutta ikinci bir yazım aynı mtime'ı alabilir)
+COLLECTION_VERSION_SETTLE_NS = 1_000_000_000
+
+def collection_version(file_path: str) -> str:
+    """Koleksiyon dosyasının sürümü (inode + mtime_ns + boyut); tüm süreçlerde aynıdır.
+
+    Atomik yazım (os.replace) her seferinde yeni inode üretir. Yine de serbest kalan inode
+    yeniden kullanılabildiği için mtime'ı son 1 sn içinde olan dosyanın sürümü her çağrıda
+    benzersizdir (git'in "racy clean" kuralı): bu sürede ETag/önbellek eşleşmez, eski veri dönmez.
+    """
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return '0'
+    version = f"{st.st_ino:x}-{st.st_mtime_ns:x}-{st.st_size:x}"
+    if time.time_ns() - st.st_mtime_ns < COLLECTION_VERSION_SETTLE_NS:
+        version += f"-r{uuid4().hex[:12]}"
+    return version
+
+def etag_json_response(collection_files, build_payload, cache_control='private, no-cache'):
+    """Koleksiyon sürümlerinden ETag üretir; istemci güncelse gövdesiz 304 döner.
+
+    build_payload sadece yanıt gerçekten gerekiyorsa çağrılır (JSON serileştirme atlanır).
+    Varsayılan Cache-Control her istekte doğrulama ister; sabit referans verilerde
+    (ör. il-ilçe) max-age verilebilir.
+    """
+    versions = '|'.join(collection_version(p) for p in collection_files)
+    raw = f"{request.path}?{request.query_string.decode('latin-1')}|{versions}"
+    etag = hashlib.sha1(raw.encode('utf-8')).hexdigest()
+    not_modified = request.if_none_match.contains_weak(etag)
+    metric_cache('http_etag', not_modified)
+    if not_modified:
+        response = app.response_class(status=304)
+    else:
+        response = app.make_response(build_payload())
+        if response.status_code != 200:
+            return response
+    response.set_etag(etag)
+    # Tarayıcı önbellekte tutar; varsayılan olarak her istekte If-None-Match ile doğrular
+    response.headers['Cache-Control'] = cache_control
+    return response
+
 def save_parameters(parameters_data):
     """Parametreleri JSON dosyasına kaydeder."""
     ok = _atomic_write_json(PARAMETERS_FILE, parameters_data, indent=4, ensure_ascii=False)
@@ -274,32 +1310,13 @@ def save_parameters(parameters_data):
 def api_debug_storage():
     """Debug endpoint: shows resolved storage paths and file stats."""
     try:
+        # Her çağrıda fsync'li deneme yazımı yapılmaz; yazma izni os.access ile kontrol edilir.
+        # Gerçek yazma sonuçları /metrics'teki emisyon_json_save_total{result="error"} sayacındadır.
         write_test = {
-            'ok': False,
+            'ok': bool(DATA_DIR) and os.path.isdir(DATA_DIR) and os.access(DATA_DIR, os.W_OK),
             'dir': DATA_DIR,
             'error': None
         }
-        try:
-            import tempfile
-            if DATA_DIR:
-                os.makedirs(DATA_DIR, exist_ok=True)
-                test_target = os.path.join(DATA_DIR, '.__write_test__.json')
-                with tempfile.NamedTemporaryFile(mode='w', delete=False, encoding='utf-8', dir=DATA_DIR, suffix='.tmp') as tf:
-                    tf.write('{"ok": true}')
-                    tf.flush()
-                    try:
-                        os.fsync(tf.fileno())
-                    except Exception:
-                        pass
-                    tmp_path = tf.name
-                os.replace(tmp_path, test_target)
-                try:
-                    os.unlink(test_target)
-                except Exception:
-                    pass
-                write_test['ok'] = True
-        except Exception as _e:
-            write_test['error'] = str(_e)
 
         def _stat(p):
             try:
@@ -335,6 +1352,231 @@ def api_debug_storage():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@app.route('/api/admin/startup_profile')
+def api_admin_startup_profile():
+    """Başlangıç profili: import aşamaları, gecikmeli başlatma adımları ve ilk istek süresi"""
+    if not session.get('logged_in'):
+        return jsonify({'success': False, 'error': 'Oturum açmanız gerekiyor'}), 401
+    if session.get('username') != 'admin':
+        return jsonify({'success': False, 'error': 'Bu işlem için admin yetkisi gerekiyor'}), 403
+    return jsonify({'success': True, 'profile': startup_profile_report()})
+
+
+# İstek profilleme (sadece admin): X-Profile: 1 başlığı veya ?_profile=1 ile istek cProfile altında
+# çalışır, sonuç DATA_DIR/profiles altına .prof (snakeviz/pstats ile açılabilir) ve özet .json
+# olarak kaydedilir. PROFILE_SAMPLE_RATE > 0 ise isteklerin bu oranı otomatik profillenir ve
+# PROFILE_SLOW_MS'den uzun sürenler saklanır. Varsayılan oran 0: kimse istemezse maliyet yoktur.
+# Süreç başına aynı anda tek profil: Python 3.12+ cProfile sys.monitoring üzerinden tüm süreci
+# izler, ikinci bir enable() hata verir ve eşzamanlı profiller birbirine karışır. Meşgulken gelen
+# elle profil istekleri normal çalışır ve yanıta X-Profile-Skipped: busy eklenir. Profil boyunca
+# diğer thread'lerde çalışan istekler 3.12+ profilde görünebilir; .json'daki concurrent_requests
+# bu sayıyı verir.
+PROFILE_DIR = data_path('profiles')
+PROFILE_SAMPLE_RATE = float(os.environ.get('PROFILE_SAMPLE_RATE', '0'))
+PROFILE_SLOW_MS = float(os.environ.get('PROFILE_SLOW_MS', '1000'))
+PROFILE_MAX_FILES = int(os.environ.get('PROFILE_MAX_FILES', '200'))
+PROFILE_TOP_FUNCTIONS = 40
+
+def _profile_function_label(func_key):
+    filename, line, name = func_key
+    if filename == '~':
+        return name
+    root = app.root_path + os.sep
+    if filename.startswith(root):
+        filename = filename[len(root):]
+    else:
+        filename = os.path.join(*filename.replace('\\', '/').split('/')[-2:])
+    return f"{name} ({filename}:{line})"
+
+def _profile_top_functions(profiler, limit=PROFILE_TOP_FUNCTIONS):
+    """Kümülatif süreye göre en pahalı fonksiyonlar"""
+    import pstats
+    stats = pstats.Stats(profiler).stats
+    rows = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:limit]
+    return [{
+        'function': _profile_function_label(func_key),
+        'ncalls': nc,
+        'tottime_ms': round(tt * 1000, 2),
+        'cumtime_ms': round(ct * 1000, 2)
+    } for func_key, (cc, nc, tt, ct, callers) in rows]
+
+def _valid_profile_id(profile_id):
+    return bool(profile_id) and len(profile_id) == 24 and all(c in '0123456789abcdef-' for c in profile_id)
+
+_profile_lock = threading.Lock()
+_requests_in_flight = 0
+_requests_in_flight_lock = threading.Lock()
+
+def save_request_profile(profiler, duration_ms, status_code, trigger):
+    """Profili kaydeder, en eski kayıtları PROFILE_MAX_FILES sınırına göre siler; profil id'sini döner"""
+    profile_id = f"{datetime.now():%Y%m%d-%H%M%S}-{uuid4().hex[:8]}"
+    try:
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        profiler.dump_stats(os.path.join(PROFILE_DIR, f"{profile_id}.prof"))
+        _atomic_write_json_unlocked(os.path.join(PROFILE_DIR, f"{profile_id}.json"), {
+            'id': profile_id,
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'trigger': trigger,
+            'method': request.method,
+            'path': request.full_path.rstrip('?'),
+            'endpoint': request.endpoint,
+            'status': status_code,
+            'duration_ms': round(duration_ms, 1),
+            'username': session.get('username'),
+            'pid': os.getpid(),
+            'concurrent_requests': g.get('profile_concurrent_requests', 0),
+            'top_functions': _profile_top_functions(profiler)
+        }, indent=2)
+        metas = sorted(f for f in os.listdir(PROFILE_DIR) if f.endswith('.json'))
+        for fname in metas[:max(0, len(metas) - PROFILE_MAX_FILES)]:
+            delete_request_profile(fname[:-len('.json')])
+        return profile_id
+    except Exception as e:
+        print(f"Profil kaydedilemedi: {e}")
+        return None
+
+def list_request_profiles():
+    """Kayıtlı profiller, en yeni önce"""
+    profiles = []
+    try:
+        names = sorted((f for f in os.listdir(PROFILE_DIR) if f.endswith('.json')), reverse=True)
+    except OSError:
+        return profiles
+    for fname in names:
+        try:
+            with open(os.path.join(PROFILE_DIR, fname), 'r', encoding='utf-8') as f:
+                profiles.append(json.load(f))
+        except (OSError, ValueError):
+            continue
+    return profiles
+
+def delete_request_profile(profile_id):
+    deleted = False
+    for ext in ('json', 'prof'):
+        try:
+            os.unlink(os.path.join(PROFILE_DIR, f"{profile_id}.{ext}"))
+            deleted = True
+        except OSError:
+            pass
+    return deleted
+
+def _stop_profiler():
+    """Bu isteğin profiler'ını kapatır ve süreç kilidini bırakır; profiler yoksa None"""
+    profiler = g.pop('profiler', None)
+    if profiler is not None:
+        profiler.disable()
+        with _requests_in_flight_lock:
+            g.profile_concurrent_requests = max(g.get('profile_concurrent_requests', 0),
+                                                _requests_in_flight - 1)
+        _profile_lock.release()
+    return profiler
+
+@app.before_request
+def profiling_start():
+    global _requests_in_flight
+    with _requests_in_flight_lock:
+        _requests_in_flight += 1
+        g.counted_in_flight = True
+    if request.endpoint == 'static':
+        return
+    if request.headers.get('X-Profile') == '1' or request.args.get('_profile') == '1':
+        if session.get('username') != 'admin':
+            return
+        trigger = 'manual'
+    elif PROFILE_SAMPLE_RATE > 0:
+        import random
+        if random.random() >= PROFILE_SAMPLE_RATE:
+            return
+        trigger = 'slow'
+    else:
+        return
+    if not _profile_lock.acquire(blocking=False):
+        # Bu süreçte başka bir istek profilleniyor; örneklenen istek sessizce atlanır
+        if trigger == 'manual':
+            g.profile_skipped = 'busy'
+        return
+    import cProfile
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        # Süreçte bu uygulamanın dışında başlatılmış bir profiler çalışıyor
+        _profile_lock.release()
+        if trigger == 'manual':
+            g.profile_skipped = 'profiler-active'
+        return
+    g.profiler = profiler
+    g.profile_trigger = trigger
+    g.profile_started_at = time.perf_counter()
+    with _requests_in_flight_lock:
+        g.profile_concurrent_requests = _requests_in_flight - 1
+
+@app.after_request
+def profiling_finish(response):
+    skipped = g.pop('profile_skipped', None)
+    if skipped:
+        response.headers['X-Profile-Skipped'] = skipped
+    profiler = _stop_profiler()
+    if profiler is None:
+        return response
+    duration_ms = (time.perf_counter() - g.profile_started_at) * 1000
+    if g.profile_trigger == 'slow' and duration_ms < PROFILE_SLOW_MS:
+        return response
+    profile_id = save_request_profile(profiler, duration_ms, response.status_code, g.profile_trigger)
+    if profile_id and g.profile_trigger == 'manual':
+        response.headers['X-Profile-Id'] = profile_id
+    return response
+
+@app.teardown_request
+def profiling_teardown(exc):
+    global _requests_in_flight
+    # after_request çalışmadan biten isteklerde profiler açık, süreç kilidi tutulu kalmasın
+    _stop_profiler()
+    if g.pop('counted_in_flight', False):
+        with _requests_in_flight_lock:
+            _requests_in_flight -= 1
+
+@app.route('/admin/profiles')
+def admin_profiles():
+    """Kayıtlı istek profilleri ve kümülatif süreye göre en pahalı fonksiyonlar"""
+    if session.get('username') != 'admin':
+        return redirect(url_for('index'))
+    return render_template('admin_profiles.html', username=session.get('username'),
+                           profiles=list_request_profiles(), sample_rate=PROFILE_SAMPLE_RATE,
+                           slow_ms=PROFILE_SLOW_MS, max_files=PROFILE_MAX_FILES)
+
+@app.route('/api/admin/profiles')
+def api_admin_profiles():
+    if not session.get('logged_in'):
+        return jsonify({'success': False, 'error': 'Oturum açmanız gerekiyor'}), 401
+    if session.get('username') != 'admin':
+        return jsonify({'success': False, 'error': 'Bu işlem için admin yetkisi gerekiyor'}), 403
+    return jsonify({'success': True, 'profiles': list_request_profiles()})
+
+@app.route('/api/admin/profiles/<profile_id>/download')
+def api_admin_profile_download(profile_id):
+    """Ham cProfile çıktısı (python -m pstats / snakeviz ile incelenir)"""
+    if not session.get('logged_in'):
+        return jsonify({'success': False, 'error': 'Oturum açmanız gerekiyor'}), 401
+    if session.get('username') != 'admin':
+        return jsonify({'success': False, 'error': 'Bu işlem için admin yetkisi gerekiyor'}), 403
+    prof_path = os.path.join(PROFILE_DIR, f"{profile_id}.prof")
+    if not _valid_profile_id(profile_id) or not os.path.isfile(prof_path):
+        return jsonify({'success': False, 'error': 'Profil bulunamadı'}), 404
+    return send_file(prof_path, as_attachment=True, download_name=f"profile-{profile_id}.prof",
+                     mimetype='application/octet-stream')
+
+@app.route('/api/admin/profiles/<profile_id>', methods=['DELETE'])
+def api_admin_profile_delete(profile_id):
+    if not session.get('logged_in'):
+        return jsonify({'success': False, 'error': 'Oturum açmanız gerekiyor'}), 401
+    if session.get('username') != 'admin':
+        return jsonify({'success': False, 'error': 'Bu işlem için admin yetkisi gerekiyor'}), 403
+    if not _valid_profile_id(profile_id) or not delete_request_profile(profile_id):
+        return jsonify({'success': False, 'error': 'Profil bulunamadı'}), 404
+    return jsonify({'success': True})
+
+
 @app.route('/api/debug/parameters')
 def api_debug_parameters():
     """Debug endpoint: shows parameters.json path, file stats and loaded count."""
@@ -380,12 +1622,11 @@ def load_measurements():
     if not os.path.exists(MEASUREMENTS_FILE):
         return []
     with open(MEASUREMENTS_FILE, 'r', encoding='utf-8') as f:
-        return json.load(f)
+        return metered_json_load(f)
 
 def save_measurements(measurements_data):
     """Ölçüm verilerini JSON dosyasına kaydeder."""
-    with open(MEASUREMENTS_FILE, 'w', encoding='utf-8') as f:
-        json.dump(measurements_data, f, indent=4, ensure_ascii=False)
+    _atomic_write_json(MEASUREMENTS_FILE, measurements_data, indent=4, ensure_ascii=False)
 
 def load_firma_olcum():
     """Firma ölçüm verilerini JSON dosyasından yükler."""
@@ -393,7 +1634,7 @@ def load_firma_olcum():
         if not os.path.exists(FIRMA_OLCUM_FILE):
             return []
         with open(FIRMA_OLCUM_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+            data = metered_json_load(f)
             if not isinstance(data, list):
                 return []
             return data
@@ -421,7 +1662,7 @@ def load_firma_kayit():
         if not os.path.exists(FIRMA_KAYIT_FILE):
             return []
         with open(FIRMA_KAYIT_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+            data = metered_json_load(f)
             if not isinstance(data, list):
                 return []
             return data
@@ -449,7 +1690,7 @@ def load_saha_olc():
         if not os.path.exists(SAHA_OLC_FILE):
             return []
         with open(SAHA_OLC_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+            data = metered_json_load(f)
             if not isinstance(data, list):
                 return []
             return data
@@ -463,9 +1704,7 @@ def save_saha_olc(saha_olc_data):
         if not isinstance(saha_olc_data, list):
             print("Hata: saha_olc_data liste olmalıdır")
             return False
-        with open(SAHA_OLC_FILE, 'w', encoding='utf-8') as f:
-            json.dump(saha_olc_data, f, indent=4, ensure_ascii=False)
-        return True
+        return _atomic_write_json(SAHA_OLC_FILE, saha_olc_data, indent=4, ensure_ascii=False)
     except Exception as e:
         print(f"Saha ölçüm verileri kaydedilirken hata: {e}")
         return False
@@ -476,7 +1715,7 @@ def load_baca_bilgileri():
         if not os.path.exists(BACA_BILGILERI_FILE):
             return []
         with open(BACA_BILGILERI_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+            data = metered_json_load(f)
             if not isinstance(data, list):
                 return []
             return data
@@ -490,9 +1729,7 @@ def save_baca_bilgileri(baca_bilgileri_data):
         if not isinstance(baca_bilgileri_data, list):
             print("Hata: baca_bilgileri_data liste olmalıdır")
             return False
-        with open(BACA_BILGILERI_FILE, 'w', encoding='utf-8') as f:
-            json.dump(baca_bilgileri_data, f, indent=4, ensure_ascii=False)
-        return True
+        return _atomic_write_json(BACA_BILGILERI_FILE, baca_bilgileri_data, indent=4, ensure_ascii=False)
     except Exception as e:
         print(f"Baca bilgileri kaydedilirken hata: {e}")
         return False
@@ -503,7 +1740,7 @@ def load_parametre_olcum():
         if not os.path.exists(PARAMETRE_OLCUM_FILE):
             return []
         with open(PARAMETRE_OLCUM_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+            data = metered_json_load(f)
             if not isinstance(data, list):
                 return []
             return data
@@ -517,9 +1754,7 @@ def save_parametre_olcum(parametre_olcum_data):
         if not isinstance(parametre_olcum_data, list):
             print("Hata: parametre_olcum_data liste olmalıdır")
             return False
-        with open(PARAMETRE_OLCUM_FILE, 'w', encoding='utf-8') as f:
-            json.dump(parametre_olcum_data, f, indent=4, ensure_ascii=False)
-        return True
+        return _atomic_write_json(PARAMETRE_OLCUM_FILE, parametre_olcum_data, indent=4, ensure_ascii=False)
     except Exception as e:
         print(f"Parametre ölçüm verileri kaydedilirken hata: {e}")
         return False
@@ -530,7 +1765,7 @@ def load_teklif():
         if not os.path.exists(TEKLIF_FILE):
             return []
         with open(TEKLIF_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+            data = metered_json_load(f)
             if not isinstance(data, list):
                 return []
             return data
@@ -559,7 +1794,7 @@ def load_used_teklif_numbers():
         if not os.path.exists(used_numbers_file):
             return set()
         with open(used_numbers_file, 'r', encoding='utf-8') as f:
-            return set(json.load(f))
+            return set(metered_json_load(f))
     except Exception as e:
         print(f"Kullanılmış teklif numaraları yüklenirken hata: {e}")
         return set()
@@ -578,6 +1813,8 @@ def save_used_teklif_numbers(used_numbers):
 
 def generate_teklif_no():
     """Yeni teklif numarası oluşturur (YYYY/TE-XXX formatında) - BENZERSİZ GARANTİLİ"""
+    # Numara eski formattaki kayıtlar dönüştürülmeden üretilmesin
+    teklif_migrations.get()
     try:
         current_year = datetime.now().year
         teklif_prefix = f"{current_year}/TE-"
@@ -647,64 +1884,68 @@ def generate_teklif_no():
 
 def reserve_teklif_no():
     """Teklif numarasını rezerve eder (henüz kullanılmamış, sadece rezerve)"""
+    # Numara eski formattaki kayıtlar dönüştürülmeden üretilmesin
+    teklif_migrations.get()
     try:
-        current_year = datetime.now().year
-        teklif_prefix = f"{current_year}/TE-"
+        # Numara seçimi ve kaydı tek kilit altında yapılır; aynı anda çalışan worker'lar aynı numarayı alamaz
+        with collection_lock(USED_TEKLIF_NUMBERS_FILE):
+            current_year = datetime.now().year
+            teklif_prefix = f"{current_year}/TE-"
         
-        # Mevcut teklifleri yükle
-        teklifler = load_teklif()
-        
-        # Kullanılmış tüm numaraları yükle
-        all_used_numbers = load_used_teklif_numbers()
+            # Mevcut teklifleri yükle
+            teklifler = load_teklif()
         
-        # Mevcut tekliflerdeki numaraları da ekle
-        for teklif in teklifler:
-            teklif_no = teklif.get('teklif_no', '')
-            if teklif_no:
-                all_used_numbers.add(teklif_no)
-
-        # Sadece bu yıla ait teklif numaralarını dikkate al (hem yeni hem eski format)
-        import re
-        year_suffix = f"{current_year % 100:02d}"
-        used_seqs_year = set()
-        for n in all_used_numbers:
-            if not isinstance(n, str):
-                continue
-            n = n.strip()
-            if not n:
-                continue
-            if n.startswith(teklif_prefix):
-                m = re.search(r"/TE-(\d{3})$", n)
-                if m:
+            # Kullanılmış tüm numaraları yükle
+            all_used_numbers = load_used_teklif_numbers()
+        
+            # Mevcut tekliflerdeki numaraları da ekle
+            for teklif in teklifler:
+                teklif_no = teklif.get('teklif_no', '')
+                if teklif_no:
+                    all_used_numbers.add(teklif_no)
+
+            # Sadece bu yıla ait teklif numaralarını dikkate al (hem yeni hem eski format)
+            import re
+            year_suffix = f"{current_year % 100:02d}"
+            used_seqs_year = set()
+            for n in all_used_numbers:
+                if not isinstance(n, str):
+                    continue
+                n = n.strip()
+                if not n:
+                    continue
+                if n.startswith(teklif_prefix):
+                    m = re.search(r"/TE-(\d{3})$", n)
+                    if m:
+                        try:
+                            used_seqs_year.add(int(m.group(1)))
+                        except Exception:
+                            pass
+                    continue
+                # Eski format: TE26-001
+                m2 = re.fullmatch(r"TE(\d{2})-(\d{3})", n)
+                if m2 and m2.group(1) == year_suffix:
                     try:
-                        used_seqs_year.add(int(m.group(1)))
+                        used_seqs_year.add(int(m2.group(2)))
                     except Exception:
                         pass
-                continue
-            # Eski format: TE26-001
-            m2 = re.fullmatch(r"TE(\d{2})-(\d{3})", n)
-            if m2 and m2.group(1) == year_suffix:
-                try:
-                    used_seqs_year.add(int(m2.group(2)))
-                except Exception:
-                    pass
-
-        max_seq = max(used_seqs_year) if used_seqs_year else 0
 
-        number = max_seq + 1
-        if number < 1:
-            number = 1
-
-        # Bu yıl için kullanılmamış numarayı bul ve rezerve et (3 haneli format)
-        while True:
-            if number > 999:
-                raise Exception("Teklif numarası limiti aşıldı!")
-            new_teklif_no = f"{teklif_prefix}{number:03d}"
-            if number not in used_seqs_year:
-                all_used_numbers.add(new_teklif_no)
-                save_used_teklif_numbers(all_used_numbers)
-                return new_teklif_no
-            number += 1
+            max_seq = max(used_seqs_year) if used_seqs_year else 0
+
+            number = max_seq + 1
+            if number < 1:
+                number = 1
+
+            # Bu yıl için kullanılmamış numarayı bul ve rezerve et (3 haneli format)
+            while True:
+                if number > 999:
+                    raise Exception("Teklif numarası limiti aşıldı!")
+                new_teklif_no = f"{teklif_prefix}{number:03d}"
+                if number not in used_seqs_year:
+                    all_used_numbers.add(new_teklif_no)
+                    save_used_teklif_numbers(all_used_numbers)
+                    return new_teklif_no
+                number += 1
                 
     except Exception as e:
         print(f"Teklif numarası rezerve edilirken hata: {e}")
@@ -715,15 +1956,17 @@ def reserve_teklif_no():
 def release_teklif_no(teklif_no):
     """Rezerve edilmiş teklif numarasını serbest bırakır (vazgeçme durumunda)"""
     try:
-        used_numbers = load_used_teklif_numbers()
+        # Rezervasyonla aynı kilit altında oku-çıkar-kaydet
+        with collection_lock(USED_TEKLIF_NUMBERS_FILE):
+            used_numbers = load_used_teklif_numbers()
         
-        # Eğer bu numara kullanılmış numaralar listesindeyse, çıkar
-        if teklif_no in used_numbers:
-            used_numbers.remove(teklif_no)
-            save_used_teklif_numbers(used_numbers)
-            return True
-        else:
-            return False
+            # Eğer bu numara kullanılmış numaralar listesindeyse, çıkar
+            if teklif_no in used_numbers:
+                used_numbers.remove(teklif_no)
+                save_used_teklif_numbers(used_numbers)
+                return True
+            else:
+                return False
             
     except Exception as e:
         print(f"Teklif numarası serbest bırakılırken hata: {e}")
@@ -731,123 +1974,462 @@ def release_teklif_no(teklif_no):
 
 def migrate_existing_teklif_numbers():
     """Mevcut teklif numaralarını kullanılmış numaralar dosyasına ekler (tek seferlik)"""
-    try:
-        teklifler = load_teklif()
-        used_numbers = load_used_teklif_numbers()
-        
-        # Mevcut teklif numaralarını ekle
-        for teklif in teklifler:
-            teklif_no = teklif.get('teklif_no', '')
-            if teklif_no:
-                used_numbers.add(teklif_no)
-        
-        # Kaydet
-        save_used_teklif_numbers(used_numbers)
-        
-    except Exception as e:
-        return
+    # Kilit sırası: teklif → used_teklif_numbers
+    with collection_lock(TEKLIF_FILE):
+        teklifler = _read_json_for_update(TEKLIF_FILE, list)
+        with collection_lock(USED_TEKLIF_NUMBERS_FILE):
+            used_numbers = load_used_teklif_numbers()
+            original_count = len(used_numbers)
+            
+            # Mevcut teklif numaralarını ekle
+            for teklif in teklifler:
+                teklif_no = teklif.get('teklif_no', '')
+                if teklif_no:
+                    used_numbers.add(teklif_no)
+            
+            # Sadece yeni numara eklendiyse kaydet (her açılışta dosyayı yeniden yazma)
+            if len(used_numbers) != original_count and not save_used_teklif_numbers(used_numbers):
+                raise OSError('Kullanılmış teklif numaraları kaydedilemedi')
+
+def _convert_teklif_no(teklif_no):
+    """TE26-001 -> 2026/TE-001; eski formatta olmayan numara için None"""
+    if not (teklif_no and teklif_no.startswith('TE') and '-' in teklif_no):
+        return None
+    parts = teklif_no.split('-')
+    if len(parts) != 2:
+        return None
+    prefix = parts[0]  # TE26
+    number = parts[1]  # 001
+    
+    # Yıl suffix'ini çıkar (TE26 -> 26)
+    if not (prefix.startswith('TE') and len(prefix) == 4 and prefix[2:].isdigit()):
+        return None
+    year_int = int(prefix[2:])
+    if year_int < 0 or year_int > 99:
+        return None
+    # 00-99 arası: 2000-2099 olarak kabul et; yeni format: YYYY/TE-XXX
+    return f"{2000 + year_int}/TE-{number.zfill(3)}"
 
 def convert_teklif_numbers_to_new_format():
     """Eski teklif numaralarını (TE26-001) yeni formata (2026/TE-001) dönüştürür"""
-    try:
-        teklifler = load_teklif()
+    # Kilit sırası: teklif → used_teklif_numbers; teklif dosyası dönüştürülürken yazılamaz
+    with collection_lock(TEKLIF_FILE):
+        teklifler = _read_json_for_update(TEKLIF_FILE, list)
         updated_count = 0
         
         for teklif in teklifler:
-            teklif_no = teklif.get('teklif_no', '')
-            if teklif_no and teklif_no.startswith('TE') and '-' in teklif_no:
-                # TE26-001 -> 2026/TE-001 formatına dönüştür
-                parts = teklif_no.split('-')
-                if len(parts) == 2:
-                    prefix = parts[0]  # TE26
-                    number = parts[1]  # 001
-                    
-                    # Yıl suffix'ini çıkar (TE26 -> 26)
-                    if prefix.startswith('TE') and len(prefix) == 4:
-                        year_suffix = prefix[2:]  # 26
-                        
-                        # 2 haneli yılı 4 haneli yıla çevir
-                        year_int = int(year_suffix)
-                        if year_int >= 0 and year_int <= 99:
-                            # 00-99 arası: 2000-2099 olarak kabul et
-                            full_year = 2000 + year_int
-                            
-                            # Yeni format: YYYY/TE-XXX
-                            new_number = f"{full_year}/TE-{number.zfill(3)}"
-                            teklif['teklif_no'] = new_number
-                            updated_count += 1
+            new_number = _convert_teklif_no(teklif.get('teklif_no', ''))
+            if new_number:
+                teklif['teklif_no'] = new_number
+                updated_count += 1
         
-        if updated_count > 0:
-            # Güncellenmiş teklifleri kaydet
-            save_teklif(teklifler)
-            
-            # Kullanılmış numaralar listesini de güncelle
+        if updated_count == 0:
+            return
+        
+        # Güncellenmiş teklifleri kaydet
+        if not save_teklif(teklifler):
+            raise OSError('Teklif verileri kaydedilemedi')
+        
+        # Kullanılmış numaralar listesini de güncelle
+        with collection_lock(USED_TEKLIF_NUMBERS_FILE):
             used_numbers = load_used_teklif_numbers()
-            new_used_numbers = set()
-            
-            for num in used_numbers:
-                if num.startswith('TE') and '-' in num:
-                    parts = num.split('-')
-                    if len(parts) == 2:
-                        prefix = parts[0]
-                        number = parts[1]
-                        
-                        if prefix.startswith('TE') and len(prefix) == 4:
-                            year_suffix = prefix[2:]
-                            year_int = int(year_suffix)
-                            if year_int >= 0 and year_int <= 99:
-                                full_year = 2000 + year_int
-                                new_num = f"{full_year}/TE-{number.zfill(3)}"
-                                new_used_numbers.add(new_num)
-                            else:
-                                new_used_numbers.add(num)
-                        else:
-                            new_used_numbers.add(num)
-                    else:
-                        new_used_numbers.add(num)
-                else:
-                    new_used_numbers.add(num)
+            new_used_numbers = {_convert_teklif_no(num) or num for num in used_numbers}
+            if not save_used_teklif_numbers(new_used_numbers):
+                raise OSError('Kullanılmış teklif numaraları kaydedilemedi')
+        print(f"Teklif numaraları yeni formata dönüştürüldü: {updated_count} kayıt")
+
+def resequence_teklif_numbers():
+    """Mevcut teklifleri 001'den başlayarak yeniden sıralar"""
+    try:
+        current_year = datetime.now().year
+        year_suffix = str(current_year)[-2:]
+        
+        # Kilit sırası: teklif → used_teklif_numbers
+        with collection_transaction(TEKLIF_FILE) as teklifler:
+            if not teklifler:
+                print("Sıralanacak teklif bulunamadı")
+                raise RecordNotFound(TEKLIF_FILE)
+            
+            # Teklifleri tarihe göre sırala (en eskiden en yeniye)
+            teklifler.sort(key=lambda x: x.get('teklif_tarihi', ''))
             
-            save_used_teklif_numbers(new_used_numbers)
+            # Yeni numaraları ata
+            new_used_numbers = []
+            for i, teklif in enumerate(teklifler, 1):
+                new_number = f'TE{year_suffix}-{i:03d}'
+                teklif['teklif_no'] = new_number
+                new_used_numbers.append(new_number)
             
+            # Kullanılmış numaralar listesini güncelle
+            with collection_transaction(USED_TEKLIF_NUMBERS_FILE, indent=2) as used_numbers:
+                used_numbers[:] = new_used_numbers
+        
+    except RecordNotFound:
+        return
     except Exception as e:
-        print(f"Teklif numarası dönüştürme hatası: {e}")
+        print(f"Teklif sıralama hatası: {e}")
+
+# Akışlı (streaming) XLSX dışa aktarma katmanı
+XLSX_MIMETYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+XLSX_DEFAULT_HEADER_FORMAT = {'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'}
+XLSX_STREAM_CHUNK_SIZE = 64 * 1024
+
+def _attachment_disposition(download_name):
+    """Türkçe karakterli dosya adları için RFC 5987 uyumlu Content-Disposition değeri"""
+    from urllib.parse import quote
+    import unicodedata
+    try:
+        download_name.encode('ascii')
+        return f'attachment; filename="{download_name}"'
+    except UnicodeEncodeError:
+        simple = unicodedata.normalize('NFKD', download_name).encode('ascii', 'ignore').decode('ascii')
+        quoted = quote(download_name, safe="!#$&+-.^_`|~")
+        return f"attachment; filename=\"{simple}\"; filename*=UTF-8''{quoted}"
+
+def _remove_file_quietly(path):
+    try:
+        if path and os.path.exists(path):
+            os.unlink(path)
+    except OSError:
+        pass
+
+def stream_file_response(path, download_name, mimetype, remove_after=True):
+    """Dosyayı parça parça gönderir; remove_after ise gönderim bitince siler"""
+    def generate():
+        try:
+            with open(path, 'rb') as f:
+                while True:
+                    chunk = f.read(XLSX_STREAM_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    yield chunk
+        finally:
+            if remove_after:
+                _remove_file_quietly(path)
+
+    response = app.response_class(generate(), mimetype=mimetype, direct_passthrough=True)
+    response.headers['Content-Length'] = str(os.path.getsize(path))
+    response.headers['Content-Disposition'] = _attachment_disposition(download_name)
+    if remove_after:
+        # Gövde hiç okunmazsa (HEAD, bağlantı kopması) geçici dosya yine silinsin
+        response.call_on_close(lambda: _remove_file_quietly(path))
+    return response
+
+def write_xlsx_rows(file_path, sheet_name, columns, rows, header_format=None,
+                    header_height=None, freeze_header=False, autofilter=False):
+    """Satırları xlsxwriter constant_memory modunda dosyaya yazar, yazılan satır sayısını döndürür.
+
+    columns: [{'header': str, 'width': int (yoksa içeriğe göre), 'num_format': str, 'align': str}]
+    rows: columns sırasında değer listeleri üreten iterable (tercihen generator)
+    """
+    import xlsxwriter
+    workbook = xlsxwriter.Workbook(file_path, {'constant_memory': True, 'tmpdir': tempfile.gettempdir()})
+    try:
+        worksheet = workbook.add_worksheet(sheet_name)
+        hdr_fmt = workbook.add_format(header_format or XLSX_DEFAULT_HEADER_FORMAT)
+
+        cell_formats = []
+        max_lengths = []
+        for col in columns:
+            props = {}
+            if col.get('num_format'):
+                props['num_format'] = col['num_format']
+            if col.get('align'):
+                props['align'] = col['align']
+            cell_formats.append(workbook.add_format(props) if props else None)
+            max_lengths.append(len(str(col['header'])))
+
+        if header_height:
+            worksheet.set_row(0, header_height)
+        for col_idx, col in enumerate(columns):
+            worksheet.write_string(0, col_idx, str(col['header']), hdr_fmt)
+
+        row_idx = 0
+        for values in rows:
+            row_idx += 1
+            for col_idx, value in enumerate(values):
+                if value is None:
+                    value = ''
+                worksheet.write(row_idx, col_idx, value, cell_formats[col_idx])
+                length = len(str(value))
+                if length > max_lengths[col_idx]:
+                    max_lengths[col_idx] = length
+
+        # constant_memory modunda sütun bilgisi kapanışta yazıldığı için genişlikler en sonda ayarlanabilir
+        for col_idx, col in enumerate(columns):
+            width = col.get('width') or min(max_lengths[col_idx] + 2, 50)
+            worksheet.set_column(col_idx, col_idx, width)
+        if freeze_header:
+            worksheet.freeze_panes(1, 0)
+        if autofilter and columns:
+            worksheet.autofilter(0, 0, row_idx, len(columns) - 1)
+    finally:
+        workbook.close()
+    return row_idx
+
+def stream_xlsx_response(download_name, sheet_name, columns, rows, **options):
+    """Satırları sabit bellekle XLSX'e yazar ve yanıtı istemciye akış olarak gönderir"""
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx') as tmp:
+        tmp_path = tmp.name
+    try:
+        write_xlsx_rows(tmp_path, sheet_name, columns, rows, **options)
+    except Exception:
+        _remove_file_quietly(tmp_path)
+        raise
+    return stream_file_response(tmp_path, download_name, XLSX_MIMETYPE)
+
+# Liste API'leri için ortak sorgu katmanı (filtre, sıralama, alan seçimi, cursor sayfalama)
+LIST_QUERY_DEFAULT_LIMIT = 100
+LIST_QUERY_MAX_LIMIT = 1000
+
+def _encode_list_cursor(sort_value, record_id):
+    import base64
+    raw = json.dumps([sort_value, record_id], ensure_ascii=False, default=str)
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
+
+def _decode_list_cursor(cursor):
+    import base64
+    try:
+        sort_value, record_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8'))
+        return sort_value, record_id
+    except Exception:
+        raise ValueError('Geçersiz cursor')
+
+def _list_sort_key(record, field):
+    value = record.get(field)
+    # None değerler en başa; karışık tiplerde karşılaştırma hatasını önlemek için str
+    return (value is not None, '' if value is None else str(value), str(record.get('id', '')))
+
+def query_list_records(records, args, filter_fields, date_field='created_at', default_sort='created_at'):
+    """Kayıt listesine istek parametrelerine göre filtre, sıralama, projeksiyon ve sayfalama uygular.
+
+    Parametreler (hepsi isteğe bağlı):
+      <filter_field>=değer   tam eşleşme (ör. firma_adi, olcum_kodu, baca_adi)
+      date_from, date_to    date_field üzerinde ISO tarih aralığı (YYYY-MM-DD, uçlar dahil)
+      sort=alan | -alan     sıralama (varsayılan default_sort, azalan için '-')
+      fields=a,b,c          sadece istenen üst seviye alanları döndür
+      limit, cursor         sayfalama; verildiğinde {'items', 'next_cursor', 'total'} döner
+
+    Hiç parametre verilmezse liste olduğu gibi döner (eski istemcilerle uyumlu); bilinmeyen
+    parametreler yok sayılır. Geçersiz limit/cursor değerlerinde ValueError fırlatır.
+    """
+    filters = {k: args.get(k) for k in filter_fields if args.get(k) is not None}
+    if filters:
+        records = [r for r in records if all(str(r.get(k, '')) == v for k, v in filters.items())]
+
+    date_from = args.get('date_from')
+    date_to = args.get('date_to')
+    if date_from or date_to:
+        field = args.get('date_field') or date_field
+        def _in_range(r):
+            value = str(r.get(field) or '')[:10]
+            if not value:
+                return False
+            if date_from and value < date_from[:10]:
+                return False
+            if date_to and value > date_to[:10]:
+                return False
+            return True
+        records = [r for r in records if _in_range(r)]
+
+    paginate = 'limit' in args or 'cursor' in args
+    sort_arg = args.get('sort')
+    if sort_arg or paginate:
+        sort_arg = sort_arg or default_sort
+        descending = sort_arg.startswith('-')
+        sort_field = sort_arg.lstrip('-')
+        records = sorted(records, key=lambda r: _list_sort_key(r, sort_field), reverse=descending)
+    else:
+        descending = False
+        sort_field = None
+
+    total = len(records)
+    next_cursor = None
+    if paginate:
+        try:
+            limit = int(args.get('limit', LIST_QUERY_DEFAULT_LIMIT))
+        except (TypeError, ValueError):
+            raise ValueError('limit sayı olmalıdır')
+        limit = max(1, min(limit, LIST_QUERY_MAX_LIMIT))
+        cursor = args.get('cursor')
+        if cursor:
+            sort_value, record_id = _decode_list_cursor(cursor)
+            marker = (sort_value is not None, '' if sort_value is None else str(sort_value), str(record_id))
+            if descending:
+                records = [r for r in records if _list_sort_key(r, sort_field) < marker]
+            else:
+                records = [r for r in records if _list_sort_key(r, sort_field) > marker]
+        if len(records) > limit:
+            last = records[limit - 1]
+            next_cursor = _encode_list_cursor(last.get(sort_field), last.get('id'))
+        records = records[:limit]
+
+    fields = [f.strip() for f in (args.get('fields') or '').split(',') if f.strip()]
+    if fields:
+        records = [{f: r[f] for f in fields if f in r} for r in records]
+
+    if paginate:
+        return {'items': records, 'next_cursor': next_cursor, 'total': total}
+    return records
+
+def list_query_response(records, filter_fields, **options):
+    """query_list_records sonucunu JSON yanıtına çevirir; hatalı parametrede 400 döner"""
+    try:
+        return jsonify(query_list_records(records, request.args, filter_fields, **options))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+# Sayfalı liste sayfaları (firma ölçüm, teklif, firma kayıt): tablo satırları sunucuda
+# aranır/sıralanır ve sayfa sayfa JSON olarak yüklenir; HTML boyutu kayıt sayısından bağımsızdır.
+PAGED_LIST_DEFAULT_SIZE = 50
+PAGED_LIST_MAX_SIZE = 200
+_paged_list_indexes = {}
+_paged_list_lock = threading.Lock()
+
+def _list_search_fold(value):
+    # Aramada ı/i ayrımı yapılmaz: kullanıcılar "FIRMA" için çoğunlukla "firma" yazar
+    return turkish_casefold(value).replace('ı', 'i')
+
+def paged_list_index(name, file_path, loader, columns):
+    """Koleksiyonun görüntü satırlarını ve arama metinlerini bir kez hazırlar.
+
+    Dizin koleksiyon sürümü (collection_version) değişene kadar bellekte tutulur; sıralama
+    düzenleri ilk istendiklerinde hesaplanıp aynı dizinde saklanır.
+    columns: {kolon: {'value': kayıt -> görüntü değeri, 'sort': kayıt -> sıralama anahtarı,
+                      'match': 'contains' | 'exact'}}
+    """
+    version = collection_version(file_path)
+    index = _paged_list_indexes.get(name)
+    if index and index['version'] == version:
+        metric_cache('paged_list_index', True)
+        return index
+    with _paged_list_lock:
+        index = _paged_list_indexes.get(name)
+        if index and index['version'] == version:
+            metric_cache('paged_list_index', True)
+            return index
+        metric_cache('paged_list_index', False)
+        rows = []
+        for record in loader():
+            row = {'id': record.get('id')}
+            for col, spec in columns.items():
+                row[col] = spec['value'](record)
+            folded = {col: _list_search_fold(row[col]) for col in columns}
+            rows.append({'record': record, 'row': row, 'folded': folded})
+        index = {'version': version, 'rows': rows, 'orders': {}}
+        _paged_list_indexes[name] = index
+        return index
+
+def _paged_list_order(index, columns, sort, descending):
+    """Sıralama düzenini (satır sıraları) önbellekten döndürür; yoksa hesaplar"""
+    key = (sort, descending)
+    order = index['orders'].get(key)
+    if order is None:
+        rows = index['rows']
+        if sort:
+            sort_fn = columns[sort].get('sort')
+            if sort_fn:
+                keys = [sort_fn(r['record']) for r in rows]
+            else:
+                keys = [r['folded'][sort] for r in rows]
+            order = sorted(range(len(rows)), key=keys.__getitem__, reverse=descending)
+        else:
+            # Sıralama verilmezse kayıt sırası
+            order = list(range(len(rows)))
+            if descending:
+                order.reverse()
+        index['orders'][key] = order
+    return order
+
+def query_paged_list(index, args, columns, search_columns=(), date_column=None, default_sort=None,
+                     default_descending=False):
+    """Sayfa isteği parametrelerini dizine uygular.
+
+    Parametreler (hepsi isteğe bağlı):
+      q=metin               search_columns içinde arar (Türkçe büyük/küçük harf duyarsız)
+      f_<kolon>=metin       kolon filtresi (kolonun match ayarına göre içerir / tam eşleşme)
+      date_from, date_to    date_column üzerinde ISO tarih aralığı (YYYY-MM-DD, uçlar dahil)
+      sort=kolon, dir=asc|desc
+      page, per_page        sayfa (1'den başlar) ve sayfa boyutu
+      ids=1                 filtreye uyan tüm kayıtların id listesini de döndür (toplu işlemler için)
+      all=1                 sayfalamadan tüm filtrelenmiş satırları döndür (dışa aktarma için)
+
+    Geçersiz sayfa/sıralama parametrelerinde ValueError fırlatır.
+    """
+    sort = args.get('sort') or default_sort
+    if sort and sort not in columns:
+        raise ValueError(f'Geçersiz sıralama alanı: {sort}')
+    direction = args.get('dir')
+    descending = default_descending if not direction else direction == 'desc'
+    try:
+        page = max(1, int(args.get('page', 1)))
+        per_page = int(args.get('per_page', PAGED_LIST_DEFAULT_SIZE))
+    except (TypeError, ValueError):
+        raise ValueError('page ve per_page sayı olmalıdır')
+    per_page = max(1, min(per_page, PAGED_LIST_MAX_SIZE))
+
+    query = _list_search_fold(args.get('q', ''))
+    column_filters = []
+    for col, spec in columns.items():
+        value = args.get(f'f_{col}')
+        if value:
+            column_filters.append((col, _list_search_fold(value), spec.get('match', 'contains') == 'exact'))
+    date_from = (args.get('date_from') or '')[:10]
+    date_to = (args.get('date_to') or '')[:10]
+
+    def matches(entry):
+        folded = entry['folded']
+        if query and not any(query in folded[col] for col in search_columns):
+            return False
+        for col, value, exact in column_filters:
+            if (folded[col] != value) if exact else (value not in folded[col]):
+                return False
+        if date_column and (date_from or date_to):
+            value = str(entry['record'].get(date_column) or '')[:10]
+            if not value or (date_from and value < date_from) or (date_to and value > date_to):
+                return False
+        return True
 
-def resequence_teklif_numbers():
-    """Mevcut teklifleri 001'den başlayarak yeniden sıralar"""
-    try:
-        teklifler = load_teklif()
-        current_year = datetime.now().year
-        year_suffix = str(current_year)[-2:]
-        
-        if not teklifler:
-            print("Sıralanacak teklif bulunamadı")
-            return
-        
-        # Teklifleri tarihe göre sırala (en eskiden en yeniye)
-        teklifler.sort(key=lambda x: x.get('teklif_tarihi', ''))
-        
-        # Yeni numaraları ata
-        new_used_numbers = set()
-        for i, teklif in enumerate(teklifler, 1):
-            old_number = teklif.get('teklif_no', '')
-            new_number = f'TE{year_suffix}-{i:03d}'
-            
-            teklif['teklif_no'] = new_number
-            new_used_numbers.add(new_number)
-            
-            pass
-        
-        # Güncellenmiş teklifleri kaydet
-        save_teklif(teklifler)
-        
-        # Kullanılmış numaralar listesini güncelle
-        save_used_teklif_numbers(new_used_numbers)
-        
-        pass
-        
-    except Exception as e:
-        print(f"Teklif sıralama hatası: {e}")
+    rows = index['rows']
+    order = _paged_list_order(index, columns, sort, descending)
+    filtering = bool(query or column_filters or (date_column and (date_from or date_to)))
+    matched = [rows[i] for i in order if matches(rows[i])] if filtering else [rows[i] for i in order]
+
+    filtered = len(matched)
+    if args.get('all') == '1':
+        page, per_page = 1, max(filtered, 1)
+    pages = max(1, (filtered + per_page - 1) // per_page)
+    page = min(page, pages)
+    start = (page - 1) * per_page
+    items = []
+    for offset, entry in enumerate(matched[start:start + per_page]):
+        item = dict(entry['row'])
+        item['sira'] = start + offset + 1
+        items.append(item)
+
+    result = {
+        'items': items,
+        'page': page,
+        'per_page': per_page,
+        'pages': pages,
+        'filtered': filtered,
+        'total': len(rows),
+        'sort': sort or '',
+        'dir': 'desc' if descending else 'asc'
+    }
+    if args.get('ids') == '1':
+        result['ids'] = [entry['row']['id'] for entry in matched]
+    return result
+
+def paged_list_response(name, file_path, loader, columns, **options):
+    """Sayfalı liste JSON yanıtı (ETag'li; koleksiyon değişmediyse 304)"""
+    def build():
+        index = paged_list_index(name, file_path, loader, columns)
+        try:
+            return jsonify(query_paged_list(index, request.args, columns, **options))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+    return etag_json_response([file_path], build)
 
 def format_tarih_gg_aa_yyyy(tarih_str):
     """YYYY-MM-DD formatındaki tarihi GG.AA.YYYY formatına çevirir"""
@@ -977,7 +2559,7 @@ def load_asgari_fiyat_ui_state():
         if not os.path.exists(ASGARI_FIYAT_UI_STATE_FILE):
             return {}
         with open(ASGARI_FIYAT_UI_STATE_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+            data = metered_json_load(f)
         return data if isinstance(data, dict) else {}
     except Exception as e:
         print(f"Asgari fiyat UI state yüklenirken hata: {e}")
@@ -999,7 +2581,7 @@ def load_teklif_parametre_secim_ui_state():
         if not os.path.exists(TEKLIF_PARAMETRE_SECIM_UI_STATE_FILE):
             return {}
         with open(TEKLIF_PARAMETRE_SECIM_UI_STATE_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+            data = metered_json_load(f)
         return data if isinstance(data, dict) else {}
     except Exception as e:
         print(f"Teklif parametre seçim UI state yüklenirken hata: {e}")
@@ -1039,11 +2621,13 @@ def api_set_ui_state_asgari_fiyat():
         col_widths = payload.get('col_widths')
         if col_widths is not None and not isinstance(col_widths, dict):
             return jsonify({'success': False, 'message': 'col_widths sözlük olmalı'}), 400
-        current = load_asgari_fiyat_ui_state()
-        current['col_widths'] = col_widths or {}
-        current['updated_at'] = datetime.now().isoformat()
-        ok = save_asgari_fiyat_ui_state(current)
-        return jsonify({'success': bool(ok)})
+        try:
+            with collection_transaction(ASGARI_FIYAT_UI_STATE_FILE, default_factory=dict, indent=2) as current:
+                current['col_widths'] = col_widths or {}
+                current['updated_at'] = datetime.now().isoformat()
+        except OSError:
+            return jsonify({'success': False})
+        return jsonify({'success': True})
     except Exception as e:
         return jsonify({'success': False, 'message': f'Hata: {str(e)}'}), 500
 
@@ -1070,11 +2654,13 @@ def api_set_ui_state_teklif_parametre_secim():
         col_widths = payload.get('col_widths')
         if col_widths is not None and not isinstance(col_widths, dict):
             return jsonify({'success': False, 'message': 'col_widths sözlük olmalı'}), 400
-        current = load_teklif_parametre_secim_ui_state()
-        current['col_widths'] = col_widths or {}
-        current['updated_at'] = datetime.now().isoformat()
-        ok = save_teklif_parametre_secim_ui_state(current)
-        return jsonify({'success': bool(ok)})
+        try:
+            with collection_transaction(TEKLIF_PARAMETRE_SECIM_UI_STATE_FILE, default_factory=dict, indent=2) as current:
+                current['col_widths'] = col_widths or {}
+                current['updated_at'] = datetime.now().isoformat()
+        except OSError:
+            return jsonify({'success': False})
+        return jsonify({'success': True})
     except Exception as e:
         return jsonify({'success': False, 'message': f'Hata: {str(e)}'}), 500
 
@@ -1128,23 +2714,105 @@ def can_delete(role):
 # Uygulama başlangıcında verileri yükle
 users = load_users()
 
-# İl-ilçe verilerini yükle
-CITIES_DATA = []
-try:
-    # Verileri yerel dosyadan okumayı dene
-    with open('il-ilce.json', 'r', encoding='utf-8') as f:
-        CITIES_DATA = json.load(f)
-except FileNotFoundError:
-    # Yerel dosya yoksa URL'den çek
+# İl-ilçe verileri ilk kullanımda (veya ısınmada) yüklenir
+IL_ILCE_URL = 'https://raw.githubusercontent.com/furkan-dogu/Turkiye-Sehir-ve-Ilceleri/main/il-ilce.json'
+
+@lazy_init('cities')
+def cities_table():
+    """İl-ilçe verisini önce DATA_DIR'den, sonra proje kökünden okur; ikisi de yoksa URL'den çeker"""
+    for path in (IL_ILCE_FILE, os.path.join(app.root_path, 'il-ilce.json')):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return metered_json_load(f)
+        except FileNotFoundError:
+            continue
+        except Exception as e:
+            print(f"İl-ilçe dosyası okunamadı ({path}): {e}")
+    # Yerel dosya yoksa URL'den çek (requests yalnızca burada yüklenir)
+    import requests
     try:
-        response = requests.get('https://raw.githubusercontent.com/furkan-dogu/Turkiye-Sehir-ve-Ilceleri/main/il-ilce.json')
+        response = requests.get(IL_ILCE_URL, timeout=10)
         response.raise_for_status() # HTTP hatalarını kontrol et
-        CITIES_DATA = response.json()
+        cities = response.json()
         # Gelen veriyi kalıcı veri klasörüne kaydet
-        with open(IL_ILCE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(CITIES_DATA, f, ensure_ascii=False, indent=2)
+        _atomic_write_json(IL_ILCE_FILE, cities, indent=2, ensure_ascii=False)
+        return cities
     except requests.exceptions.RequestException as e:
         print(f"Uyarı: İl-ilçe verileri yüklenemedi. Hata: {e}")
+        return []
+
+def get_cities_data():
+    """İl-ilçe listesini döndürür (ilk çağrıda yüklenir)"""
+    return cities_table.get() or []
+
+# Formlarda en üstte gösterilen iller (bölgedeki müşteriler)
+ONCELIKLI_ILLER = ['KOCAELİ', 'SAKARYA', 'DÜZCE', 'BOLU', 'İSTANBUL', 'BURSA', 'BİLECİK', 'KÜTAHYA']
+IL_ILCE_CACHE_CONTROL = 'public, max-age=86400'
+
+def turkish_casefold(text):
+    """Türkçe kurallarıyla küçük harfe çevirir (İ->i, I->ı); il/ilçe karşılaştırmaları için"""
+    return str(text or '').strip().replace('İ', 'i').replace('I', 'ı').lower()
+
+@lazy_init('cities_index')
+def cities_index():
+    """İl-ilçe tablosunu bir kez derler: ad -> il sözlüğü, öncelik sıralı liste, önek araması için sıralı adlar"""
+    by_name = {}
+    for il in get_cities_data():
+        ilceler = sorted(ilce.get('ilce_adi', '') for ilce in il.get('ilceler', []))
+        by_name[turkish_casefold(il.get('il_adi'))] = {
+            'il': il,
+            'ilceler': ilceler,
+            # (katlanmış ad, orijinal ad) sıralı; bisect ile önek araması
+            'ilce_keys': sorted((turkish_casefold(ad), ad) for ad in ilceler)
+        }
+    oncelikli_keys = [turkish_casefold(ad) for ad in ONCELIKLI_ILLER]
+    sirali = [by_name[key]['il'] for key in oncelikli_keys if key in by_name]
+    sirali += [il for il in get_cities_data() if turkish_casefold(il.get('il_adi')) not in oncelikli_keys]
+    return {
+        'by_name': by_name,
+        'priority_ordered': sirali,
+        'il_keys': sorted((key, entry['il'].get('il_adi', '')) for key, entry in by_name.items())
+    }
+
+def get_priority_ordered_cities():
+    """Öncelikli iller başta olmak üzere il listesi (formlardaki il seçimi için)"""
+    return (cities_index.get() or {}).get('priority_ordered', [])
+
+def find_il(il_adi):
+    """İl adını (büyük/küçük harf ve Türkçe İ/ı farkı gözetmeden) sözlükten bulur"""
+    return (cities_index.get() or {}).get('by_name', {}).get(turkish_casefold(il_adi))
+
+def _prefix_matches(sorted_keys, prefix, limit=None):
+    """(katlanmış ad, ad) çiftlerinin sıralı listesinde öneki taşıyan adları döndürür"""
+    from bisect import bisect_left
+    key = turkish_casefold(prefix)
+    matches = []
+    for folded, name in sorted_keys[bisect_left(sorted_keys, (key, '')):]:
+        if not folded.startswith(key) or (limit and len(matches) >= limit):
+            break
+        matches.append(name)
+    return matches
+
+def search_iller(prefix, limit=None):
+    """İl adı otomatik tamamlama (önek araması)"""
+    return _prefix_matches((cities_index.get() or {}).get('il_keys', []), prefix, limit)
+
+def search_ilceler(il_adi, prefix, limit=None):
+    """Verilen ilde ilçe adı otomatik tamamlama (önek araması)"""
+    entry = find_il(il_adi)
+    if not entry:
+        return []
+    return _prefix_matches(entry['ilce_keys'], prefix, limit)
+
+def _il_ilce_files():
+    # ETag için il-ilce.json'un okunabileceği tüm konumlar
+    return [IL_ILCE_FILE, os.path.join(app.root_path, 'il-ilce.json')]
+
+@app.before_request
+def record_first_request():
+    global _startup_first_request_ms
+    if _startup_first_request_ms is None:
+        _startup_first_request_ms = round((time.perf_counter() - _STARTUP_STARTED_AT) * 1000, 2)
 
 @app.route('/login', methods=['GET', 'POST'])
 def login():
@@ -1322,54 +2990,17 @@ def admin():
     if request.method == 'POST':
         action = request.form.get('action')
 
-        if action == 'add_user':
-            username = request.form['username']
-            password = request.form['password']
-            surname = request.form.get('surname', '')
-            gorev = request.form.get('gorev', '')
-            role = request.form['role']
-            
-            # İmza dosyasını işle
-            imza_filename = None
-            if 'imza' in request.files and request.files['imza'].filename:
-                imza_file = request.files['imza']
-                if imza_file and allowed_file(imza_file.filename, {'png', 'jpg', 'jpeg', 'gif'}):
-                    # Dosya adını güvenli hale getir
-                    filename = secure_filename(imza_file.filename)
-                    imza_filename = f"{username}_{filename}"
-                    
-                    # Static/images/signatures klasörünü oluştur
-                    import os
-                    signatures_dir = os.path.join('static', 'images', 'signatures')
-                    os.makedirs(signatures_dir, exist_ok=True)
-                    
-                    # Dosyayı kaydet
-                    imza_file.save(os.path.join(signatures_dir, imza_filename))
-            
-            if username and password and username not in current_users:
-                current_users[username] = {
-                    'password': password, 
-                    'role': role,
-                    'surname': surname,
-                    'gorev': gorev,
-                    'imza': imza_filename
-                }
-                save_users(current_users)
-                flash(f'Kullanıcı "{username}" başarıyla eklendi!', 'success')
-            else:
-                flash('Kullanıcı adı zaten mevcut veya eksik bilgi!', 'danger')
-
-        elif action == 'update_user':
-            username = request.form.get('edit_username') or request.form['username']
-            if username != 'admin' and username in current_users:
-                # Şifre sadece girilmişse güncelle
-                if request.form.get('password'):
-                    current_users[username]['password'] = request.form['password']
-                current_users[username]['role'] = request.form['role']
-                current_users[username]['surname'] = request.form.get('surname', '')
-                current_users[username]['gorev'] = request.form.get('gorev', '')
+        # Kullanıcılar kilit altında yeniden okunur; değişiklik blok sonunda yazılır
+        with collection_transaction(USERS_FILE, default_factory=dict) as current_users:
+            if action == 'add_user':
+                username = request.form['username']
+                password = request.form['password']
+                surname = request.form.get('surname', '')
+                gorev = request.form.get('gorev', '')
+                role = request.form['role']
                 
                 # İmza dosyasını işle
+                imza_filename = None
                 if 'imza' in request.files and request.files['imza'].filename:
                     imza_file = request.files['imza']
                     if imza_file and allowed_file(imza_file.filename, {'png', 'jpg', 'jpeg', 'gif'}):
@@ -1382,30 +3013,65 @@ def admin():
                         signatures_dir = os.path.join('static', 'images', 'signatures')
                         os.makedirs(signatures_dir, exist_ok=True)
                         
-                        # Eski imzayı sil
-                        if current_users[username].get('imza'):
-                            old_imza_path = os.path.join(signatures_dir, current_users[username]['imza'])
-                            if os.path.exists(old_imza_path):
-                                os.remove(old_imza_path)
-                        
-                        # Yeni dosyayı kaydet
+                        # Dosyayı kaydet
                         imza_file.save(os.path.join(signatures_dir, imza_filename))
-                        current_users[username]['imza'] = imza_filename
                 
-                save_users(current_users)
-                flash(f'Kullanıcı "{username}" başarıyla güncellendi!', 'success')
-            else:
-                flash('Kullanıcı güncellenemedi!', 'danger')
+                if username and password and username not in current_users:
+                    current_users[username] = {
+                        'password': password, 
+                        'role': role,
+                        'surname': surname,
+                        'gorev': gorev,
+                        'imza': imza_filename
+                    }
+                    flash(f'Kullanıcı "{username}" başarıyla eklendi!', 'success')
+                else:
+                    flash('Kullanıcı adı zaten mevcut veya eksik bilgi!', 'danger')
+
+            elif action == 'update_user':
+                username = request.form.get('edit_username') or request.form['username']
+                if username != 'admin' and username in current_users:
+                    # Şifre sadece girilmişse güncelle
+                    if request.form.get('password'):
+                        current_users[username]['password'] = request.form['password']
+                    current_users[username]['role'] = request.form['role']
+                    current_users[username]['surname'] = request.form.get('surname', '')
+                    current_users[username]['gorev'] = request.form.get('gorev', '')
+                    
+                    # İmza dosyasını işle
+                    if 'imza' in request.files and request.files['imza'].filename:
+                        imza_file = request.files['imza']
+                        if imza_file and allowed_file(imza_file.filename, {'png', 'jpg', 'jpeg', 'gif'}):
+                            # Dosya adını güvenli hale getir
+                            filename = secure_filename(imza_file.filename)
+                            imza_filename = f"{username}_{filename}"
+                            
+                            # Static/images/signatures klasörünü oluştur
+                            import os
+                            signatures_dir = os.path.join('static', 'images', 'signatures')
+                            os.makedirs(signatures_dir, exist_ok=True)
+                            
+                            # Eski imzayı sil
+                            if current_users[username].get('imza'):
+                                old_imza_path = os.path.join(signatures_dir, current_users[username]['imza'])
+                                if os.path.exists(old_imza_path):
+                                    os.remove(old_imza_path)
+                            
+                            # Yeni dosyayı kaydet
+                            imza_file.save(os.path.join(signatures_dir, imza_filename))
+                            current_users[username]['imza'] = imza_filename
+                    flash(f'Kullanıcı "{username}" başarıyla güncellendi!', 'success')
+                else:
+                    flash('Kullanıcı güncellenemedi!', 'danger')
 
-        elif action == 'delete_user':
-            username = request.form['username']
-            if username != 'admin' and username in current_users:
-                del current_users[username]
-                save_users(current_users)
-                flash(f'Kullanıcı "{username}" başarıyla silindi!', 'success')
-            else:
-                flash('Kullanıcı silinemedi!', 'danger')
-        
+            elif action == 'delete_user':
+                username = request.form['username']
+                if username != 'admin' and username in current_users:
+                    del current_users[username]
+                    flash(f'Kullanıcı "{username}" başarıyla silindi!', 'success')
+                else:
+                    flash('Kullanıcı silinemedi!', 'danger')
+            
         return redirect(url_for('admin'))
 
     # For GET request, pass the list of users to the template
@@ -1417,7 +3083,6 @@ def add_emission():
         return redirect(url_for('index')) # Yetkisiz erişim
 
     if request.method == 'POST':
-        emissions = load_emissions()
         new_emission = {
             'id': str(uuid4()),
             'tesis_adi': request.form['tesis_adi'],
@@ -1426,8 +3091,8 @@ def add_emission():
             'sonuc': request.form['sonuc'],
             'birim': request.form['birim']
         }
-        emissions.append(new_emission)
-        save_emissions(emissions)
+        with collection_transaction(EMISSIONS_FILE) as emissions:
+            emissions.append(new_emission)
         return redirect(url_for('index'))
 
     return render_template('add_emission.html', username=session.get('username'))
@@ -1444,12 +3109,19 @@ def edit_emission(emission_id):
         return redirect(url_for('index')) # Kayıt bulunamadı
 
     if request.method == 'POST':
-        emission_to_edit['tesis_adi'] = request.form['tesis_adi']
-        emission_to_edit['tarih'] = request.form['tarih']
-        emission_to_edit['parametre'] = request.form['parametre']
-        emission_to_edit['sonuc'] = request.form['sonuc']
-        emission_to_edit['birim'] = request.form['birim']
-        save_emissions(emissions)
+        # Güncel liste kilit altında yeniden okunur; kayıt bu arada silinmişse yazılmaz
+        try:
+            with collection_transaction(EMISSIONS_FILE) as emissions:
+                emission_to_edit = next((e for e in emissions if e['id'] == emission_id), None)
+                if not emission_to_edit:
+                    raise RecordNotFound(emission_id)
+                emission_to_edit['tesis_adi'] = request.form['tesis_adi']
+                emission_to_edit['tarih'] = request.form['tarih']
+                emission_to_edit['parametre'] = request.form['parametre']
+                emission_to_edit['sonuc'] = request.form['sonuc']
+                emission_to_edit['birim'] = request.form['birim']
+        except RecordNotFound:
+            pass
         return redirect(url_for('index'))
 
     return render_template('edit_emission.html', username=session.get('username'), emission=emission_to_edit)
@@ -1459,9 +3131,8 @@ def delete_emission(emission_id):
     if not session.get('logged_in') or not can_delete(session.get('role')):
         return redirect(url_for('index'))
 
-    emissions = load_emissions()
-    emissions_to_keep = [e for e in emissions if e['id'] != emission_id]
-    save_emissions(emissions_to_keep)
+    with collection_transaction(EMISSIONS_FILE) as emissions:
+        emissions[:] = [e for e in emissions if e['id'] != emission_id]
     return redirect(url_for('index'))
 
 
@@ -1640,9 +3311,8 @@ def add_parameter():
             '+3S': request.form.get('+3S')
         }
         
-        parameters = load_parameters()
-        parameters.append(new_param)
-        save_parameters(parameters)
+        with collection_transaction(PARAMETERS_FILE) as parameters:
+            parameters.append(new_param)
         flash('Yeni parametre başarıyla eklendi.', 'success')
         return redirect(url_for('parametre'))
 
@@ -1661,25 +3331,31 @@ def edit_parameter(parameter_id):
         return redirect(url_for('parametre'))
 
     if request.method == 'POST':
-        param_to_edit['Parametre Adı'] = request.form.get('Parametre Adı')
-        param_to_edit['Metot'] = request.form.get('Metot')
-        param_to_edit['İzo Oran'] = request.form.get('İzo Oran')
-        param_to_edit['LOQ'] = request.form.get('LOQ')
-        param_to_edit['KK'] = request.form.get('KK')
-        param_to_edit['1. İmp'] = request.form.get('1. İmp')
-        param_to_edit['2. İmp'] = request.form.get('2. İmp')
-        param_to_edit['3. İmp'] = request.form.get('3. İmp')
-        param_to_edit['4. İmp'] = request.form.get('4. İmp')
-        param_to_edit['L/DAK'] = request.form.get('L/DAK')
-        param_to_edit['Nozzle'] = request.form.get('Nozzle')
-        param_to_edit['T.HAC'] = request.form.get('T.HAC')
-        param_to_edit['-3S'] = request.form.get('-3S')
-        param_to_edit['-2S'] = request.form.get('-2S')
-        param_to_edit['+2S'] = request.form.get('+2S')
-        param_to_edit['+3S'] = request.form.get('+3S')
-        
-        save_parameters(parameters)
-        flash('Parametre başarıyla güncellendi.', 'success')
+        try:
+            with collection_transaction(PARAMETERS_FILE) as parameters:
+                param_to_edit = next((p for p in parameters if p['id'] == parameter_id), None)
+                if not param_to_edit:
+                    raise RecordNotFound(parameter_id)
+                param_to_edit['Parametre Adı'] = request.form.get('Parametre Adı')
+                param_to_edit['Metot'] = request.form.get('Metot')
+                param_to_edit['İzo Oran'] = request.form.get('İzo Oran')
+                param_to_edit['LOQ'] = request.form.get('LOQ')
+                param_to_edit['KK'] = request.form.get('KK')
+                param_to_edit['1. İmp'] = request.form.get('1. İmp')
+                param_to_edit['2. İmp'] = request.form.get('2. İmp')
+                param_to_edit['3. İmp'] = request.form.get('3. İmp')
+                param_to_edit['4. İmp'] = request.form.get('4. İmp')
+                param_to_edit['L/DAK'] = request.form.get('L/DAK')
+                param_to_edit['Nozzle'] = request.form.get('Nozzle')
+                param_to_edit['T.HAC'] = request.form.get('T.HAC')
+                param_to_edit['-3S'] = request.form.get('-3S')
+                param_to_edit['-2S'] = request.form.get('-2S')
+                param_to_edit['+2S'] = request.form.get('+2S')
+                param_to_edit['+3S'] = request.form.get('+3S')
+        except RecordNotFound:
+            flash('Parametre bulunamadı.', 'danger')
+        else:
+            flash('Parametre başarıyla güncellendi.', 'success')
         return redirect(url_for('parametre'))
 
     return render_template('add_edit_parameter.html', parameter=param_to_edit, username=session.get('username'))
@@ -1689,13 +3365,15 @@ def delete_parameter(parameter_id):
     if not session.get('logged_in') or not can_delete(session.get('role')):
         return redirect(url_for('login'))
 
-    parameters = load_parameters()
-    parameters_to_keep = [p for p in parameters if p['id'] != parameter_id]
-
-    if len(parameters) == len(parameters_to_keep):
+    try:
+        with collection_transaction(PARAMETERS_FILE) as parameters:
+            parameters_to_keep = [p for p in parameters if p['id'] != parameter_id]
+            if len(parameters) == len(parameters_to_keep):
+                raise RecordNotFound(parameter_id)
+            parameters[:] = parameters_to_keep
+    except RecordNotFound:
         flash('Silinecek parametre bulunamadı.', 'danger')
     else:
-        save_parameters(parameters_to_keep)
         flash('Parametre başarıyla silindi.', 'success')
     
     return redirect(url_for('parametre'))
@@ -1704,12 +3382,28 @@ def delete_parameter(parameter_id):
 
 @app.route('/api/ilceler/<il_adi>')
 def api_ilceler(il_adi):
-    # Gelen il adına göre ilçeleri bul ve sadece ilçe adlarını döndür
-    for il in CITIES_DATA:
-        if il['il_adi'].upper() == il_adi.upper():
-            ilceler = [ilce['ilce_adi'] for ilce in il['ilceler']]
-            return jsonify(sorted(ilceler))
-    return jsonify([])
+    # Gelen il adına göre ilçe adlarını döndür (?q= verilirse önek araması)
+    prefix = request.args.get('q', '').strip()
+
+    def build_payload():
+        if prefix:
+            return jsonify(search_ilceler(il_adi, prefix))
+        entry = find_il(il_adi)
+        return jsonify(entry['ilceler'] if entry else [])
+
+    return etag_json_response(_il_ilce_files(), build_payload, cache_control=IL_ILCE_CACHE_CONTROL)
+
+@app.route('/api/iller')
+def api_iller():
+    # İl adları öncelik sırasıyla (?q= verilirse önek araması)
+    prefix = request.args.get('q', '').strip()
+
+    def build_payload():
+        if prefix:
+            return jsonify(search_iller(prefix))
+        return jsonify([il.get('il_adi', '') for il in get_priority_ordered_cities()])
+
+    return etag_json_response(_il_ilce_files(), build_payload, cache_control=IL_ILCE_CACHE_CONTROL)
 
 
 
@@ -1738,7 +3432,7 @@ def olcum_olustur():
         if name and name not in seen:
             unique_param_names.append(name)
             seen.add(name)
-    return render_template('olcum_olustur_simple.html', username=session.get('username'), measurements=measurements, users=user_list, unique_param_names=unique_param_names, CITIES_DATA=CITIES_DATA)
+    return render_template('olcum_olustur_simple.html', username=session.get('username'), measurements=measurements, users=user_list, unique_param_names=unique_param_names, CITIES_DATA=get_cities_data())
 
 @app.route('/add_measurement', methods=['POST'])
 def add_measurement():
@@ -1771,9 +3465,8 @@ def add_measurement():
             'durum': request.form.get('durum', 'Aktif')
         }
         
-        measurements = load_measurements()
-        measurements.append(new_measurement)
-        save_measurements(measurements)
+        with collection_transaction(MEASUREMENTS_FILE) as measurements:
+            measurements.append(new_measurement)
         
         # AJAX/fetch ile gelirse JSON döndür
         if request.headers.get('X-Requested-With') == 'XMLHttpRequest' or request.is_json:
@@ -1807,25 +3500,27 @@ def save_baca_data():
 def edit_measurement(measurement_id):
     if not session.get('logged_in') or not can_edit(session.get('role')):
         return redirect(url_for('login'))
-    measurements = load_measurements()
-    measurement = next((m for m in measurements if m['id'] == measurement_id), None)
-    if not measurement:
-        flash('Ölçüm kaydı bulunamadı.', 'danger')
-        return redirect(url_for('olcum_olustur'))
-    
     # Çoklu personel seçimini al ve virgülle birleştir
     selected_personnel = request.form.getlist('olcumPersoneli')
     personnel_str = ', '.join(selected_personnel) if selected_personnel else ''
     
-    # Formdan gelen verilerle güncelle
-    measurement['firma_adi'] = request.form.get('firmaAdi')
-    measurement['olcum_kodu'] = request.form.get('olcumKodu')
-    measurement['baca_sayisi'] = request.form.get('bacaSayisi')
-    measurement['olcum_baslangic'] = request.form.get('olcumBas')
-    measurement['olcum_bitis'] = request.form.get('olcumBit')
-    measurement['olcumPersoneli'] = personnel_str
-    measurement['tarih'] = request.form.get('olcumBas', '')[:10] if request.form.get('olcumBas') else ''
-    save_measurements(measurements)
+    try:
+        with collection_transaction(MEASUREMENTS_FILE) as measurements:
+            measurement = next((m for m in measurements if m['id'] == measurement_id), None)
+            if not measurement:
+                raise RecordNotFound(measurement_id)
+            
+            # Formdan gelen verilerle güncelle
+            measurement['firma_adi'] = request.form.get('firmaAdi')
+            measurement['olcum_kodu'] = request.form.get('olcumKodu')
+            measurement['baca_sayisi'] = request.form.get('bacaSayisi')
+            measurement['olcum_baslangic'] = request.form.get('olcumBas')
+            measurement['olcum_bitis'] = request.form.get('olcumBit')
+            measurement['olcumPersoneli'] = personnel_str
+            measurement['tarih'] = request.form.get('olcumBas', '')[:10] if request.form.get('olcumBas') else ''
+    except RecordNotFound:
+        flash('Ölçüm kaydı bulunamadı.', 'danger')
+        return redirect(url_for('olcum_olustur'))
     flash('Ölçüm başarıyla güncellendi!', 'success')
     return redirect(url_for('olcum_olustur'))
 
@@ -1835,14 +3530,15 @@ def delete_measurement(measurement_id):
         return jsonify({'error': 'Unauthorized'}), 401
     
     try:
-        measurements = load_measurements()
-        new_measurements = [m for m in measurements if m['id'] != measurement_id]
-        
-        if len(measurements) == len(new_measurements):
-            return jsonify({'error': 'Silinecek ölçüm kaydı bulunamadı'}), 404
-        else:
-            save_measurements(new_measurements)
-            return jsonify({'success': True, 'message': 'Ölçüm başarıyla silindi'}), 200
+        with collection_transaction(MEASUREMENTS_FILE) as measurements:
+            new_measurements = [m for m in measurements if m['id'] != measurement_id]
+            if len(measurements) == len(new_measurements):
+                raise RecordNotFound(measurement_id)
+            measurements[:] = new_measurements
+        return jsonify({'success': True, 'message': 'Ölçüm başarıyla silindi'}), 200
+    
+    except RecordNotFound:
+        return jsonify({'error': 'Silinecek ölçüm kaydı bulunamadı'}), 404
             
     except Exception as e:
         return jsonify({'error': f'Silme işlemi sırasında hata: {str(e)}'}), 500
@@ -1859,18 +3555,19 @@ def delete_selected_measurements():
         if not selected_ids:
             return jsonify({'error': 'Seçilen ölçüm bulunamadı'}), 400
         
-        measurements = load_measurements()
-        original_count = len(measurements)
-        
-        # Seçilen ID'leri sil
-        new_measurements = [m for m in measurements if m['id'] not in selected_ids]
-        
-        if len(new_measurements) < original_count:
-            save_measurements(new_measurements)
-            deleted_count = original_count - len(new_measurements)
-            return jsonify({'success': True, 'message': f'{deleted_count} ölçüm başarıyla silindi'}), 200
-        else:
-            return jsonify({'error': 'Silinecek ölçüm bulunamadı'}), 404
+        with collection_transaction(MEASUREMENTS_FILE) as measurements:
+            original_count = len(measurements)
+            
+            # Seçilen ID'leri sil
+            new_measurements = [m for m in measurements if m['id'] not in selected_ids]
+            if len(new_measurements) == original_count:
+                raise RecordNotFound(selected_ids)
+            measurements[:] = new_measurements
+        deleted_count = original_count - len(new_measurements)
+        return jsonify({'success': True, 'message': f'{deleted_count} ölçüm başarıyla silindi'}), 200
+    
+    except RecordNotFound:
+        return jsonify({'error': 'Silinecek ölçüm bulunamadı'}), 404
             
     except Exception as e:
         return jsonify({'error': f'Silme işlemi sırasında hata: {str(e)}'}), 500
@@ -2096,32 +3793,19 @@ def export_all_measurements():
         flash('Dışarı aktarılacak ölçüm bulunmuyor.', 'warning')
         return redirect(url_for('olcum_olustur'))
     
-    # Ölçüm verilerini DataFrame'e çevir
-    data_list = []
-    for m in measurements:
-        data_list.append({
-            'Firma Adı': m['firma_adi'],
-            'Ölçüm Kodu': m['olcum_kodu'],
-            'Baca Sayısı': m['baca_sayisi'],
-            'Ölçüm Başlangıç': m['olcum_baslangic'],
-            'Ölçüm Bitiş': m['olcum_bitis'],
-            'Personel': m['olcumPersoneli'],
-            'Durum': m['durum'],
-            'Tarih': m['tarih']
-        })
-    
-    df = pd.DataFrame(data_list)
-    
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx') as tmp:
-        df.to_excel(tmp.name, index=False, sheet_name='Tüm Ölçümler', engine='openpyxl')
-        tmp.flush()
-        
-        return send_file(
-            tmp.name,
-            mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            as_attachment=True,
-            download_name='tum_olcumler.xlsx'
-        )
+    columns = [{'header': h} for h in (
+        'Firma Adı', 'Ölçüm Kodu', 'Baca Sayısı', 'Ölçüm Başlangıç',
+        'Ölçüm Bitiş', 'Personel', 'Durum', 'Tarih'
+    )]
+
+    def rows():
+        for m in measurements:
+            yield [
+                m['firma_adi'], m['olcum_kodu'], m['baca_sayisi'], m['olcum_baslangic'],
+                m['olcum_bitis'], m['olcumPersoneli'], m['durum'], m['tarih']
+            ]
+
+    return stream_xlsx_response('tum_olcumler.xlsx', 'Tüm Ölçümler', columns, rows())
 
 @app.route('/import_measurement_data', methods=['POST'])
 def import_measurement_data():
@@ -2140,24 +3824,22 @@ def import_measurement_data():
     if file and file.filename and file.filename.endswith(('.xlsx', '.xls')):
         try:
             df = pd.read_excel(file)
-            measurements = load_measurements()
             
-            # Excel'den gelen verileri ölçümlere uygula
-            for index, row in df.iterrows():
-                # Ölçüm kodu ile eşleşen kaydı bul
-                matching_measurement = next((m for m in measurements if m['olcum_kodu'] == row.get('Ölçüm Kodu', '')), None)
-                
-                if matching_measurement:
-                    # Verileri güncelle
-                    matching_measurement['firma_adi'] = row.get('Firma Adı', matching_measurement['firma_adi'])
-                    matching_measurement['baca_sayisi'] = str(row.get('Baca Sayısı', matching_measurement['baca_sayisi']))
-                    matching_measurement['olcum_baslangic'] = str(row.get('Ölçüm Başlangıç', matching_measurement['olcum_baslangic']))
-                    matching_measurement['olcum_bitis'] = str(row.get('Ölçüm Bitiş', matching_measurement['olcum_bitis']))
-                    matching_measurement['olcumPersoneli'] = str(row.get('Personel', matching_measurement['olcumPersoneli']))
-                    matching_measurement['durum'] = row.get('Durum', matching_measurement['durum'])
-                    matching_measurement['tarih'] = str(row.get('Tarih', matching_measurement['tarih']))
-            
-            save_measurements(measurements)
+            # Excel'den gelen verileri kilit altında güncel ölçümlere uygula
+            with collection_transaction(MEASUREMENTS_FILE) as measurements:
+                for index, row in df.iterrows():
+                    # Ölçüm kodu ile eşleşen kaydı bul
+                    matching_measurement = next((m for m in measurements if m['olcum_kodu'] == row.get('Ölçüm Kodu', '')), None)
+                    
+                    if matching_measurement:
+                        # Verileri güncelle
+                        matching_measurement['firma_adi'] = row.get('Firma Adı', matching_measurement['firma_adi'])
+                        matching_measurement['baca_sayisi'] = str(row.get('Baca Sayısı', matching_measurement['baca_sayisi']))
+                        matching_measurement['olcum_baslangic'] = str(row.get('Ölçüm Başlangıç', matching_measurement['olcum_baslangic']))
+                        matching_measurement['olcum_bitis'] = str(row.get('Ölçüm Bitiş', matching_measurement['olcum_bitis']))
+                        matching_measurement['olcumPersoneli'] = str(row.get('Personel', matching_measurement['olcumPersoneli']))
+                        matching_measurement['durum'] = row.get('Durum', matching_measurement['durum'])
+                        matching_measurement['tarih'] = str(row.get('Tarih', matching_measurement['tarih']))
             flash('Ölçüm verileri başarıyla güncellendi.', 'success')
             
         except Exception as e:
@@ -2268,15 +3950,14 @@ def delete_selected_users():
     if not usernames:
         return jsonify({'success': False, 'error': 'No usernames provided'}), 400
     
-    current_users = load_users()
+    load_users()  # dosya yoksa varsayılan admin ile oluşturulur
     deleted_count = 0
     
-    for username in usernames:
-        if username != 'admin' and username in current_users:
-            del current_users[username]
-            deleted_count += 1
-    
-    save_users(current_users)
+    with collection_transaction(USERS_FILE, default_factory=dict) as current_users:
+        for username in usernames:
+            if username != 'admin' and username in current_users:
+                del current_users[username]
+                deleted_count += 1
     
     if deleted_count > 0:
         flash(f'{deleted_count} kullanıcı başarıyla silindi!', 'success')
@@ -2372,10 +4053,9 @@ def delete_selected_parameters():
     ids = data.get('ids', []) if data else []
     if not ids:
         return jsonify({'success': False, 'error': 'No IDs provided'}), 400
-    parameters = load_parameters()
     print('Silinecek parametre idleri:', ids)
-    new_parameters = [p for p in parameters if str(p.get('id')) not in ids and p.get('id') not in ids]
-    save_parameters(new_parameters)
+    with collection_transaction(PARAMETERS_FILE) as parameters:
+        parameters[:] = [p for p in parameters if str(p.get('id')) not in ids and p.get('id') not in ids]
     return jsonify({'success': True})
 
 @app.route('/add_selected_parameters', methods=['POST'])
@@ -2390,27 +4070,28 @@ def add_selected_parameters():
         return jsonify({'success': False, 'error': 'No IDs provided'}), 400
     
     try:
-        parameters = load_parameters()
-        selected_parameters = [p for p in parameters if str(p.get('id')) in ids or p.get('id') in ids]
-        
-        if not selected_parameters:
-            return jsonify({'success': False, 'error': 'Seçilen parametreler bulunamadı'}), 404
-        
-        # Seçilen parametreleri kopyala ve yeni ID'ler ver
-        new_parameters = []
-        for param in selected_parameters:
-            new_param = param.copy()
-            new_param['id'] = str(uuid4())  # Yeni benzersiz ID
-            new_param['created_at'] = datetime.now().isoformat()
-            new_parameters.append(new_param)
-        
-        # Yeni parametreleri mevcut listeye ekle
-        parameters.extend(new_parameters)
-        save_parameters(parameters)
+        with collection_transaction(PARAMETERS_FILE) as parameters:
+            selected_parameters = [p for p in parameters if str(p.get('id')) in ids or p.get('id') in ids]
+            
+            if not selected_parameters:
+                raise RecordNotFound(ids)
+            
+            # Seçilen parametreleri kopyala ve yeni ID'ler ver
+            new_parameters = []
+            for param in selected_parameters:
+                new_param = param.copy()
+                new_param['id'] = str(uuid4())  # Yeni benzersiz ID
+                new_param['created_at'] = datetime.now().isoformat()
+                new_parameters.append(new_param)
+            
+            # Yeni parametreleri mevcut listeye ekle
+            parameters.extend(new_parameters)
         
         print(f'{len(new_parameters)} adet parametre başarıyla eklendi')
         return jsonify({'success': True, 'message': f'{len(new_parameters)} adet parametre başarıyla eklendi'})
         
+    except RecordNotFound:
+        return jsonify({'success': False, 'error': 'Seçilen parametreler bulunamadı'}), 404
     except Exception as e:
         print(f'Parametre ekleme hatası: {e}')
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -2428,82 +4109,114 @@ def update_parameter_field():
     if not parameter_id or not field:
         return jsonify({'success': False, 'error': 'Missing required fields'}), 400
     
-    parameters = load_parameters()
-    parameter = next((p for p in parameters if str(p.get('id')) == str(parameter_id)), None)
-    
-    if not parameter:
+    try:
+        with collection_transaction(PARAMETERS_FILE) as parameters:
+            parameter = next((p for p in parameters if str(p.get('id')) == str(parameter_id)), None)
+            if not parameter:
+                raise RecordNotFound(parameter_id)
+            
+            # Yeni sütunları güncelle
+            parameter[field] = value
+    except RecordNotFound:
         return jsonify({'success': False, 'error': 'Parameter not found'}), 404
     
-    # Yeni sütunları güncelle
-    parameter[field] = value
-    save_parameters(parameters)
-    
     return jsonify({'success': True})
 
+def _text_column(field, match='contains'):
+    """Sayfalı liste için düz metin kolonu"""
+    return {'value': lambda r: str(r.get(field) or ''), 'match': match}
+
+def _list_amount(value):
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+FIRMA_KAYIT_LIST_COLUMNS = {
+    field: _text_column(field, match='exact' if field in ('il', 'ilce') else 'contains')
+    for field in ('firmaAdi', 'adres', 'il', 'ilce', 'vergiDairesi', 'vergiNo', 'yetkiliAdi', 'yetkiliTel',
+                  'yetkiliMail', 'danismanAdi', 'danismanMail', 'danismanTel', 'kayitTarihi')
+}
+
 @app.route('/firma_kayit')
 def firma_kayit():
     if not session.get('logged_in') or not can_read(session.get('role')):
         return redirect(url_for('login'))
     
-    # Firma kayıt verilerini yükle
-    firma_kayitlar = load_firma_kayit()
-    
-    # İstediğiniz illeri en üste taşı
-    oncelikli_iller = ['KOCAELİ', 'SAKARYA', 'DÜZCE', 'BOLU', 'İSTANBUL', 'BURSA', 'BİLECİK', 'KÜTAHYA']
-    
-    # İlleri öncelik sırasına göre düzenle
-    sirali_cities = []
-    
-    # Önce öncelikli illeri ekle
-    for il_adi in oncelikli_iller:
-        for il in CITIES_DATA:
-            if il['il_adi'] == il_adi:
-                sirali_cities.append(il)
-                break
-    
-    # Sonra diğer illeri ekle
-    for il in CITIES_DATA:
-        if il['il_adi'] not in oncelikli_iller:
-            sirali_cities.append(il)
+    # Öncelikli iller en üstte (liste bir kez derlenir)
+    sirali_cities = get_priority_ordered_cities()
     
+    # Firma satırları sayfa sayfa /api/firma_kayit/list üzerinden yüklenir
     return render_template('firma_kayit.html', 
                          username=session.get('username'), 
                          role=session.get('role'),
-                         cities_data=sirali_cities,
-                         firma_kayitlar=firma_kayitlar)
+                         cities_data=sirali_cities)
+
+@app.route('/api/firma_kayit/list')
+def api_firma_kayit_list():
+    """Firma kayıt tablosu için sayfalı, aranabilir ve sıralanabilir liste"""
+    if not session.get('logged_in') or not can_read(session.get('role')):
+        return jsonify({'error': 'Oturum açmanız gerekiyor'}), 401
+    try:
+        return paged_list_response('firma_kayit', FIRMA_KAYIT_FILE, load_firma_kayit, FIRMA_KAYIT_LIST_COLUMNS,
+                                   search_columns=('firmaAdi', 'adres', 'yetkiliAdi'))
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+def teklif_no_key(t):
+    """Teklif No sıralama anahtarı: önce sıra numarası, sonra yıl"""
+    no = t.get('teklif_no', '') or ''
+    digits = ''.join(ch if ch.isdigit() else ' ' for ch in no).split()
+    year = 0
+    seq = 0
+    try:
+        if digits:
+            year = int(digits[0])
+        if digits:
+            seq = int(digits[-1])  # son sayı dizisi asıl sıra
+    except Exception:
+        pass
+    return (seq, year)
+
+TEKLIF_LIST_COLUMNS = {
+    'teklif_no': {'value': lambda r: str(r.get('teklif_no') or ''), 'sort': teklif_no_key},
+    'firma_adi': _text_column('firma_adi'),
+    'teklif_tipi': _text_column('teklif_tipi', match='exact'),
+    'teklif_tarihi': {'value': lambda r: format_tarih_gg_aa_yyyy(r.get('teklif_tarihi') or ''),
+                      'sort': lambda r: str(r.get('teklif_tarihi') or '')},
+    'toplam': {'value': lambda r: _list_amount(r.get('toplam')), 'sort': lambda r: _list_amount(r.get('toplam'))},
+    'indirim': {'value': lambda r: _list_amount(r.get('indirim')), 'sort': lambda r: _list_amount(r.get('indirim'))},
+    'netToplam': {'value': lambda r: _list_amount(r.get('netToplam')), 'sort': lambda r: _list_amount(r.get('netToplam'))},
+    'teklif_durumu': {'value': lambda r: r.get('teklif_durumu') or 'BEKLEMEDE', 'match': 'exact'},
+    'durum_tarihi': _text_column('durum_tarihi')
+}
 
 @app.route('/teklif')
 def teklif():
     if not session.get('logged_in') or not can_read(session.get('role')):
         return redirect(url_for('login'))
     
-    # Teklif verilerini yükle ve Teklif No'ya göre (büyükten küçüğe) sırala
-    def teklif_no_key(t):
-        no = t.get('teklif_no', '') or ''
-        digits = ''.join(ch if ch.isdigit() else ' ' for ch in no).split()
-        year = 0
-        seq = 0
-        try:
-            if digits:
-                year = int(digits[0])
-            if digits:
-                seq = int(digits[-1])  # son sayı dizisi asıl sıra
-        except Exception:
-            pass
-        # Önce sıra numarasını, sonra yılı büyükten küçüğe sırala
-        return (seq, year)
-
-    teklifler = sorted(load_teklif(), key=teklif_no_key, reverse=True)
-    
     # Firma listesini yükle (firma seçimi için)
     firma_kayitlar = load_firma_kayit()
     
+    # Teklif satırları sayfa sayfa /api/teklif/list üzerinden yüklenir
     return render_template('teklif.html', 
                          username=session.get('username'), 
                          role=session.get('role'),
-                         teklifler=teklifler,
                          firma_kayitlar=firma_kayitlar)
 
+@app.route('/api/teklif/list')
+def api_teklif_list():
+    """Teklif tablosu için sayfalı liste; varsayılan sıralama Teklif No'ya göre büyükten küçüğe"""
+    if not session.get('logged_in') or not can_read(session.get('role')):
+        return jsonify({'error': 'Oturum açmanız gerekiyor'}), 401
+    try:
+        return paged_list_response('teklif', TEKLIF_FILE, load_teklif, TEKLIF_LIST_COLUMNS,
+                                   search_columns=('teklif_no', 'firma_adi'), date_column='teklif_tarihi',
+                                   default_sort='teklif_no', default_descending=True)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/teklif/add', methods=['POST'])
 def add_teklif():
     if not session.get('logged_in'):
@@ -2532,15 +4245,15 @@ def add_teklif():
             'updated_at': datetime.now().isoformat()
         }
         
-        # Mevcut verileri yükle
-        teklifler = load_teklif()
-        teklifler.append(yeni_teklif)
-        
-        # Verileri kaydet
-        if save_teklif(teklifler):
-            return jsonify({'success': True, 'message': 'Teklif başarıyla kaydedildi', 'teklif': yeni_teklif})
-        else:
+        # Kilit altında güncel listeye ekle ve kaydet
+        try:
+            with collection_transaction(TEKLIF_FILE) as teklifler:
+                teklifler.append(yeni_teklif)
+        except OSError as e:
+            print(f"Teklif kaydedilemedi: {e}")
             return jsonify({'success': False, 'message': 'Teklif kaydedilirken hata oluştu'})
+        
+        return jsonify({'success': True, 'message': 'Teklif başarıyla kaydedildi', 'teklif': yeni_teklif})
             
     except Exception as e:
         return jsonify({'success': False, 'message': f'Hata: {str(e)}'})
@@ -2639,25 +4352,24 @@ def add_asgari_fiyat():
         if not yeni_parametre['parametre']:
             return jsonify({'success': False, 'message': 'Parametre adı gerekli'})
         
-        # Dosyadan oku, ekle ve kaydet
-        data_file = load_asgari_fiyatlar()
-        # Aynı parametre varsa güncelle
-        updated = False
-        for item in data_file:
-            if item.get('parametre', '').upper() == yeni_parametre['parametre'].upper():
-                item['metot'] = yeni_parametre.get('metot', item.get('metot', ''))
-                yillik = item.get('yillik', {}) or {}
-                yillik[str(datetime.now().year)] = yeni_parametre['fiyat']
-                item['yillik'] = yillik
-                updated = True
-                break
-        if not updated:
-            data_file.append({
-                'parametre': yeni_parametre['parametre'],
-                'metot': yeni_parametre['metot'],
-                'yillik': { str(datetime.now().year): yeni_parametre['fiyat'] }
-            })
-        save_asgari_fiyatlar(data_file)
+        # Kilit altında oku, ekle ve kaydet
+        with collection_transaction(ASGARI_FIYATLAR_FILE, indent=2) as data_file:
+            # Aynı parametre varsa güncelle
+            updated = False
+            for item in data_file:
+                if item.get('parametre', '').upper() == yeni_parametre['parametre'].upper():
+                    item['metot'] = yeni_parametre.get('metot', item.get('metot', ''))
+                    yillik = item.get('yillik', {}) or {}
+                    yillik[str(datetime.now().year)] = yeni_parametre['fiyat']
+                    item['yillik'] = yillik
+                    updated = True
+                    break
+            if not updated:
+                data_file.append({
+                    'parametre': yeni_parametre['parametre'],
+                    'metot': yeni_parametre['metot'],
+                    'yillik': { str(datetime.now().year): yeni_parametre['fiyat'] }
+                })
         return jsonify({'success': True})
         
     except Exception as e:
@@ -2721,24 +4433,26 @@ def delete_teklif():
         if not teklif_id:
             return jsonify({'success': False, 'message': 'Teklif ID gerekli'})
         
-        teklifler = load_teklif()
-        
-        # Silinecek teklifi bul ve numarasını kaydet
-        silinen_teklif = next((t for t in teklifler if t.get('id') == teklif_id), None)
-        
-        if silinen_teklif and silinen_teklif.get('teklif_no'):
-            # Kullanılmış numaralar listesine ekle (zaten ekliydi ama emin olmak için)
-            used_numbers = load_used_teklif_numbers()
-            used_numbers.add(silinen_teklif['teklif_no'])
-            save_used_teklif_numbers(used_numbers)
-        
-        # Teklifi listeden kaldır
-        teklifler = [t for t in teklifler if t.get('id') != teklif_id]
-        
-        if save_teklif(teklifler):
-            return jsonify({'success': True, 'message': 'Teklif başarıyla silindi ve numarası korundu'})
-        else:
+        # Kilit sırası: teklif → used_teklif_numbers (numara silinen teklifle birlikte korunur)
+        try:
+            with collection_transaction(TEKLIF_FILE) as teklifler:
+                # Silinecek teklifi bul ve numarasını kaydet
+                silinen_teklif = next((t for t in teklifler if t.get('id') == teklif_id), None)
+                
+                if silinen_teklif and silinen_teklif.get('teklif_no'):
+                    # Kullanılmış numaralar listesine ekle (zaten ekliydi ama emin olmak için)
+                    with collection_transaction(USED_TEKLIF_NUMBERS_FILE, indent=2) as used_numbers:
+                        if silinen_teklif['teklif_no'] not in used_numbers:
+                            used_numbers.append(silinen_teklif['teklif_no'])
+                
+                # Teklifi listeden kaldır
+                teklifler[:] = [t for t in teklifler if t.get('id') != teklif_id]
+        except OSError as e:
+            print(f"Teklif silinemedi: {e}")
             return jsonify({'success': False, 'message': 'Teklif silinirken hata oluştu'})
+        
+        invalidate_teklif_cache(teklif_id)
+        return jsonify({'success': True, 'message': 'Teklif başarıyla silindi ve numarası korundu'})
             
     except Exception as e:
         return jsonify({'success': False, 'message': f'Hata: {str(e)}'})
@@ -2756,31 +4470,35 @@ def delete_teklif_bulk():
         if not isinstance(teklif_ids, list) or not teklif_ids:
             return jsonify({'success': False, 'message': 'teklif_ids liste olmalı ve boş olmamalı'})
 
-        teklifler = load_teklif()
         id_set = set(str(x) for x in teklif_ids if x is not None)
-
-        # Silinecek teklif numaralarını used_numbers'a ekle
-        used_numbers = load_used_teklif_numbers()
         deleted_count = 0
 
-        for t in teklifler:
-            try:
-                if str(t.get('id')) in id_set:
-                    deleted_count += 1
-                    teklif_no = t.get('teklif_no')
-                    if teklif_no:
-                        used_numbers.add(teklif_no)
-            except Exception:
-                pass
-
-        save_used_teklif_numbers(used_numbers)
+        # Kilit sırası: teklif → used_teklif_numbers
+        try:
+            with collection_transaction(TEKLIF_FILE) as teklifler:
+                # Silinecek teklif numaralarını used_numbers'a ekle
+                with collection_transaction(USED_TEKLIF_NUMBERS_FILE, indent=2) as used_numbers:
+                    used_set = set(used_numbers)
+                    for t in teklifler:
+                        try:
+                            if str(t.get('id')) in id_set:
+                                deleted_count += 1
+                                teklif_no = t.get('teklif_no')
+                                if teklif_no and teklif_no not in used_set:
+                                    used_set.add(teklif_no)
+                                    used_numbers.append(teklif_no)
+                        except Exception:
+                            pass
 
-        # Teklifleri listeden kaldır
-        teklifler_new = [t for t in teklifler if str(t.get('id')) not in id_set]
+                # Teklifleri listeden kaldır
+                teklifler[:] = [t for t in teklifler if str(t.get('id')) not in id_set]
+        except OSError as e:
+            print(f"Teklifler silinemedi: {e}")
+            return jsonify({'success': False, 'message': 'Teklifler silinirken hata oluştu'})
 
-        if save_teklif(teklifler_new):
-            return jsonify({'success': True, 'message': f'{deleted_count} teklif başarıyla silindi ve numaraları korundu'})
-        return jsonify({'success': False, 'message': 'Teklifler silinirken hata oluştu'})
+        for deleted_id in id_set:
+            invalidate_teklif_cache(deleted_id)
+        return jsonify({'success': True, 'message': f'{deleted_count} teklif başarıyla silindi ve numaraları korundu'})
 
     except Exception as e:
         return jsonify({'success': False, 'message': f'Hata: {str(e)}'})
@@ -2790,7 +4508,7 @@ def load_asgari_fiyatlar():
     """Asgari fiyatları yıllara göre yükler"""
     try:
         with open('asgari_fiyatlar.json', 'r', encoding='utf-8') as f:
-            return json.load(f)
+            return metered_json_load(f)
     except Exception as e:
         print(f"Asgari fiyatlar yüklenirken hata: {e}")
         return []
@@ -3012,34 +4730,39 @@ def update_teklif():
         if not teklif_id:
             return jsonify({'success': False, 'message': 'Teklif ID gerekli'})
         
-        teklifler = load_teklif()
-        teklif = next((t for t in teklifler if t.get('id') == teklif_id), None)
-        
-        if not teklif:
+        # Kilit altında güncel listeden bul ve güncelle (diğer worker'ların eklediği teklifler korunur)
+        try:
+            with collection_transaction(TEKLIF_FILE) as teklifler:
+                teklif = next((t for t in teklifler if t.get('id') == teklif_id), None)
+                
+                if not teklif:
+                    raise RecordNotFound(teklif_id)
+                
+                # Teklifi güncelle
+                teklif.update({
+                    'teklif_tipi': data.get('teklif_tipi', teklif.get('teklif_tipi')),
+                    'firma_adi': data.get('firma_adi', teklif.get('firma_adi')),
+                    'teklif_tarihi': data.get('teklif_tarihi', teklif.get('teklif_tarihi')),
+                    'teklif_no': data.get('teklif_no', teklif.get('teklif_no')),
+                    'indirim_orani': data.get('indirim_orani', teklif.get('indirim_orani')),
+                    'indirim_tipi': data.get('indirim_tipi', teklif.get('indirim_tipi')),
+                    'parametreler': data.get('parametreler', teklif.get('parametreler', [])),
+                    'toplam': data.get('toplam', teklif.get('toplam', 0)),
+                    'indirim': data.get('indirim', teklif.get('indirim', 0)),
+                    'netToplam': data.get('netToplam', teklif.get('netToplam', 0)),
+                    'teklif_giris_metni': data.get('teklif_giris_metni', teklif.get('teklif_giris_metni', '')),
+                    'genel_hukumler': data.get('genel_hukumler', teklif.get('genel_hukumler', '')),
+                    'teklif_durumu': data.get('teklif_durumu', teklif.get('teklif_durumu', 'BEKLEMEDE')),
+                    'updated_at': datetime.now().isoformat()
+                })
+        except RecordNotFound:
             return jsonify({'success': False, 'message': 'Teklif bulunamadı'})
-        
-        # Teklifi güncelle
-        teklif.update({
-            'teklif_tipi': data.get('teklif_tipi', teklif.get('teklif_tipi')),
-            'firma_adi': data.get('firma_adi', teklif.get('firma_adi')),
-            'teklif_tarihi': data.get('teklif_tarihi', teklif.get('teklif_tarihi')),
-            'teklif_no': data.get('teklif_no', teklif.get('teklif_no')),
-            'indirim_orani': data.get('indirim_orani', teklif.get('indirim_orani')),
-            'indirim_tipi': data.get('indirim_tipi', teklif.get('indirim_tipi')),
-            'parametreler': data.get('parametreler', teklif.get('parametreler', [])),
-            'toplam': data.get('toplam', teklif.get('toplam', 0)),
-            'indirim': data.get('indirim', teklif.get('indirim', 0)),
-            'netToplam': data.get('netToplam', teklif.get('netToplam', 0)),
-            'teklif_giris_metni': data.get('teklif_giris_metni', teklif.get('teklif_giris_metni', '')),
-            'genel_hukumler': data.get('genel_hukumler', teklif.get('genel_hukumler', '')),
-            'teklif_durumu': data.get('teklif_durumu', teklif.get('teklif_durumu', 'BEKLEMEDE')),
-            'updated_at': datetime.now().isoformat()
-        })
-        
-        if save_teklif(teklifler):
-            return jsonify({'success': True, 'message': 'Teklif başarıyla güncellendi', 'teklif': teklif})
-        else:
+        except OSError as e:
+            print(f"Teklif güncellenemedi: {e}")
             return jsonify({'success': False, 'message': 'Teklif güncellenirken hata oluştu'})
+        
+        invalidate_teklif_cache(teklif_id)
+        return jsonify({'success': True, 'message': 'Teklif başarıyla güncellendi', 'teklif': teklif})
             
     except Exception as e:
         return jsonify({'success': False, 'message': f'Hata: {str(e)}'})
@@ -3062,22 +4785,26 @@ def update_teklif_status():
         if not yeni_durum:
             return jsonify({'success': False, 'message': 'Yeni durum gerekli'})
         
-        teklifler = load_teklif()
-        teklif = next((t for t in teklifler if t.get('id') == teklif_id), None)
-        
-        if not teklif:
+        try:
+            with collection_transaction(TEKLIF_FILE) as teklifler:
+                teklif = next((t for t in teklifler if t.get('id') == teklif_id), None)
+                
+                if not teklif:
+                    raise RecordNotFound(teklif_id)
+                
+                # Durumu ve durum tarihini güncelle
+                teklif['teklif_durumu'] = yeni_durum
+                if durum_tarihi:
+                    teklif['durum_tarihi'] = durum_tarihi
+                teklif['updated_at'] = datetime.now().isoformat()
+        except RecordNotFound:
             return jsonify({'success': False, 'message': 'Teklif bulunamadı'})
-        
-        # Durumu ve durum tarihini güncelle
-        teklif['teklif_durumu'] = yeni_durum
-        if durum_tarihi:
-            teklif['durum_tarihi'] = durum_tarihi
-        teklif['updated_at'] = datetime.now().isoformat()
-        
-        if save_teklif(teklifler):
-            return jsonify({'success': True, 'message': 'Teklif durumu başarıyla güncellendi', 'teklif': teklif})
-        else:
+        except OSError as e:
+            print(f"Teklif durumu güncellenemedi: {e}")
             return jsonify({'success': False, 'message': 'Teklif durumu güncellenirken hata oluştu'})
+        
+        invalidate_teklif_cache(teklif_id)
+        return jsonify({'success': True, 'message': 'Teklif durumu başarıyla güncellendi', 'teklif': teklif})
             
     except Exception as e:
         return jsonify({'success': False, 'message': f'Hata: {str(e)}'})
@@ -3096,20 +4823,24 @@ def update_teklif_durum_tarihi():
         if not teklif_id:
             return jsonify({'success': False, 'message': 'Teklif ID gerekli'})
         
-        teklifler = load_teklif()
-        teklif = next((t for t in teklifler if t.get('id') == teklif_id), None)
-        
-        if not teklif:
+        try:
+            with collection_transaction(TEKLIF_FILE) as teklifler:
+                teklif = next((t for t in teklifler if t.get('id') == teklif_id), None)
+                
+                if not teklif:
+                    raise RecordNotFound(teklif_id)
+                
+                # Sadece durum tarihini güncelle
+                teklif['durum_tarihi'] = durum_tarihi
+                teklif['updated_at'] = datetime.now().isoformat()
+        except RecordNotFound:
             return jsonify({'success': False, 'message': 'Teklif bulunamadı'})
-        
-        # Sadece durum tarihini güncelle
-        teklif['durum_tarihi'] = durum_tarihi
-        teklif['updated_at'] = datetime.now().isoformat()
-        
-        if save_teklif(teklifler):
-            return jsonify({'success': True, 'message': 'Durum tarihi başarıyla güncellendi', 'teklif': teklif})
-        else:
+        except OSError as e:
+            print(f"Durum tarihi güncellenemedi: {e}")
             return jsonify({'success': False, 'message': 'Durum tarihi güncellenirken hata oluştu'})
+        
+        invalidate_teklif_cache(teklif_id)
+        return jsonify({'success': True, 'message': 'Durum tarihi başarıyla güncellendi', 'teklif': teklif})
             
     except Exception as e:
         return jsonify({'success': False, 'message': f'Hata: {str(e)}'})
@@ -3140,15 +4871,15 @@ def add_firma_kayit():
             'kayitTarihi': datetime.now().strftime('%d.%m.%Y')
         }
         
-        # Mevcut verileri yükle
-        firma_kayitlar = load_firma_kayit()
-        firma_kayitlar.append(yeni_firma)
-        
-        # Verileri kaydet
-        if save_firma_kayit(firma_kayitlar):
-            return jsonify({'success': True, 'message': 'Firma başarıyla kaydedildi', 'firma': yeni_firma})
-        else:
+        # Kilit altında güncel listeye ekle ve kaydet
+        try:
+            with collection_transaction(FIRMA_KAYIT_FILE) as firma_kayitlar:
+                firma_kayitlar.append(yeni_firma)
+        except OSError as e:
+            print(f"Firma kaydedilemedi: {e}")
             return jsonify({'success': False, 'message': 'Firma kaydedilirken hata oluştu'})
+        
+        return jsonify({'success': True, 'message': 'Firma başarıyla kaydedildi', 'firma': yeni_firma})
             
     except Exception as e:
         return jsonify({'success': False, 'message': f'Hata: {str(e)}'})
@@ -3160,35 +4891,33 @@ def update_firma_kayit():
     
     try:
         data = request.get_json()
-        firma_id = data.get('id')
-        
-        # Mevcut verileri yükle
-        firma_kayitlar = load_firma_kayit()
-        
-        # Firma bul ve güncelle
-        for firma in firma_kayitlar:
-            if firma.get('id') == firma_id:
-                firma.update({
-                    'firmaAdi': data.get('firmaAdi', ''),
-                    'adres': data.get('adres', ''),
-                    'il': data.get('il', ''),
-                    'ilce': data.get('ilce', ''),
-                    'vergiDairesi': data.get('vergiDairesi', ''),
-                    'vergiNo': data.get('vergiNo', ''),
-                    'yetkiliAdi': data.get('yetkiliAdi', ''),
-                    'yetkiliTel': data.get('yetkiliTel', ''),
-                    'yetkiliMail': data.get('yetkiliMail', ''),
-                    'danismanAdi': data.get('danismanAdi', ''),
-                    'danismanMail': data.get('danismanMail', ''),
-                    'danismanTel': data.get('danismanTel', '')
-                })
-                break
+        firma_id = data.get('id')
         
-        # Verileri kaydet
-        if save_firma_kayit(firma_kayitlar):
-            return jsonify({'success': True, 'message': 'Firma başarıyla güncellendi'})
-        else:
+        # Kilit altında güncel listede firmayı bul ve güncelle
+        try:
+            with collection_transaction(FIRMA_KAYIT_FILE) as firma_kayitlar:
+                for firma in firma_kayitlar:
+                    if firma.get('id') == firma_id:
+                        firma.update({
+                            'firmaAdi': data.get('firmaAdi', ''),
+                            'adres': data.get('adres', ''),
+                            'il': data.get('il', ''),
+                            'ilce': data.get('ilce', ''),
+                            'vergiDairesi': data.get('vergiDairesi', ''),
+                            'vergiNo': data.get('vergiNo', ''),
+                            'yetkiliAdi': data.get('yetkiliAdi', ''),
+                            'yetkiliTel': data.get('yetkiliTel', ''),
+                            'yetkiliMail': data.get('yetkiliMail', ''),
+                            'danismanAdi': data.get('danismanAdi', ''),
+                            'danismanMail': data.get('danismanMail', ''),
+                            'danismanTel': data.get('danismanTel', '')
+                        })
+                        break
+        except OSError as e:
+            print(f"Firma güncellenemedi: {e}")
             return jsonify({'success': False, 'message': 'Firma güncellenirken hata oluştu'})
+        
+        return jsonify({'success': True, 'message': 'Firma başarıyla güncellendi'})
             
     except Exception as e:
         return jsonify({'success': False, 'message': f'Hata: {str(e)}'})
@@ -3202,17 +4931,15 @@ def delete_firma_kayit():
         data = request.get_json()
         firma_id = data.get('id')
         
-        # Mevcut verileri yükle
-        firma_kayitlar = load_firma_kayit()
-        
-        # Firma bul ve sil
-        firma_kayitlar = [firma for firma in firma_kayitlar if firma.get('id') != firma_id]
-        
-        # Verileri kaydet
-        if save_firma_kayit(firma_kayitlar):
-            return jsonify({'success': True, 'message': 'Firma başarıyla silindi'})
-        else:
+        # Kilit altında güncel listeden firmayı sil
+        try:
+            with collection_transaction(FIRMA_KAYIT_FILE) as firma_kayitlar:
+                firma_kayitlar[:] = [firma for firma in firma_kayitlar if firma.get('id') != firma_id]
+        except OSError as e:
+            print(f"Firma silinemedi: {e}")
             return jsonify({'success': False, 'message': 'Firma silinirken hata oluştu'})
+        
+        return jsonify({'success': True, 'message': 'Firma başarıyla silindi'})
             
     except Exception as e:
         return jsonify({'success': False, 'message': f'Hata: {str(e)}'})
@@ -3229,25 +4956,23 @@ def import_firma_kayit():
         if not imported_firmalar:
             return jsonify({'success': False, 'message': 'İçe aktarılacak firma verisi bulunamadı'})
         
-        # Mevcut verileri yükle
-        firma_kayitlar = load_firma_kayit()
-        
-        # Yeni firmaları ekle
-        for firma in imported_firmalar:
-            # ID kontrolü - eğer aynı ID varsa yeni ID oluştur
-            if any(existing_firma.get('id') == firma.get('id') for existing_firma in firma_kayitlar):
-                firma['id'] = str(uuid.uuid4())
-            firma_kayitlar.append(firma)
-        
-        # Verileri kaydet
-        if save_firma_kayit(firma_kayitlar):
-            return jsonify({
-                'success': True, 
-                'message': f'{len(imported_firmalar)} adet firma başarıyla içe aktarıldı',
-                'imported_count': len(imported_firmalar)
-            })
-        else:
+        # Kilit altında güncel listeye yeni firmaları ekle
+        try:
+            with collection_transaction(FIRMA_KAYIT_FILE) as firma_kayitlar:
+                for firma in imported_firmalar:
+                    # ID kontrolü - eğer aynı ID varsa yeni ID oluştur
+                    if any(existing_firma.get('id') == firma.get('id') for existing_firma in firma_kayitlar):
+                        firma['id'] = str(uuid.uuid4())
+                    firma_kayitlar.append(firma)
+        except OSError as e:
+            print(f"Firmalar içe aktarılamadı: {e}")
             return jsonify({'success': False, 'message': 'Firmalar içe aktarılırken hata oluştu'})
+        
+        return jsonify({
+            'success': True, 
+            'message': f'{len(imported_firmalar)} adet firma başarıyla içe aktarıldı',
+            'imported_count': len(imported_firmalar)
+        })
             
     except Exception as e:
         return jsonify({'success': False, 'message': f'Hata: {str(e)}'})
@@ -3257,25 +4982,50 @@ def firma_olcum():
     if not session.get('logged_in') or not can_read(session.get('role')):
         return redirect(url_for('login'))
     
-    firma_olcumler = load_firma_olcum()
-    
-    # Tarihleri GG.AA.YY formatında formatla
-    for olcum in firma_olcumler:
-        # Tarihleri GG.AA.YY formatında formatla
-        if 'baslangic_tarihi' in olcum and olcum['baslangic_tarihi']:
-            olcum['baslangic_tarihi'] = format_date_with_day(olcum['baslangic_tarihi'])
-        if 'bitis_tarihi' in olcum and olcum['bitis_tarihi']:
-            olcum['bitis_tarihi'] = format_date_with_day(olcum['bitis_tarihi'])
-    
     # Parametreleri yükle
     parameters = load_parameters()
     
+    # Ölçüm satırları sayfa sayfa /api/firma_olcum/list üzerinden yüklenir
     return render_template('firma_olcum.html', 
-                         firma_olcumler=firma_olcumler, 
                          username=session.get('username'), 
                          role=session.get('role'),
                          parameters=parameters)
 
+def _joined_column(field):
+    """Liste alanını virgülle birleştirilmiş metin olarak gösterir"""
+    return {'value': lambda r: ', '.join(str(v) for v in (r.get(field) or [])), 'match': 'contains'}
+
+def _date_with_day_column(field):
+    # Görüntü GG.AA.YY (GÜN), sıralama ham ISO tarih
+    return {'value': lambda r: format_date_with_day(r.get(field)) if r.get(field) else '',
+            'sort': lambda r: str(r.get(field) or '')}
+
+FIRMA_OLCUM_LIST_COLUMNS = {
+    'firma_adi': _text_column('firma_adi'),
+    'olcum_kodu': _text_column('olcum_kodu'),
+    'baslangic_tarihi': _date_with_day_column('baslangic_tarihi'),
+    'bitis_tarihi': _date_with_day_column('bitis_tarihi'),
+    'baca_sayisi': _text_column('baca_sayisi'),
+    'parametreler': _joined_column('parametreler'),
+    'personel': _joined_column('personel'),
+    'il': _text_column('il'),
+    'ilce': _text_column('ilce'),
+    'yetkili': _text_column('yetkili'),
+    'telefon': _text_column('telefon'),
+    'durum': _text_column('durum', match='exact')
+}
+
+@app.route('/api/firma_olcum/list')
+def api_firma_olcum_list():
+    """Firma ölçüm tablosu için sayfalı, aranabilir ve sıralanabilir liste"""
+    if not session.get('logged_in') or not can_read(session.get('role')):
+        return jsonify({'error': 'Oturum açmanız gerekiyor'}), 401
+    try:
+        return paged_list_response('firma_olcum', FIRMA_OLCUM_FILE, load_firma_olcum, FIRMA_OLCUM_LIST_COLUMNS,
+                                   search_columns=('firma_adi', 'olcum_kodu'))
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/firma_olcum/add_step1', methods=['GET', 'POST'])
 def add_firma_olcum_step1():
     if not session.get('logged_in'):
@@ -3326,23 +5076,8 @@ def add_firma_olcum_step1():
                 'gorev': user_data.get('gorev', '')
             })
     
-    # İstediğiniz illeri en üste taşı
-    oncelikli_iller = ['KOCAELİ', 'SAKARYA', 'DÜZCE', 'BOLU', 'İSTANBUL', 'BURSA', 'BİLECİK', 'KÜTAHYA']
-    
-    # İlleri öncelik sırasına göre düzenle
-    sirali_cities = []
-    
-    # Önce öncelikli illeri ekle
-    for il_adi in oncelikli_iller:
-        for il in CITIES_DATA:
-            if il['il_adi'] == il_adi:
-                sirali_cities.append(il)
-                break
-    
-    # Sonra diğer illeri ekle
-    for il in CITIES_DATA:
-        if il['il_adi'] not in oncelikli_iller:
-            sirali_cities.append(il)
+    # Öncelikli iller en üstte (liste bir kez derlenir)
+    sirali_cities = get_priority_ordered_cities()
     
     # Firma listesini yükle ve formatını düzenle
     firma_kayitlar = load_firma_kayit()
@@ -3427,10 +5162,12 @@ def add_firma_olcum_step2():
                 'olusturma_tarihi': datetime.now().isoformat()
             }
             
-            # Veriyi kaydet
-            firma_olcumler = load_firma_olcum()
-            firma_olcumler.append(yeni_kayit)
-            if not save_firma_olcum(firma_olcumler):
+            # Kilit altında güncel listeye ekle ve kaydet
+            try:
+                with collection_transaction(FIRMA_OLCUM_FILE) as firma_olcumler:
+                    firma_olcumler.append(yeni_kayit)
+            except OSError as e:
+                print(f"Firma ölçüm kaydedilemedi: {e}")
                 raise Exception('Veriler kaydedilemedi')
             
             # Session'dan geçici veriyi temizle
@@ -3527,19 +5264,22 @@ def delete_firma_olcum(olcum_id):
         return jsonify({'success': False, 'error': 'Yetkisiz erişim'}), 401
     
     try:
-        firma_olcumler = load_firma_olcum()
-        olcum = next((o for o in firma_olcumler if o['id'] == olcum_id), None)
-        
-        if not olcum:
+        try:
+            with collection_transaction(FIRMA_OLCUM_FILE) as firma_olcumler:
+                olcum = next((o for o in firma_olcumler if o['id'] == olcum_id), None)
+                
+                if not olcum:
+                    raise RecordNotFound(olcum_id)
+                
+                # Kaydı sil
+                firma_olcumler[:] = [o for o in firma_olcumler if o['id'] != olcum_id]
+        except RecordNotFound:
             return jsonify({'success': False, 'error': 'Ölçüm kaydı bulunamadı'}), 404
-        
-        # Kaydı sil
-        firma_olcumler = [o for o in firma_olcumler if o['id'] != olcum_id]
-        
-        if save_firma_olcum(firma_olcumler):
-            return jsonify({'success': True, 'message': 'Ölçüm kaydı başarıyla silindi'})
-        else:
+        except OSError as e:
+            print(f"Ölçüm kaydı silinemedi: {e}")
             return jsonify({'success': False, 'error': 'Kayıt silinirken hata oluştu'}), 500
+        
+        return jsonify({'success': True, 'message': 'Ölçüm kaydı başarıyla silindi'})
             
     except Exception as e:
         print(f"Silme hatası: {e}")
@@ -3557,17 +5297,18 @@ def delete_selected_firma_olcum():
         if not ids:
             return jsonify({'success': False, 'error': 'Silinecek kayıt seçilmedi'}), 400
         
-        firma_olcumler = load_firma_olcum()
-        original_count = len(firma_olcumler)
-        
-        # Seçilen kayıtları sil
-        firma_olcumler = [o for o in firma_olcumler if o['id'] not in ids]
-        
-        if save_firma_olcum(firma_olcumler):
-            deleted_count = original_count - len(firma_olcumler)
-            return jsonify({'success': True, 'message': f'{deleted_count} kayıt başarıyla silindi'})
-        else:
+        try:
+            with collection_transaction(FIRMA_OLCUM_FILE) as firma_olcumler:
+                original_count = len(firma_olcumler)
+                
+                # Seçilen kayıtları sil
+                firma_olcumler[:] = [o for o in firma_olcumler if o['id'] not in ids]
+                deleted_count = original_count - len(firma_olcumler)
+        except OSError as e:
+            print(f"Ölçüm kayıtları silinemedi: {e}")
             return jsonify({'success': False, 'error': 'Kayıtlar silinirken hata oluştu'}), 500
+        
+        return jsonify({'success': True, 'message': f'{deleted_count} kayıt başarıyla silindi'})
             
     except Exception as e:
         print(f"Toplu silme hatası: {e}")
@@ -3610,7 +5351,7 @@ def edit_firma_olcum(olcum_id):
                                      username=session.get('username'), 
                                      role=session.get('role'),
                                      olcum=olcum,
-                                     cities=CITIES_DATA)
+                                     cities=get_cities_data())
             
             # JSON'dan baca parametrelerini parse et
             try:
@@ -3618,27 +5359,34 @@ def edit_firma_olcum(olcum_id):
             except json.JSONDecodeError:
                 baca_parametreleri = {}
             
-            # Kaydı güncelle
-            olcum['firma_adi'] = firma_adi
-            olcum['olcum_kodu'] = olcum_kodu
-            olcum['baslangic_tarihi'] = baslangic_tarihi
-            olcum['bitis_tarihi'] = bitis_tarihi
-            olcum['il'] = il
-            olcum['ilce'] = ilce
-            olcum['yetkili'] = yetkili
-            olcum['telefon'] = telefon
-            olcum['durum'] = durum
-            olcum['personel'] = secilen_personel
-            olcum['baca_sayisi'] = baca_sayisi
-            olcum['baca_parametreleri'] = baca_parametreleri
-            olcum['notlar'] = notlar
-            
-            # Veriyi kaydet
-            if save_firma_olcum(firma_olcumler):
-                flash('Firma ölçüm kaydı başarıyla güncellendi!', 'success')
+            # Kaydı kilit altında güncel listede güncelle (diğer worker'ların kayıtları korunur)
+            try:
+                with collection_transaction(FIRMA_OLCUM_FILE) as firma_olcumler:
+                    olcum = next((o for o in firma_olcumler if o['id'] == olcum_id), None)
+                    if not olcum:
+                        raise RecordNotFound(olcum_id)
+                    olcum['firma_adi'] = firma_adi
+                    olcum['olcum_kodu'] = olcum_kodu
+                    olcum['baslangic_tarihi'] = baslangic_tarihi
+                    olcum['bitis_tarihi'] = bitis_tarihi
+                    olcum['il'] = il
+                    olcum['ilce'] = ilce
+                    olcum['yetkili'] = yetkili
+                    olcum['telefon'] = telefon
+                    olcum['durum'] = durum
+                    olcum['personel'] = secilen_personel
+                    olcum['baca_sayisi'] = baca_sayisi
+                    olcum['baca_parametreleri'] = baca_parametreleri
+                    olcum['notlar'] = notlar
+            except RecordNotFound:
+                flash('Ölçüm kaydı bulunamadı!', 'error')
                 return redirect(url_for('firma_olcum'))
-            else:
+            except OSError as e:
+                print(f"Firma ölçüm güncellenemedi: {e}")
                 flash('Kayıt güncellenirken hata oluştu!', 'error')
+            else:
+                flash('Firma ölçüm kaydı başarıyla güncellendi!', 'success')
+                return redirect(url_for('firma_olcum'))
                 
         except Exception as e:
             print(f"Güncelleme hatası: {e}")
@@ -3655,23 +5403,8 @@ def edit_firma_olcum(olcum_id):
                 'gorev': user_data.get('gorev', '')
             })
     
-    # İstediğiniz illeri en üste taşı
-    oncelikli_iller = ['KOCAELİ', 'SAKARYA', 'DÜZCE', 'BOLU', 'İSTANBUL', 'BURSA', 'BİLECİK', 'KÜTAHYA']
-    
-    # İlleri öncelik sırasına göre düzenle
-    sirali_cities = []
-    
-    # Önce öncelikli illeri ekle
-    for il_adi in oncelikli_iller:
-        for il in CITIES_DATA:
-            if il['il_adi'] == il_adi:
-                sirali_cities.append(il)
-                break
-    
-    # Sonra diğer illeri ekle
-    for il in CITIES_DATA:
-        if il['il_adi'] not in oncelikli_iller:
-            sirali_cities.append(il)
+    # Öncelikli iller en üstte (liste bir kez derlenir)
+    sirali_cities = get_priority_ordered_cities()
     
     # Parametreleri yükle
     parameters = load_parameters()
@@ -4376,6 +6109,7 @@ def create_kk_excel_report(parametre, gercek_veriler, kk, minus_3s, minus_2s, pl
         print(f"KK Excel rapor oluşturma hatası: {e}")
         return jsonify({'error': f'Excel rapor oluşturulurken hata oluştu: {str(e)}'}), 500
 
+@report_timer('kk_word')
 def create_kk_word_report(parametre, gercek_veriler, kk, minus_3s, minus_2s, plus_2s, plus_3s, ortalama, standart_sapma, min_deger, max_deger, tarih_baslangic, tarih_bitis):
     """KK Word raporu oluştur"""
     try:
@@ -4653,7 +6387,7 @@ def create_kk_pdf_report(parametre, gercek_veriler, kk, minus_3s, minus_2s, plus
 @app.route('/api/firmalar')
 def api_firmalar():
     """Firma listesini döndür"""
-    try:
+    def build():
         firma_olcumler = load_firma_olcum()
         firmalar = []
         firma_adi_set = set()
@@ -4664,13 +6398,16 @@ def api_firmalar():
                 firma_adi_set.add(olcum['firma_adi'])
         
         return jsonify(firmalar)
+
+    try:
+        return etag_json_response([FIRMA_OLCUM_FILE], build)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/olcum_kodlari/<firma_adi>')
 def api_olcum_kodlari(firma_adi):
     """Belirli firma için ölçüm kodlarını döndür"""
-    try:
+    def build():
         firma_olcumler = load_firma_olcum()
         olcum_kodlari = []
         olcum_kodu_set = set()
@@ -4683,6 +6420,9 @@ def api_olcum_kodlari(firma_adi):
                 olcum_kodu_set.add(olcum['olcum_kodu'])
         
         return jsonify(olcum_kodlari)
+
+    try:
+        return etag_json_response([FIRMA_OLCUM_FILE], build)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -4735,8 +6475,8 @@ def api_parametre_listesi(firma_adi, olcum_kodu, baca_adi):
 def api_baca_bilgileri():
     """Kaydedilen baca bilgileri listesini döndürür."""
     try:
-        saved_baca_bilgileri = load_baca_bilgileri()
-        return jsonify(saved_baca_bilgileri)
+        return etag_json_response([BACA_BILGILERI_FILE], lambda: list_query_response(
+            load_baca_bilgileri(), ('id', 'firma_adi', 'olcum_kodu', 'baca_adi', 'personel_adi')))
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -4758,104 +6498,57 @@ def export_baca_bilgileri_excel():
         if not filtered_data:
             return jsonify({'error': 'Dışa aktarılacak veri bulunamadı'}), 404
         
-        # Excel için DataFrame oluştur - baca_bilgileri objesi içindeki verileri doğru şekilde map et
-        df_data = []
-        for item in filtered_data:
-            # Baca bilgileri objesini al
-            baca_bilgileri = item.get('baca_bilgileri', {})
-            
-            # UUID'leri alan adlarına map et - gerçek UUID'leri kullan
-            field_mapping = {
-                '597fad80-d28f-40ea-bd28-a76c61c5203d': 'BACA NO',
-                'ddca398d-0e55-4662-b661-3731e0975bd2': 'YAKIT TÜRÜ',
-                '22867c9a-ca3c-4d80-b017-b73dafdd7fef': 'ISIL GÜÇ (MW)',
-                '6b3546e0-184c-49de-82e4-e2835e81923b': 'ÇATI ŞEKLİ',
-                '98399625-5bbc-465e-8e09-de454f231ae4': 'KAYNAK TÜRÜ',
-                'd9958774-43f7-4bc3-8e12-436614a6193a': 'BACA ŞEKLİ',
-                'b1b6fc38-98c0-4048-8b8e-795cf7d44c48': 'BACA ÖLÇÜSÜ',
-                '6a301d72-f21b-485b-b8fb-116ad5cb223f': 'YERDEN YÜK.',
-                '8ec9ecc9-ecda-4bf2-9802-02fa2e3fda4c': 'ÇATI YÜK',
-                'ab2b67dd-16a5-4bee-9b6e-b60b8cfc2d0c': 'RÜZGAR HIZ (M/S)',
-                'eca60e54-ec39-4412-8884-caa17faed0be': 'ORT. SIC.',
-                '64238e0a-6387-4c31-9bf4-d7f800ef17e1': 'ORT. NEM',
-                'b09ad69a-e4d4-4219-b055-2cf923ffd499': 'ORT. BAS.',
-                '9c8c8bcf-c98e-4109-8b10-63b08b26460e': 'A BACA',
-                'af55c55f-f83b-4b90-a655-ee76bf6bb2ac': 'B BACA',
-                '20881447-f7c8-4a6b-8583-76c7246082ef': 'C DELİK'
-            }
-            
-            # Temel alanlar
-            row = {
-                'Firma': item.get('firma_adi', ''),
-                'Ölçüm Kodu': item.get('olcum_kodu', ''),
-                'Baca': item.get('baca_adi', ''),
-            }
-            
-            # Baca bilgileri objesindeki her UUID için değeri al
-            for uuid, field_name in field_mapping.items():
-                value = baca_bilgileri.get(uuid, '')
-                if value and value.strip() != '':
-                    row[field_name] = value
-                else:
-                    row[field_name] = '*'
-            
-            # Ek alanlar
-            created_at = item.get('created_at', '')
-            updated_at = item.get('updated_at', '')
-            
-            # Tarih formatını düzelt
-            if created_at:
-                try:
-                    created_date = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                    created_at = created_date.strftime('%d.%m.%Y %H:%M')
-                except:
-                    created_at = created_at
-            
-            if updated_at:
-                try:
-                    updated_date = datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
-                    updated_at = updated_date.strftime('%d.%m.%Y %H:%M')
-                except:
-                    updated_at = updated_at
-            
-            row.update({
-                'Fotoğraf': item.get('photo_path', '') or '*',
-                'Kayıt Tarihi': created_at or '*',
-                'Güncelleme Tarihi': updated_at or '*'
-            })
-            
-            df_data.append(row)
-        
-        df = pd.DataFrame(df_data)
-        
-        # Geçici dosya oluştur
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx') as tmp_file:
-            # Excel dosyasını oluştur
-            with pd.ExcelWriter(tmp_file.name, engine='openpyxl') as writer:
-                df.to_excel(writer, index=False, sheet_name='Baca Bilgileri')
-                
-                # Sütun genişliklerini ayarla
-                worksheet = writer.sheets['Baca Bilgileri']
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    adjusted_width = min(max_length + 2, 50)  # Maksimum 50 karakter
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
-            
-            tmp_file_path = tmp_file.name
-        
-        # Dosyayı gönder
-        return send_file(
-            tmp_file_path,
-            as_attachment=True,
-            download_name=f'baca_bilgileri_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx',
-            mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+        # UUID'leri alan adlarına map et - gerçek UUID'leri kullan
+        field_mapping = {
+            '597fad80-d28f-40ea-bd28-a76c61c5203d': 'BACA NO',
+            'ddca398d-0e55-4662-b661-3731e0975bd2': 'YAKIT TÜRÜ',
+            '22867c9a-ca3c-4d80-b017-b73dafdd7fef': 'ISIL GÜÇ (MW)',
+            '6b3546e0-184c-49de-82e4-e2835e81923b': 'ÇATI ŞEKLİ',
+            '98399625-5bbc-465e-8e09-de454f231ae4': 'KAYNAK TÜRÜ',
+            'd9958774-43f7-4bc3-8e12-436614a6193a': 'BACA ŞEKLİ',
+            'b1b6fc38-98c0-4048-8b8e-795cf7d44c48': 'BACA ÖLÇÜSÜ',
+            '6a301d72-f21b-485b-b8fb-116ad5cb223f': 'YERDEN YÜK.',
+            '8ec9ecc9-ecda-4bf2-9802-02fa2e3fda4c': 'ÇATI YÜK',
+            'ab2b67dd-16a5-4bee-9b6e-b60b8cfc2d0c': 'RÜZGAR HIZ (M/S)',
+            'eca60e54-ec39-4412-8884-caa17faed0be': 'ORT. SIC.',
+            '64238e0a-6387-4c31-9bf4-d7f800ef17e1': 'ORT. NEM',
+            'b09ad69a-e4d4-4219-b055-2cf923ffd499': 'ORT. BAS.',
+            '9c8c8bcf-c98e-4109-8b10-63b08b26460e': 'A BACA',
+            'af55c55f-f83b-4b90-a655-ee76bf6bb2ac': 'B BACA',
+            '20881447-f7c8-4a6b-8583-76c7246082ef': 'C DELİK'
+        }
+
+        headers = ['Firma', 'Ölçüm Kodu', 'Baca'] + list(field_mapping.values()) + \
+            ['Fotoğraf', 'Kayıt Tarihi', 'Güncelleme Tarihi']
+        columns = [{'header': h} for h in headers]
+
+        def format_tarih(value):
+            if not value:
+                return value
+            try:
+                return datetime.fromisoformat(value.replace('Z', '+00:00')).strftime('%d.%m.%Y %H:%M')
+            except Exception:
+                return value
+
+        def rows():
+            for item in filtered_data:
+                # Baca bilgileri objesini al
+                baca_bilgileri = item.get('baca_bilgileri', {})
+                row = [item.get('firma_adi', ''), item.get('olcum_kodu', ''), item.get('baca_adi', '')]
+                # Baca bilgileri objesindeki her UUID için değeri al
+                for uuid in field_mapping:
+                    value = baca_bilgileri.get(uuid, '')
+                    row.append(value if value and value.strip() != '' else '*')
+                row.extend([
+                    item.get('photo_path', '') or '*',
+                    format_tarih(item.get('created_at', '')) or '*',
+                    format_tarih(item.get('updated_at', '')) or '*'
+                ])
+                yield row
+
+        return stream_xlsx_response(
+            f'baca_bilgileri_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx',
+            'Baca Bilgileri', columns, rows()
         )
     
     except Exception as e:
@@ -5026,9 +6719,6 @@ def import_baca_bilgileri_excel():
         if missing_columns:
             return jsonify({'error': f'Eksik sütunlar: {", ".join(missing_columns)}'}), 400
         
-        # Mevcut baca bilgilerini yükle
-        existing_data = load_baca_bilgileri()
-        
         # Yeni kayıtları ekle - baca_bilgileri objesi formatında
         new_records = []
         for index, row in df.iterrows():
@@ -5093,18 +6783,19 @@ def import_baca_bilgileri_excel():
             except Exception as row_error:
                 return jsonify({'error': f'Satır {index + 1} işlenirken hata: {str(row_error)}'}), 400
         
-        # Yeni kayıtları mevcut veriye ekle
-        existing_data.extend(new_records)
-        
-        # Veriyi kaydet
-        if save_baca_bilgileri(existing_data):
-            return jsonify({
-                'success': True,
-                'message': f'{len(new_records)} kayıt başarıyla içe aktarıldı',
-                'imported_count': len(new_records)
-            })
-        else:
+        # Yeni kayıtları kilit altında güncel veriye ekle
+        try:
+            with collection_transaction(BACA_BILGILERI_FILE) as existing_data:
+                existing_data.extend(new_records)
+        except OSError as e:
+            print(f"Baca bilgileri kaydedilemedi: {e}")
             return jsonify({'error': 'Veriler kaydedilemedi'}), 500
+        
+        return jsonify({
+            'success': True,
+            'message': f'{len(new_records)} kayıt başarıyla içe aktarıldı',
+            'imported_count': len(new_records)
+        })
     
     except Exception as e:
         return jsonify({'error': f'Excel içe aktarma hatası: {str(e)}'}), 500
@@ -5113,27 +6804,23 @@ def import_baca_bilgileri_excel():
 def api_delete_baca_bilgileri(record_id):
     """Belirtilen ID'ye sahip baca bilgilerini siler."""
     try:
-        saved_baca_bilgileri = load_baca_bilgileri()
-        
-        # Kaydı bul
-        record_index = None
-        for i, record in enumerate(saved_baca_bilgileri):
-            if record.get('id') == record_id:
-                record_index = i
-                break
+        deleted_record = None
+        try:
+            with collection_transaction(BACA_BILGILERI_FILE) as saved_baca_bilgileri:
+                # Kaydı bul ve sil
+                for i, record in enumerate(saved_baca_bilgileri):
+                    if record.get('id') == record_id:
+                        deleted_record = saved_baca_bilgileri.pop(i)
+                        break
+        except OSError as e:
+            print(f"Baca bilgileri kaydedilemedi: {e}")
+            return jsonify({'success': False, 'error': 'Veriler kaydedilemedi'}), 500
         
-        if record_index is None:
+        if deleted_record is None:
             return jsonify({'success': False, 'error': 'Kayıt bulunamadı'}), 404
         
-        # Kaydı sil
-        deleted_record = saved_baca_bilgileri.pop(record_index)
-        
-        # Dosyaya kaydet
-        if save_baca_bilgileri(saved_baca_bilgileri):
-            print(f"Baca bilgileri silindi: {deleted_record.get('firma_adi')} - {deleted_record.get('olcum_kodu')} - {deleted_record.get('baca_adi')}")
-            return jsonify({'success': True, 'message': 'Baca bilgileri başarıyla silindi'})
-        else:
-            return jsonify({'success': False, 'error': 'Veriler kaydedilemedi'}), 500
+        print(f"Baca bilgileri silindi: {deleted_record.get('firma_adi')} - {deleted_record.get('olcum_kodu')} - {deleted_record.get('baca_adi')}")
+        return jsonify({'success': True, 'message': 'Baca bilgileri başarıyla silindi'})
             
     except Exception as e:
         print(f"Baca bilgileri silinirken hata: {e}")
@@ -5174,9 +6861,6 @@ def save_parametre_olcum_old():
         if not all([firma_adi, olcum_kodu, baca_adi, parametre_adi, olcum_sonucu, olcum_birimi]):
             return jsonify({'success': False, 'error': 'Eksik bilgi'})
         
-        # Saha ölçüm verilerini yükle
-        saha_olc_data = load_saha_olc()
-        
         # Yeni ölçüm kaydı
         new_olcum = {
             'id': str(uuid4()),
@@ -5192,18 +6876,19 @@ def save_parametre_olcum_old():
             'created_at': datetime.now().isoformat()
         }
         
-        # Veriyi ekle
-        saha_olc_data.append(new_olcum)
-        
-        # Dosyaya kaydet
-        if save_saha_olc(saha_olc_data):
-            print(f"Parametre ölçümü kaydedildi: {firma_adi} - {olcum_kodu} - {baca_adi} - {parametre_adi}")
-            return jsonify({
-                'success': True, 
-                'message': 'Parametre ölçümü başarıyla kaydedildi'
-            })
-        else:
+        # Kilit altında güncel listeye ekle ve kaydet
+        try:
+            with collection_transaction(SAHA_OLC_FILE) as saha_olc_data:
+                saha_olc_data.append(new_olcum)
+        except OSError as e:
+            print(f"Saha ölçüm verileri kaydedilemedi: {e}")
             return jsonify({'success': False, 'error': 'Veriler kaydedilemedi'}), 500
+        
+        print(f"Parametre ölçümü kaydedildi: {firma_adi} - {olcum_kodu} - {baca_adi} - {parametre_adi}")
+        return jsonify({
+            'success': True, 
+            'message': 'Parametre ölçümü başarıyla kaydedildi'
+        })
             
     except Exception as e:
         print(f"Parametre ölçümü kaydedilirken hata: {e}")
@@ -5224,9 +6909,6 @@ def save_parametre_olcum_saha():
         
         parametre_verileri = json.loads(parametre_verileri_json)
         
-        # Mevcut parametre ölçümlerini yükle
-        saved_parametre_olcum = load_parametre_olcum()
-        
         # İlgili baca bilgisinden personel adını bul (parametre ölçümü için varsayılan)
         personel_adi_default = ''
         try:
@@ -5255,33 +6937,35 @@ def save_parametre_olcum_saha():
             'updated_at': datetime.now().isoformat()
         }
         
-        # Aynı firma-ölçüm-baca-parametre kombinasyonu varsa güncelle, yoksa ekle
-        record_found = False
-        for i, record in enumerate(saved_parametre_olcum):
-            if (record.get('firma_adi') == firma_adi and 
-                record.get('olcum_kodu') == olcum_kodu and 
-                record.get('baca_adi') == baca_adi and
-                record.get('parametre_adi') == parametre_adi):
-                # Mevcut kaydı güncelle
-                new_record['id'] = record.get('id', str(uuid4()))
-                new_record['created_at'] = record.get('created_at', datetime.now().isoformat())
-                saved_parametre_olcum[i] = new_record
-                record_found = True
-                break
-        
-        if not record_found:
-            # Yeni kayıt ekle
-            saved_parametre_olcum.append(new_record)
-        
-        # Dosyaya kaydet
-        if save_parametre_olcum(saved_parametre_olcum):
-            print(f"Parametre ölçümü kaydedildi: {firma_adi} - {olcum_kodu} - {baca_adi} - {parametre_adi}")
-            return jsonify({
-                'success': True, 
-                'message': 'Parametre ölçümü başarıyla kaydedildi'
-            })
-        else:
+        # Kilit altında güncel listeyi okuyup kaydet (diğer worker'ların kayıtları kaybolmaz)
+        try:
+            with collection_transaction(PARAMETRE_OLCUM_FILE) as saved_parametre_olcum:
+                # Aynı firma-ölçüm-baca-parametre kombinasyonu varsa güncelle, yoksa ekle
+                record_found = False
+                for i, record in enumerate(saved_parametre_olcum):
+                    if (record.get('firma_adi') == firma_adi and 
+                        record.get('olcum_kodu') == olcum_kodu and 
+                        record.get('baca_adi') == baca_adi and
+                        record.get('parametre_adi') == parametre_adi):
+                        # Mevcut kaydı güncelle
+                        new_record['id'] = record.get('id', str(uuid4()))
+                        new_record['created_at'] = record.get('created_at', datetime.now().isoformat())
+                        saved_parametre_olcum[i] = new_record
+                        record_found = True
+                        break
+                
+                if not record_found:
+                    # Yeni kayıt ekle
+                    saved_parametre_olcum.append(new_record)
+        except OSError as e:
+            print(f"Parametre ölçümü kaydedilemedi: {e}")
             return jsonify({'success': False, 'error': 'Veriler kaydedilemedi'}), 500
+        
+        print(f"Parametre ölçümü kaydedildi: {firma_adi} - {olcum_kodu} - {baca_adi} - {parametre_adi}")
+        return jsonify({
+            'success': True, 
+            'message': 'Parametre ölçümü başarıyla kaydedildi'
+        })
             
     except Exception as e:
         print(f"Parametre ölçümü kaydedilirken hata: {e}")
@@ -5292,7 +6976,7 @@ def api_parametre_olcumleri():
     """Tüm parametre ölçümlerini döndürür."""
     try:
         parametre_olcumleri = load_parametre_olcum()
-        return jsonify(parametre_olcumleri)
+        return list_query_response(parametre_olcumleri, ('id', 'firma_adi', 'olcum_kodu', 'baca_adi', 'parametre_adi', 'personel_adi'))
     except Exception as e:
         print(f"Parametre ölçümleri yüklenirken hata: {e}")
         return jsonify([])
@@ -5307,29 +6991,237 @@ def api_bulk_delete_parametre_olcumleri():
         if not ids_to_delete:
             return jsonify({'success': False, 'error': 'Silinecek kayıt seçilmedi'})
         
-        # Mevcut parametre ölçümlerini yükle
-        parametre_olcumleri = load_parametre_olcum()
-        
-        # Silinecek kayıtları filtrele
-        original_count = len(parametre_olcumleri)
-        parametre_olcumleri = [record for record in parametre_olcumleri if record.get('id') not in ids_to_delete]
-        deleted_count = original_count - len(parametre_olcumleri)
-        
-        # Dosyaya kaydet
-        if save_parametre_olcum(parametre_olcumleri):
-            print(f"Parametre ölçümleri toplu silindi: {deleted_count} kayıt")
-            return jsonify({
-                'success': True, 
-                'message': f'{deleted_count} adet parametre ölçümü başarıyla silindi',
-                'deleted_count': deleted_count
-            })
-        else:
+        try:
+            with collection_transaction(PARAMETRE_OLCUM_FILE) as parametre_olcumleri:
+                # Silinecek kayıtları filtrele
+                original_count = len(parametre_olcumleri)
+                parametre_olcumleri[:] = [record for record in parametre_olcumleri if record.get('id') not in ids_to_delete]
+                deleted_count = original_count - len(parametre_olcumleri)
+        except OSError as e:
+            print(f"Parametre ölçümleri kaydedilemedi: {e}")
             return jsonify({'success': False, 'error': 'Veriler kaydedilemedi'})
+        
+        print(f"Parametre ölçümleri toplu silindi: {deleted_count} kayıt")
+        return jsonify({
+            'success': True, 
+            'message': f'{deleted_count} adet parametre ölçümü başarıyla silindi',
+            'deleted_count': deleted_count
+        })
             
     except Exception as e:
         print(f"Parametre ölçümleri toplu silme hatası: {e}")
         return jsonify({'success': False, 'error': str(e)})
 
+# Baca fotoğrafları: orijinal, yüklenen içeriğin sha256'sından türeyen adla bir kez saklanır (aynı
+# fotoğraf ikinci kez yüklenirse mevcut dosya kullanılır). Orijinal baytlar olduğu gibi korunur;
+# EXIF (GPS konumu dahil) taşıyabildiği için /photo/... ve /static/uploads/photos yalnızca oturum
+# açmış kullanıcılara sunulur. Web boyutu ve küçük resim varyantları arka plan thread'inde üretilir:
+# EXIF yönü uygulanır, metadata atılır.
+# Sayfalar /photo/<varyant>/<photo_path> kullanır; varyant henüz yoksa orijinal döner ve
+# üretim kuyruğa alınır (eski adlandırmayla yüklenmiş fotoğraflar da böylece varyant kazanır).
+# Üretimi başarısız olan fotoğraf, dosya değişmedikçe yeniden kuyruğa alınmaz.
+PHOTOS_DIR = os.path.join(app.root_path, 'static', 'uploads', 'photos')
+PHOTO_URL_PREFIX = 'uploads/photos/'
+PHOTO_VARIANTS = {'web': 1600, 'thumb': 240}  # Uzun kenar (piksel)
+PHOTO_VARIANT_QUALITY = {'web': 82, 'thumb': 75}
+PHOTO_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp'}
+PHOTO_HASH_LENGTH = 32
+
+def _photo_source_path(photo_path):
+    """Kayıttaki photo_path'i (uploads/photos/...) PHOTOS_DIR içindeki dosya yoluna çevirir"""
+    rel = str(photo_path or '').replace('\\', '/')
+    if rel.startswith(PHOTO_URL_PREFIX):
+        rel = rel[len(PHOTO_URL_PREFIX):]
+    if not rel or '/' in rel or rel.startswith('.'):
+        return None
+    return os.path.join(PHOTOS_DIR, rel)
+
+def photo_variant_file(source_path, variant):
+    """Varyant dosya yolu: <PHOTOS_DIR>/<varyant>/<orijinal adın kökü>.jpg"""
+    stem = os.path.splitext(os.path.basename(source_path))[0]
+    return os.path.join(PHOTOS_DIR, variant, f'{stem}.jpg')
+
+def store_photo_upload(file_storage):
+    """Yüklenen fotoğrafı akış halinde hash'leyerek saklar; 'uploads/photos/<ad>' döner"""
+    os.makedirs(PHOTOS_DIR, exist_ok=True)
+    ext = os.path.splitext(file_storage.filename or '')[1].lower()
+    if ext not in PHOTO_EXTENSIONS:
+        ext = '.jpg'
+    digest = hashlib.sha256()
+    fd, tmp_path = tempfile.mkstemp(dir=PHOTOS_DIR, prefix='.upload-', suffix=ext)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            while True:
+                chunk = file_storage.stream.read(1024 * 1024)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                f.write(chunk)
+        filename = f'{digest.hexdigest()[:PHOTO_HASH_LENGTH]}{ext}'
+        target = os.path.join(PHOTOS_DIR, filename)
+        if os.path.exists(target):
+            print(f"Fotoğraf zaten kayıtlı, tekrar yazılmadı: {filename}")
+        else:
+            os.replace(tmp_path, target)
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+    photo_worker.enqueue(target)
+    return f'{PHOTO_URL_PREFIX}{filename}'
+
+def open_oriented_rgb_image(source_path):
+    """Görseli EXIF yönü uygulanmış RGB olarak açar (saydam alanlar beyaz). Pillow yoksa ImportError."""
+    from PIL import Image, ImageOps
+
+    with Image.open(source_path) as img:
+        img = ImageOps.exif_transpose(img)
+        if img.mode in ('RGBA', 'LA', 'P'):
+            img = img.convert('RGBA')
+            background = Image.new('RGB', img.size, (255, 255, 255))
+            background.paste(img, mask=img.getchannel('A'))
+            return background
+        return img.convert('RGB') if img.mode != 'RGB' else img.copy()
+
+def save_jpeg_atomic(img, path, quality):
+    """JPEG'i geçici dosyaya yazıp yerine taşır; exif verilmediği için metadata yazılmaz"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            img.save(f, 'JPEG', quality=quality, optimize=True, progressive=True)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+def generate_photo_variants(source_path):
+    """Eksik/eski varyantları üretir; {varyant: yol} döner. Pillow yoksa ImportError yükselir."""
+    from PIL import Image
+
+    source_mtime = os.path.getmtime(source_path)
+    pending = {v: photo_variant_file(source_path, v) for v in PHOTO_VARIANTS}
+    pending = {v: p for v, p in pending.items()
+               if not (os.path.exists(p) and os.path.getmtime(p) >= source_mtime)}
+    if pending:
+        img = open_oriented_rgb_image(source_path)
+        # Büyükten küçüğe: her varyant bir öncekinden küçültülür
+        for variant in sorted(pending, key=lambda v: -PHOTO_VARIANTS[v]):
+            size = PHOTO_VARIANTS[variant]
+            img.thumbnail((size, size), Image.LANCZOS)
+            save_jpeg_atomic(img, pending[variant], PHOTO_VARIANT_QUALITY[variant])
+    return {v: photo_variant_file(source_path, v) for v in PHOTO_VARIANTS}
+
+class PhotoVariantWorker:
+    """Varyant üretim kuyruğu. Thread ilk işte (worker sürecinde) başlatılır; fork güvenlidir."""
+
+    def __init__(self):
+        self._queue = None
+        self._pending = set()
+        # Üretimi başarısız olan kaynaklar: yol -> o andaki mtime_ns (dosya değişmedikçe denenmez)
+        self._failed = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+        self.processed = 0
+        self.failed = 0
+        self.last_error = None
+        self.last_duration_ms = None
+
+    def _ensure_thread(self):
+        if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():
+            return
+        import queue
+        self._queue = queue.Queue()
+        self._pending = set()
+        self._pid = os.getpid()
+        self._thread = threading.Thread(target=self._run, name='photo-variants', daemon=True)
+        self._thread.start()
+
+    @staticmethod
+    def _mtime_ns(source_path):
+        try:
+            return os.stat(source_path).st_mtime_ns
+        except OSError:
+            return None
+
+    def enqueue(self, source_path):
+        if source_path in self._failed and self._failed[source_path] == self._mtime_ns(source_path):
+            return False
+        with self._lock:
+            self._ensure_thread()
+            if source_path in self._pending:
+                return False
+            self._pending.add(source_path)
+            self._queue.put(source_path)
+            return True
+
+    def _run(self):
+        work_queue = self._queue
+        while True:
+            source_path = work_queue.get()
+            started = time.perf_counter()
+            try:
+                generate_photo_variants(source_path)
+                self.processed += 1
+                self._failed.pop(source_path, None)
+            except ImportError:
+                self.failed += 1
+                self.last_error = 'Pillow kurulu değil; varyant üretilemiyor'
+                self._failed[source_path] = self._mtime_ns(source_path)
+            except Exception as e:
+                self.failed += 1
+                self.last_error = f'{os.path.basename(source_path)}: {e}'
+                self._failed[source_path] = self._mtime_ns(source_path)
+                print(f"Fotoğraf varyantı üretilemedi ({source_path}): {e}")
+            finally:
+                self.last_duration_ms = round((time.perf_counter() - started) * 1000, 2)
+                with self._lock:
+                    self._pending.discard(source_path)
+                work_queue.task_done()
+
+    def wait(self, timeout=30):
+        """Kuyruk boşalana kadar bekler (betikler/denetim için)"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with self._lock:
+                if not self._pending:
+                    return True
+            time.sleep(0.05)
+        return False
+
+    def status(self):
+        return {
+            'pending': len(self._pending),
+            'processed': self.processed,
+            'failed': self.failed,
+            'failed_photos': len(self._failed),
+            'last_error': self.last_error,
+            'last_duration_ms': self.last_duration_ms
+        }
+
+photo_worker = PhotoVariantWorker()
+
+@app.route('/photo/<variant>/<path:photo_path>')
+def serve_photo_variant(variant, photo_path):
+    """Fotoğrafın web/thumb varyantı; hazır değilse orijinal (önbelleğe alınmadan) döner"""
+    if not session.get('logged_in'):
+        abort(401)
+    if variant not in PHOTO_VARIANTS and variant != 'original':
+        abort(404)
+    source_path = _photo_source_path(photo_path)
+    if not source_path or not os.path.isfile(source_path):
+        abort(404)
+    if variant != 'original':
+        variant_path = photo_variant_file(source_path, variant)
+        if os.path.isfile(variant_path) and os.path.getmtime(variant_path) >= os.path.getmtime(source_path):
+            response = send_file(variant_path, mimetype='image/jpeg', conditional=True)
+            response.headers['Cache-Control'] = f'private, max-age={STATIC_IMMUTABLE_MAX_AGE}, immutable'
+            return response
+        photo_worker.enqueue(source_path)
+    response = send_file(source_path, conditional=True)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
 @app.route('/save_baca_bilgileri_saha', methods=['POST'])
 def save_baca_bilgileri_saha():
     """Saha ölçümü için baca bilgilerini kaydeder."""
@@ -5353,21 +7245,8 @@ def save_baca_bilgileri_saha():
         if 'photo' in request.files:
             photo = request.files['photo']
             if photo and photo.filename:
-                # Fotoğraf klasörü oluştur
-                photo_dir = os.path.join(app.root_path, 'static', 'uploads', 'photos')
-                os.makedirs(photo_dir, exist_ok=True)
-                
-                # Benzersiz dosya adı oluştur
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                filename = f"{firma_adi}_{olcum_kodu}_{baca_adi}_{timestamp}.jpg"
-                photo_path = os.path.join(photo_dir, filename)
-                
-                # Fotoğrafı kaydet
-                photo.save(photo_path)
-                photo_path = f"uploads/photos/{filename}"  # Web erişimi için relative path
-        
-        # Mevcut baca bilgilerini yükle
-        saved_baca_bilgileri = load_baca_bilgileri()
+                # Orijinal içerik hash'iyle saklanır; web/küçük resim varyantları arka planda üretilir
+                photo_path = store_photo_upload(photo)  # Web erişimi için relative path
         
         # Kaydedilecek yeni veri
         new_record = {
@@ -5382,45 +7261,49 @@ def save_baca_bilgileri_saha():
             'updated_at': datetime.now().isoformat()
         }
         
-        # Eğer güncelleme ise, mevcut kaydı bul ve güncelle
-        if is_edit:
-            record_found = False
-            for i, record in enumerate(saved_baca_bilgileri):
-                if (record.get('firma_adi') == firma_adi and 
-                    record.get('olcum_kodu') == olcum_kodu and 
-                    record.get('baca_adi') == baca_adi):
-                    # Mevcut kaydı güncelle
-                    new_record['id'] = record.get('id', str(uuid4()))
-                    new_record['created_at'] = record.get('created_at', datetime.now().isoformat())
-                    # Fotoğraf değişmemişse eski fotoğrafı koru
-                    if not photo_path:
-                        new_record['photo_path'] = record.get('photo_path')
-                    saved_baca_bilgileri[i] = new_record
-                    record_found = True
-                    break
-            
-            if not record_found:
-                # Kayıt bulunamadıysa yeni kayıt olarak ekle
-                saved_baca_bilgileri.append(new_record)
-        else:
-            # Yeni kayıt ekle
-            saved_baca_bilgileri.append(new_record)
+        # Baca kaydı ve personel güncellemesi tek birim: yedek/anlık görüntü ikisini birlikte görür
+        with collection_group():
+            # Kilit altında güncel listeyi okuyup kaydet (diğer worker'ların kayıtları kaybolmaz)
+            try:
+                with collection_transaction(BACA_BILGILERI_FILE) as saved_baca_bilgileri:
+                    # Eğer güncelleme ise, mevcut kaydı bul ve güncelle
+                    if is_edit:
+                        record_found = False
+                        for i, record in enumerate(saved_baca_bilgileri):
+                            if (record.get('firma_adi') == firma_adi and 
+                                record.get('olcum_kodu') == olcum_kodu and 
+                                record.get('baca_adi') == baca_adi):
+                                # Mevcut kaydı güncelle
+                                new_record['id'] = record.get('id', str(uuid4()))
+                                new_record['created_at'] = record.get('created_at', datetime.now().isoformat())
+                                # Fotoğraf değişmemişse eski fotoğrafı koru
+                                if not photo_path:
+                                    new_record['photo_path'] = record.get('photo_path')
+                                saved_baca_bilgileri[i] = new_record
+                                record_found = True
+                                break
+                    
+                        if not record_found:
+                            # Kayıt bulunamadıysa yeni kayıt olarak ekle
+                            saved_baca_bilgileri.append(new_record)
+                    else:
+                        # Yeni kayıt ekle
+                        saved_baca_bilgileri.append(new_record)
+            except OSError as e:
+                print(f"Baca bilgileri kaydedilemedi: {e}")
+                return jsonify({'success': False, 'error': 'Veriler kaydedilemedi'})
         
-        # Baca bilgilerini dosyaya kaydet
-        if save_baca_bilgileri(saved_baca_bilgileri):
             print(f"Baca bilgileri kaydedildi: {firma_adi} - {olcum_kodu} - {baca_adi}")
-            
+        
             # Personel adı değiştiyse, o bacaya ait parametre ölçüm kayıtlarını güncelle
             if personel_adi:
                 update_parametre_olcum_personel(firma_adi, olcum_kodu, baca_adi, personel_adi)
-            
-            return jsonify({
-                'success': True, 
-                'message': 'Baca bilgileri başarıyla kaydedildi',
-                'photo_path': photo_path
-            })
-        else:
-            return jsonify({'success': False, 'error': 'Veriler kaydedilemedi'})
+        
+        return jsonify({
+            'success': True, 
+            'message': 'Baca bilgileri başarıyla kaydedildi',
+            'photo_path': photo_path
+        })
         
     except Exception as e:
         print(f"Baca bilgileri kaydetme hatası: {str(e)}")
@@ -5429,24 +7312,20 @@ def save_baca_bilgileri_saha():
 def update_parametre_olcum_personel(firma_adi, olcum_kodu, baca_adi, personel_adi):
     """Baca bilgilerinde personel adı değiştiğinde, o bacaya ait parametre ölçüm kayıtlarını günceller."""
     try:
-        # Mevcut parametre ölçüm kayıtlarını yükle
-        parametre_olcumleri = load_parametre_olcum()
-        
         # Güncellenen kayıt sayısı
         updated_count = 0
         
-        # O bacaya ait tüm parametre ölçüm kayıtlarını bul ve güncelle
-        for record in parametre_olcumleri:
-            if (record.get('firma_adi') == firma_adi and 
-                record.get('olcum_kodu') == olcum_kodu and 
-                record.get('baca_adi') == baca_adi):
-                # Personel adını güncelle
-                record['personel_adi'] = personel_adi
-                updated_count += 1
+        with collection_transaction(PARAMETRE_OLCUM_FILE) as parametre_olcumleri:
+            # O bacaya ait tüm parametre ölçüm kayıtlarını bul ve güncelle
+            for record in parametre_olcumleri:
+                if (record.get('firma_adi') == firma_adi and 
+                    record.get('olcum_kodu') == olcum_kodu and 
+                    record.get('baca_adi') == baca_adi):
+                    # Personel adını güncelle
+                    record['personel_adi'] = personel_adi
+                    updated_count += 1
         
-        # Güncellenmiş verileri kaydet
         if updated_count > 0:
-            save_parametre_olcum(parametre_olcumleri)
             print(f"Parametre ölçüm kayıtları güncellendi: {updated_count} kayıt - {firma_adi} - {olcum_kodu} - {baca_adi} - Personel: {personel_adi}")
         else:
             print(f"Güncellenecek parametre ölçüm kaydı bulunamadı: {firma_adi} - {olcum_kodu} - {baca_adi}")
@@ -5460,9 +7339,6 @@ def sync_all_parametre_personel():
         # Baca bilgilerini yükle
         baca_bilgileri = load_baca_bilgileri()
         
-        # Parametre ölçümlerini yükle
-        parametre_olcumleri = load_parametre_olcum()
-        
         # Firma + Ölçüm kodu -> Personel adı eşleştirmesi
         personel_map = {}
         for baca in baca_bilgileri:
@@ -5479,25 +7355,25 @@ def sync_all_parametre_personel():
         # Güncellenen kayıt sayısı
         updated_count = 0
         
-        # Tüm parametre ölçüm kayıtlarını güncelle
-        for record in parametre_olcumleri:
-            firma = record.get('firma_adi', '').strip()
-            olcum = record.get('olcum_kodu', '').strip()
-            
-            if firma and olcum:
-                key = f"{firma}||{olcum}"
-                if key in personel_map:
-                    # Personel adını güncelle
-                    record['personel_adi'] = personel_map[key]
-                    updated_count += 1
+        # Tüm parametre ölçüm kayıtlarını kilit altında güncelle (değişiklik yoksa yazılmaz)
+        with collection_transaction(PARAMETRE_OLCUM_FILE) as parametre_olcumleri:
+            for record in parametre_olcumleri:
+                firma = record.get('firma_adi', '').strip()
+                olcum = record.get('olcum_kodu', '').strip()
+                
+                if firma and olcum:
+                    key = f"{firma}||{olcum}"
+                    if key in personel_map:
+                        # Personel adını güncelle
+                        record['personel_adi'] = personel_map[key]
+                        updated_count += 1
+            if updated_count == 0:
+                raise RecordNotFound(PARAMETRE_OLCUM_FILE)
         
-        # Güncellenmiş verileri kaydet
-        if updated_count > 0:
-            save_parametre_olcum(parametre_olcumleri)
-            print(f"Tüm parametre ölçüm kayıtları senkronize edildi: {updated_count} kayıt")
-        else:
-            print("Senkronize edilecek kayıt bulunamadı")
+        print(f"Tüm parametre ölçüm kayıtları senkronize edildi: {updated_count} kayıt")
             
+    except RecordNotFound:
+        print("Senkronize edilecek kayıt bulunamadı")
     except Exception as e:
         print(f"Parametre ölçüm kayıtları senkronize edilirken hata: {str(e)}")
 
@@ -5516,27 +7392,24 @@ def cleanup_orphaned_parametre_personel():
         
         print(f"Geçerli personel isimleri: {valid_personel}")
         
-        # Parametre ölçümlerini yükle
-        parametre_olcumleri = load_parametre_olcum()
-        
         # Temizlenen kayıt sayısı
         cleaned_count = 0
         
-        # Geçersiz personel isimlerini temizle
-        for record in parametre_olcumleri:
-            current_personel = record.get('personel_adi', '').strip()
-            if current_personel and current_personel not in valid_personel:
-                print(f"Geçersiz personel ismi temizleniyor: {current_personel} -> (boş)")
-                record['personel_adi'] = ''
-                cleaned_count += 1
-        
-        # Temizlenmiş verileri kaydet
-        if cleaned_count > 0:
-            save_parametre_olcum(parametre_olcumleri)
-            print(f"Geçersiz personel isimleri temizlendi: {cleaned_count} kayıt")
-        else:
-            print("Temizlenecek geçersiz personel ismi bulunamadı")
+        # Geçersiz personel isimlerini kilit altında temizle (değişiklik yoksa yazılmaz)
+        with collection_transaction(PARAMETRE_OLCUM_FILE) as parametre_olcumleri:
+            for record in parametre_olcumleri:
+                current_personel = record.get('personel_adi', '').strip()
+                if current_personel and current_personel not in valid_personel:
+                    print(f"Geçersiz personel ismi temizleniyor: {current_personel} -> (boş)")
+                    record['personel_adi'] = ''
+                    cleaned_count += 1
+            if cleaned_count == 0:
+                raise RecordNotFound(PARAMETRE_OLCUM_FILE)
+        
+        print(f"Geçersiz personel isimleri temizlendi: {cleaned_count} kayıt")
             
+    except RecordNotFound:
+        print("Temizlenecek geçersiz personel ismi bulunamadı")
     except Exception as e:
         print(f"Geçersiz personel isimleri temizlenirken hata: {str(e)}")
 
@@ -5666,19 +7539,19 @@ def save_parametre_sahabil():
                     'isdl': request.form.get(f'isdl_{i}')
                 }
         
-        # Parametre sahabil verilerini yükle
-        parametre_sahabil_data = load_parametre_sahabil()
-        parametre_sahabil_data.append(olcum_data)
-        
-        # Dosyaya kaydet
-        if save_parametre_sahabil(parametre_sahabil_data):
-            print(f"Parametre sahabil ölçümü kaydedildi: {parametre_adi}")
-            return jsonify({
-                'success': True, 
-                'message': 'Parametre ölçümü başarıyla kaydedildi'
-            })
-        else:
+        # Kilit altında güncel listeye ekle ve kaydet
+        try:
+            with collection_transaction(PARAMETRE_SAHABIL_FILE) as parametre_sahabil_data:
+                parametre_sahabil_data.append(olcum_data)
+        except OSError as e:
+            print(f"Parametre sahabil verileri kaydedilemedi: {e}")
             return jsonify({'success': False, 'error': 'Veriler kaydedilemedi'}), 500
+        
+        print(f"Parametre sahabil ölçümü kaydedildi: {parametre_adi}")
+        return jsonify({
+            'success': True, 
+            'message': 'Parametre ölçümü başarıyla kaydedildi'
+        })
             
     except Exception as e:
         print(f"Parametre sahabil ölçümü kaydedilirken hata: {e}")
@@ -5741,7 +7614,7 @@ def api_parametre_sahabil_list():
     """Parametre sahabil ölçümlerini döndürür."""
     try:
         parametre_sahabil_data = load_parametre_sahabil()
-        return jsonify(parametre_sahabil_data)
+        return list_query_response(parametre_sahabil_data, ('id', 'firma_adi', 'olcum_kodu', 'baca_adi', 'parametre_adi'))
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -5749,15 +7622,15 @@ def api_parametre_sahabil_list():
 def delete_parametre_sahabil(record_id):
     """Parametre sahabil ölçümünü siler."""
     try:
-        parametre_sahabil_data = load_parametre_sahabil()
-        
-        # Kaydı bul ve sil
-        parametre_sahabil_data = [record for record in parametre_sahabil_data if record.get('id') != record_id]
-        
-        if save_parametre_sahabil(parametre_sahabil_data):
-            return jsonify({'success': True, 'message': 'Kayıt başarıyla silindi'})
-        else:
+        # Kaydı kilit altında bul ve sil
+        try:
+            with collection_transaction(PARAMETRE_SAHABIL_FILE) as parametre_sahabil_data:
+                parametre_sahabil_data[:] = [record for record in parametre_sahabil_data if record.get('id') != record_id]
+        except OSError as e:
+            print(f"Parametre sahabil verileri kaydedilemedi: {e}")
             return jsonify({'success': False, 'error': 'Veriler kaydedilemedi'}), 500
+        
+        return jsonify({'success': True, 'message': 'Kayıt başarıyla silindi'})
             
     except Exception as e:
         print(f"Parametre sahabil silme hatası: {e}")
@@ -5773,15 +7646,15 @@ def delete_selected_parametre_sahabil():
         if not selected_ids:
             return jsonify({'success': False, 'error': 'Seçilen kayıt bulunamadı'})
         
-        parametre_sahabil_data = load_parametre_sahabil()
-        
-        # Seçilen kayıtları sil
-        parametre_sahabil_data = [record for record in parametre_sahabil_data if record.get('id') not in selected_ids]
-        
-        if save_parametre_sahabil(parametre_sahabil_data):
-            return jsonify({'success': True, 'message': f'{len(selected_ids)} kayıt başarıyla silindi'})
-        else:
+        # Seçilen kayıtları kilit altında sil
+        try:
+            with collection_transaction(PARAMETRE_SAHABIL_FILE) as parametre_sahabil_data:
+                parametre_sahabil_data[:] = [record for record in parametre_sahabil_data if record.get('id') not in selected_ids]
+        except OSError as e:
+            print(f"Parametre sahabil verileri kaydedilemedi: {e}")
             return jsonify({'success': False, 'error': 'Veriler kaydedilemedi'}), 500
+        
+        return jsonify({'success': True, 'message': f'{len(selected_ids)} kayıt başarıyla silindi'})
             
     except Exception as e:
         print(f"Seçilen parametre sahabil silme hatası: {e}")
@@ -5808,10 +7681,8 @@ def import_parametre_sahabil():
         # Excel dosyasını oku
         df = pd.read_excel(file)
         
-        # Mevcut parametre sahabil verilerini yükle
-        parametre_sahabil_data = load_parametre_sahabil()
-        
         # Excel verilerini parametre sahabil formatına dönüştür
+        new_records = []
         imported_count = 0
         print(f"Excel dosyası okundu. Toplam satır: {len(df)}")
         
@@ -5846,17 +7717,21 @@ def import_parametre_sahabil():
                     'created_at': datetime.now().isoformat()
                 }
                 
-                parametre_sahabil_data.append(new_record)
+                new_records.append(new_record)
                 imported_count += 1
         
-        # Verileri kaydet
-        if save_parametre_sahabil(parametre_sahabil_data):
-            return jsonify({
-                'success': True, 
-                'message': f'{imported_count} adet parametre ölçümü başarıyla içe aktarıldı'
-            })
-        else:
+        # Yeni kayıtları kilit altında güncel veriye ekle
+        try:
+            with collection_transaction(PARAMETRE_SAHABIL_FILE) as parametre_sahabil_data:
+                parametre_sahabil_data.extend(new_records)
+        except OSError as e:
+            print(f"Parametre sahabil verileri kaydedilemedi: {e}")
             return jsonify({'success': False, 'error': 'Veriler kaydedilemedi'}), 500
+        
+        return jsonify({
+            'success': True, 
+            'message': f'{imported_count} adet parametre ölçümü başarıyla içe aktarıldı'
+        })
             
     except Exception as e:
         print(f"Parametre sahabil import hatası: {e}")
@@ -5917,30 +7792,25 @@ def save_parametre_field():
         if not parametre_type or not field_name:
             return jsonify({'success': False, 'message': 'Parametre tipi ve alan adı gerekli!'}), 400
         
-        # Mevcut alanları yükle
-        fields = load_parametre_fields()
-        
-        # Parametre tipine göre alanları organize et
-        if parametre_type not in fields:
-            fields[parametre_type] = []
-        
-        # Alan zaten var mı kontrol et
-        if field_name in fields[parametre_type]:
-            return jsonify({'success': False, 'message': f'"{field_name}" alanı zaten mevcut!'}), 400
-        
-        # Yeni alanı ekle
-        fields[parametre_type].append(field_name)
-        
-        # Kaydet
-        if save_parametre_fields(fields):
-            return jsonify({
-                'success': True, 
-                'message': f'"{field_name}" alanı {parametre_type.upper()} parametresine başarıyla eklendi!',
-                'fieldName': field_name,
-                'parametreType': parametre_type
-            })
-        else:
+        try:
+            with collection_transaction(PARAMETRE_FIELDS_FILE, default_factory=dict, indent=2) as fields:
+                # Alan zaten var mı kontrol et
+                if field_name in fields.get(parametre_type, []):
+                    raise TransactionRejected((jsonify({'success': False, 'message': f'"{field_name}" alanı zaten mevcut!'}), 400))
+                
+                # Yeni alanı parametre tipinin listesine ekle
+                fields.setdefault(parametre_type, []).append(field_name)
+        except TransactionRejected as rejected:
+            return rejected.response
+        except OSError:
             return jsonify({'success': False, 'message': 'Alan kaydedilirken hata oluştu!'}), 500
+        
+        return jsonify({
+            'success': True, 
+            'message': f'"{field_name}" alanı {parametre_type.upper()} parametresine başarıyla eklendi!',
+            'fieldName': field_name,
+            'parametreType': parametre_type
+        })
             
     except Exception as e:
         print(f"Parametre alanı kaydedilirken hata: {e}")
@@ -5969,33 +7839,32 @@ def update_parametre_field():
         if not parametre_type or not old_field_name or not new_field_name:
             return jsonify({'success': False, 'message': 'Tüm alanlar gerekli!'}), 400
         
-        # Mevcut alanları yükle
-        fields = load_parametre_fields()
-        
-        # Parametre tipi var mı kontrol et
-        if parametre_type not in fields:
-            return jsonify({'success': False, 'message': 'Parametre tipi bulunamadı!'}), 404
-        
-        # Eski alan var mı kontrol et
-        if old_field_name not in fields[parametre_type]:
-            return jsonify({'success': False, 'message': f'"{old_field_name}" alanı bulunamadı!'}), 404
-        
-        # Yeni alan adı zaten var mı kontrol et
-        if new_field_name in fields[parametre_type] and new_field_name != old_field_name:
-            return jsonify({'success': False, 'message': f'"{new_field_name}" alanı zaten mevcut!'}), 400
-        
-        # Alanı güncelle
-        field_index = fields[parametre_type].index(old_field_name)
-        fields[parametre_type][field_index] = new_field_name
-        
-        # Kaydet
-        if save_parametre_fields(fields):
-            return jsonify({
-                'success': True, 
-                'message': f'"{old_field_name}" alanı "{new_field_name}" olarak güncellendi!'
-            })
-        else:
+        try:
+            with collection_transaction(PARAMETRE_FIELDS_FILE, default_factory=dict, indent=2) as fields:
+                # Parametre tipi var mı kontrol et
+                if parametre_type not in fields:
+                    raise TransactionRejected((jsonify({'success': False, 'message': 'Parametre tipi bulunamadı!'}), 404))
+                
+                # Eski alan var mı kontrol et
+                if old_field_name not in fields[parametre_type]:
+                    raise TransactionRejected((jsonify({'success': False, 'message': f'"{old_field_name}" alanı bulunamadı!'}), 404))
+                
+                # Yeni alan adı zaten var mı kontrol et
+                if new_field_name in fields[parametre_type] and new_field_name != old_field_name:
+                    raise TransactionRejected((jsonify({'success': False, 'message': f'"{new_field_name}" alanı zaten mevcut!'}), 400))
+                
+                # Alanı güncelle
+                field_index = fields[parametre_type].index(old_field_name)
+                fields[parametre_type][field_index] = new_field_name
+        except TransactionRejected as rejected:
+            return rejected.response
+        except OSError:
             return jsonify({'success': False, 'message': 'Alan güncellenirken hata oluştu!'}), 500
+        
+        return jsonify({
+            'success': True, 
+            'message': f'"{old_field_name}" alanı "{new_field_name}" olarak güncellendi!'
+        })
             
     except Exception as e:
         print(f"Parametre alanı güncellenirken hata: {e}")
@@ -6012,28 +7881,27 @@ def delete_parametre_field():
         if not parametre_type or not field_name:
             return jsonify({'success': False, 'message': 'Parametre tipi ve alan adı gerekli!'}), 400
         
-        # Mevcut alanları yükle
-        fields = load_parametre_fields()
-        
-        # Parametre tipi var mı kontrol et
-        if parametre_type not in fields:
-            return jsonify({'success': False, 'message': 'Parametre tipi bulunamadı!'}), 404
-        
-        # Alan var mı kontrol et
-        if field_name not in fields[parametre_type]:
-            return jsonify({'success': False, 'message': f'"{field_name}" alanı bulunamadı!'}), 404
-        
-        # Alanı sil
-        fields[parametre_type].remove(field_name)
-        
-        # Kaydet
-        if save_parametre_fields(fields):
-            return jsonify({
-                'success': True, 
-                'message': f'"{field_name}" alanı başarıyla silindi!'
-            })
-        else:
+        try:
+            with collection_transaction(PARAMETRE_FIELDS_FILE, default_factory=dict, indent=2) as fields:
+                # Parametre tipi var mı kontrol et
+                if parametre_type not in fields:
+                    raise TransactionRejected((jsonify({'success': False, 'message': 'Parametre tipi bulunamadı!'}), 404))
+                
+                # Alan var mı kontrol et
+                if field_name not in fields[parametre_type]:
+                    raise TransactionRejected((jsonify({'success': False, 'message': f'"{field_name}" alanı bulunamadı!'}), 404))
+                
+                # Alanı sil
+                fields[parametre_type].remove(field_name)
+        except TransactionRejected as rejected:
+            return rejected.response
+        except OSError:
             return jsonify({'success': False, 'message': 'Alan silinirken hata oluştu!'}), 500
+        
+        return jsonify({
+            'success': True, 
+            'message': f'"{field_name}" alanı başarıyla silindi!'
+        })
             
     except Exception as e:
         print(f"Parametre alanı silinirken hata: {e}")
@@ -6282,8 +8150,6 @@ def add_baca_bilgisi():
         return redirect(url_for('login'))
     
     try:
-        baca_bilgileri_list = load_baca_bilgileri()
-        
         new_baca = {
             'id': str(uuid4()),
             'firma_adi': request.form.get('firma_adi', ''),
@@ -6311,12 +8177,15 @@ def add_baca_bilgisi():
             flash('Baca numarası zorunludur!', 'error')
             return redirect(url_for('baca_bilgileri'))
         
-        baca_bilgileri_list.append(new_baca)
-        
-        if save_baca_bilgileri(baca_bilgileri_list):
-            flash('Baca bilgisi başarıyla eklendi!', 'success')
-        else:
+        # Kilit altında güncel listeye ekle ve kaydet
+        try:
+            with collection_transaction(BACA_BILGILERI_FILE) as baca_bilgileri_list:
+                baca_bilgileri_list.append(new_baca)
+        except OSError as e:
+            print(f"Baca bilgisi kaydedilemedi: {e}")
             flash('Baca bilgisi eklenirken hata oluştu!', 'error')
+        else:
+            flash('Baca bilgisi başarıyla eklendi!', 'success')
             
     except Exception as e:
         print(f"Baca bilgisi ekleme hatası: {e}")
@@ -6330,41 +8199,45 @@ def edit_baca_bilgisi(baca_id):
         return redirect(url_for('login'))
     
     try:
-        baca_bilgileri_list = load_baca_bilgileri()
-        baca = next((b for b in baca_bilgileri_list if b['id'] == baca_id), None)
-        
-        if not baca:
-            flash('Baca bilgisi bulunamadı!', 'error')
-            return redirect(url_for('baca_bilgileri'))
-        
-        # Baca bilgilerini güncelle
-        baca['firma_adi'] = request.form.get('firma_adi', '')
-        baca['olcum_kodu'] = request.form.get('olcum_kodu', '')
-        baca['baca_no'] = request.form.get('baca_no', '').strip()
-        baca['yakit_turu'] = request.form.get('yakit_turu', '')
-        baca['isil_guc'] = request.form.get('isil_guc', '')
-        baca['cati_sekli'] = request.form.get('cati_sekli', '')
-        baca['kaynak_turu'] = request.form.get('kaynak_turu', '')
-        baca['baca_sekli'] = request.form.get('baca_sekli', '')
-        baca['baca_olcusu'] = request.form.get('baca_olcusu', '')
-        baca['yerden_yuk'] = request.form.get('yerden_yuk', '')
-        baca['cati_yuk'] = request.form.get('cati_yuk', '')
-        baca['ruzgar_hiz'] = request.form.get('ruzgar_hiz', '')
-        baca['ort_sic'] = request.form.get('ort_sic', '')
-        baca['ort_nem'] = request.form.get('ort_nem', '')
-        baca['ort_bas'] = request.form.get('ort_bas', '')
-        baca['a_baca'] = request.form.get('a_baca', '')
-        baca['b_baca'] = request.form.get('b_baca', '')
-        baca['c_delik'] = request.form.get('c_delik', '')
-        
-        if not baca['baca_no']:
+        if not request.form.get('baca_no', '').strip():
             flash('Baca numarası zorunludur!', 'error')
             return redirect(url_for('baca_bilgileri'))
         
-        if save_baca_bilgileri(baca_bilgileri_list):
-            flash('Baca bilgisi başarıyla güncellendi!', 'success')
-        else:
+        # Kilit altında güncel listede bul ve güncelle
+        try:
+            with collection_transaction(BACA_BILGILERI_FILE) as baca_bilgileri_list:
+                baca = next((b for b in baca_bilgileri_list if b['id'] == baca_id), None)
+                
+                if not baca:
+                    raise RecordNotFound(baca_id)
+                
+                # Baca bilgilerini güncelle
+                baca['firma_adi'] = request.form.get('firma_adi', '')
+                baca['olcum_kodu'] = request.form.get('olcum_kodu', '')
+                baca['baca_no'] = request.form.get('baca_no', '').strip()
+                baca['yakit_turu'] = request.form.get('yakit_turu', '')
+                baca['isil_guc'] = request.form.get('isil_guc', '')
+                baca['cati_sekli'] = request.form.get('cati_sekli', '')
+                baca['kaynak_turu'] = request.form.get('kaynak_turu', '')
+                baca['baca_sekli'] = request.form.get('baca_sekli', '')
+                baca['baca_olcusu'] = request.form.get('baca_olcusu', '')
+                baca['yerden_yuk'] = request.form.get('yerden_yuk', '')
+                baca['cati_yuk'] = request.form.get('cati_yuk', '')
+                baca['ruzgar_hiz'] = request.form.get('ruzgar_hiz', '')
+                baca['ort_sic'] = request.form.get('ort_sic', '')
+                baca['ort_nem'] = request.form.get('ort_nem', '')
+                baca['ort_bas'] = request.form.get('ort_bas', '')
+                baca['a_baca'] = request.form.get('a_baca', '')
+                baca['b_baca'] = request.form.get('b_baca', '')
+                baca['c_delik'] = request.form.get('c_delik', '')
+        except RecordNotFound:
+            flash('Baca bilgisi bulunamadı!', 'error')
+            return redirect(url_for('baca_bilgileri'))
+        except OSError as e:
+            print(f"Baca bilgisi kaydedilemedi: {e}")
             flash('Baca bilgisi güncellenirken hata oluştu!', 'error')
+        else:
+            flash('Baca bilgisi başarıyla güncellendi!', 'success')
             
     except Exception as e:
         print(f"Baca bilgisi güncelleme hatası: {e}")
@@ -6378,16 +8251,20 @@ def delete_baca_bilgisi(baca_id):
         return redirect(url_for('login'))
     
     try:
-        baca_bilgileri_list = load_baca_bilgileri()
-        baca_bilgileri_to_keep = [b for b in baca_bilgileri_list if b['id'] != baca_id]
-        
-        if len(baca_bilgileri_list) == len(baca_bilgileri_to_keep):
+        try:
+            with collection_transaction(BACA_BILGILERI_FILE) as baca_bilgileri_list:
+                baca_bilgileri_to_keep = [b for b in baca_bilgileri_list if b['id'] != baca_id]
+                
+                if len(baca_bilgileri_list) == len(baca_bilgileri_to_keep):
+                    raise RecordNotFound(baca_id)
+                baca_bilgileri_list[:] = baca_bilgileri_to_keep
+        except RecordNotFound:
             flash('Silinecek baca bilgisi bulunamadı.', 'error')
+        except OSError as e:
+            print(f"Baca bilgisi silinemedi: {e}")
+            flash('Baca bilgisi silinirken hata oluştu.', 'error')
         else:
-            if save_baca_bilgileri(baca_bilgileri_to_keep):
-                flash('Baca bilgisi başarıyla silindi.', 'success')
-            else:
-                flash('Baca bilgisi silinirken hata oluştu.', 'error')
+            flash('Baca bilgisi başarıyla silindi.', 'success')
                 
     except Exception as e:
         print(f"Baca bilgisi silme hatası: {e}")
@@ -6411,9 +8288,6 @@ def add_baca_para():
             flash('Baca parametre adı zorunludur!', 'error')
             return redirect(url_for('formlar'))
         
-        # Baca parametrelerini yükle
-        baca_paralar = load_baca_paralar()
-        
         # Yeni parametre oluştur
         yeni_para = {
             'id': str(uuid4()),
@@ -6422,8 +8296,8 @@ def add_baca_para():
             'created_at': datetime.now().isoformat()
         }
         
-        baca_paralar.append(yeni_para)
-        save_baca_paralar(baca_paralar)
+        with baca_paralar_transaction() as baca_paralar:
+            baca_paralar.append(yeni_para)
         
         flash(f'Baca parametresi başarıyla eklendi: {baca_par_adi}', 'success')
         
@@ -6448,18 +8322,14 @@ def edit_baca_para(para_id):
             flash('Baca parametre adı zorunludur!', 'error')
             return redirect(url_for('formlar'))
         
-        # Baca parametrelerini yükle
-        baca_paralar = load_baca_paralar()
-        
-        # Parametreyi bul ve güncelle
-        for para in baca_paralar:
-            if str(para.get('id')) == str(para_id):
-                para['baca_par_adi'] = baca_par_adi
-                para['liste_icerigi'] = liste_icerigi
-                para['updated_at'] = datetime.now().isoformat()
-                break
-        
-        save_baca_paralar(baca_paralar)
+        # Parametreyi kilit altında bul ve güncelle
+        with baca_paralar_transaction() as baca_paralar:
+            for para in baca_paralar:
+                if str(para.get('id')) == str(para_id):
+                    para['baca_par_adi'] = baca_par_adi
+                    para['liste_icerigi'] = liste_icerigi
+                    para['updated_at'] = datetime.now().isoformat()
+                    break
         flash(f'Baca parametresi başarıyla güncellendi: {baca_par_adi}', 'success')
         
     except Exception as e:
@@ -6475,16 +8345,17 @@ def delete_baca_para(para_id):
         return jsonify({'success': False, 'error': 'Yetkiniz yok'})
     
     try:
-        baca_paralar = load_baca_paralar()
-        
-        # Parametreyi bul ve sil
-        for i, para in enumerate(baca_paralar):
-            if str(para.get('id')) == str(para_id):
-                deleted_para = baca_paralar.pop(i)
-                save_baca_paralar(baca_paralar)
-                return jsonify({'success': True, 'message': f'Baca parametresi silindi: {deleted_para.get("baca_par_adi", "Bilinmeyen")}'})
+        try:
+            with baca_paralar_transaction() as baca_paralar:
+                # Parametreyi bul ve sil
+                index = next((i for i, para in enumerate(baca_paralar) if str(para.get('id')) == str(para_id)), None)
+                if index is None:
+                    raise RecordNotFound(para_id)
+                deleted_para = baca_paralar.pop(index)
+        except RecordNotFound:
+            return jsonify({'success': False, 'error': 'Baca parametresi bulunamadı'})
         
-        return jsonify({'success': False, 'error': 'Baca parametresi bulunamadı'})
+        return jsonify({'success': True, 'message': f'Baca parametresi silindi: {deleted_para.get("baca_par_adi", "Bilinmeyen")}'})
         
     except Exception as e:
         return jsonify({'success': False, 'error': f'Hata: {str(e)}'})
@@ -6502,28 +8373,29 @@ def delete_selected_baca_para():
         if not selected_ids:
             return jsonify({'success': False, 'error': 'Silinecek parametre seçilmedi'})
         
-        baca_paralar = load_baca_paralar()
         deleted_count = 0
         deleted_names = []
         
-        # Seçilen parametreleri sil
-        for para_id in selected_ids:
-            for i, para in enumerate(baca_paralar):
-                if str(para.get('id')) == str(para_id):
-                    deleted_para = baca_paralar.pop(i)
-                    deleted_count += 1
-                    deleted_names.append(deleted_para.get('baca_par_adi', 'Bilinmeyen'))
-                    break
-        
-        if deleted_count > 0:
-            save_baca_paralar(baca_paralar)
-            return jsonify({
-                'success': True, 
-                'message': f'{deleted_count} baca parametresi başarıyla silindi: {", ".join(deleted_names)}'
-            })
-        else:
+        try:
+            with baca_paralar_transaction() as baca_paralar:
+                # Seçilen parametreleri sil
+                for para_id in selected_ids:
+                    for i, para in enumerate(baca_paralar):
+                        if str(para.get('id')) == str(para_id):
+                            deleted_para = baca_paralar.pop(i)
+                            deleted_count += 1
+                            deleted_names.append(deleted_para.get('baca_par_adi', 'Bilinmeyen'))
+                            break
+                if deleted_count == 0:
+                    raise RecordNotFound(selected_ids)
+        except RecordNotFound:
             return jsonify({'success': False, 'error': 'Silinecek parametre bulunamadı'})
         
+        return jsonify({
+            'success': True, 
+            'message': f'{deleted_count} baca parametresi başarıyla silindi: {", ".join(deleted_names)}'
+        })
+        
     except Exception as e:
         return jsonify({'success': False, 'error': f'Hata: {str(e)}'})
 
@@ -6563,7 +8435,6 @@ def export_baca_bilgileri():
 
 def load_baca_paralar():
     """Baca parametrelerini JSON dosyasından yükler."""
-    BACA_PARALAR_FILE = 'baca_paralar.json'
     if not os.path.exists(BACA_PARALAR_FILE):
         # Varsayılan parametreler - 26 alan sırasıyla
         default_paralar = [
@@ -6729,18 +8600,25 @@ def load_baca_paralar():
     
     try:
         with open(BACA_PARALAR_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
+            return metered_json_load(f)
     except Exception as e:
         print(f"Baca parametreleri yüklenirken hata: {e}")
         return []
 
+@contextmanager
+def baca_paralar_transaction():
+    """baca_paralar için collection_transaction; dosya yoksa önce varsayılanlar yazılır"""
+    with collection_lock(BACA_PARALAR_FILE):
+        if not os.path.exists(BACA_PARALAR_FILE):
+            load_baca_paralar()
+        with collection_transaction(BACA_PARALAR_FILE) as baca_paralar:
+            yield baca_paralar
+
 def save_baca_paralar(baca_paralar_data):
     """Baca parametrelerini JSON dosyasına kaydeder."""
     # Yol başta tanımlandı: BACA_PARALAR_FILE
     try:
-        with open(BACA_PARALAR_FILE, 'w', encoding='utf-8') as f:
-            json.dump(baca_paralar_data, f, indent=4, ensure_ascii=False)
-        return True
+        return _atomic_write_json(BACA_PARALAR_FILE, baca_paralar_data, indent=4, ensure_ascii=False)
     except Exception as e:
         print(f"Baca parametreleri kaydedilirken hata: {e}")
         return False
@@ -6752,7 +8630,7 @@ def load_parametre_sahabil():
         return []
     try:
         with open(PARAMETRE_SAHABIL_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
+            return metered_json_load(f)
     except Exception as e:
         print(f"Parametre sahabil verileri yüklenirken hata: {e}")
         return []
@@ -6760,9 +8638,7 @@ def load_parametre_sahabil():
 def save_parametre_sahabil(parametre_sahabil_data):
     """Parametre sahabil verilerini JSON dosyasına kaydeder."""
     try:
-        with open(PARAMETRE_SAHABIL_FILE, 'w', encoding='utf-8') as f:
-            json.dump(parametre_sahabil_data, f, indent=4, ensure_ascii=False)
-        return True
+        return _atomic_write_json(PARAMETRE_SAHABIL_FILE, parametre_sahabil_data, indent=4, ensure_ascii=False)
     except Exception as e:
         print(f"Parametre sahabil verileri kaydedilirken hata: {e}")
         return False
@@ -6773,7 +8649,7 @@ def load_parametre_fields():
         if not os.path.exists(PARAMETRE_FIELDS_FILE):
             return {}
         with open(PARAMETRE_FIELDS_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
+            return metered_json_load(f)
     except Exception as e:
         print(f"Parametre alanları yüklenirken hata: {e}")
         return {}
@@ -6783,7 +8659,7 @@ def load_asgari_fiyatlar():
         if not os.path.exists(ASGARI_FIYATLAR_FILE):
             return []
         with open(ASGARI_FIYATLAR_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
+            return metered_json_load(f)
     except Exception as e:
         print(f"Asgari fiyatlar yüklenirken hata: {e}")
         return []
@@ -6803,7 +8679,7 @@ def load_par_saha_headers():
         if not os.path.exists(PAR_SAHA_HEADERS_FILE):
             return {"groups": []}
         with open(PAR_SAHA_HEADERS_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
+            return metered_json_load(f)
     except Exception as e:
         print(f"PAR SAHA header yüklenirken hata: {e}")
         return {"groups": []}
@@ -6826,7 +8702,7 @@ def load_forms():
         return []
     try:
         with open(FORMS_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
+            return metered_json_load(f)
     except Exception as e:
         print(f"Form verileri yüklenirken hata: {e}")
         return []
@@ -6847,34 +8723,35 @@ def api_bulk_delete_baca_bilgileri():
         if not isinstance(record_ids, list) or len(record_ids) == 0:
             return jsonify({'success': False, 'error': 'Geçersiz kayıt ID listesi'}), 400
         
-        saved_baca_bilgileri = load_baca_bilgileri()
-        original_count = len(saved_baca_bilgileri)
-        
-        # Seçili kayıtları filtrele
-        filtered_records = []
-        deleted_records = []
-        
-        for record in saved_baca_bilgileri:
-            if record.get('id') in record_ids:
-                deleted_records.append(record)
-            else:
-                filtered_records.append(record)
-        
-        # Silinen kayıt sayısını kontrol et
-        if len(deleted_records) == 0:
+        try:
+            with collection_transaction(BACA_BILGILERI_FILE) as saved_baca_bilgileri:
+                # Seçili kayıtları filtrele
+                filtered_records = []
+                deleted_records = []
+                
+                for record in saved_baca_bilgileri:
+                    if record.get('id') in record_ids:
+                        deleted_records.append(record)
+                    else:
+                        filtered_records.append(record)
+                
+                # Silinen kayıt sayısını kontrol et
+                if len(deleted_records) == 0:
+                    raise RecordNotFound(record_ids)
+                saved_baca_bilgileri[:] = filtered_records
+        except RecordNotFound:
             return jsonify({'success': False, 'error': 'Silinecek kayıt bulunamadı'}), 404
-        
-        # Dosyaya kaydet
-        if save_baca_bilgileri(filtered_records):
-            deleted_info = [f"{r.get('firma_adi')} - {r.get('olcum_kodu')} - {r.get('baca_adi')}" for r in deleted_records]
-            print(f"Baca bilgileri toplu silindi: {', '.join(deleted_info)}")
-            return jsonify({
-                'success': True, 
-                'message': f'{len(deleted_records)} kayıt başarıyla silindi',
-                'deleted_count': len(deleted_records)
-            })
-        else:
+        except OSError as e:
+            print(f"Baca bilgileri kaydedilemedi: {e}")
             return jsonify({'success': False, 'error': 'Veriler kaydedilemedi'}), 500
+        
+        deleted_info = [f"{r.get('firma_adi')} - {r.get('olcum_kodu')} - {r.get('baca_adi')}" for r in deleted_records]
+        print(f"Baca bilgileri toplu silindi: {', '.join(deleted_info)}")
+        return jsonify({
+            'success': True, 
+            'message': f'{len(deleted_records)} kayıt başarıyla silindi',
+            'deleted_count': len(deleted_records)
+        })
             
     except Exception as e:
         print(f"Baca bilgileri toplu silinirken hata: {e}")
@@ -6885,7 +8762,7 @@ def api_forms():
     """Form listesini döndürür."""
     try:
         forms = load_forms()
-        return jsonify(forms)
+        return list_query_response(forms, ('id', 'formAdi', 'formKodu'))
     except Exception as e:
         print(f"Formlar yüklenirken hata: {e}")
         return jsonify({'error': str(e)}), 500
@@ -6895,8 +8772,8 @@ def api_forms():
 def api_get_par_saha_headers():
     if not session.get('logged_in'):
         return jsonify({'success': False, 'message': 'Oturum açmanız gerekiyor'}), 401
-    data = load_par_saha_headers()
-    return jsonify({'success': True, **data})
+    return etag_json_response([PAR_SAHA_HEADERS_FILE],
+                              lambda: jsonify({'success': True, **load_par_saha_headers()}))
 
 # PAR_SAHA başlıklarını kaydet
 @app.route('/api/par_saha_headers', methods=['POST'])
@@ -6926,7 +8803,6 @@ def add_form():
             flash('Tüm alanları doldurun!', 'error')
             return redirect(url_for('formlar'))
         
-        forms = load_forms()
         new_form = {
             'id': str(uuid4()),
             'formAdi': formAdi,
@@ -6937,12 +8813,15 @@ def add_form():
             'created_at': datetime.now().isoformat()
         }
         
-        forms.append(new_form)
-        
-        if save_forms(forms):
-            flash('Form başarıyla eklendi!', 'success')
-        else:
+        # Kilit altında güncel listeye ekle ve kaydet
+        try:
+            with collection_transaction(FORMS_FILE) as forms:
+                forms.append(new_form)
+        except OSError as e:
+            print(f"Form kaydedilemedi: {e}")
             flash('Form eklenirken hata oluştu!', 'error')
+        else:
+            flash('Form başarıyla eklendi!', 'success')
             
         return redirect(url_for('formlar'))
         
@@ -6965,30 +8844,26 @@ def edit_form(form_id):
             flash('Tüm alanları doldurun!', 'error')
             return redirect(url_for('formlar'))
         
-        forms = load_forms()
-        form_index = None
-        
-        for i, form in enumerate(forms):
-            if form.get('id') == form_id:
-                form_index = i
-                break
-        
-        if form_index is not None:
-            forms[form_index].update({
-                'formAdi': formAdi,
-                'formKodu': formKodu,
-                'yayinTarihi': yayinTarihi,
-                'revizyonTarihi': revizyonTarihi,
-                'revizyonNo': revizyonNo,
-                'updated_at': datetime.now().isoformat()
-            })
-            
-            if save_forms(forms):
-                flash('Form başarıyla güncellendi!', 'success')
-            else:
-                flash('Form güncellenirken hata oluştu!', 'error')
-        else:
+        try:
+            with collection_transaction(FORMS_FILE) as forms:
+                form = next((f for f in forms if f.get('id') == form_id), None)
+                if form is None:
+                    raise RecordNotFound(form_id)
+                form.update({
+                    'formAdi': formAdi,
+                    'formKodu': formKodu,
+                    'yayinTarihi': yayinTarihi,
+                    'revizyonTarihi': revizyonTarihi,
+                    'revizyonNo': revizyonNo,
+                    'updated_at': datetime.now().isoformat()
+                })
+        except RecordNotFound:
             flash('Form bulunamadı!', 'error')
+        except OSError as e:
+            print(f"Form kaydedilemedi: {e}")
+            flash('Form güncellenirken hata oluştu!', 'error')
+        else:
+            flash('Form başarıyla güncellendi!', 'success')
             
         return redirect(url_for('formlar'))
         
@@ -7001,32 +8876,28 @@ def edit_form(form_id):
 def delete_form(form_id):
     """Form siler."""
     try:
-        forms = load_forms()
-        form_to_delete = None
-        
-        for form in forms:
-            if form.get('id') == form_id:
-                form_to_delete = form
-                break
-        
-        if form_to_delete:
-            forms.remove(form_to_delete)
-            
-            if save_forms(forms):
-                return jsonify({
-                    'success': True,
-                    'message': f'"{form_to_delete.get("formAdi")}" formu başarıyla silindi'
-                })
-            else:
-                return jsonify({
-                    'success': False,
-                    'error': 'Form silinirken hata oluştu'
-                })
-        else:
+        try:
+            with collection_transaction(FORMS_FILE) as forms:
+                form_to_delete = next((f for f in forms if f.get('id') == form_id), None)
+                if form_to_delete is None:
+                    raise RecordNotFound(form_id)
+                forms.remove(form_to_delete)
+        except RecordNotFound:
             return jsonify({
                 'success': False,
                 'error': 'Form bulunamadı'
             })
+        except OSError as e:
+            print(f"Form silinemedi: {e}")
+            return jsonify({
+                'success': False,
+                'error': 'Form silinirken hata oluştu'
+            })
+        
+        return jsonify({
+            'success': True,
+            'message': f'"{form_to_delete.get("formAdi")}" formu başarıyla silindi'
+        })
             
     except Exception as e:
         print(f"Form silinirken hata: {e}")
@@ -7565,147 +9436,92 @@ def api_firma_olcum_detail_excel_export():
         print(f"DEBUG: Hata detayı: {traceback.format_exc()}")
         return jsonify({'error': f'Excel export hatası: {str(e)}'}), 500
 
-@app.route('/api/firma_olcum_excel_export', methods=['POST'])
-def api_firma_olcum_excel_export():
-    """Firma ölçüm bilgilerini Excel formatında dışa aktarır - Basit format."""
-    try:
-        # Pandas kütüphanesini import et
-        try:
-            import pandas as pd
-            print(f"DEBUG: pandas başarıyla import edildi: {pd}")
-        except ImportError as e:
-            print(f"DEBUG: pandas import hatası: {e}")
-            return jsonify({'error': 'pandas kütüphanesi yüklü değil'}), 500
-        data = request.get_json()
-        olcum_ids = data.get('olcum_ids', [])
-        
-        if not olcum_ids:
-            return jsonify({'error': 'En az bir ölçüm ID gerekli!'}), 400
-        
-        # Firma ölçümlerini yükle
-        firma_olcumler = load_firma_olcum()
-        
-        # Seçili ölçümleri filtrele
-        if olcum_ids:
-            filtered_olcumler = [item for item in firma_olcumler if str(item.get('id')) in olcum_ids]
-        else:
-            filtered_olcumler = firma_olcumler
-        
-        if not filtered_olcumler:
-            return jsonify({'error': 'Dışa aktarılacak veri bulunamadı'}), 404
-        
-        # Firma kayıt bilgilerini al
-        firma_kayitlar = load_firma_kayit()
-        
-        # Excel için DataFrame oluştur - basit format
-        df_data = []
-        for index, olcum in enumerate(filtered_olcumler, 1):
-            # Firma bilgilerini bul
-            firma_bilgisi = None
-            for firma in firma_kayitlar:
-                if firma.get('firmaAdi') == olcum.get('firma_adi'):
-                    firma_bilgisi = firma
-                    break
-            
-            # Tarih formatını düzelt
-            baslangic_tarihi = olcum.get('baslangic_tarihi', '')
-            bitis_tarihi = olcum.get('bitis_tarihi', '')
-            
-            # Tarihleri DD.MM.YY formatına çevir
-            if baslangic_tarihi:
-                try:
-                    baslangic_date = datetime.strptime(baslangic_tarihi, '%Y-%m-%d')
-                    baslangic_tarihi = baslangic_date.strftime('%d.%m.%y')
-                except:
-                    pass
-            
-            if bitis_tarihi:
-                try:
-                    bitis_date = datetime.strptime(bitis_tarihi, '%Y-%m-%d')
-                    bitis_tarihi = bitis_date.strftime('%d.%m.%y')
-                except:
-                    pass
-            
-            # Personel listesini string'e çevir
-            personel = olcum.get('personel', [])
-            if isinstance(personel, list):
-                personel_str = ', '.join(personel)
-            else:
-                personel_str = str(personel) if personel else ''
-            
-            # Parametreleri al ve sayılarını hesapla
-            baca_parametreleri = olcum.get('baca_parametreleri', {})
-            parametre_sayilari = {}
-            
-            for baca_params in baca_parametreleri.values():
-                for parametre in baca_params:
-                    if parametre in parametre_sayilari:
-                        parametre_sayilari[parametre] += 1
-                    else:
-                        parametre_sayilari[parametre] = 1
-            
-            # Parametreleri sayılarıyla birlikte formatla
-            parametre_listesi = []
-            for parametre, sayi in parametre_sayilari.items():
-                parametre_listesi.append(f"{parametre} ({sayi})")
-            
-            parametre_str = ', '.join(parametre_listesi) if parametre_listesi else ''
-            
-            row = {
-                'RA': index,
-                'FIRMA': firma_bilgisi.get('firmaAdi', '') if firma_bilgisi else olcum.get('firma_adi', ''),
-                'OLC_KOD': olcum.get('olcum_kodu', ''),
-                'BAS TRH': baslangic_tarihi,
-                'BIT TAR': bitis_tarihi,
-                'BACA_SAY': olcum.get('baca_sayisi', ''),
-                'PARAMETRE': parametre_str,
-                'PER.': personel_str,
-                'IL': firma_bilgisi.get('il', '') if firma_bilgisi else olcum.get('il', ''),
-                'ILCE': firma_bilgisi.get('ilce', '') if firma_bilgisi else olcum.get('ilce', ''),
-                'YETK': firma_bilgisi.get('yetkiliAdi', '') if firma_bilgisi else olcum.get('yetkili', ''),
-                'TEL': str(firma_bilgisi.get('yetkiliTel', '')) if firma_bilgisi else olcum.get('telefon', ''),
-                'DURU': olcum.get('durum', '')
-            }
-            
-            df_data.append(row)
-        
-        print(f"DEBUG: df_data hazırlandı: {df_data}")
-        df = pd.DataFrame(df_data)
-        print(f"DEBUG: DataFrame oluşturuldu: {df}")
-        
-        # Geçici dosya oluştur
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx') as tmp_file:
-            # Excel dosyasını oluştur
-            with pd.ExcelWriter(tmp_file.name, engine='openpyxl') as writer:
-                df.to_excel(writer, index=False, sheet_name='Firma Ölçümleri')
-                
-                # Sütun genişliklerini ayarla
-                worksheet = writer.sheets['Firma Ölçümleri']
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    adjusted_width = min(max_length + 2, 50)
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
-            
-            # Dosya adını oluştur
-            if len(filtered_olcumler) == 1:
-                olcum = filtered_olcumler[0]
-                filename = f"{olcum.get('firma_adi', 'bilinmeyen')}_{olcum.get('olcum_kodu', 'bilinmeyen')}_OLCUM.xlsx"
-            else:
-                filename = f"TUM_FIRMA_OLCUMLERI_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-            
-            return send_file(
-                tmp_file.name,
-                as_attachment=True,
-                download_name=filename,
-                mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-            )
+@app.route('/api/firma_olcum_excel_export', methods=['POST'])
+def api_firma_olcum_excel_export():
+    """Firma ölçüm bilgilerini Excel formatında dışa aktarır - Basit format."""
+    try:
+        data = request.get_json()
+        olcum_ids = data.get('olcum_ids', [])
+        
+        if not olcum_ids:
+            return jsonify({'error': 'En az bir ölçüm ID gerekli!'}), 400
+        
+        # Firma ölçümlerini yükle
+        firma_olcumler = load_firma_olcum()
+        
+        # Seçili ölçümleri filtrele
+        if olcum_ids:
+            filtered_olcumler = [item for item in firma_olcumler if str(item.get('id')) in olcum_ids]
+        else:
+            filtered_olcumler = firma_olcumler
+        
+        if not filtered_olcumler:
+            return jsonify({'error': 'Dışa aktarılacak veri bulunamadı'}), 404
+        
+        # Firma kayıt bilgilerini al
+        firma_kayitlar = load_firma_kayit()
+        
+        # Firma adına göre tek seferlik sözlük
+        firma_by_name = {}
+        for firma in firma_kayitlar:
+            firma_by_name.setdefault(firma.get('firmaAdi'), firma)
+
+        def format_tarih(value):
+            # Tarihleri DD.MM.YY formatına çevir
+            if not value:
+                return value
+            try:
+                return datetime.strptime(value, '%Y-%m-%d').strftime('%d.%m.%y')
+            except Exception:
+                return value
+
+        def rows():
+            for index, olcum in enumerate(filtered_olcumler, 1):
+                firma_bilgisi = firma_by_name.get(olcum.get('firma_adi'))
+
+                # Personel listesini string'e çevir
+                personel = olcum.get('personel', [])
+                if isinstance(personel, list):
+                    personel_str = ', '.join(personel)
+                else:
+                    personel_str = str(personel) if personel else ''
+
+                # Parametreleri sayılarıyla birlikte formatla
+                parametre_sayilari = {}
+                for baca_params in olcum.get('baca_parametreleri', {}).values():
+                    for parametre in baca_params:
+                        parametre_sayilari[parametre] = parametre_sayilari.get(parametre, 0) + 1
+                parametre_str = ', '.join(f"{parametre} ({sayi})" for parametre, sayi in parametre_sayilari.items())
+
+                yield [
+                    index,
+                    firma_bilgisi.get('firmaAdi', '') if firma_bilgisi else olcum.get('firma_adi', ''),
+                    olcum.get('olcum_kodu', ''),
+                    format_tarih(olcum.get('baslangic_tarihi', '')),
+                    format_tarih(olcum.get('bitis_tarihi', '')),
+                    olcum.get('baca_sayisi', ''),
+                    parametre_str,
+                    personel_str,
+                    firma_bilgisi.get('il', '') if firma_bilgisi else olcum.get('il', ''),
+                    firma_bilgisi.get('ilce', '') if firma_bilgisi else olcum.get('ilce', ''),
+                    firma_bilgisi.get('yetkiliAdi', '') if firma_bilgisi else olcum.get('yetkili', ''),
+                    str(firma_bilgisi.get('yetkiliTel', '')) if firma_bilgisi else olcum.get('telefon', ''),
+                    olcum.get('durum', '')
+                ]
+
+        columns = [{'header': h} for h in (
+            'RA', 'FIRMA', 'OLC_KOD', 'BAS TRH', 'BIT TAR', 'BACA_SAY', 'PARAMETRE',
+            'PER.', 'IL', 'ILCE', 'YETK', 'TEL', 'DURU'
+        )]
+
+        # Dosya adını oluştur
+        if len(filtered_olcumler) == 1:
+            olcum = filtered_olcumler[0]
+            filename = f"{olcum.get('firma_adi', 'bilinmeyen')}_{olcum.get('olcum_kodu', 'bilinmeyen')}_OLCUM.xlsx"
+        else:
+            filename = f"TUM_FIRMA_OLCUMLERI_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+
+        return stream_xlsx_response(filename, 'Firma Ölçümleri', columns, rows())
         
     except Exception as e:
         print(f"Firma ölçüm Excel export hatası: {e}")
@@ -7837,6 +9653,7 @@ def create_firma_olcum_detail_word_document(olcum, firma_bilgisi, olcum_bacalar,
         print(f"DEBUG: Hata detayı: {traceback.format_exc()}")
         return jsonify({'error': f'Word doküman oluşturma hatası: {str(e)}'}), 500
 
+@report_timer('firma_olcum_word')
 def create_firma_olcum_word_document(olcum, olcum_bacalar, olcum_parametreleri):
     """Firma ölçüm bilgilerini Word şablonu kullanarak oluşturur."""
     try:
@@ -8472,7 +10289,7 @@ def create_firma_raporu(firma_adi, olcum_kodu):
     try:
         # Şablonu yükle
         with open('rapor_sablonu.json', 'r', encoding='utf-8') as f:
-            sablon = json.load(f)
+            sablon = metered_json_load(f)
         
         # Verileri yükle
         baca_bilgileri = load_baca_bilgileri()
@@ -8495,7 +10312,7 @@ def create_firma_raporu(firma_adi, olcum_kodu):
         emisyon_formu = None
         try:
             with open('forms.json', 'r', encoding='utf-8') as f:
-                forms_data = json.load(f)
+                forms_data = metered_json_load(f)
                 emisyon_formu = next((form for form in forms_data if form['formAdi'] == 'EMİSYON ÖLÇÜM FORMU'), None)
         except Exception as e:
             print(f"Form verileri yüklenirken hata: {e}")
@@ -9070,6 +10887,7 @@ def merge_word_documents(documents):
     
     return merged_doc
 
+@report_timer('firma_raporu')
 def create_firma_raporu_from_template(firma_adi, olcum_kodu):
     """Her baca için ayrı Word dosyası oluşturup birleştirir."""
     try:
@@ -9234,89 +11052,31 @@ def api_parametre_olcumleri_excel_export():
             'T.DIŞ-3', 'T.DIŞ-4', 'İLK KURULUM', '2. KURULUM'
         ]
         
-        print("DataFrame oluşturuluyor...")
-        
-        # Excel için DataFrame oluştur - ekranda gördüğünüz format
-        df_data = []
-        for index, olcum in enumerate(filtered_olcumler, 1):
-            # Temel bilgiler (ekranda gördüğünüz sütunlar)
-            row = {
-                '#': index,
-                'Firma': olcum.get('firma_adi', ''),
-                'Ölçüm Kodu': olcum.get('olcum_kodu', ''),
-                'Baca': olcum.get('baca_adi', ''),
-                'Parametre': olcum.get('parametre_adi', ''),
-                'Kayıt Tarihi': olcum.get('created_at', '')[:19].replace('T', ' ') if olcum.get('created_at') else ''
-            }
-            
-            # Parametre verilerini ekle (ekranda gördüğünüz parametre sütunları)
-            parametre_verileri = olcum.get('parametre_verileri', {})
-            for alan in allParametreFields:
-                row[alan] = parametre_verileri.get(alan, '*')
-            
-            df_data.append(row)
-        
-        print(f"DataFrame verisi hazırlandı, satır sayısı: {len(df_data)}")
-        
-        df = pd.DataFrame(df_data)
-        print(f"DataFrame oluşturuldu, boyut: {df.shape}")
-        
-        # Geçici dosya oluştur
-        print("Geçici dosya oluşturuluyor...")
-        tmp_file_path = None
-        
-        try:
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx') as tmp_file:
-                tmp_file_path = tmp_file.name
-                print(f"Geçici dosya yolu: {tmp_file_path}")
-            
-            # Excel dosyasını oluştur
-            with pd.ExcelWriter(tmp_file_path, engine='openpyxl') as writer:
-                df.to_excel(writer, index=False, sheet_name='Parametre Ölçümleri')
-                
-                # Sütun genişliklerini ayarla
-                worksheet = writer.sheets['Parametre Ölçümleri']
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    adjusted_width = min(max_length + 2, 50)
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
-            
-            print("Excel dosyası oluşturuldu, okunuyor...")
-            
-            # Dosyayı oku ve response oluştur
-            with open(tmp_file_path, 'rb') as f:
-                file_content = f.read()
-            
-            print(f"Dosya okundu, boyut: {len(file_content)} bytes")
-            
-        finally:
-            # Geçici dosyayı sil (hata olsa bile)
-            if tmp_file_path and os.path.exists(tmp_file_path):
-                try:
-                    os.unlink(tmp_file_path)
-                    print("Geçici dosya silindi")
-                except Exception as delete_error:
-                    print(f"Geçici dosya silinirken hata: {delete_error}")
-                    # Dosya silinemezse sorun değil, sistem temizleyecek
-        
-        # Response oluştur
-        response = make_response(file_content)
-        response.headers['Content-Type'] = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-        
+        # Aynı başlık iki kez tanımlı olabilir (KK1-SPAN); sütunları tekilleştir
+        parametre_alanlari = list(dict.fromkeys(allParametreFields))
+        columns = [{'header': h} for h in ['#', 'Firma', 'Ölçüm Kodu', 'Baca', 'Parametre', 'Kayıt Tarihi']]
+        columns += [{'header': alan} for alan in parametre_alanlari]
+
+        def rows():
+            for index, olcum in enumerate(filtered_olcumler, 1):
+                # Temel bilgiler (ekranda gördüğünüz sütunlar)
+                row = [
+                    index,
+                    olcum.get('firma_adi', ''),
+                    olcum.get('olcum_kodu', ''),
+                    olcum.get('baca_adi', ''),
+                    olcum.get('parametre_adi', ''),
+                    olcum.get('created_at', '')[:19].replace('T', ' ') if olcum.get('created_at') else ''
+                ]
+                # Parametre verilerini ekle (ekranda gördüğünüz parametre sütunları)
+                parametre_verileri = olcum.get('parametre_verileri', {})
+                row.extend(parametre_verileri.get(alan, '*') for alan in parametre_alanlari)
+                yield row
+
         # Dosya adını oluştur
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f"Parametre_Olcumleri_{len(filtered_olcumler)}_kayit_{timestamp}.xlsx"
-        response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
-        
-        print(f"Response hazırlandı, dosya adı: {filename}")
-        return response
+        return stream_xlsx_response(filename, 'Parametre Ölçümleri', columns, rows())
         
     except Exception as e:
         print(f"Parametre ölçümleri Excel export hatası: {e}")
@@ -9567,6 +11327,158 @@ def api_parametre_olcumleri_pdf_export():
         print(f"Parametre ölçümleri PDF export hatası: {e}")
         return jsonify({'error': f'PDF export hatası: {str(e)}'}), 500
 
+# Üretilmiş teklif belgeleri (DOCX/PDF) için içerik adresli disk önbelleği
+TEKLIF_CACHE_DIR = data_path('teklif_cache')
+TEKLIF_CACHE_MAX_BYTES = int(os.environ.get('TEKLIF_CACHE_MAX_MB', '200')) * 1024 * 1024
+_teklif_cache_lock = threading.Lock()
+
+TEKLIF_CACHE_MIMETYPES = {
+    'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    'pdf': 'application/pdf'
+}
+
+def _teklif_template_paths():
+    """create_word_teklif'in kullandığı şablon ve görsellerin yolları"""
+    images_dir = os.path.join(app.root_path, 'static', 'images')
+    return [
+        os.path.join(images_dir, 'TEKLİF-1 GİRİŞ.docx'),
+        os.path.join(images_dir, 'TEKLİF - 2 FİYAT.docx'),
+        os.path.join(images_dir, 'TEKLİF - 3 GENEL HUKUM.docx'),
+        os.path.join(images_dir, 'tek_ust1.jpg')
+    ]
+
+def teklif_cache_key(teklif, firma, ext):
+    """Teklif kaydı, firma kaydı ve şablon mtime'larından önbellek anahtarı üretir"""
+    templates = []
+    for path in _teklif_template_paths():
+        try:
+            st = os.stat(path)
+            templates.append([os.path.basename(path), st.st_mtime_ns, st.st_size])
+        except OSError:
+            templates.append([os.path.basename(path), None, None])
+    payload = json.dumps({
+        'teklif': teklif,
+        'firma': firma,
+        'templates': templates,
+        'format': ext
+    }, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def _teklif_cache_paths(cache_key, ext):
+    return (os.path.join(TEKLIF_CACHE_DIR, f"{cache_key}.{ext}"),
+            os.path.join(TEKLIF_CACHE_DIR, f"{cache_key}.json"))
+
+def teklif_cache_get(cache_key, ext):
+    """Önbellekteki belgeyi (yol, indirme adı) olarak döndürür, yoksa None"""
+    file_path, meta_path = _teklif_cache_paths(cache_key, ext)
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if not os.path.isfile(file_path):
+            metric_cache(f'teklif_{ext}', False)
+            return None
+        # LRU tahliyesi için son kullanım zamanını güncelle
+        os.utime(file_path, None)
+        metric_cache(f'teklif_{ext}', True)
+        return file_path, meta.get('download_name') or os.path.basename(file_path)
+    except (OSError, ValueError):
+        metric_cache(f'teklif_{ext}', False)
+        return None
+
+def teklif_cache_put(cache_key, ext, teklif_id, source_path, download_name):
+    """Üretilen belgeyi önbelleğe kopyalar ve önbellekteki yolunu döndürür"""
+    try:
+        import shutil
+        os.makedirs(TEKLIF_CACHE_DIR, exist_ok=True)
+        file_path, meta_path = _teklif_cache_paths(cache_key, ext)
+        with tempfile.NamedTemporaryFile(delete=False, dir=TEKLIF_CACHE_DIR, suffix='.tmp') as tf:
+            tmp_path = tf.name
+        shutil.copyfile(source_path, tmp_path)
+        os.replace(tmp_path, file_path)
+        _atomic_write_json_unlocked(meta_path, {
+            'teklif_id': teklif_id,
+            'format': ext,
+            'download_name': download_name,
+            'created_at': datetime.now().isoformat()
+        }, indent=2)
+        _evict_teklif_cache()
+        return file_path
+    except Exception as e:
+        print(f"Teklif önbelleğine yazılamadı: {e}")
+        return None
+
+def _evict_teklif_cache():
+    """Önbellek boyutu sınırı aşarsa en eski kullanılan belgeleri siler"""
+    with _teklif_cache_lock:
+        try:
+            entries = []
+            total = 0
+            for fname in os.listdir(TEKLIF_CACHE_DIR):
+                if fname.endswith('.json') or fname.endswith('.tmp'):
+                    continue
+                path = os.path.join(TEKLIF_CACHE_DIR, fname)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                if not os.path.isfile(path):
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+                total += st.st_size
+            entries.sort()
+            for _mtime, size, path in entries:
+                if total <= TEKLIF_CACHE_MAX_BYTES:
+                    break
+                _remove_teklif_cache_entry(path)
+                total -= size
+        except OSError:
+            pass
+
+def _remove_teklif_cache_entry(file_path):
+    meta_path = os.path.splitext(file_path)[0] + '.json'
+    for path in (file_path, meta_path):
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+def clear_teklif_cache():
+    """Tüm teklif belge önbelleğini siler (ör. veri geri yüklendikten sonra)"""
+    if not os.path.isdir(TEKLIF_CACHE_DIR):
+        return
+    with _teklif_cache_lock:
+        for fname in os.listdir(TEKLIF_CACHE_DIR):
+            try:
+                os.unlink(os.path.join(TEKLIF_CACHE_DIR, fname))
+            except OSError:
+                pass
+
+def invalidate_teklif_cache(teklif_id):
+    """Verilen teklife ait tüm önbellek kayıtlarını siler"""
+    if not teklif_id or not os.path.isdir(TEKLIF_CACHE_DIR):
+        return
+    with _teklif_cache_lock:
+        for fname in os.listdir(TEKLIF_CACHE_DIR):
+            if not fname.endswith('.json'):
+                continue
+            meta_path = os.path.join(TEKLIF_CACHE_DIR, fname)
+            try:
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if meta.get('teklif_id') == teklif_id:
+                base = os.path.splitext(meta_path)[0]
+                _remove_teklif_cache_entry(f"{base}.{meta.get('format', 'docx')}")
+
+def _send_cached_teklif(file_path, download_name, ext):
+    return send_file(
+        file_path,
+        as_attachment=True,
+        download_name=download_name,
+        mimetype=TEKLIF_CACHE_MIMETYPES[ext]
+    )
+
 @app.route('/api/teklif/yazdir/<teklif_id>', methods=['POST'])
 def yazdir_teklif(teklif_id):
     """Teklifi Word formatında yazdırır"""
@@ -9594,10 +11506,34 @@ def yazdir_teklif(teklif_id):
             # Geçici firma objesi oluştur
             firma = {'firmaAdi': teklif.get('firma_adi', '')}
         
+        ext = 'docx' if format_type == 'word' else 'pdf'
+        cache_key = teklif_cache_key(teklif, firma, ext)
+        cached = teklif_cache_get(cache_key, ext)
+        if cached:
+            return _send_cached_teklif(cached[0], cached[1], ext)
+
         if format_type == 'word':
-            return create_word_teklif(teklif, firma)
+            result = create_word_teklif(teklif, firma, return_file_info=True)
+            if not isinstance(result, tuple):
+                return result
+            word_path, word_name = result
+            try:
+                cached_path = teklif_cache_put(cache_key, ext, teklif_id, word_path, word_name)
+                if cached_path:
+                    return _send_cached_teklif(cached_path, word_name, ext)
+                with open(word_path, 'rb') as f:
+                    word_bytes = f.read()
+            finally:
+                try:
+                    os.unlink(word_path)
+                except OSError:
+                    pass
+            response = make_response(word_bytes)
+            response.headers['Content-Type'] = TEKLIF_CACHE_MIMETYPES['docx']
+            response.headers['Content-Disposition'] = f'attachment; filename="{word_name}"'
+            return response
         else:
-            return create_pdf_teklif(teklif, firma)
+            return create_pdf_teklif(teklif, firma, cache_key=cache_key)
             
     except Exception as e:
         return jsonify({'success': False, 'message': f'Hata: {str(e)}'})
@@ -9616,66 +11552,48 @@ def export_teklif_excel():
         if not teklifler:
             return jsonify({'success': False, 'message': 'Dışa aktarılacak teklif bulunamadı'}), 404
         # Excel üret
-        pd = load_pandas()
-        df = pd.DataFrame([{
-            'Teklif No': t.get('teklif_no', ''),
-            'Firma Adı': t.get('firma_adi', ''),
-            'Teklif Tipi': t.get('teklif_tipi', ''),
-            'Teklif Tarihi': t.get('teklif_tarihi', ''),
-            'Top Fiyat': t.get('toplam', 0),
-            'İskonto (TL)': t.get('indirim', 0),
-            'Son Fiyat': t.get('netToplam', 0),
-            'Teklif Durumu': t.get('teklif_durumu', ''),
-            'DRM TRH': t.get('durum_tarihi', '')
-        } for t in teklifler])
-        output = BytesIO()
-        with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-            df.to_excel(writer, index=False, sheet_name='Teklifler')
-            workbook = writer.book
-            worksheet = writer.sheets['Teklifler']
-
-            header_format = workbook.add_format({
-                'bold': True,
-                'bg_color': '#0D47A1',
-                'font_color': '#FFFFFF',
-                'align': 'center',
-                'valign': 'vcenter',
-                'border': 0
-            })
-            worksheet.set_row(0, 25, header_format)
-            worksheet.freeze_panes(1, 0)
-            worksheet.autofilter(0, 0, len(df), len(df.columns) - 1)
-
-            column_formats = {
-                'Teklif No': {'width': 18},
-                'Firma Adı': {'width': 38},
-                'Teklif Tipi': {'width': 15},
-                'Teklif Tarihi': {'width': 14, 'num_format': 'dd.mm.yy'},
-                'Top Fiyat': {'width': 16, 'num_format': '#,##0.00'},
-                'İskonto (TL)': {'width': 16, 'num_format': '#,##0.00'},
-                'Son Fiyat': {'width': 16, 'num_format': '#,##0.00'},
-                'Teklif Durumu': {'width': 12},
-                'DRM TRH': {'width': 14}
-            }
-            for col_num, column in enumerate(df.columns):
-                fmt = column_formats.get(column, {})
-                width = fmt.get('width', 14)
-                if 'num_format' in fmt:
-                    col_format = workbook.add_format({
-                        'align': 'right',
-                        'num_format': fmt['num_format']
-                    })
-                else:
-                    col_format = workbook.add_format({'align': 'left'})
-                worksheet.set_column(col_num, col_num, width, col_format)
-        output.seek(0)
-        response = make_response(output.getvalue())
-        response.headers['Content-Type'] = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-        response.headers['Content-Disposition'] = 'attachment; filename="teklif_listesi.xlsx"'
-        return response
+        columns = [
+            {'header': 'Teklif No', 'width': 18, 'align': 'left'},
+            {'header': 'Firma Adı', 'width': 38, 'align': 'left'},
+            {'header': 'Teklif Tipi', 'width': 15, 'align': 'left'},
+            {'header': 'Teklif Tarihi', 'width': 14, 'align': 'right', 'num_format': 'dd.mm.yy'},
+            {'header': 'Top Fiyat', 'width': 16, 'align': 'right', 'num_format': '#,##0.00'},
+            {'header': 'İskonto (TL)', 'width': 16, 'align': 'right', 'num_format': '#,##0.00'},
+            {'header': 'Son Fiyat', 'width': 16, 'align': 'right', 'num_format': '#,##0.00'},
+            {'header': 'Teklif Durumu', 'width': 12, 'align': 'left'},
+            {'header': 'DRM TRH', 'width': 14, 'align': 'left'}
+        ]
+        header_format = {
+            'bold': True,
+            'bg_color': '#0D47A1',
+            'font_color': '#FFFFFF',
+            'align': 'center',
+            'valign': 'vcenter',
+            'border': 0
+        }
+
+        def rows():
+            for t in teklifler:
+                yield [
+                    t.get('teklif_no', ''),
+                    t.get('firma_adi', ''),
+                    t.get('teklif_tipi', ''),
+                    t.get('teklif_tarihi', ''),
+                    t.get('toplam', 0),
+                    t.get('indirim', 0),
+                    t.get('netToplam', 0),
+                    t.get('teklif_durumu', ''),
+                    t.get('durum_tarihi', '')
+                ]
+
+        return stream_xlsx_response(
+            'teklif_listesi.xlsx', 'Teklifler', columns, rows(),
+            header_format=header_format, header_height=25, freeze_header=True, autofilter=True
+        )
     except Exception as e:
         return jsonify({'success': False, 'message': f'Excel export hatası: {str(e)}'}), 500
 
+@report_timer('teklif_word')
 def create_word_teklif(teklif, firma, return_file_info: bool = False):
     try:
         Document, Inches, Pt, RGBColor, WD_ALIGN_PARAGRAPH, WD_TABLE_ALIGNMENT, WD_ALIGN_VERTICAL = load_docx()
@@ -10538,7 +12456,8 @@ def create_word_teklif(teklif, firma, return_file_info: bool = False):
     except Exception as e:
         return jsonify({'success': False, 'message': f'Word dosyası oluşturma hatası: {str(e)}'})
 
-def create_pdf_teklif(teklif, firma):
+@report_timer('teklif_pdf')
+def create_pdf_teklif(teklif, firma, cache_key=None):
     """PDF formatında teklif oluşturur (Word'den PDF'e çevir)"""
     try:
         # Önce DOCX üret
@@ -10566,6 +12485,9 @@ def create_pdf_teklif(teklif, firma):
             with open(pdf_path, 'rb') as f:
                 pdf_bytes = f.read()
 
+            if cache_key:
+                teklif_cache_put(cache_key, 'pdf', teklif.get('id'), pdf_path, pdf_name)
+
             response = make_response(pdf_bytes)
             response.headers['Content-Type'] = 'application/pdf'
             response.headers['Content-Disposition'] = f'attachment; filename="{pdf_name}"'
@@ -11390,6 +13312,60 @@ def api_pivot_export_xlsx():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 # Admin Backup/Restore endpoints
+# Yedekler DATA_DIR/backups altındaki içerik adresli depoda tutulur (bkz. backup_store.py):
+# her yedek bir manifesttir, değişmeyen dosyalar yeniden kopyalanmaz. Saklama süresi
+# BACKUP_KEEP_LAST / BACKUP_KEEP_HOURLY / BACKUP_KEEP_DAILY / BACKUP_KEEP_MONTHLY ile ayarlanır.
+BACKUP_DATA_FILES = COLLECTION_FILES
+BACKUP_DIR = os.environ.get('BACKUP_DIR') or data_path('backups')
+BACKUP_RETENTION = RetentionPolicy.from_env()
+backup_store = BackupStore(BACKUP_DIR)
+
+def create_data_backup(label='manual'):
+    """Koleksiyonların tutarlı bir andaki yedeğini alır ve saklama politikasını uygular; manifest döner"""
+    files = {name: data_path(name) for name in BACKUP_DATA_FILES}
+    previous = backup_store.latest_manifest()
+    # Kapı içinde sadece stat ve değişen dosyaların baytları okunur; hash, gzip ve fsync kapı
+    # bırakıldıktan sonra yapılır. Yazıcılar genelde birkaç milisaniye bekler.
+    with storage_snapshot() as snap:
+        captured = backup_store.capture(files, previous=previous)
+    manifest = backup_store.commit(captured, label=label)
+    manifest['snapshot_wait_ms'] = snap['waited_ms']
+    manifest['cleanup'] = cleanup_old_backups()
+    return manifest
+
+def restore_data_backup(snapshot_id):
+    """Yedekteki koleksiyonları doğrulayıp tek set olarak geri yükler; (dosya adları, güvenlik yedeği) döner"""
+    manifest = backup_store.load_manifest(snapshot_id)
+    if not manifest:
+        raise KeyError(f'Yedek bulunamadı: {snapshot_id}')
+    import shutil
+    staging_dir = new_restore_staging()
+    try:
+        # Tüm içerik önce hazırlanır ve doğrulanır; eksik/bozuk obje varsa hiçbir dosyaya dokunulmaz
+        names = []
+        for name, entry in manifest.get('files', {}).items():
+            if name in BACKUP_DATA_FILES:
+                _write_file_durable(os.path.join(staging_dir, name), backup_store.read_object(entry['sha256']))
+                names.append(name)
+        errors = validate_staged_restore(staging_dir, names)
+        if errors:
+            raise ValueError('; '.join(errors))
+        safety = commit_staged_restore(staging_dir, names)
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+    return sorted(names), safety
+
+def _backup_summary(manifest):
+    return {
+        'id': manifest['id'],
+        'created_at': manifest.get('created_at'),
+        'label': manifest.get('label'),
+        'files': len(manifest.get('files', {})),
+        'total_bytes': manifest.get('total_bytes', 0),
+        'new_bytes': manifest.get('new_bytes', 0),
+        'duration_ms': manifest.get('duration_ms')
+    }
+
 @app.route('/api/admin/backup', methods=['POST'])
 def api_admin_backup():
     """Admin için veri yedekleme"""
@@ -11401,55 +13377,42 @@ def api_admin_backup():
         return jsonify({'success': False, 'error': 'Bu işlem için admin yetkisi gerekiyor'}), 403
     
     try:
-        from datetime import datetime
-        import shutil
-        
-        # Yedekleme dizini oluştur
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        backup_dir = f'backups/backup_{timestamp}'
-        os.makedirs(backup_dir, exist_ok=True)
-        
-        # Yedeklenecek dosyalar
-        data_files = [
-            'firma_kayit.json',
-            'teklif.json', 
-            'firma_olcum.json',
-            'saha_olc.json',
-            'parameters.json',
-            'baca_bilgileri.json',
-            'parametre_olcum.json',
-            'parametre_sahabil.json',
-            'asgari_fiyatlar.json',
-            'forms.json',
-            'users.json',
-            'used_teklif_numbers.json',
-            'par_saha_header_groups.json'
-        ]
-        
-        backed_up_files = []
-        for file in data_files:
-            src_path = data_path(file)
-            dst_path = os.path.join(backup_dir, file)
-            if os.path.exists(src_path):
-                shutil.copy2(src_path, dst_path)
-                backed_up_files.append(file)
-        
-        # Eski yedekleri temizle (7 günden eski)
-        cleanup_old_backups()
-        
+        manifest = create_data_backup('manual')
         return jsonify({
             'success': True, 
-            'message': f'{len(backed_up_files)} dosya yedeklendi. Yedek klasörü: {backup_dir}',
-            'backup_dir': backup_dir,
-            'files': backed_up_files
+            'message': f"{len(manifest['files'])} dosya yedeklendi ({manifest['hashed_files']} değişmiş). Yedek: {manifest['id']}",
+            'backup_id': manifest['id'],
+            'files': sorted(manifest['files']),
+            'new_bytes': manifest['new_bytes'],
+            'duration_ms': manifest['duration_ms'],
+            'cleanup': manifest['cleanup']
         })
         
     except Exception as e:
         return jsonify({'success': False, 'error': f'Yedekleme hatası: {str(e)}'}), 500
 
+@app.route('/api/admin/backups', methods=['GET'])
+def api_admin_backups():
+    """Admin için yedek listesi, depo boyutu ve saklama politikası"""
+    if not session.get('logged_in'):
+        return jsonify({'success': False, 'error': 'Oturum açmanız gerekiyor'}), 401
+    
+    if session.get('username') != 'admin':
+        return jsonify({'success': False, 'error': 'Bu işlem için admin yetkisi gerekiyor'}), 403
+    
+    try:
+        return jsonify({
+            'success': True,
+            'backups': [_backup_summary(m) for m in backup_store.list_snapshots()],
+            'store': backup_store.stats(),
+            'retention': BACKUP_RETENTION.to_dict()
+        })
+    except Exception as e:
+        return jsonify({'success': False, 'error': f'Yedekler listelenemedi: {str(e)}'}), 500
+
 @app.route('/api/admin/restore', methods=['POST'])
 def api_admin_restore():
-    """Admin için veri geri yükleme"""
+    """Admin için veri geri yükleme (varsayılan: en son yedek, veya body'de backup_id)"""
     if not session.get('logged_in'):
         return jsonify({'success': False, 'error': 'Oturum açmanız gerekiyor'}), 401
     
@@ -11458,90 +13421,146 @@ def api_admin_restore():
         return jsonify({'success': False, 'error': 'Bu işlem için admin yetkisi gerekiyor'}), 403
     
     try:
-        import shutil
-        from datetime import datetime
-        
-        # En son yedek klasörünü bul
-        backup_base_dir = 'backups'
-        if not os.path.exists(backup_base_dir):
-            return jsonify({'success': False, 'error': 'Yedek klasörü bulunamadı'}), 404
-        
-        # Yedek klasörlerini listele
-        backup_dirs = [d for d in os.listdir(backup_base_dir) if d.startswith('backup_')]
-        if not backup_dirs:
-            return jsonify({'success': False, 'error': 'Yedek dosyası bulunamadı'}), 404
-        
-        # En son yedek klasörünü seç
-        latest_backup = sorted(backup_dirs)[-1]
-        latest_backup_path = os.path.join(backup_base_dir, latest_backup)
-        
-        # Mevcut dosyaları yedekle (güvenlik için)
-        current_backup_time = datetime.now().strftime("%Y%m%d_%H%M%S")
-        current_backup_dir = f'backups/current_backup_{current_backup_time}'
-        os.makedirs(current_backup_dir, exist_ok=True)
-        
-        data_files = [
-            'firma_kayit.json',
-            'teklif.json', 
-            'firma_olcum.json',
-            'saha_olc.json',
-            'parameters.json',
-            'baca_bilgileri.json',
-            'parametre_olcum.json',
-            'parametre_sahabil.json',
-            'asgari_fiyatlar.json',
-            'forms.json',
-            'users.json',
-            'used_teklif_numbers.json',
-            'par_saha_header_groups.json'
-        ]
-        
-        # Mevcut dosyaları yedekle
-        for file in data_files:
-            src_path = data_path(file)
-            if os.path.exists(src_path):
-                shutil.copy2(src_path, os.path.join(current_backup_dir, file))
-        
-        # Yedek dosyalarını geri yükle
-        restored_files = []
-        for file in data_files:
-            backup_file = os.path.join(latest_backup_path, file)
-            dst_path = data_path(file)
-            if os.path.exists(backup_file):
-                shutil.copy2(backup_file, dst_path)
-                restored_files.append(file)
+        payload = request.get_json(silent=True) or {}
+        backup_id = payload.get('backup_id')
+        if not backup_id:
+            # Önceki geri yüklemelerin güvenlik yedekleri "en son yedek" sayılmaz
+            candidates = [m for m in backup_store.list_snapshots() if m.get('label') != 'pre-restore']
+            if not candidates:
+                return jsonify({'success': False, 'error': 'Yedek dosyası bulunamadı'}), 404
+            backup_id = candidates[0]['id']
+        elif not backup_store.load_manifest(backup_id):
+            return jsonify({'success': False, 'error': 'Yedek bulunamadı'}), 404
+        
+        # Mevcut dosyalar geri yüklemeyle aynı anda yedeklenir (güvenlik için)
+        restored_files, safety = restore_data_backup(backup_id)
         
         return jsonify({
             'success': True, 
-            'message': f'{len(restored_files)} dosya geri yüklendi. Yedek: {latest_backup}',
+            'message': f'{len(restored_files)} dosya geri yüklendi. Yedek: {backup_id}',
             'restored_files': restored_files,
-            'backup_used': latest_backup
+            'backup_used': backup_id,
+            'pre_restore_backup': safety['id']
         })
         
     except Exception as e:
         return jsonify({'success': False, 'error': f'Geri yükleme hatası: {str(e)}'}), 500
 
 def cleanup_old_backups():
-    """7 günden eski yedekleri temizler"""
-    import shutil
-    backup_dir = 'backups'
-    if not os.path.exists(backup_dir):
-        return
-    
-    from datetime import datetime
-    current_time = datetime.now()
-    for item in os.listdir(backup_dir):
-        item_path = os.path.join(backup_dir, item)
-        if os.path.isdir(item_path):
-            # Dizin oluşturma zamanını kontrol et
-            creation_time = datetime.fromtimestamp(os.path.getctime(item_path))
-            if (current_time - creation_time).days > 7:
-                shutil.rmtree(item_path)
-                print(f"🗑️ Eski yedek silindi: {item}")
+    """Saklama politikasına uymayan yedekleri ve artık kullanılmayan içerikleri siler"""
+    result = backup_store.prune(BACKUP_RETENTION)
+    if result['removed_snapshots']:
+        print(f"🗑️ {len(result['removed_snapshots'])} eski yedek silindi, {result['freed_bytes']} bayt boşaldı")
+    return result
+
+# Akışlı ZIP yedek: arşiv bellekte toplanmaz, zipfile'ın yazdığı baytlar parça parça gönderilir.
+# JSON koleksiyonları tutarlı anlık görüntüden, fotoğraf/görseller diskten okunur; arşivin
+# sonuna her dosyanın boyutu ve sha256'sını içeren manifest.json eklenir.
+BACKUP_ZIP_CHUNK_SIZE = 1024 * 1024
+BACKUP_MANIFEST_NAME = 'manifest.json'
+# Zaten sıkıştırılmış türler yeniden sıkıştırılmaz (CPU harcamadan saklanır)
+BACKUP_STORED_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.zip', '.docx', '.xlsx', '.pdf', '.gz'}
+
+class _ZipStreamBuffer:
+    """zipfile için seek edilemeyen yazma hedefi; yazılanlar drain() ile alınır"""
+
+    def __init__(self):
+        self._chunks = []
+        self._pending = 0
+        self._offset = 0
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._pending += len(data)
+        self._offset += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._offset
+
+    def flush(self):
+        pass
+
+    @property
+    def pending(self):
+        return self._pending
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        self._pending = 0
+        return data
+
+def _backup_media_files(include_photos, include_images):
+    """(arşiv adı, dosya yolu) çiftleri: uploads/photos/... ve images/..."""
+    sources = []
+    if include_photos:
+        sources.append(('uploads/photos', PHOTOS_DIR))
+    if include_images:
+        sources.append(('images', IMAGES_DIR))
+    for prefix, directory in sources:
+        if not os.path.isdir(directory):
+            continue
+        # Fotoğraf varyantları (web/thumb) orijinalden yeniden üretilebilir; arşive alınmaz
+        skip_dirs = set(PHOTO_VARIANTS) if directory == PHOTOS_DIR else set()
+        for root, dirs, files in os.walk(directory):
+            dirs[:] = sorted(d for d in dirs if not (root == directory and d in skip_dirs))
+            for fname in sorted(files):
+                if fname.startswith('.'):  # Yarım kalmış yüklemelerin geçici dosyaları
+                    continue
+                path = os.path.join(root, fname)
+                rel = os.path.relpath(path, directory).replace(os.sep, '/')
+                yield f"{prefix}/{rel}", path
+
+def iter_backup_zip(contents, media_files=(), info=None):
+    """ZIP arşivini parça parça üretir; contents: {ad: bayt}, media_files: (arşiv adı, yol)"""
+    import zipfile
+    buffer = _ZipStreamBuffer()
+    entries = []
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        for name, data in contents.items():
+            zip_file.writestr(name, data)
+            entries.append({'name': name, 'size': len(data), 'sha256': hashlib.sha256(data).hexdigest()})
+            yield buffer.drain()
+        for arcname, path in media_files:
+            try:
+                src = open(path, 'rb')
+            except OSError:
+                continue
+            with src:
+                zinfo = zipfile.ZipInfo.from_file(path, arcname)
+                if os.path.splitext(arcname)[1].lower() in BACKUP_STORED_EXTENSIONS:
+                    zinfo.compress_type = zipfile.ZIP_STORED
+                else:
+                    zinfo.compress_type = zipfile.ZIP_DEFLATED
+                digest = hashlib.sha256()
+                size = 0
+                with zip_file.open(zinfo, 'w', force_zip64=zinfo.file_size > 0x7FFFFFFF) as dst:
+                    while True:
+                        chunk = src.read(BACKUP_ZIP_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        digest.update(chunk)
+                        size += len(chunk)
+                        dst.write(chunk)
+                        if buffer.pending >= BACKUP_ZIP_CHUNK_SIZE:
+                            yield buffer.drain()
+            entries.append({'name': arcname, 'size': size, 'sha256': digest.hexdigest()})
+            yield buffer.drain()
+        manifest = dict(info or {})
+        manifest['files'] = entries
+        zip_file.writestr(BACKUP_MANIFEST_NAME, json.dumps(manifest, ensure_ascii=False, indent=2))
+    yield buffer.drain()
+
+def _request_flag(name):
+    """Bayrak JSON gövdesinden, formdan veya sorgu parametresinden okunur"""
+    payload = request.get_json(silent=True) or {}
+    value = payload.get(name, request.values.get(name))
+    return str(value).lower() in ('1', 'true', 'on', 'yes')
 
 @app.route('/api/admin/backup-download', methods=['POST'])
 def api_admin_backup_download():
-    """Admin için veri yedekleme - ZIP dosyası olarak indir"""
+    """Admin için veri yedekleme - ZIP dosyası olarak akışlı indir (include_photos / include_images)"""
     if not session.get('logged_in'):
         return jsonify({'success': False, 'error': 'Oturum açmanız gerekiyor'}), 401
     
@@ -11550,45 +13569,32 @@ def api_admin_backup_download():
         return jsonify({'success': False, 'error': 'Bu işlem için admin yetkisi gerekiyor'}), 403
     
     try:
-        import zipfile
-        import io
         from datetime import datetime
         
-        # Yedeklenecek dosyalar
-        data_files = [
-            'firma_kayit.json',
-            'teklif.json', 
-            'firma_olcum.json',
-            'saha_olc.json',
-            'parameters.json',
-            'baca_bilgileri.json',
-            'parametre_olcum.json',
-            'parametre_sahabil.json',
-            'asgari_fiyatlar.json',
-            'forms.json',
-            'users.json',
-            'used_teklif_numbers.json',
-            'par_saha_header_groups.json'
-        ]
+        include_photos = _request_flag('include_photos')
+        include_images = _request_flag('include_images')
         
-        # ZIP dosyası oluştur
-        zip_buffer = io.BytesIO()
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            for file in data_files:
-                src_path = data_path(file)
-                if os.path.exists(src_path):
-                    zip_file.write(src_path, file)
+        # Koleksiyonlar tek bir tutarlı anda okunur, arşiv yazıcılar beklemeden oluşturulur
+        contents = read_storage_snapshot(BACKUP_DATA_FILES)
         
-        zip_buffer.seek(0)
+        info = {
+            'format': 'emisyon-backup',
+            'version': 1,
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'include_photos': include_photos,
+            'include_images': include_images
+        }
+        media_files = _backup_media_files(include_photos, include_images)
         
         # Dosya adı oluştur
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f'emisyon_backup_{timestamp}.zip'
         
-        return zip_buffer.getvalue(), 200, {
-            'Content-Type': 'application/zip',
-            'Content-Disposition': f'attachment; filename="{filename}"'
-        }
+        response = app.response_class(iter_backup_zip(contents, media_files, info),
+                                      mimetype='application/zip', direct_passthrough=True)
+        response.headers['Content-Disposition'] = _attachment_disposition(filename)
+        response.headers['Cache-Control'] = 'no-store'
+        return response
         
     except Exception as e:
         return jsonify({'success': False, 'error': f'Yedekleme hatası: {str(e)}'}), 500
@@ -11638,9 +13644,263 @@ def api_forms_genel_hukum_docx():
         print(f"GENEL_HUKUM.docx okuma hatası: {e}")
         return jsonify({'success': False, 'error': f'Dosya okuma hatası: {str(e)}'}), 500
 
+# Doğrulamalı geri yükleme: yüklenen dosyalar DATA_DIR içindeki bir hazırlık klasörüne akışla
+# açılır, her koleksiyon şemaya göre denetlenir ve hepsi geçerliyse tek set olarak yerine
+# konur. Yerine koymadan önce klasöre COMMIT günlüğü yazılır; işlem yarıda kesilirse açılışta
+# recover_interrupted_restore() kalan dosyaları tamamlar. Hatalı bir dosya varsa hiçbir
+# koleksiyona dokunulmaz.
+RESTORE_STAGING_PREFIX = '.restore-'
+RESTORE_COMMIT_NAME = 'COMMIT'
+RESTORE_MAX_FILE_BYTES = int(os.environ.get('RESTORE_MAX_FILE_MB', '200')) * 1024 * 1024
+RESTORE_STALE_STAGING_SECONDS = 3600
+DATA_GENERATION_FILE = data_path('.data_generation')
+TEKLIF_MIGRATIONS_MARKER = data_path('.teklif_migrations.done')
+
+# Koleksiyon şemaları: üst düzey tür, kayıt türü ve uygulamanın dayandığı zorunlu alanlar
+COLLECTION_SCHEMAS = {
+    'firma_kayit.json': {'type': list, 'item': dict, 'required': ('firmaAdi',)},
+    'teklif.json': {'type': list, 'item': dict, 'required': ('id', 'teklif_no', 'firma_adi')},
+    'firma_olcum.json': {'type': list, 'item': dict, 'required': ('firma_adi', 'olcum_kodu')},
+    'saha_olc.json': {'type': list, 'item': dict},
+    'parameters.json': {'type': list, 'item': dict, 'required': ('Parametre Adı',)},
+    'baca_bilgileri.json': {'type': list, 'item': dict, 'required': ('firma_adi', 'olcum_kodu', 'baca_adi')},
+    'parametre_olcum.json': {'type': list, 'item': dict,
+                             'required': ('firma_adi', 'olcum_kodu', 'baca_adi', 'parametre_adi')},
+    'parametre_sahabil.json': {'type': list, 'item': dict},
+    'asgari_fiyatlar.json': {'type': list, 'item': dict, 'required': ('parametre',)},
+    'forms.json': {'type': list, 'item': dict},
+    'users.json': {'type': dict, 'values': dict, 'required': ('password', 'role')},
+    'used_teklif_numbers.json': {'type': list, 'item': str},
+    'par_saha_header_groups.json': {'type': dict, 'keys': {'groups': list}}
+}
+COLLECTION_SCHEMA_MAX_ERRORS = 10
+_SCHEMA_TYPE_LABELS = {list: 'liste', dict: 'nesne', str: 'metin'}
+
+def validate_collection(name, data):
+    """Koleksiyon verisini şemaya göre denetler; hata mesajları listesi döner (boşsa geçerli)"""
+    schema = COLLECTION_SCHEMAS.get(name)
+    if schema is None:
+        return [f'{name}: bilinmeyen koleksiyon']
+    if not isinstance(data, schema['type']):
+        return [f"{name}: {_SCHEMA_TYPE_LABELS[schema['type']]} bekleniyordu, {type(data).__name__} geldi"]
+    errors = []
+    for key, expected in schema.get('keys', {}).items():
+        if not isinstance(data.get(key), expected):
+            errors.append(f"{name}: '{key}' alanı {_SCHEMA_TYPE_LABELS[expected]} olmalı")
+    item_type = schema.get('item') or schema.get('values')
+    if item_type is None:
+        return errors
+    required = schema.get('required', ())
+    items = enumerate(data) if isinstance(data, list) else data.items()
+    for key, item in items:
+        if len(errors) >= COLLECTION_SCHEMA_MAX_ERRORS:
+            errors.append(f'{name}: ... (diğer hatalar gösterilmiyor)')
+            break
+        if not isinstance(item, item_type):
+            errors.append(f'{name}[{key}]: {_SCHEMA_TYPE_LABELS[item_type]} bekleniyordu')
+            continue
+        missing = [field for field in required if field not in item]
+        if missing:
+            errors.append(f"{name}[{key}]: eksik alan: {', '.join(missing)}")
+    return errors
+
+def _data_root():
+    return DATA_DIR or app.root_path
+
+def _fsync_dir(directory):
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def _write_file_durable(path, data: bytes):
+    with open(path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+def new_restore_staging():
+    """Koleksiyonlarla aynı dosya sisteminde hazırlık klasörü (os.replace atomik olsun)"""
+    return tempfile.mkdtemp(prefix=RESTORE_STAGING_PREFIX, dir=_data_root())
+
+def _stage_stream(src, dst_path):
+    """Kaynağı parça parça diske yazar, sha256 döner; RESTORE_MAX_FILE_BYTES aşılırsa ValueError"""
+    digest = hashlib.sha256()
+    size = 0
+    with open(dst_path, 'wb') as dst:
+        while True:
+            chunk = src.read(BACKUP_ZIP_CHUNK_SIZE)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > RESTORE_MAX_FILE_BYTES:
+                raise ValueError(f'{os.path.basename(dst_path)}: dosya çok büyük (en fazla {RESTORE_MAX_FILE_BYTES // (1024 * 1024)} MB)')
+            digest.update(chunk)
+            dst.write(chunk)
+        dst.flush()
+        os.fsync(dst.fileno())
+    return digest.hexdigest()
+
+def stage_restore_uploads(files, staging_dir):
+    """Yüklenen ZIP/JSON dosyalarını hazırlık klasörüne açar; (hazırlanan adlar, hatalar, atlananlar)"""
+    import zipfile
+    staged, errors, ignored = [], [], []
+    for index, upload in enumerate(files):
+        filename = os.path.basename(upload.filename or '')
+        if filename.lower().endswith('.zip'):
+            # Yükleme belleğe alınmaz: werkzeug'un geçici dosyasından parça parça kopyalanır
+            archive_path = os.path.join(staging_dir, f'upload-{index}.zip')
+            upload.save(archive_path)
+            try:
+                with zipfile.ZipFile(archive_path) as zip_file:
+                    checksums = {}
+                    if BACKUP_MANIFEST_NAME in zip_file.namelist():
+                        try:
+                            manifest = json.loads(zip_file.read(BACKUP_MANIFEST_NAME))
+                            checksums = {e['name']: e.get('sha256') for e in manifest.get('files', [])}
+                        except (ValueError, KeyError, TypeError, AttributeError):
+                            errors.append(f'{filename}: {BACKUP_MANIFEST_NAME} okunamadı')
+                    for info in zip_file.infolist():
+                        name = info.filename
+                        if name not in BACKUP_DATA_FILES:
+                            if name != BACKUP_MANIFEST_NAME and not info.is_dir():
+                                ignored.append(name)
+                            continue
+                        if info.file_size > RESTORE_MAX_FILE_BYTES:
+                            errors.append(f'{name}: dosya çok büyük')
+                            continue
+                        try:
+                            with zip_file.open(info) as src:
+                                digest = _stage_stream(src, os.path.join(staging_dir, name))
+                        except (ValueError, zipfile.BadZipFile) as e:
+                            errors.append(f'{name}: {e}')
+                            continue
+                        if checksums.get(name) and checksums[name] != digest:
+                            errors.append(f'{name}: sha256 {BACKUP_MANIFEST_NAME} ile uyuşmuyor')
+                        if name not in staged:
+                            staged.append(name)
+            except zipfile.BadZipFile:
+                errors.append(f'{filename}: geçerli bir ZIP dosyası değil')
+            finally:
+                os.unlink(archive_path)
+        elif filename in BACKUP_DATA_FILES:
+            try:
+                _stage_stream(upload.stream, os.path.join(staging_dir, filename))
+            except ValueError as e:
+                errors.append(str(e))
+                continue
+            if filename not in staged:
+                staged.append(filename)
+        elif filename:
+            ignored.append(filename)
+    return staged, errors, ignored
+
+def validate_staged_restore(staging_dir, names):
+    """Hazırlanan her koleksiyonu JSON olarak ayrıştırır ve şemaya göre denetler"""
+    errors = []
+    for name in sorted(names):
+        try:
+            with open(os.path.join(staging_dir, name), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (ValueError, UnicodeDecodeError) as e:
+            errors.append(f'{name}: geçersiz JSON ({e})')
+            continue
+        errors.extend(validate_collection(name, data))
+    return errors
+
+def _apply_staged_restore(staging_dir, names):
+    for name in names:
+        src = os.path.join(staging_dir, name)
+        if os.path.exists(src):
+            os.replace(src, data_path(name))
+    # Geri yüklenen teklifler eski numara formatında olabilir: migration'lar bir kez daha çalışsın
+    try:
+        os.unlink(TEKLIF_MIGRATIONS_MARKER)
+    except FileNotFoundError:
+        pass
+    _fsync_dir(_data_root())
+
+def commit_staged_restore(staging_dir, names):
+    """Mevcut veriyi yedekler, hazırlanan dosyaları tek set olarak yerine koyar; güvenlik yedeğini döner"""
+    names = sorted(names)
+    _write_file_durable(os.path.join(staging_dir, RESTORE_COMMIT_NAME), json.dumps(names).encode('utf-8'))
+    files = {name: data_path(name) for name in BACKUP_DATA_FILES}
+    # Anlık görüntü kapısı özel alınır: devam eden yazımlar biter, yenileri set yerine konana kadar
+    # bekler. Güvenlik yedeği aynı bölümde alınır; arada yapılan bir yazım kaybolmaz. create_data_backup'tan
+    # farklı olarak yedek kapı içinde diske yazılır: dosyalar değiştirilmeden önce kalıcı olmalıdır.
+    with storage_snapshot():
+        safety = backup_store.create_snapshot(files, label='pre-restore')
+        _apply_staged_restore(staging_dir, names)
+    clear_teklif_cache()
+    bump_data_generation()
+    cleanup_old_backups()
+    return safety
+
+def recover_interrupted_restore():
+    """Açılışta yarım kalan geri yüklemeleri tamamlar (COMMIT varsa) veya eski hazırlıkları siler"""
+    import shutil
+    root = _data_root()
+    try:
+        entries = [e for e in os.listdir(root) if e.startswith(RESTORE_STAGING_PREFIX)]
+    except OSError:
+        return
+    for entry in entries:
+        staging_dir = os.path.join(root, entry)
+        journal = os.path.join(staging_dir, RESTORE_COMMIT_NAME)
+        try:
+            if os.path.exists(journal):
+                with open(journal, 'r', encoding='utf-8') as f:
+                    names = [n for n in json.load(f) if n in BACKUP_DATA_FILES]
+                _apply_staged_restore(staging_dir, names)
+                print(f"Yarım kalan geri yükleme tamamlandı: {entry} ({len(names)} dosya)")
+            elif time.time() - os.path.getmtime(staging_dir) < RESTORE_STALE_STAGING_SECONDS:
+                # Başka bir süreçte sürmekte olan hazırlık olabilir
+                continue
+            shutil.rmtree(staging_dir, ignore_errors=True)
+        except (OSError, ValueError) as e:
+            print(f"Geri yükleme kurtarma hatası ({entry}): {e}")
+
+# Veri kuşağı: geri yükleme DATA_GENERATION_FILE'ı yeniler; her worker istek başında dosyanın
+# mtime'ına bakar ve değiştiyse kendi bellek önbelleklerini boşaltır.
+def _data_generation_stamp():
+    try:
+        st = os.stat(DATA_GENERATION_FILE)
+        return (st.st_ino, st.st_mtime_ns)
+    except OSError:
+        return None
+
+_seen_data_generation = _data_generation_stamp()
+
+def invalidate_data_caches():
+    """Bu süreçteki veri türevli önbellekleri boşaltır (geri yükleme sonrası)"""
+    global users, _seen_data_generation
+    _seen_data_generation = _data_generation_stamp()
+    with _paged_list_lock:
+        _paged_list_indexes.clear()
+    # Geri yükleme migration işaretini siler; bu süreç bir sonraki numara üretiminde işarete bakar
+    teklif_migrations.reset()
+    users = load_users()
+
+def bump_data_generation():
+    _write_file_durable(DATA_GENERATION_FILE, uuid4().hex.encode('ascii'))
+    invalidate_data_caches()
+
+@app.before_request
+def check_data_generation():
+    if _data_generation_stamp() != _seen_data_generation:
+        invalidate_data_caches()
+
+recover_interrupted_restore()
+
 @app.route('/api/admin/restore-upload', methods=['POST'])
 def api_admin_restore_upload():
-    """Admin için veri geri yükleme - Yüklenen dosyalardan"""
+    """Admin için veri geri yükleme - Yüklenen ZIP/JSON dosyalarından, doğrulamalı ve atomik"""
     if not session.get('logged_in'):
         return jsonify({'success': False, 'error': 'Oturum açmanız gerekiyor'}), 401
     
@@ -11648,12 +13908,10 @@ def api_admin_restore_upload():
     if session.get('username') != 'admin':
         return jsonify({'success': False, 'error': 'Bu işlem için admin yetkisi gerekiyor'}), 403
     
+    import shutil
+    
+    staging_dir = None
     try:
-        import zipfile
-        import io
-        import shutil
-        from datetime import datetime
-        
         if 'files' not in request.files:
             return jsonify({'success': False, 'error': 'Dosya bulunamadı'}), 400
         
@@ -11661,71 +13919,317 @@ def api_admin_restore_upload():
         if not files or files[0].filename == '':
             return jsonify({'success': False, 'error': 'Dosya seçilmedi'}), 400
         
-        # Mevcut dosyaları yedekle (güvenlik için)
-        current_backup_time = datetime.now().strftime("%Y%m%d_%H%M%S")
-        current_backup_dir = f'backups/current_backup_{current_backup_time}'
-        os.makedirs(current_backup_dir, exist_ok=True)
-        
-        data_files = [
-            'firma_kayit.json',
-            'teklif.json', 
-            'firma_olcum.json',
-            'saha_olc.json',
-            'parameters.json',
-            'baca_bilgileri.json',
-            'parametre_olcum.json',
-            'parametre_sahabil.json',
-            'asgari_fiyatlar.json',
-            'forms.json',
-            'users.json',
-            'used_teklif_numbers.json',
-            'par_saha_header_groups.json'
-        ]
+        staging_dir = new_restore_staging()
+        restored_files, errors, ignored = stage_restore_uploads(files, staging_dir)
+        if not errors:
+            errors = validate_staged_restore(staging_dir, restored_files)
+        if not restored_files and not errors:
+            errors = ['Yüklenen dosyalarda geri yüklenecek veri dosyası yok']
+        if errors:
+            return jsonify({
+                'success': False,
+                'error': 'Geri yükleme iptal edildi, hiçbir dosya değiştirilmedi: ' + '; '.join(errors[:5]),
+                'errors': errors
+            }), 400
         
-        # Mevcut dosyaları yedekle
-        for file in data_files:
-            src_path = data_path(file)
-            if os.path.exists(src_path):
-                shutil.copy2(src_path, os.path.join(current_backup_dir, file))
-        
-        restored_files = []
-        
-        # ZIP dosyası kontrolü
-        for file in files:
-            if file.filename.endswith('.zip'):
-                # ZIP dosyasını çıkar
-                zip_data = file.read()
-                with zipfile.ZipFile(io.BytesIO(zip_data), 'r') as zip_file:
-                    for zip_info in zip_file.infolist():
-                        if zip_info.filename in data_files:
-                            # Dosyayı çıkar ve kaydet
-                            file_data = zip_file.read(zip_info.filename)
-                            dst_path = data_path(zip_info.filename)
-                            with open(dst_path, 'wb') as f:
-                                f.write(file_data)
-                            restored_files.append(zip_info.filename)
-            else:
-                # Tekil JSON dosyası
-                filename = file.filename
-                if filename in data_files:
-                    file.save(data_path(filename))
-                    restored_files.append(filename)
+        # Mevcut dosyalar geri yüklemeyle aynı anda yedeklenir (güvenlik için)
+        safety = commit_staged_restore(staging_dir, restored_files)
         
         return jsonify({
             'success': True, 
             'message': f'{len(restored_files)} dosya geri yüklendi.',
-            'restored_files': restored_files
+            'restored_files': sorted(restored_files),
+            'ignored_files': ignored[:20],
+            'pre_restore_backup': safety['id']
         })
         
     except Exception as e:
         return jsonify({'success': False, 'error': f'Geri yükleme hatası: {str(e)}'}), 500
+    finally:
+        if staging_dir:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+# Veri bütünlüğü izleme (eski data_monitor.py döngüsünün yerini alır). Her koleksiyon sadece
+# sürümü (mtime/boyut) değiştiğinde yeniden okunur; içerik hash'i aynıysa ayrıştırılmaz.
+# Dosya denetimi şemayı (COLLECTION_SCHEMAS) ve yinelenen id'leri kontrol eder ve referans
+# denetimleri için küçük anahtar kümeleri çıkarır; referans denetimleri yalnızca girdilerinden
+# biri değiştiğinde bu kümeler üzerinden yeniden hesaplanır.
+INTEGRITY_EXAMPLE_LIMIT = 5
+
+def _integrity_text(value):
+    return str(value or '').strip()
+
+def _integrity_keys(name, data):
+    """Referans denetimleri için koleksiyondan çıkarılan anahtar kümeleri"""
+    t = _integrity_text
+    if name == 'firma_kayit.json':
+        return {'firmalar': {t(r.get('firmaAdi')) for r in data}}
+    if name == 'firma_olcum.json':
+        return {'olcumler': {(t(r.get('firma_adi')), t(r.get('olcum_kodu'))) for r in data}}
+    if name == 'baca_bilgileri.json':
+        return {'bacalar': {(t(r.get('firma_adi')), t(r.get('olcum_kodu')), t(r.get('baca_adi'))) for r in data}}
+    if name == 'parametre_olcum.json':
+        return {'parametre_bacalari': {(t(r.get('firma_adi')), t(r.get('olcum_kodu')), t(r.get('baca_adi')))
+                                       for r in data}}
+    if name == 'teklif.json':
+        return {'teklif_numaralari': {t(r.get('teklif_no')) for r in data if t(r.get('teklif_no'))}}
+    if name == 'used_teklif_numbers.json':
+        return {'kullanilan_numaralar': {t(n) for n in data}}
+    return {}
+
+# (ad, alt koleksiyon, anahtar, üst koleksiyon, anahtar, alt anahtarı üst anahtara çeviren fonksiyon)
+INTEGRITY_RELATIONS = [
+    ('parametre_olcum→baca_bilgileri', 'parametre_olcum.json', 'parametre_bacalari',
+     'baca_bilgileri.json', 'bacalar', lambda key: key),
+    ('baca_bilgileri→firma_olcum', 'baca_bilgileri.json', 'bacalar',
+     'firma_olcum.json', 'olcumler', lambda key: key[:2]),
+    ('firma_olcum→firma_kayit', 'firma_olcum.json', 'olcumler',
+     'firma_kayit.json', 'firmalar', lambda key: key[0]),
+    ('teklif→used_teklif_numbers', 'teklif.json', 'teklif_numaralari',
+     'used_teklif_numbers.json', 'kullanilan_numaralar', lambda key: key),
+]
+
+def _integrity_example(key):
+    return ' / '.join(key) if isinstance(key, tuple) else key
+
+class IntegrityMonitor:
+    """Koleksiyonların artımlı bütünlük denetimi; sonuçlar süreç içinde saklanır"""
+
+    def __init__(self, names, relations):
+        self.names = list(names)
+        self.relations = relations
+        self._files = {}
+        self._relations = {}
+        self._last_report = None
+        self._lock = threading.Lock()
+
+    def _check_file(self, name, version):
+        """Dosyayı okur, şemaya göre denetler; içerik değişmediyse önceki sonucu kullanır"""
+        path = data_path(name)
+        previous = self._files.get(name)
+        started = time.perf_counter()
+        if version == '0':
+            return {'name': name, 'status': 'missing', 'version': version, 'sha256': None, 'records': 0,
+                    'errors': [], 'warnings': [f'{name}: dosya bulunamadı'], 'keys': {},
+                    'duration_ms': 0.0, 'checked_at': datetime.now().isoformat(timespec='seconds')}
+        with open(path, 'rb') as f:
+            raw = f.read()
+        digest = hashlib.sha256(raw).hexdigest()
+        if previous and previous['sha256'] == digest:
+            return dict(previous, version=version)
+        errors, warnings, keys, records = [], [], {}, 0
+        try:
+            data = json.loads(raw.decode('utf-8'))
+        except (ValueError, UnicodeDecodeError) as e:
+            errors.append(f'{name}: geçersiz JSON ({e})')
+        else:
+            records = len(data) if isinstance(data, (list, dict)) else 0
+            errors.extend(validate_collection(name, data))
+            if not errors:
+                keys = _integrity_keys(name, data)
+                if isinstance(data, list):
+                    seen, duplicates = set(), set()
+                    for record in data:
+                        record_id = record.get('id') if isinstance(record, dict) else None
+                        if record_id is None:
+                            continue
+                        (duplicates if record_id in seen else seen).add(record_id)
+                    if duplicates:
+                        warnings.append(f'{name}: {len(duplicates)} yinelenen id '
+                                        f'({", ".join(map(str, sorted(duplicates, key=str)[:INTEGRITY_EXAMPLE_LIMIT]))})')
+        return {
+            'name': name,
+            'status': 'error' if errors else ('warning' if warnings else 'ok'),
+            'version': version,
+            'sha256': digest,
+            'records': records,
+            'errors': errors,
+            'warnings': warnings,
+            'keys': keys,
+            'duration_ms': round((time.perf_counter() - started) * 1000, 2),
+            'checked_at': datetime.now().isoformat(timespec='seconds')
+        }
 
-if __name__ == '__main__':
-    # Teklif numarası benzersizliği için migration çalıştır
-    migrate_existing_teklif_numbers()
+    def _check_relation(self, relation):
+        label, child, child_key, parent, parent_key, project = relation
+        child_state, parent_state = self._files.get(child), self._files.get(parent)
+        inputs = (child_state and child_state['sha256'], parent_state and parent_state['sha256'])
+        previous = self._relations.get(label)
+        if previous and previous['inputs'] == inputs:
+            return dict(previous, cached=True)
+        started = time.perf_counter()
+        if not child_state or not parent_state or child_key not in child_state['keys'] \
+                or parent_key not in parent_state['keys']:
+            result = {'status': 'skipped', 'missing': 0, 'examples': []}
+        else:
+            parent_keys = parent_state['keys'][parent_key]
+            missing = sorted({project(k) for k in child_state['keys'][child_key]} - parent_keys)
+            result = {
+                'status': 'warning' if missing else 'ok',
+                'missing': len(missing),
+                'examples': [_integrity_example(k) for k in missing[:INTEGRITY_EXAMPLE_LIMIT]]
+            }
+        result.update({
+            'name': label,
+            'inputs': inputs,
+            'cached': False,
+            'duration_ms': round((time.perf_counter() - started) * 1000, 2),
+            'checked_at': datetime.now().isoformat(timespec='seconds')
+        })
+        return result
+
+    def run(self):
+        """Değişen koleksiyonları ve etkilenen referansları denetler; raporu döndürür"""
+        with self._lock:
+            started = time.perf_counter()
+            files = []
+            for name in self.names:
+                version = collection_version(data_path(name))
+                previous = self._files.get(name)
+                if previous and previous['version'] == version:
+                    files.append(dict(previous, cached=True))
+                    continue
+                try:
+                    state = self._check_file(name, version)
+                except OSError as e:
+                    state = {'name': name, 'status': 'error', 'version': version, 'sha256': None, 'records': 0,
+                             'errors': [f'{name}: okunamadı ({e})'], 'warnings': [], 'keys': {},
+                             'duration_ms': 0.0, 'checked_at': datetime.now().isoformat(timespec='seconds')}
+                self._files[name] = state
+                files.append(dict(state, cached=False))
+            relations = []
+            for relation in self.relations:
+                result = self._check_relation(relation)
+                self._relations[result['name']] = result
+                relations.append(result)
+
+            statuses = [f['status'] for f in files] + [r['status'] for r in relations]
+            if 'error' in statuses:
+                status = 'error'
+            elif 'warning' in statuses or 'missing' in statuses:
+                status = 'degraded'
+            else:
+                status = 'ok'
+            self._last_report = {
+                'status': status,
+                'checked_at': datetime.now().isoformat(timespec='seconds'),
+                'duration_ms': round((time.perf_counter() - started) * 1000, 2),
+                'files_checked': sum(1 for f in files if not f['cached']),
+                'relations_checked': sum(1 for r in relations if not r['cached']),
+                'files': [{k: v for k, v in f.items() if k not in ('keys', 'sha256')} for f in files],
+                'relations': [{k: v for k, v in r.items() if k != 'inputs'} for r in relations]
+            }
+            return self._last_report
+
+integrity_monitor = IntegrityMonitor(COLLECTION_SCHEMAS, INTEGRITY_RELATIONS)
+
+@app.route('/health')
+def health():
+    """Genel sağlık özeti (kimlik doğrulamasız; kayıt ayrıntısı içermez). ?strict=1 ise hata 503 döner"""
+    report = integrity_monitor.run()
+    issues = sum(len(f['errors']) + len(f['warnings']) for f in report['files']) + \
+        sum(1 for r in report['relations'] if r['status'] == 'warning')
+    status_code = 503 if request.args.get('strict') == '1' and report['status'] == 'error' else 200
+    response = jsonify({
+        'status': report['status'],
+        'checked_at': report['checked_at'],
+        'duration_ms': report['duration_ms'],
+        'issues': issues,
+        'pid': os.getpid()
+    })
+    response.status_code = status_code
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
+@app.route('/api/admin/health')
+def api_admin_health():
+    """Admin için ayrıntılı veri bütünlüğü raporu (dosya ve referans denetimleri, süreler)"""
+    if not session.get('logged_in'):
+        return jsonify({'success': False, 'error': 'Oturum açmanız gerekiyor'}), 401
+    
+    if session.get('username') != 'admin':
+        return jsonify({'success': False, 'error': 'Bu işlem için admin yetkisi gerekiyor'}), 403
     
-    # Eski teklif numaralarını yeni formata dönüştür (TE26-001 -> 2026/TE-001)
-    convert_teklif_numbers_to_new_format()
+    try:
+        report = integrity_monitor.run()
+        response = jsonify({'success': True, **report, 'photo_variants': photo_worker.status()})
+        response.headers['Cache-Control'] = 'no-store'
+        return response
+    except Exception as e:
+        return jsonify({'success': False, 'error': f'Bütünlük denetimi hatası: {str(e)}'}), 500
+
+@lazy_init('teklif_migrations')
+def teklif_migrations():
+    """Teklif numarası migration'ları; veri dizini başına bir kez çalışır.
+
+    gunicorn'da master on_starting ile çalıştırır, worker'lar sonucu fork ile devralır.
+    Bitince TEKLIF_MIGRATIONS_MARKER yazılır: diğer süreçler ve yenilenen worker'lar dosyalara
+    dokunmaz. Geri yükleme işareti siler; ilk numara üretiminde migration bir kez daha çalışır.
+    """
+    if os.path.exists(TEKLIF_MIGRATIONS_MARKER):
+        return True
+    # Numara rezervasyonuyla aynı kilitler (sıra: teklif → used_teklif_numbers): migration
+    # sırasında numara dağıtılmaz, aynı anda başlayan ikinci süreç işareti görüp çıkar
+    with collection_lock(TEKLIF_FILE), collection_lock(USED_TEKLIF_NUMBERS_FILE):
+        if os.path.exists(TEKLIF_MIGRATIONS_MARKER):
+            return True
+        # Teklif numarası benzersizliği için migration çalıştır
+        migrate_existing_teklif_numbers()
+        
+        # Eski teklif numaralarını yeni formata dönüştür (TE26-001 -> 2026/TE-001)
+        convert_teklif_numbers_to_new_format()
+        _write_file_durable(TEKLIF_MIGRATIONS_MARKER, datetime.now().isoformat().encode('ascii'))
+    return True
+
+def run_startup_migrations():
+    """Migration'ları hemen çalıştırır (gunicorn master, betikler ve elle çalıştırma için)"""
+    return teklif_migrations.get(trigger='startup')
+
+# Opsiyonel kütüphanelerin ısınması: ilk grafik/rapor/dışa aktarımda import ve font önbelleği
+# beklenmesin diye worker açıldıktan sonra arka planda yüklenir (migration'lardan sonra).
+# STARTUP_WARMUP_LIBS ile seçilir; boş bırakılırsa kütüphaneler yine ilk kullanımda yüklenir.
+STARTUP_WARMUP_LIBS = {
+    name.strip() for name in os.environ.get('STARTUP_WARMUP_LIBS', 'matplotlib,docx,pandas').split(',')
+    if name.strip()
+}
+
+@lazy_init('matplotlib', warm='matplotlib' in STARTUP_WARMUP_LIBS)
+def warm_matplotlib():
+    """matplotlib'i yükler, font önbelleğini hazırlar ve atılacak bir grafik çizer"""
+    plt, np, mdates, Rectangle = load_matplotlib()
+    from matplotlib import font_manager
+    # Font önbelleği yoksa burada oluşturulur (Docker imajında önceden hazırlanır)
+    font_manager.findfont(font_manager.FontProperties())
+    fig, ax = plt.subplots(figsize=(2, 2))
+    ax.plot([datetime(2024, 1, 1), datetime(2024, 1, 2)], [0, 1])
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%d.%m'))
+    ax.set_title('Isınma')
+    fig.savefig(BytesIO(), format='png', dpi=50)
+    plt.close(fig)
+    return True
+
+@lazy_init('docx', warm='docx' in STARTUP_WARMUP_LIBS)
+def warm_docx():
+    """python-docx'i yükler ve varsayılan şablonu bir kez ayrıştırır"""
+    Document = load_docx()[0]
+    if Document is None:
+        return False
+    Document()
+    return True
+
+@lazy_init('pandas', warm='pandas' in STARTUP_WARMUP_LIBS)
+def warm_pandas():
+    """pandas'ı yükler"""
+    pd = load_pandas()
+    pd.DataFrame({'a': [1]})
+    return True
+
+mark_startup_phase('module_body')
+print(f"Uygulama yüklendi: {startup_profile_report()['import_total_ms']} ms (pid {os.getpid()})")
+
+if __name__ == '__main__':
+    # Geliştirme sunucusu; production'da gunicorn.conf.py kullanılır
+    start_background_warmup()
     
     # Render için port ayarı (Render'ın verdiği PORT değişkenini kullan, yoksa 5001 kullan)
     port = int(os.environ.get('PORT', 5001))
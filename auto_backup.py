@@ -2,80 +2,95 @@
 # -*- coding: utf-8 -*-
 """
 Otomatik Veri Yedekleme Sistemi
+Uygulamanın kullandığı içerik adresli depoya (DATA_DIR/backups) artımlı yedek alır:
+sadece değişen dosyalar saklanır, saklama politikası her yedekten sonra uygulanır.
+
+Kullanım:
+    python auto_backup.py            # saat başı yedek (sürekli çalışır)
+    python auto_backup.py --once     # tek yedek al ve çık
+    python auto_backup.py --list     # yedekleri listele
+
+Ortam: DATA_DIR, BACKUP_DIR, BACKUP_KEEP_LAST / BACKUP_KEEP_HOURLY / BACKUP_KEEP_DAILY / BACKUP_KEEP_MONTHLY
 """
 
-import json
+import argparse
 import os
-import shutil
-from datetime import datetime
-import schedule
 import time
 
-def create_backup():
-    """Tüm veri dosyalarını yedekler"""
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    backup_dir = f'backups/backup_{timestamp}'
-    
-    # Yedekleme dizini oluştur
-    os.makedirs(backup_dir, exist_ok=True)
-    
-    # Yedeklenecek dosyalar
-    data_files = [
-        'baca_bilgileri.json',
-        'parametre_olcum.json',
-        'firma_olcum.json',
-        'users.json',
-        'parameters.json'
-    ]
-    
-    for file in data_files:
-        if os.path.exists(file):
-            shutil.copy2(file, backup_dir)
-            print(f"✅ {file} yedeklendi")
-    
-    # Eski yedekleri temizle (7 günden eski)
-    cleanup_old_backups()
-    
-    print(f"📦 Yedekleme tamamlandı: {backup_dir}")
-
-def cleanup_old_backups():
-    """7 günden eski yedekleri temizler"""
-    backup_dir = 'backups'
-    if not os.path.exists(backup_dir):
-        return
-    
-    current_time = datetime.now()
-    for item in os.listdir(backup_dir):
-        item_path = os.path.join(backup_dir, item)
-        if os.path.isdir(item_path):
-            # Dizin oluşturma zamanını kontrol et
-            creation_time = datetime.fromtimestamp(os.path.getctime(item_path))
-            if (current_time - creation_time).days > 7:
-                shutil.rmtree(item_path)
-                print(f"🗑️ Eski yedek silindi: {item}")
+import storage_gate
+from backup_store import COLLECTION_FILES, BackupStore, RetentionPolicy
+
+
+def resolve_data_dir():
+    """Uygulamayla aynı çözüm (storage_gate): DATA_DIR, /data, <geçici dizin>/emisyon_data"""
+    return storage_gate.resolve_data_dir()
+
+
+def open_store(data_dir):
+    return BackupStore(os.environ.get('BACKUP_DIR') or os.path.join(data_dir, 'backups'))
+
+
+def create_backup(data_dir=None):
+    """Tüm veri dosyalarını yedekler ve eski yedekleri temizler"""
+    data_dir = data_dir or resolve_data_dir()
+    store = open_store(data_dir)
+    files = {name: os.path.join(data_dir, name) for name in COLLECTION_FILES}
+    previous = store.latest_manifest()
+    # Uygulamanın anlık görüntü kapısı: yazıcılar sadece stat ve değişen dosyaların okunması
+    # boyunca bekler; hash, gzip ve fsync kapı bırakıldıktan sonra yapılır
+    with storage_gate.exclusive(data_dir):
+        captured = store.capture(files, previous=previous)
+    manifest = store.commit(captured, label='auto')
+    print(f"📦 Yedek {manifest['id']}: {len(manifest['files'])} dosya, {manifest['hashed_files']} değişmiş, "
+          f"+{manifest['new_bytes']} bayt, {manifest['duration_ms']} ms")
+
+    result = store.prune(RetentionPolicy.from_env())
+    if result['removed_snapshots']:
+        print(f"🗑️ {len(result['removed_snapshots'])} eski yedek silindi, {result['freed_bytes']} bayt boşaldı")
+    return manifest
+
+
+def list_backups(data_dir=None):
+    store = open_store(data_dir or resolve_data_dir())
+    for manifest in store.list_snapshots():
+        print(f"{manifest['id']}  {manifest.get('label', ''):<12} {len(manifest.get('files', {})):>3} dosya  "
+              f"{manifest.get('total_bytes', 0):>10} bayt  (+{manifest.get('new_bytes', 0)})")
+    stats = store.stats()
+    print(f"Depo: {stats['objects']} obje, {stats['stored_bytes']} bayt")
+
 
 def main():
     """Ana fonksiyon"""
+    parser = argparse.ArgumentParser(description='Otomatik artımlı veri yedekleme')
+    parser.add_argument('--once', action='store_true', help='Tek yedek al ve çık')
+    parser.add_argument('--list', action='store_true', help='Yedekleri listele')
+    args = parser.parse_args()
+
+    if args.list:
+        list_backups()
+        return
+    if args.once:
+        create_backup()
+        return
+
+    import schedule
+
     print("🔄 Otomatik Yedekleme Sistemi Başlatılıyor...")
-    
-    # İlk yedekleme
     create_backup()
-    
-    # Her saat başı yedekleme
-    schedule.every().hour.do(create_backup)
-    
-    # Her gün gece yarısı yedekleme
-    schedule.every().day.at("00:00").do(create_backup)
-    
+
+    # Her saat başı yedekleme; değişmeyen dosyalar yer kaplamadığı için sık yedek ucuzdur
+    schedule.every().hour.at(":00").do(create_backup)
+
+    policy = RetentionPolicy.from_env()
     print("⏰ Yedekleme zamanlaması ayarlandı:")
     print("  - Her saat başı")
-    print("  - Her gün gece yarısı")
-    print("  - 7 günden eski yedekler otomatik silinir")
-    
+    print(f"  - Saklama: son {policy.last} yedek, {policy.hourly} saatlik, {policy.daily} günlük, {policy.monthly} aylık")
+
     # Sürekli çalış
     while True:
         schedule.run_pending()
         time.sleep(60)  # 1 dakika bekle
 
+
 if __name__ == "__main__":
     main()
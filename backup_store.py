@@ -0,0 +1,357 @@
+# -*- coding: utf-8 -*-
+"""
+İçerik Adresli (Content-Addressed) Yedek Deposu
+Her yedek (snapshot) bir manifest dosyasıdır: dosya adı -> sha256. Dosya içerikleri
+objects/ altında hash'leriyle bir kez (gzip'li) saklanır; değişmeyen dosya yeni yedekte
+yer kaplamaz. inode/mtime/boyut son manifestle aynıysa dosya yeniden okunup hash'lenmez;
+son manifest alınırken mtime'ı henüz oturmamış (STAT_SETTLE_NS içinde) dosyalar her zaman
+yeniden hash'lenir, aynı saat tikinde yapılan ikinci yazım gözden kaçmaz.
+
+Dizin yapısı:
+    <kök>/objects/ab/abcdef...   gzip'li içerik (ham içeriğin sha256'sı)
+    <kök>/snapshots/<id>.json    manifest
+    <kök>/.lock                  süreçler arası kilit (oluşturma/budama/GC)
+
+Tutarlı yedek için capture() anlık görüntü kapısı içinde çağrılır (sadece stat ve değişen
+dosyaların okunması); commit() kapı bırakıldıktan sonra hash, gzip ve fsync yapar.
+
+Saklama politikası (RetentionPolicy): en son N yedek olduğu gibi, ayrıca son N saatlik,
+N günlük ve N aylık yedeğin her periyottaki en yenisi tutulur. prune() politikaya uymayan
+manifestleri siler, gc() hiçbir manifestin göstermediği objeleri siler.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    import fcntl  # Süreçler arası dosya kilidi (Linux/Fly); Windows'ta yok
+except ImportError:
+    fcntl = None
+
+# Yedeklenen koleksiyon dosyaları (DATA_DIR'e göre)
+COLLECTION_FILES = [
+    'firma_kayit.json',
+    'teklif.json',
+    'firma_olcum.json',
+    'saha_olc.json',
+    'parameters.json',
+    'baca_bilgileri.json',
+    'parametre_olcum.json',
+    'parametre_sahabil.json',
+    'asgari_fiyatlar.json',
+    'forms.json',
+    'users.json',
+    'used_teklif_numbers.json',
+    'par_saha_header_groups.json'
+]
+
+# mtime bu kadar eskiyse stat ile değişiklik tespitine güvenilir (git'in "racy clean" kuralı)
+STAT_SETTLE_NS = 1_000_000_000
+
+SNAPSHOT_ID_RE = re.compile(r'^\d{8}T\d{6}-\d{6}$')
+HASH_RE = re.compile(r'^[0-9a-f]{64}$')
+
+
+class RetentionPolicy:
+    """Son kaç yedek ve saatlik/günlük/aylık kaç yedek tutulacağı"""
+
+    def __init__(self, last=10, hourly=48, daily=30, monthly=12):
+        self.last = max(1, int(last))
+        self.hourly = max(0, int(hourly))
+        self.daily = max(0, int(daily))
+        self.monthly = max(0, int(monthly))
+
+    @classmethod
+    def from_env(cls, environ=None):
+        environ = os.environ if environ is None else environ
+        return cls(last=environ.get('BACKUP_KEEP_LAST', 10),
+                   hourly=environ.get('BACKUP_KEEP_HOURLY', 48),
+                   daily=environ.get('BACKUP_KEEP_DAILY', 30),
+                   monthly=environ.get('BACKUP_KEEP_MONTHLY', 12))
+
+    def to_dict(self):
+        return {'last': self.last, 'hourly': self.hourly, 'daily': self.daily, 'monthly': self.monthly}
+
+    def select(self, snapshot_ids):
+        """Tutulacak yedek id'leri; her periyotta (saat/gün/ay) en yeni yedek sayılır"""
+        ordered = sorted(snapshot_ids, reverse=True)
+        keep = set(ordered[:self.last])
+        for count, key_len in ((self.hourly, 11), (self.daily, 8), (self.monthly, 6)):
+            seen = set()
+            for snapshot_id in ordered:
+                if len(seen) >= count:
+                    break
+                # Id biçimi YYYYMMDDTHHMMSS-ffffff: önek uzunluğu periyodu belirler
+                period = snapshot_id[:key_len]
+                if period not in seen:
+                    seen.add(period)
+                    keep.add(snapshot_id)
+        return keep
+
+
+class BackupStore:
+    """Manifest + içerik adresli obje deposu"""
+
+    def __init__(self, root):
+        self.root = root
+        self.objects_dir = os.path.join(root, 'objects')
+        self.snapshots_dir = os.path.join(root, 'snapshots')
+        self._thread_lock = threading.RLock()
+
+    # --- kilit ve yardımcılar ---
+
+    @contextmanager
+    def lock(self):
+        """Aynı depoda oluşturma/budama/GC'yi süreçler arasında sıraya koyar"""
+        os.makedirs(self.root, exist_ok=True)
+        with self._thread_lock:
+            with open(os.path.join(self.root, '.lock'), 'a') as lock_fh:
+                if fcntl is not None:
+                    fcntl.flock(lock_fh.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(lock_fh.fileno(), fcntl.LOCK_UN)
+
+    def _object_path(self, digest):
+        return os.path.join(self.objects_dir, digest[:2], digest)
+
+    def _manifest_path(self, snapshot_id):
+        return os.path.join(self.snapshots_dir, f'{snapshot_id}.json')
+
+    @staticmethod
+    def _write_atomic(path, data):
+        dir_name = os.path.dirname(path)
+        os.makedirs(dir_name, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=dir_name, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    def _new_snapshot_id(self):
+        snapshot_id = datetime.now().strftime('%Y%m%dT%H%M%S-%f')
+        while os.path.exists(self._manifest_path(snapshot_id)):
+            time.sleep(0.000001)
+            snapshot_id = datetime.now().strftime('%Y%m%dT%H%M%S-%f')
+        return snapshot_id
+
+    # --- objeler ---
+
+    def put_bytes(self, data):
+        """İçeriği saklar (yoksa); (sha256, yeni_mi, saklanan_bayt) döner"""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if os.path.exists(path):
+            return digest, False, 0
+        packed = gzip.compress(data, compresslevel=6, mtime=0)
+        self._write_atomic(path, packed)
+        return digest, True, len(packed)
+
+    def has_object(self, digest):
+        return bool(HASH_RE.match(digest or '')) and os.path.exists(self._object_path(digest))
+
+    def read_object(self, digest):
+        if not HASH_RE.match(digest or ''):
+            raise ValueError(f'Geçersiz obje hash: {digest}')
+        with open(self._object_path(digest), 'rb') as f:
+            data = gzip.decompress(f.read())
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ValueError(f'Obje bozuk (hash uyuşmuyor): {digest}')
+        return data
+
+    # --- yedekler ---
+
+    def list_snapshots(self):
+        """Manifestler, en yeni önce"""
+        if not os.path.isdir(self.snapshots_dir):
+            return []
+        manifests = []
+        for name in sorted(os.listdir(self.snapshots_dir), reverse=True):
+            snapshot_id = name[:-5] if name.endswith('.json') else None
+            if not snapshot_id or not SNAPSHOT_ID_RE.match(snapshot_id):
+                continue
+            manifest = self.load_manifest(snapshot_id)
+            if manifest:
+                manifests.append(manifest)
+        return manifests
+
+    def load_manifest(self, snapshot_id):
+        if not SNAPSHOT_ID_RE.match(snapshot_id or ''):
+            return None
+        try:
+            with open(self._manifest_path(snapshot_id), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def latest_manifest(self):
+        if not os.path.isdir(self.snapshots_dir):
+            return None
+        for name in sorted(os.listdir(self.snapshots_dir), reverse=True):
+            manifest = self.load_manifest(name[:-5]) if name.endswith('.json') else None
+            if manifest:
+                return manifest
+        return None
+
+    @staticmethod
+    def _unchanged(prev, st, scanned_ns):
+        """Önceki girdi bu stat için hâlâ geçerli mi; şüphede False (yeniden hash'lenir)"""
+        if not prev or scanned_ns is None:
+            return False
+        if (prev.get('ino'), prev.get('mtime_ns'), prev.get('size')) != (st.st_ino, st.st_mtime_ns, st.st_size):
+            return False
+        return scanned_ns - st.st_mtime_ns >= STAT_SETTLE_NS
+
+    def capture(self, files, read_file=None, previous=None):
+        """Yedeğin anlık görüntü kapısı içinde yapılması gereken kısmı: stat ve değişen dosyaların
+        baytlarını okuma. Hash, sıkıştırma ve fsync commit() ile kapı bırakıldıktan sonra yapılır.
+
+        files: {ad: yol}. Değişmeyen dosyalar (inode/mtime/boyut aynı) okunmaz.
+        read_file(ad, yol) -> bayt verilirse içerik onunla okunur (ör. koleksiyon kilidi altında).
+        previous: önceden okunmuş son manifest (kapı dışında latest_manifest() ile); verilmezse okunur.
+        """
+        started = time.perf_counter()
+        if previous is None:
+            previous = self.latest_manifest()
+        previous_files = previous.get('files', {}) if previous else {}
+        previous_scanned_ns = previous.get('scanned_ns') if previous else None
+        captured = {'scanned_ns': time.time_ns(), 'reused': {}, 'changed': {}}
+        for name, path in sorted(files.items()):
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            prev = previous_files.get(name)
+            if self._unchanged(prev, st, previous_scanned_ns) and self.has_object(prev.get('sha256')):
+                captured['reused'][name] = dict(prev)
+                continue
+            if read_file is not None:
+                data = read_file(name, path)
+            else:
+                with open(path, 'rb') as f:
+                    data = f.read()
+            if data is None:
+                continue
+            captured['changed'][name] = (data, st.st_mtime_ns, st.st_ino)
+        captured['capture_ms'] = round((time.perf_counter() - started) * 1000, 2)
+        return captured
+
+    def commit(self, captured, label='manual'):
+        """capture() sonucunu depoya yazar (hash, gzip, fsync) ve manifesti oluşturur"""
+        started = time.perf_counter()
+        with self.lock():
+            entries, new_objects, new_bytes, hashed = {}, 0, 0, 0
+            for name, entry in captured['reused'].items():
+                entries[name] = entry
+            for name, (data, mtime_ns, ino) in captured['changed'].items():
+                digest, created, stored = self.put_bytes(data)
+                hashed += 1
+                new_objects += int(created)
+                new_bytes += stored
+                entries[name] = {'sha256': digest, 'size': len(data), 'mtime_ns': mtime_ns, 'ino': ino}
+
+            snapshot_id = self._new_snapshot_id()
+            manifest = {
+                'id': snapshot_id,
+                'created_at': datetime.now().isoformat(timespec='seconds'),
+                'label': label,
+                'scanned_ns': captured['scanned_ns'],
+                'files': dict(sorted(entries.items())),
+                'total_bytes': sum(e['size'] for e in entries.values()),
+                'hashed_files': hashed,
+                'new_objects': new_objects,
+                'new_bytes': new_bytes,
+                'capture_ms': captured.get('capture_ms', 0),
+                'duration_ms': 0
+            }
+            # Toplam süre: kapı içindeki okuma + depoya yazma
+            manifest['duration_ms'] = round(manifest['capture_ms'] + (time.perf_counter() - started) * 1000, 2)
+            self._write_atomic(self._manifest_path(snapshot_id),
+                               json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8'))
+        return manifest
+
+    def create_snapshot(self, files, label='manual', read_file=None):
+        """capture() + commit() tek adımda; kapı tutulurken çağrılırsa hash/fsync de kapı içinde olur"""
+        return self.commit(self.capture(files, read_file), label)
+
+    def read_snapshot_file(self, snapshot_id, name):
+        manifest = self.load_manifest(snapshot_id)
+        if not manifest or name not in manifest.get('files', {}):
+            raise KeyError(f'{snapshot_id} yedeğinde {name} yok')
+        return self.read_object(manifest['files'][name]['sha256'])
+
+    # --- saklama ve temizlik ---
+
+    def prune(self, policy):
+        """Politikaya uymayan manifestleri siler, ardından GC çalıştırır"""
+        with self.lock():
+            snapshots = [m['id'] for m in self.list_snapshots()]
+            keep = policy.select(snapshots)
+            removed = []
+            for snapshot_id in snapshots:
+                if snapshot_id not in keep:
+                    try:
+                        os.unlink(self._manifest_path(snapshot_id))
+                        removed.append(snapshot_id)
+                    except OSError:
+                        pass
+            gc_result = self._gc()
+        return {'removed_snapshots': removed, 'kept_snapshots': len(keep), **gc_result}
+
+    def gc(self):
+        """Hiçbir manifestin göstermediği objeleri siler"""
+        with self.lock():
+            return self._gc()
+
+    def _gc(self):
+        referenced = set()
+        for manifest in self.list_snapshots():
+            referenced.update(e.get('sha256') for e in manifest.get('files', {}).values())
+        removed, freed = 0, 0
+        if os.path.isdir(self.objects_dir):
+            for prefix in os.listdir(self.objects_dir):
+                prefix_dir = os.path.join(self.objects_dir, prefix)
+                if not os.path.isdir(prefix_dir):
+                    continue
+                for name in os.listdir(prefix_dir):
+                    # Yarım kalmış .tmp yazımları da temizlenir
+                    if name in referenced:
+                        continue
+                    path = os.path.join(prefix_dir, name)
+                    try:
+                        freed += os.path.getsize(path)
+                        os.unlink(path)
+                        removed += 1
+                    except OSError:
+                        pass
+        return {'removed_objects': removed, 'freed_bytes': freed}
+
+    def stats(self):
+        """Obje sayısı ve depodaki toplam bayt"""
+        count, size = 0, 0
+        if os.path.isdir(self.objects_dir):
+            for prefix in os.listdir(self.objects_dir):
+                prefix_dir = os.path.join(self.objects_dir, prefix)
+                if os.path.isdir(prefix_dir):
+                    for name in os.listdir(prefix_dir):
+                        try:
+                            size += os.path.getsize(os.path.join(prefix_dir, name))
+                            count += 1
+                        except OSError:
+                            pass
+        return {'objects': count, 'stored_bytes': size}
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Performans Benchmark'ı
+synthetic_data.py ile 1x / 10x / 100x veri setleri üretir, her ölçekte zamanlanmış senaryoları
+Flask test client üzerinden çalıştırır ve sonuçları makinece okunabilir bir baseline dosyasına
+yazar. --compare ile önceki baseline'a göre yavaşlayan senaryolar raporlanır (çıkış kodu 1).
+
+Kullanım:
+    python benchmark.py                                   # 1,10,100 ölçek -> benchmark_baseline.json
+    python benchmark.py --scales 1,10 --repeat 3 --only teklif_list,pivot_compare
+    python benchmark.py --scales 1,10 --out /tmp/yeni.json --compare benchmark_baseline.json
+
+Uygulama geçici bir DATA_DIR ile yüklenir; gerçek veri dosyalarına dokunulmaz.
+
+Depodaki benchmark_baseline.json, içindeki 'machine'/'platform' alanlarında yazan makinede
+(1 vCPU Xeon, Python 3.11) ölçülmüştür. Farklı bir makinede --compare uyarı verir; orada önce
+--out ile kendi baseline'ınızı üretip onunla karşılaştırın.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from synthetic_data import base_counts_from, dataset_summary, generate_dataset, write_dataset
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(ROOT_DIR, 'benchmark_baseline.json')
+DEFAULT_TOLERANCE = 0.30
+
+
+class Scenario:
+    """Tek bir zamanlanmış istek. url/json/form/setup, ölçek bağlamını (ctx) alan fonksiyonlardır."""
+
+    def __init__(self, name, method, url, json_body=None, form=None, setup=None, expect=(200,)):
+        self.name = name
+        self.method = method
+        self.url = url
+        self.json_body = json_body
+        self.form = form
+        self.setup = setup
+        self.expect = expect
+
+    def request_kwargs(self, ctx):
+        kwargs = {'method': self.method, 'path': self.url(ctx) if callable(self.url) else self.url}
+        if self.json_body is not None:
+            kwargs['json'] = self.json_body(ctx)
+        if self.form is not None:
+            kwargs['data'] = self.form(ctx)
+        return kwargs
+
+
+def _clear_teklif_cache(ctx):
+    shutil.rmtree(ctx['app'].TEKLIF_CACHE_DIR, ignore_errors=True)
+
+
+def _save_parametre_form(ctx):
+    baca = ctx['dataset']['baca_bilgileri'][0]
+    ctx['save_seq'] = ctx.get('save_seq', 0) + 1
+    return {
+        'firma_adi': baca['firma_adi'],
+        'olcum_kodu': baca['olcum_kodu'],
+        'baca_adi': baca['baca_adi'],
+        'parametre_adi': 'Toz',
+        'parametre_verileri': json.dumps({'TARİH': datetime.now().strftime('%d.%m.%y'), 'B.HIZ': str(ctx['save_seq'])},
+                                         ensure_ascii=False)
+    }
+
+
+SCENARIOS = [
+    Scenario('page_teklif', 'GET', '/teklif'),
+    Scenario('firma_kayit_list', 'GET', '/api/firma_kayit/list'),
+    Scenario('firma_kayit_list_search', 'GET', '/api/firma_kayit/list?q=anadolu'),
+    Scenario('teklif_list', 'GET', '/api/teklif/list'),
+    Scenario('teklif_list_sorted', 'GET', '/api/teklif/list?sort=firma_adi&dir=asc&page=2'),
+    Scenario('firma_olcum_list', 'GET', '/api/firma_olcum/list'),
+    Scenario('pivot_summary', 'GET', lambda ctx: f"/api/pivot/summary?start={ctx['year'] - 1}-01-01&end={ctx['year']}-12-31"),
+    Scenario('pivot_compare', 'GET', lambda ctx: f"/api/pivot/compare?years={ctx['year'] - 2},{ctx['year'] - 1},{ctx['year']}"),
+    Scenario('kk_grafik_olustur', 'POST', '/api/kk_grafik_olustur',
+             json_body=lambda ctx: {'parametre': 'O2', 'baslangic_tarih': f"{ctx['year'] - 3}-01-01",
+                                    'bitis_tarih': f"{ctx['year']}-12-31", 'localStorage_verileri': []}),
+    Scenario('save_parametre_olcum_saha', 'POST', '/save_parametre_olcum_saha', form=_save_parametre_form),
+    Scenario('teklif_word', 'POST', lambda ctx: f"/api/teklif/yazdir/{ctx['dataset']['teklif'][-1]['id']}",
+             json_body=lambda ctx: {'format': 'word'}, setup=_clear_teklif_cache),
+    Scenario('teklif_word_cached', 'POST', lambda ctx: f"/api/teklif/yazdir/{ctx['dataset']['teklif'][-1]['id']}",
+             json_body=lambda ctx: {'format': 'word'}),
+    Scenario('firma_olcum_word_export', 'POST', '/api/firma_olcum_word_export',
+             json_body=lambda ctx: {'olcum_ids': [ctx['dataset']['firma_olcum'][-1]['id']]}),
+    Scenario('teklif_export_excel', 'POST', '/api/teklif/export_excel', json_body=lambda ctx: {}),
+    Scenario('firma_olcum_excel_export', 'POST', '/api/firma_olcum_excel_export',
+             json_body=lambda ctx: {'olcum_ids': [o['id'] for o in ctx['dataset']['firma_olcum']]}),
+    Scenario('parametre_olcumleri_excel_export', 'POST', '/api/parametre_olcumleri_excel_export',
+             json_body=lambda ctx: {'olcum_ids': [p['id'] for p in ctx['dataset']['parametre_olcum']]}),
+]
+
+
+def load_app(data_dir):
+    """Uygulamayı geçici DATA_DIR ile yükler (import'tan önce ortam değişkenleri ayarlanmalı)"""
+    os.environ['DATA_DIR'] = data_dir
+    os.environ.setdefault('STARTUP_WARMUP', '0')
+    os.environ.setdefault('METRICS_ENABLED', 'false')
+    sys.path.insert(0, ROOT_DIR)
+    import app as application
+    application.app.config['TESTING'] = True
+    return application
+
+
+def login(client, username='admin', role='admin'):
+    with client.session_transaction() as sess:
+        sess['logged_in'] = True
+        sess['username'] = username
+        sess['role'] = role
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    k = (len(ordered) - 1) * pct / 100
+    lower = int(k)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (k - lower)
+
+
+def run_scenario(client, scenario, ctx, repeat, warmup=1, verbose=False):
+    timings, statuses, size = [], set(), 0
+    for i in range(warmup + repeat):
+        if scenario.setup:
+            scenario.setup(ctx)
+        # Uygulamanın DEBUG çıktıları ölçüm tablosunu bozmasın (--verbose ile gösterilir)
+        output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+        with output:
+            started = time.perf_counter()
+            response = client.open(**scenario.request_kwargs(ctx))
+            body = response.get_data()
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            response.close()
+        statuses.add(response.status_code)
+        size = len(body)
+        if i >= warmup:
+            timings.append(elapsed_ms)
+    return {
+        'runs': repeat,
+        'median_ms': round(statistics.median(timings), 2),
+        'p95_ms': round(percentile(timings, 95), 2),
+        'min_ms': round(min(timings), 2),
+        'max_ms': round(max(timings), 2),
+        'status': sorted(statuses),
+        'ok': statuses <= set(scenario.expect),
+        'response_bytes': size
+    }
+
+
+def settle_data_files(data_dir, settle_ns):
+    """Son settle_ns içinde yazılmış dosyaların mtime'ını geriye çeker.
+
+    collection_version, mtime'ı yeni olan dosyaya her çağrıda farklı sürüm verir; yeni yazılmış
+    veriyle ölçülen senaryolarda önbellek/ETag bazen soğuk bazen sıcak kalır. Değişmemiş
+    dosyalara dokunulmaz (sürümleri, dolayısıyla sıcak önbellekleri korunur).
+    """
+    now_ns = time.time_ns()
+    for name in os.listdir(data_dir):
+        path = os.path.join(data_dir, name)
+        st = os.stat(path)
+        if os.path.isfile(path) and now_ns - st.st_mtime_ns < settle_ns:
+            backdated = now_ns - 2 * settle_ns
+            os.utime(path, ns=(backdated, backdated))
+
+
+def run_scale(application, client, data_dir, scale, args, base_counts):
+    dataset = generate_dataset(scale, args.seed, base_counts)
+    write_dataset(data_dir, dataset)
+    settle_ns = application.COLLECTION_VERSION_SETTLE_NS
+    shutil.rmtree(application.TEKLIF_CACHE_DIR, ignore_errors=True)
+    ctx = {'app': application, 'dataset': dataset, 'year': max(int(t['teklif_tarihi'][:4]) for t in dataset['teklif'])}
+    result = {'counts': dataset_summary(dataset),
+              'bytes': {name: os.path.getsize(os.path.join(data_dir, f"{name}.json")) for name in dataset},
+              'scenarios': {}}
+    for scenario in SCENARIOS:
+        if args.only and scenario.name not in args.only:
+            continue
+        # Önceki senaryonun yazdığı dosyalar da oturmuş sayılır; ilk (ısınma) turu önbelleği doldurur
+        settle_data_files(data_dir, settle_ns)
+        stats = run_scenario(client, scenario, ctx, args.repeat, verbose=args.verbose)
+        result['scenarios'][scenario.name] = stats
+        flag = '' if stats['ok'] else f"  !! durum {stats['status']}"
+        print(f"  {scenario.name:<34} median {stats['median_ms']:>10.2f} ms  p95 {stats['p95_ms']:>10.2f} ms"
+              f"  {stats['response_bytes']:>10} B{flag}")
+    return result
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def machine_info():
+    """Baseline'ın ölçüldüğü makine; süreler yalnızca aynı makinede karşılaştırılabilir"""
+    cpu_model = platform.processor() or platform.machine()
+    try:
+        with open('/proc/cpuinfo', 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith('model name'):
+                    cpu_model = line.split(':', 1)[1].strip()
+                    break
+    except OSError:
+        pass
+    return {'hostname': platform.node(), 'cpu': cpu_model, 'cpu_count': os.cpu_count()}
+
+
+def compare_results(current, baseline, tolerance):
+    """Baseline'a göre median süresi tolerance oranından fazla artan senaryolar"""
+    regressions = []
+    for scale, scale_result in current['scales'].items():
+        base_scale = baseline.get('scales', {}).get(scale)
+        if not base_scale:
+            continue
+        for name, stats in scale_result['scenarios'].items():
+            base_stats = base_scale['scenarios'].get(name)
+            if not base_stats or not base_stats.get('median_ms'):
+                continue
+            ratio = stats['median_ms'] / base_stats['median_ms']
+            if ratio > 1 + tolerance:
+                regressions.append({'scale': scale, 'scenario': name, 'baseline_ms': base_stats['median_ms'],
+                                    'current_ms': stats['median_ms'], 'ratio': round(ratio, 2)})
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Emisyon uygulaması performans benchmark\'ı')
+    parser.add_argument('--scales', default='1,10,100', help='Virgülle ayrılmış ölçekler')
+    parser.add_argument('--repeat', type=int, default=5, help='Senaryo başına ölçülen tekrar sayısı')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--only', help='Sadece bu senaryolar (virgülle ayrılmış)')
+    parser.add_argument('--base-from', help='1x taban sayılarını bu DATA_DIR\'den al')
+    parser.add_argument('--verbose', action='store_true', help='Uygulama çıktılarını gösterir')
+    parser.add_argument('--out', default=DEFAULT_BASELINE, help='Sonuç dosyası')
+    parser.add_argument('--compare', help='Karşılaştırılacak baseline dosyası')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='İzin verilen yavaşlama oranı (0.30 = %%30)')
+    args = parser.parse_args()
+    args.only = set(args.only.split(',')) if args.only else None
+    scales = [s.strip() for s in args.scales.split(',') if s.strip()]
+    base_counts = base_counts_from(args.base_from) if args.base_from else None
+
+    data_dir = tempfile.mkdtemp(prefix='emisyon_bench_')
+    try:
+        application = load_app(data_dir)
+        client = application.app.test_client()
+        login(client)
+        results = {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'git_commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'machine': machine_info(),
+            'repeat': args.repeat,
+            'seed': args.seed,
+            'scales': {}
+        }
+        for scale in scales:
+            print(f"Ölçek {scale}x:")
+            results['scales'][scale] = run_scale(application, client, data_dir, float(scale), args, base_counts)
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"Sonuçlar yazıldı: {args.out}")
+
+    failed = [f"{scale}x {name}" for scale, r in results['scales'].items()
+              for name, stats in r['scenarios'].items() if not stats['ok']]
+    if failed:
+        print(f"Beklenmeyen durum kodu: {', '.join(failed)}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        # Hostname karşılaştırılmaz: aynı donanımdaki yeni bir VM/konteyner farklı ad alır
+        same_machine = {k: v for k, v in (baseline.get('machine') or {}).items() if k != 'hostname'}
+        if same_machine != {k: v for k, v in results['machine'].items() if k != 'hostname'}:
+            print(f"UYARI: baseline başka bir makinede ölçülmüş ({baseline.get('machine')}); "
+                  f"süre farkları makine farkından kaynaklanabilir")
+        regressions = compare_results(results, baseline, args.tolerance)
+        for r in regressions:
+            print(f"YAVAŞLAMA {r['scale']}x {r['scenario']}: {r['baseline_ms']} ms -> {r['current_ms']} ms (x{r['ratio']})")
+        if regressions:
+            sys.exit(1)
+        print(f"Baseline'a göre yavaşlama yok (tolerans %{int(args.tolerance * 100)})")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -2,60 +2,63 @@
 # -*- coding: utf-8 -*-
 """
 Veri Bütünlüğü İzleme Sistemi
+Uygulamanın IntegrityMonitor'ünü (app.py) kullanır: şema ve referans denetimleri
+(parametre_olcum → baca_bilgileri → firma_olcum → firma_kayit, teklif → used_teklif_numbers).
+Aynı denetim çalışan uygulamada /health ve /api/admin/health üzerinden de sunulur.
+
+Kullanım:
+    python data_monitor.py                  # tek denetim
+    python data_monitor.py --watch          # 300 sn'de bir (sadece değişen dosyalar denetlenir)
+    python data_monitor.py --json           # raporu JSON olarak yaz
+
+Çıkış kodu: 0 = ok/degraded, 1 = error
 """
 
+import argparse
 import json
 import os
 import time
-from datetime import datetime
-
-def check_data_integrity():
-    """Veri dosyalarının bütünlüğünü kontrol eder"""
-    data_files = [
-        'baca_bilgileri.json',
-        'parametre_olcum.json',
-        'firma_olcum.json',
-        'users.json',
-        'parameters.json'
-    ]
-    
-    issues = []
-    
-    for file in data_files:
-        if os.path.exists(file):
-            try:
-                with open(file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                # Temel kontroller
-                if isinstance(data, list):
-                    print(f"✅ {file}: {len(data)} kayıt")
-                else:
-                    issues.append(f"❌ {file}: Liste formatında değil")
-                    
-            except json.JSONDecodeError as e:
-                issues.append(f"❌ {file}: JSON hatası - {e}")
-            except Exception as e:
-                issues.append(f"❌ {file}: Okuma hatası - {e}")
-        else:
-            print(f"⚠️ {file}: Dosya bulunamadı")
-    
-    if issues:
-        print("\n🚨 VERİ BÜTÜNLÜĞÜ SORUNLARI:")
-        for issue in issues:
-            print(f"  {issue}")
-    else:
-        print("\n✅ Tüm veri dosyaları sağlıklı")
+
+os.environ.setdefault('STARTUP_WARMUP', '0')
+
+
+def print_report(report):
+    """Raporu okunur biçimde yazdırır"""
+    icon = {'ok': '✅', 'degraded': '⚠️', 'error': '❌'}.get(report['status'], '•')
+    print(f"{icon} {report['checked_at']} durum: {report['status']} "
+          f"({report['files_checked']} dosya, {report['relations_checked']} referans denetlendi, "
+          f"{report['duration_ms']} ms)")
+    for state in report['files']:
+        for message in state['errors']:
+            print(f"  ❌ {message}")
+        for message in state['warnings']:
+            print(f"  ⚠️ {message}")
+    for relation in report['relations']:
+        if relation['status'] == 'warning':
+            print(f"  ⚠️ {relation['name']}: {relation['missing']} eşleşmeyen kayıt "
+                  f"(ör. {', '.join(relation['examples'])})")
+
 
 def main():
     """Ana fonksiyon"""
-    print("🔍 Veri Bütünlüğü İzleme Sistemi")
-    print("=" * 40)
-    
+    parser = argparse.ArgumentParser(description='Veri bütünlüğü denetimi')
+    parser.add_argument('--watch', action='store_true', help='Sürekli çalış')
+    parser.add_argument('--interval', type=int, default=300, help='Denetim aralığı (sn)')
+    parser.add_argument('--json', action='store_true', help='Raporu JSON olarak yaz')
+    args = parser.parse_args()
+
+    from app import integrity_monitor
+
     while True:
-        print(f"\n📊 Kontrol zamanı: {datetime.now().strftime('%H:%M:%S')}")
-        check_data_integrity()
-        time.sleep(300)  # 5 dakika bekle
+        report = integrity_monitor.run()
+        if args.json:
+            print(json.dumps(report, ensure_ascii=False, indent=2))
+        else:
+            print_report(report)
+        if not args.watch:
+            return 1 if report['status'] == 'error' else 0
+        time.sleep(args.interval)
+
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+Production gunicorn ayarları
+
+Kullanım: gunicorn -c gunicorn.conf.py app:app
+Fly.io VM'i (1 paylaşımlı CPU, 1 GB RAM) için boyutlandırılmıştır; değerler
+ortam değişkenleriyle değiştirilebilir.
+"""
+
+import os
+
+bind = [f"0.0.0.0:{os.environ.get('PORT', '8080')}"]
+# /metrics ayrı bir portta sunulur (app.py METRICS_PORT); Fly bu portu dışarı açmaz,
+# [metrics] kazıyıcısı özel ağdan erişir
+if os.environ.get('METRICS_PORT'):
+    bind.append(f"0.0.0.0:{os.environ['METRICS_PORT']}")
+
+# gthread: her worker birkaç istek thread'i taşır; rapor/Excel üretimi sırasında
+# diğer istekler beklemez. 1 CPU için 2 worker x 4 thread.
+worker_class = 'gthread'
+workers = int(os.environ.get('WEB_CONCURRENCY', '2'))
+threads = int(os.environ.get('GUNICORN_THREADS', '4'))
+
+# Uygulama master'da bir kez yüklenir, worker'lar copy-on-write ile paylaşır
+preload_app = True
+
+# Uzun süren Word/Excel/PDF dışa aktarımları için geniş zaman aşımları
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', '180'))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', '60'))
+keepalive = 5
+
+# Bellek sızıntılarına karşı worker'ları periyodik olarak yenile
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', '1000'))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', '100'))
+
+# Heartbeat dosyaları disk yerine bellekte (Docker overlay fs yavaşlığını önler)
+if os.path.isdir('/dev/shm'):
+    worker_tmp_dir = '/dev/shm'
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'info')
+
+
+def on_starting(server):
+    """Teklif numarası migration'ları master'da, worker'lar fork edilmeden önce bir kez çalışır.
+
+    preload_app ile uygulama bu noktada yüklenmiştir; worker'lar (max_requests ile yenilenenler
+    dahil) tamamlanmış adımı devralır ve migration'ları yeniden çalıştırmaz.
+    """
+    import app as application
+    application.run_startup_migrations()
+
+
+def post_worker_init(worker):
+    """Worker hazır olduktan sonra il-ilçe tablosu ve rapor kütüphaneleri (matplotlib, docx,
+    pandas) arka planda hazırlanır.
+
+    Import sırasında ağır iş yapılmadığı için worker hemen istek kabul eder; ısınma
+    thread'i fork'tan sonra başlatılır (master'da thread açmak fork'u güvensiz yapar).
+    """
+    import app as application
+    application.start_background_warmup()
+
+
+def worker_exit(server, worker):
+    """Kapanan worker'ın (ör. max_requests) son metrikleri /metrics toplamında kaybolmasın"""
+    import app as application
+    application.flush_metrics(only_if_scraped=True)
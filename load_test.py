@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Saha Ekibi Yük Testi
+N teknisyen aynı anda baca bilgisi (save_baca_bilgileri_saha) ve parametre ölçümü
+(save_parametre_olcum_saha) kaydederken M ofis kullanıcısı /teklif sayfasını, teklif listesini
+ve pivot raporlarını gezer. Sonunda işlem hacmi, p50/p95/p99 gecikmeler ve beklenen kayıtların
+parametre_olcum.json / baca_bilgileri.json ile karşılaştırılmasıyla kayıp güncelleme (lost update)
+raporu verilir.
+
+Kullanım:
+    python load_test.py                                  # geçici DATA_DIR ile gunicorn başlatır
+    python load_test.py --technicians 20 --office 5 --workers 4 --scale 10
+    python load_test.py --url http://localhost:8080 --username admin --password 1
+
+--url verilmezse sunucu gunicorn.conf.py ile (çoklu worker) yerel olarak başlatılır; böylece
+worker'lar arası dosya kilitleri de test edilir. Sonuçlar --out ile JSON olarak yazılabilir.
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import requests
+
+from synthetic_data import generate_dataset, write_dataset
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+# Yük testi kayıtlarını ayırt etmek için parametre_verileri içine yazılan işaretler
+MARKER_RUN = 'LOADTEST-RUN'
+MARKER_REV = 'LOADTEST-REV'
+PASSWORD = 'loadtest'
+
+
+class Recorder:
+    """İşlem türüne göre gecikme ve hata kayıtları (thread-safe)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = {}
+        self.errors = {}
+
+    def record(self, operation, elapsed_ms, ok):
+        with self.lock:
+            self.latencies.setdefault(operation, []).append(elapsed_ms)
+            if not ok:
+                self.errors[operation] = self.errors.get(operation, 0) + 1
+
+    def summary(self, wall_seconds):
+        def stats(values):
+            ordered = sorted(values)
+            return {
+                'count': len(ordered),
+                'p50_ms': round(percentile(ordered, 50), 2),
+                'p95_ms': round(percentile(ordered, 95), 2),
+                'p99_ms': round(percentile(ordered, 99), 2),
+                'mean_ms': round(statistics.mean(ordered), 2),
+                'max_ms': round(ordered[-1], 2)
+            }
+        operations = {op: dict(stats(values), errors=self.errors.get(op, 0))
+                      for op, values in sorted(self.latencies.items())}
+        all_values = [v for values in self.latencies.values() for v in values]
+        total = dict(stats(all_values), errors=sum(self.errors.values())) if all_values else {'count': 0, 'errors': 0}
+        total['throughput_rps'] = round(len(all_values) / wall_seconds, 2) if wall_seconds else None
+        return {'wall_seconds': round(wall_seconds, 2), 'total': total, 'operations': operations}
+
+
+def percentile(ordered, pct):
+    if not ordered:
+        return 0.0
+    k = (len(ordered) - 1) * pct / 100
+    lower = int(k)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (k - lower)
+
+
+def timed(recorder, session, operation, method, url, **kwargs):
+    started = time.perf_counter()
+    try:
+        response = session.request(method, url, timeout=120, **kwargs)
+        ok = response.status_code in (200, 304)
+        if ok and response.headers.get('Content-Type', '').startswith('application/json'):
+            body = response.json()
+            ok = not (isinstance(body, dict) and body.get('success') is False)
+    except requests.RequestException:
+        ok = False
+    recorder.record(operation, (time.perf_counter() - started) * 1000, ok)
+    return ok
+
+
+def login(base_url, username, password):
+    session = requests.Session()
+    response = session.post(f"{base_url}/login", data={'username': username, 'password': password},
+                            allow_redirects=False, timeout=30)
+    if response.status_code != 302:
+        raise RuntimeError(f"Giriş başarısız: {username} ({response.status_code})")
+    return session
+
+
+class Technician:
+    """Bir saha teknisyeni: kendi ölçüm kodunda bacaları ve parametreleri sırayla kaydeder"""
+
+    def __init__(self, index, run_id, args, rng, username, password):
+        self.index = index
+        self.run_id = run_id
+        self.args = args
+        self.rng = rng
+        self.username = username
+        self.password = password
+        self.firma_adi = f"YÜK TESTİ FİRMA {index % max(1, args.technicians // 2) + 1}"
+        self.olcum_kodu = f"LT-{run_id}-{index + 1:03d}"
+        # Beklenen son durum: (baca, parametre) -> son revizyon
+        self.expected_parametre = {}
+        self.expected_baca = set()
+
+    def run(self, base_url, recorder):
+        session = login(base_url, self.username, self.password)
+        parametreler = ['Toz', 'NEM', 'Yg', 'Voc', 'Hcl', 'Pm10']
+        for b in range(self.args.bacas):
+            baca_adi = f"BACA-{b + 1}"
+            ok = timed(recorder, session, 'save_baca_bilgileri_saha', 'POST', f"{base_url}/save_baca_bilgileri_saha", data={
+                'firma_adi': self.firma_adi,
+                'olcum_kodu': self.olcum_kodu,
+                'baca_adi': baca_adi,
+                'baca_bilgileri': json.dumps({'BACA NO': str(b + 1), 'YAKIT TÜRÜ': 'DOĞAL GAZ'}, ensure_ascii=False),
+                'personel_adi': self.username
+            })
+            if ok:
+                self.expected_baca.add(baca_adi)
+            for parametre_adi in parametreler[:self.args.params]:
+                revisions = 1 + (1 if self.rng.random() < self.args.update_ratio else 0)
+                for rev in range(1, revisions + 1):
+                    ok = timed(recorder, session, 'save_parametre_olcum_saha', 'POST', f"{base_url}/save_parametre_olcum_saha", data={
+                        'firma_adi': self.firma_adi,
+                        'olcum_kodu': self.olcum_kodu,
+                        'baca_adi': baca_adi,
+                        'parametre_adi': parametre_adi,
+                        'parametre_verileri': json.dumps({
+                            'TARİH': datetime.now().strftime('%d.%m.%y'),
+                            'B.HIZ': f"{self.rng.uniform(3, 12):.1f}",
+                            MARKER_RUN: self.run_id,
+                            MARKER_REV: rev
+                        }, ensure_ascii=False)
+                    })
+                    if ok:
+                        self.expected_parametre[(baca_adi, parametre_adi)] = rev
+                    if self.args.think_ms:
+                        time.sleep(self.rng.uniform(0, self.args.think_ms) / 1000)
+
+
+def office_user(base_url, username, password, recorder, stop_event, rng, year):
+    session = login(base_url, username, password)
+    while not stop_event.is_set():
+        action = rng.random()
+        if action < 0.25:
+            timed(recorder, session, 'page_teklif', 'GET', f"{base_url}/teklif")
+        elif action < 0.60:
+            timed(recorder, session, 'teklif_list', 'GET', f"{base_url}/api/teklif/list",
+                  params={'page': rng.randint(1, 3), 'sort': rng.choice(['teklif_no', 'firma_adi', 'teklif_tarihi'])})
+        elif action < 0.80:
+            timed(recorder, session, 'pivot_summary', 'GET', f"{base_url}/api/pivot/summary",
+                  params={'start': f"{year - 1}-01-01", 'end': f"{year}-12-31"})
+        else:
+            timed(recorder, session, 'pivot_compare', 'GET', f"{base_url}/api/pivot/compare",
+                  params={'years': f"{year - 1},{year}"})
+
+
+def fetch_collection(base_url, session, data_dir, filename, api_path):
+    """Uzlaştırma için koleksiyonu dosyadan (yerel sunucu) veya API'den okur"""
+    if data_dir:
+        with open(os.path.join(data_dir, filename), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    data = session.get(f"{base_url}{api_path}", timeout=120).json()
+    return data.get('items', []) if isinstance(data, dict) else data
+
+
+def reconcile(technicians, run_id, parametre_olcum, baca_bilgileri):
+    """Beklenen son durumu kayıtlı veriyle karşılaştırır"""
+    found = {}
+    duplicates = 0
+    for record in parametre_olcum:
+        veriler = record.get('parametre_verileri') or {}
+        if veriler.get(MARKER_RUN) != run_id:
+            continue
+        key = (record.get('olcum_kodu'), record.get('baca_adi'), record.get('parametre_adi'))
+        if key in found:
+            duplicates += 1
+        found[key] = veriler.get(MARKER_REV)
+    baca_found = {(r.get('olcum_kodu'), r.get('baca_adi')) for r in baca_bilgileri}
+
+    missing, stale = [], []
+    expected_count = 0
+    for tech in technicians:
+        for (baca_adi, parametre_adi), rev in tech.expected_parametre.items():
+            expected_count += 1
+            key = (tech.olcum_kodu, baca_adi, parametre_adi)
+            if key not in found:
+                missing.append(key)
+            elif found[key] != rev:
+                stale.append({'key': key, 'expected_rev': rev, 'found_rev': found[key]})
+    missing_baca = [(t.olcum_kodu, b) for t in technicians for b in t.expected_baca if (t.olcum_kodu, b) not in baca_found]
+    return {
+        'expected_parametre_records': expected_count,
+        'found_parametre_records': len(found),
+        'missing_parametre_records': len(missing),
+        'stale_revisions': len(stale),
+        'duplicate_records': duplicates,
+        'expected_baca_records': sum(len(t.expected_baca) for t in technicians),
+        'missing_baca_records': len(missing_baca),
+        'lost_updates': len(missing) + len(stale) + len(missing_baca),
+        'examples': {'missing': [list(k) for k in missing[:5]], 'stale': [dict(s, key=list(s['key'])) for s in stale[:5]],
+                     'missing_baca': [list(k) for k in missing_baca[:5]]}
+    }
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def prepare_data_dir(data_dir, args):
+    """Sentetik veri ve yük testi kullanıcılarıyla geçici DATA_DIR hazırlar"""
+    write_dataset(data_dir, generate_dataset(args.scale, args.seed))
+    users = {'admin': {'password': PASSWORD, 'role': 'admin'}}
+    for i in range(args.technicians):
+        users[f"tech{i + 1}"] = {'password': PASSWORD, 'role': '3'}
+    for i in range(args.office):
+        users[f"office{i + 1}"] = {'password': PASSWORD, 'role': 'admin'}
+    with open(os.path.join(data_dir, 'users.json'), 'w', encoding='utf-8') as f:
+        json.dump(users, f, ensure_ascii=False, indent=4)
+
+
+def start_server(data_dir, args):
+    port = free_port()
+    env = dict(os.environ, DATA_DIR=data_dir, PORT=str(port), WEB_CONCURRENCY=str(args.workers),
+               GUNICORN_THREADS=str(args.threads), STARTUP_WARMUP='0', GUNICORN_LOG_LEVEL='warning')
+    log = open(os.path.join(data_dir, 'server.log'), 'w')
+    process = subprocess.Popen([sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'app:app'],
+                               cwd=ROOT_DIR, env=env, stdout=log, stderr=subprocess.STDOUT)
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        if process.poll() is not None:
+            with open(log.name, 'r', encoding='utf-8', errors='replace') as f:
+                raise RuntimeError('Sunucu başlatılamadı:\n' + ''.join(f.readlines()[-20:]))
+        try:
+            if requests.get(f"{base_url}/login", timeout=2).status_code == 200:
+                return process, base_url
+        except requests.RequestException:
+            time.sleep(0.3)
+    process.terminate()
+    raise RuntimeError('Sunucu 60 saniyede hazır olmadı')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Saha ekibi eşzamanlı yük testi')
+    parser.add_argument('--url', help='Çalışan sunucu (verilmezse gunicorn yerel olarak başlatılır)')
+    parser.add_argument('--data-dir', help='--url ile: uzlaştırma için sunucunun DATA_DIR\'i (yoksa API kullanılır)')
+    parser.add_argument('--username', default='admin', help='--url ile: tüm sanal kullanıcıların giriş adı')
+    parser.add_argument('--password', help='--url ile: giriş şifresi')
+    parser.add_argument('--technicians', type=int, default=10)
+    parser.add_argument('--office', type=int, default=3)
+    parser.add_argument('--bacas', type=int, default=3, help='Teknisyen başına baca')
+    parser.add_argument('--params', type=int, default=4, help='Baca başına parametre (en fazla 6)')
+    parser.add_argument('--update-ratio', type=float, default=0.3, help='Tekrar kaydedilen (güncellenen) ölçüm oranı')
+    parser.add_argument('--think-ms', type=int, default=0, help='Kayıtlar arası en fazla bekleme')
+    parser.add_argument('--workers', type=int, default=2, help='Yerel gunicorn worker sayısı')
+    parser.add_argument('--threads', type=int, default=4, help='Yerel gunicorn worker başına thread')
+    parser.add_argument('--scale', type=float, default=1, help='Yerel sunucu için sentetik veri ölçeği')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--out', help='Sonuçları JSON olarak yaz')
+    args = parser.parse_args()
+
+    run_id = uuid.uuid4().hex[:8]
+    process = None
+    data_dir = args.data_dir
+    tmp_dir = None
+    try:
+        if args.url:
+            base_url = args.url.rstrip('/')
+            credentials = lambda role, i: (args.username, args.password)
+        else:
+            tmp_dir = data_dir = tempfile.mkdtemp(prefix='emisyon_load_')
+            prepare_data_dir(data_dir, args)
+            process, base_url = start_server(data_dir, args)
+            credentials = lambda role, i: (f"{role}{i + 1}", PASSWORD)
+        print(f"Hedef: {base_url}  çalıştırma: {run_id}  teknisyen: {args.technicians}  ofis: {args.office}")
+
+        rng = random.Random(args.seed)
+        technicians = [Technician(i, run_id, args, random.Random(rng.random()), *credentials('tech', i))
+                       for i in range(args.technicians)]
+        recorder = Recorder()
+        stop_event = threading.Event()
+        year = datetime.now().year
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.technicians + args.office) as pool:
+            office_futures = [
+                pool.submit(office_user, base_url, *credentials('office', i),
+                            recorder, stop_event, random.Random(rng.random()), year)
+                for i in range(args.office)
+            ]
+            tech_futures = [pool.submit(tech.run, base_url, recorder) for tech in technicians]
+            for future in tech_futures:
+                future.result()
+            stop_event.set()
+            for future in office_futures:
+                future.result()
+        wall = time.perf_counter() - started
+
+        session = login(base_url, *(credentials('admin', 0) if args.url else ('admin', PASSWORD)))
+        result = recorder.summary(wall)
+        result['run_id'] = run_id
+        result['config'] = {k: v for k, v in vars(args).items() if k != 'password'}
+        result['reconciliation'] = reconcile(
+            technicians, run_id,
+            fetch_collection(base_url, session, data_dir, 'parametre_olcum.json', '/api/parametre_olcumleri'),
+            fetch_collection(base_url, session, data_dir, 'baca_bilgileri.json', '/api/baca_bilgileri'))
+    finally:
+        if process is not None:
+            process.terminate()
+            try:
+                process.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        if tmp_dir:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    print_report(result)
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"Sonuçlar yazıldı: {args.out}")
+    if result['reconciliation']['lost_updates'] or result['reconciliation']['duplicate_records']:
+        sys.exit(1)
+
+
+def print_report(result):
+    total = result['total']
+    print(f"\nSüre: {result['wall_seconds']} s  istek: {total['count']}  hata: {total['errors']}  "
+          f"işlem hacmi: {total.get('throughput_rps')} istek/s")
+    print(f"{'işlem':<28}{'adet':>7}{'hata':>6}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}  (ms)")
+    for op, s in result['operations'].items():
+        print(f"{op:<28}{s['count']:>7}{s['errors']:>6}{s['p50_ms']:>10}{s['p95_ms']:>10}{s['p99_ms']:>10}{s['max_ms']:>10}")
+    r = result['reconciliation']
+    print(f"\nUzlaştırma: beklenen {r['expected_parametre_records']} parametre kaydı, bulunan {r['found_parametre_records']}, "
+          f"eksik {r['missing_parametre_records']}, eski revizyon {r['stale_revisions']}, çift kayıt {r['duplicate_records']}, "
+          f"eksik baca {r['missing_baca_records']}")
+    print('KAYIP GÜNCELLEME YOK' if not r['lost_updates'] and not r['duplicate_records'] else f"KAYIP GÜNCELLEME: {r['lost_updates']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Rapor Üretimi Benchmark'ı ve Altın Çıktı (Golden) Regresyon Testi
+create_word_teklif, create_firma_raporu_from_template, create_firma_olcum_word_document ve
+create_kk_word_report fonksiyonlarını sabit (seed'li) fixture verisiyle farklı boyutlarda
+çalıştırır. Her durum için süre, tracemalloc ile tepe bellek ve çıktı boyutu ölçülür; belgenin
+normalize edilmiş XML'i report_golden/ altındaki altın dosyalarla karşılaştırılır.
+
+Kullanım:
+    python report_regression.py                      # karşılaştır (fark varsa çıkış kodu 1)
+    python report_regression.py --update             # altın dosyaları yeniden yaz
+    python report_regression.py --only teklif_word --sizes small,large --repeat 5 --out rapor_bench.json
+
+Normalizasyon: docProps/core.xml (oluşturma zamanı), w:rsid* öznitelikleri, belge birleştirmede
+rastgele üretilen w:nsid değerleri, gömülü görsellerin içeriği (matplotlib sürümüne/fontlara bağlı)
+ve bugünün tarihi/saati karşılaştırmadan çıkarılır. Altın dosyalar gzip'li tutulur (<durum>.xml.gz).
+Performans değişikliklerinden sonra fark çıkarsa belge içeriği değişmiş demektir.
+"""
+
+import argparse
+import difflib
+import gzip
+import json
+import os
+import re
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import zipfile
+from datetime import datetime
+from io import BytesIO
+
+from synthetic_data import PARAMETRE_ALANLARI, TEKLIF_KALEMLERI, SyntheticDataGenerator, write_dataset
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+GOLDEN_DIR = os.path.join(ROOT_DIR, 'report_golden')
+SEED = 2024
+FIXTURE_DATE = datetime(2025, 10, 6, 9, 30)
+
+# Boyut -> (baca sayısı, baca başına parametre, teklif kalemi, KK ölçüm noktası)
+SIZES = {
+    'small': (1, 2, 4, 5),
+    'medium': (4, 4, 12, 30),
+    'large': (12, 6, 40, 150),
+}
+
+
+def build_fixture(size):
+    """Boyuta göre tek firma, tek ölçüm, bacaları, parametre ölçümleri, teklif ve KK verisi"""
+    baca_count, param_count, kalem_count, kk_points = SIZES[size]
+    gen = SyntheticDataGenerator(SEED, today=FIXTURE_DATE)
+    firma = gen.firma_kayit(0)
+    olcum = gen.firma_olcum(firma, 'E-251006-01', FIXTURE_DATE)
+    parametre_adlari = sorted(PARAMETRE_ALANLARI)[:param_count]
+    olcum['baca_parametreleri'] = {f"BACA-{i + 1:02d}": list(parametre_adlari) for i in range(baca_count)}
+    olcum['baca_sayisi'] = str(baca_count)
+
+    bacalar, parametreler = [], []
+    for b, baca_adi in enumerate(olcum['baca_parametreleri']):
+        zaman = FIXTURE_DATE.replace(hour=10 + b % 8)
+        baca = gen.baca_bilgisi(olcum, baca_adi, 'Kaan Süzer', zaman)
+        bacalar.append(baca)
+        for parametre_adi in parametre_adlari:
+            parametreler.append(gen.parametre_olcum(baca, parametre_adi, zaman))
+
+    teklif = gen.teklif(firma, '2025/TE-042', FIXTURE_DATE)
+    sabit = teklif['parametreler'][:2]
+    rapor = teklif['parametreler'][-1]
+    kalemler = []
+    for i in range(kalem_count):
+        parametre, metot, fiyat = TEKLIF_KALEMLERI[i % len(TEKLIF_KALEMLERI)]
+        adet = 1 + i % 5
+        kalemler.append({'adet': adet, 'birimFiyat': fiyat, 'metot': metot,
+                         'parametre': parametre if i < len(TEKLIF_KALEMLERI) else f"{parametre} ({i // len(TEKLIF_KALEMLERI) + 1})",
+                         'topFiyat': adet * fiyat})
+    teklif['parametreler'] = sabit + kalemler + [rapor]
+    teklif['toplam'] = sum(k['topFiyat'] for k in teklif['parametreler'])
+    teklif['indirim'] = teklif['toplam'] * int(teklif['indirim_orani']) / 100
+    teklif['netToplam'] = teklif['toplam'] - teklif['indirim']
+
+    kk_veriler = [{
+        'tarih': f"2025-{1 + i * 11 // kk_points:02d}-{1 + (i * 7) % 28:02d}",
+        'deger': round(6.8 + (i % 9) * 0.05, 2),
+        'firma': firma['firmaAdi'],
+        'kod': olcum['olcum_kodu'],
+        'baca': f"BACA-{i % max(1, baca_count) + 1:02d}",
+        'personel': 'Kaan Süzer'
+    } for i in range(kk_points)]
+
+    return {'firma': firma, 'olcum': olcum, 'bacalar': bacalar, 'parametreler': parametreler,
+            'teklif': teklif, 'kk_veriler': kk_veriler}
+
+
+def response_bytes(result):
+    """Rapor fonksiyonunun döndürdüğü Flask yanıtından / (yol, ad) çiftinden docx baytları"""
+    if isinstance(result, tuple) and len(result) == 2 and isinstance(result[0], str):
+        with open(result[0], 'rb') as f:
+            data = f.read()
+        os.unlink(result[0])
+        return data
+    if isinstance(result, tuple):
+        result = result[0]
+    if result.status_code != 200:
+        raise RuntimeError(f"Rapor üretilemedi ({result.status_code}): {result.get_data(as_text=True)[:300]}")
+    result.direct_passthrough = False
+    data = result.get_data()
+    result.close()
+    return data
+
+
+def report_cases(application):
+    """Rapor adı -> fixture alıp docx baytı döndüren fonksiyon"""
+    def teklif_word(fx):
+        return response_bytes(application.create_word_teklif(fx['teklif'], fx['firma'], return_file_info=True))
+
+    def firma_olcum_word(fx):
+        doc = application.create_firma_olcum_word_document(fx['olcum'], fx['bacalar'], fx['parametreler'])
+        return response_bytes(doc)
+
+    def firma_raporu(fx):
+        return response_bytes(application.create_firma_raporu_from_template(fx['olcum']['firma_adi'], fx['olcum']['olcum_kodu']))
+
+    def kk_word(fx):
+        veriler = fx['kk_veriler']
+        degerler = [v['deger'] for v in veriler]
+        return response_bytes(application.create_kk_word_report(
+            'O2', veriler, 7.0, 6.6, 6.8, 7.2, 7.4, sum(degerler) / len(degerler), (7.4 - 7.0) / 3,
+            min(degerler), max(degerler), '2025-01-01', '2025-12-31'))
+
+    return {'teklif_word': teklif_word, 'firma_olcum_word': firma_olcum_word,
+            'firma_raporu': firma_raporu, 'kk_word': kk_word}
+
+
+def _volatile_patterns():
+    now = datetime.now()
+    dates = {now.strftime(fmt) for fmt in ('%d.%m.%Y', '%d.%m.%y', '%Y-%m-%d', '%d/%m/%Y', '%Y%m%d')}
+    return [re.compile(re.escape(d) + r'([ _T]?\d{2}[:]?\d{2}([:]?\d{2}(\.\d+)?)?)?') for d in sorted(dates, key=len, reverse=True)]
+
+
+def normalize_docx(data):
+    """Belgenin karşılaştırılabilir metin gösterimi (parça adları + kanonik XML)"""
+    from lxml import etree
+    patterns = _volatile_patterns()
+    lines = []
+    with zipfile.ZipFile(BytesIO(data)) as z:
+        for name in sorted(z.namelist()):
+            if name == 'docProps/core.xml':
+                continue
+            if not (name.endswith('.xml') or name.endswith('.rels')):
+                lines.append(f"==== {name} (binary)")
+                continue
+            root = etree.fromstring(z.read(name))
+            for el in root.iter():
+                for attr in [a for a in el.attrib if etree.QName(a).localname.startswith('rsid')]:
+                    del el.attrib[attr]
+                if isinstance(el.tag, str) and etree.QName(el).localname == 'nsid':
+                    for attr in el.attrib:
+                        el.attrib[attr] = '<NSID>'
+            text = etree.tostring(root, pretty_print=True, encoding='unicode')
+            for pattern in patterns:
+                text = pattern.sub('<TODAY>', text)
+            lines.append(f"==== {name}")
+            lines.append(text.rstrip('\n'))
+    return '\n'.join(lines) + '\n'
+
+
+def measure(func, fixture, repeat):
+    """Süre (tracemalloc kapalıyken), tepe bellek (ayrı bir çalıştırmada) ve çıktı"""
+    timings = []
+    data = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        data = func(fixture)
+        timings.append((time.perf_counter() - started) * 1000)
+    tracemalloc.start()
+    try:
+        func(fixture)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return data, {
+        'median_ms': round(statistics.median(timings), 2),
+        'min_ms': round(min(timings), 2),
+        'peak_memory_kb': round(peak / 1024, 1),
+        'output_bytes': len(data)
+    }
+
+
+def load_app(data_dir):
+    os.environ['DATA_DIR'] = data_dir
+    os.environ.setdefault('STARTUP_WARMUP', '0')
+    os.environ.setdefault('METRICS_ENABLED', 'false')
+    sys.path.insert(0, ROOT_DIR)
+    import app as application
+    # KK raporu modül düzeyindeki plt/mdates'i kullanır; istek akışında önce grafik yüklenir
+    application.load_matplotlib()
+    return application
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rapor üretimi benchmark\'ı ve altın çıktı regresyon testi')
+    parser.add_argument('--only', help='Sadece bu raporlar (virgülle ayrılmış)')
+    parser.add_argument('--sizes', default=','.join(SIZES), help='Fixture boyutları')
+    parser.add_argument('--repeat', type=int, default=3, help='Süre ölçümü tekrar sayısı')
+    parser.add_argument('--update', action='store_true', help='Altın dosyaları güncelle')
+    parser.add_argument('--out', help='Ölçüm sonuçlarını JSON olarak yaz')
+    parser.add_argument('--verbose', action='store_true', help='Uygulama çıktılarını göster')
+    args = parser.parse_args()
+    only = set(args.only.split(',')) if args.only else None
+    sizes = [s for s in args.sizes.split(',') if s in SIZES]
+
+    data_dir = tempfile.mkdtemp(prefix='emisyon_report_')
+    results, mismatches = {}, []
+    try:
+        application = load_app(data_dir)
+        cases = report_cases(application)
+        os.makedirs(GOLDEN_DIR, exist_ok=True)
+        for size in sizes:
+            fixture = build_fixture(size)
+            # firma_raporu veriyi DATA_DIR'den okur
+            write_dataset(data_dir, {'firma_kayit': [fixture['firma']], 'teklif': [fixture['teklif']],
+                                     'firma_olcum': [fixture['olcum']], 'baca_bilgileri': fixture['bacalar'],
+                                     'parametre_olcum': fixture['parametreler']})
+            for name, func in cases.items():
+                if only and name not in only:
+                    continue
+                case = f"{name}_{size}"
+                output = None if args.verbose else open(os.devnull, 'w')
+                try:
+                    with application.app.test_request_context():
+                        if output:
+                            sys.stdout, saved_stdout = output, sys.stdout
+                        try:
+                            data, stats = measure(func, fixture, args.repeat)
+                        finally:
+                            if output:
+                                sys.stdout = saved_stdout
+                finally:
+                    if output:
+                        output.close()
+                results[case] = stats
+                normalized = normalize_docx(data)
+                golden_path = os.path.join(GOLDEN_DIR, f"{case}.xml.gz")
+                if args.update or not os.path.exists(golden_path):
+                    with open(golden_path, 'wb') as f:
+                        f.write(gzip.compress(normalized.encode('utf-8'), compresslevel=9, mtime=0))
+                    status = 'yazıldı'
+                else:
+                    with gzip.open(golden_path, 'rt', encoding='utf-8') as f:
+                        golden = f.read()
+                    if golden == normalized:
+                        status = 'aynı'
+                    else:
+                        status = 'FARKLI'
+                        mismatches.append((case, golden, normalized))
+                stats['golden'] = status
+                print(f"{case:<26} {stats['median_ms']:>10.1f} ms  tepe {stats['peak_memory_kb']:>10.1f} KB"
+                      f"  {stats['output_bytes']:>9} B  altın: {status}")
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump({'created_at': datetime.now().isoformat(timespec='seconds'), 'repeat': args.repeat,
+                       'cases': results}, f, ensure_ascii=False, indent=2)
+        print(f"Sonuçlar yazıldı: {args.out}")
+
+    for case, golden, normalized in mismatches:
+        diff = difflib.unified_diff(golden.splitlines(), normalized.splitlines(),
+                                    f"report_golden/{case}.xml.gz", 'şimdiki', lineterm='', n=2)
+        print('\n'.join(list(diff)[:60]))
+    if mismatches:
+        print(f"{len(mismatches)} rapor altın çıktıdan farklı. Değişiklik bilinçliyse --update ile güncelleyin.")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,162 @@
+// Sunucu tarafı sayfalı tablo: satırlar liste API'sinden (ör. /api/teklif/list) sayfa sayfa
+// yüklenir; arama, filtre ve sıralama sunucuda yapılır. Sayfa HTML'i kayıt sayısından bağımsızdır.
+class PagedTable {
+    constructor(options) {
+        this.url = options.url;
+        this.tbody = options.tbody;
+        this.pager = options.pager;
+        this.renderRow = options.renderRow;
+        this.colspan = options.colspan || 1;
+        this.emptyText = options.emptyText || 'Kayıt bulunamadı.';
+        this.onLoad = options.onLoad || null;
+        this.perPage = options.perPage || 50;
+        this.sort = options.sort || '';
+        this.dir = options.dir || '';
+        this.filters = {};
+        this.page = 1;
+        this.result = null;
+        this.debounceTimer = null;
+        this.requestSeq = 0;
+    }
+
+    static escape(value) {
+        return String(value === null || value === undefined ? '' : value)
+            .replace(/&/g, '&amp;')
+            .replace(/</g, '&lt;')
+            .replace(/>/g, '&gt;')
+            .replace(/"/g, '&quot;')
+            .replace(/'/g, '&#39;');
+    }
+
+    buildUrl(extra) {
+        const params = new URLSearchParams();
+        Object.entries(this.filters).forEach(([key, value]) => params.set(key, value));
+        if (this.sort) params.set('sort', this.sort);
+        if (this.dir) params.set('dir', this.dir);
+        params.set('page', this.page);
+        params.set('per_page', this.perPage);
+        Object.entries(extra || {}).forEach(([key, value]) => params.set(key, value));
+        return `${this.url}?${params.toString()}`;
+    }
+
+    // Filtre değiştir (boş değer filtreyi kaldırır); metin kutuları için debounce kullanılır
+    setFilter(name, value, debounce) {
+        if (value) {
+            this.filters[name] = value;
+        } else {
+            delete this.filters[name];
+        }
+        this.page = 1;
+        clearTimeout(this.debounceTimer);
+        if (debounce) {
+            this.debounceTimer = setTimeout(() => this.load(), 300);
+        } else {
+            this.load();
+        }
+    }
+
+    // Tüm filtreleri birlikte uygula (filtre formu olan sayfalar için)
+    setFilters(filters, debounce) {
+        this.filters = {};
+        Object.entries(filters).forEach(([name, value]) => {
+            if (value) this.filters[name] = value;
+        });
+        this.page = 1;
+        clearTimeout(this.debounceTimer);
+        if (debounce) {
+            this.debounceTimer = setTimeout(() => this.load(), 300);
+            return Promise.resolve();
+        }
+        return this.load();
+    }
+
+    clearFilters() {
+        this.filters = {};
+        this.page = 1;
+        return this.load();
+    }
+
+    // Aynı kolona tekrar tıklanınca yön değişir
+    setSort(column) {
+        if (this.sort === column) {
+            this.dir = this.dir === 'asc' ? 'desc' : 'asc';
+        } else {
+            this.sort = column;
+            this.dir = 'asc';
+        }
+        this.page = 1;
+        return this.load();
+    }
+
+    goTo(page) {
+        this.page = page;
+        return this.load();
+    }
+
+    load() {
+        const seq = ++this.requestSeq;
+        return fetch(this.buildUrl(), { credentials: 'same-origin' })
+            .then(response => response.json())
+            .then(result => {
+                // Daha yeni bir istek başladıysa eski yanıtı yok say
+                if (seq !== this.requestSeq) return;
+                if (result.error) throw new Error(result.error);
+                this.result = result;
+                this.page = result.page;
+                this.sort = result.sort;
+                this.dir = result.dir;
+                this.render();
+                if (this.onLoad) this.onLoad(result);
+                return result;
+            })
+            .catch(error => {
+                console.error('Liste yüklenemedi:', error);
+                this.tbody.innerHTML = `<tr><td colspan="${this.colspan}" class="text-center text-danger p-4">Liste yüklenemedi: ${PagedTable.escape(error.message)}</td></tr>`;
+            });
+    }
+
+    // Filtreye uyan tüm kayıtların id'leri (toplu işlemler için)
+    fetchIds() {
+        return fetch(this.buildUrl({ ids: '1', page: 1, per_page: 1 }), { credentials: 'same-origin' })
+            .then(response => response.json())
+            .then(result => result.ids || []);
+    }
+
+    render() {
+        const items = this.result.items;
+        if (items.length === 0) {
+            this.tbody.innerHTML = `<tr><td colspan="${this.colspan}" class="text-center text-muted p-4">${PagedTable.escape(this.emptyText)}</td></tr>`;
+        } else {
+            this.tbody.innerHTML = items.map(item => this.renderRow(item)).join('');
+        }
+        this.renderPager();
+    }
+
+    renderPager() {
+        if (!this.pager) return;
+        const { page, pages, per_page: perPage, filtered, total } = this.result;
+        const first = filtered === 0 ? 0 : (page - 1) * perPage + 1;
+        const last = Math.min(page * perPage, filtered);
+        const summary = filtered === total
+            ? `${first}–${last} / ${total} kayıt`
+            : `${first}–${last} / ${filtered} kayıt (toplam ${total})`;
+        const options = [];
+        for (let p = 1; p <= pages; p++) {
+            options.push(`<option value="${p}" ${p === page ? 'selected' : ''}>${p}</option>`);
+        }
+        this.pager.innerHTML = `
+            <span class="text-muted small">${summary}</span>
+            <div class="btn-group btn-group-sm align-items-center">
+                <button type="button" class="btn btn-outline-secondary" data-page="${page - 1}" ${page <= 1 ? 'disabled' : ''}>&laquo;</button>
+                <select class="form-select form-select-sm mx-1" style="width: auto;">${options.join('')}</select>
+                <span class="text-muted small me-1">/ ${pages}</span>
+                <button type="button" class="btn btn-outline-secondary" data-page="${page + 1}" ${page >= pages ? 'disabled' : ''}>&raquo;</button>
+            </div>`;
+        this.pager.querySelectorAll('button[data-page]').forEach(button => {
+            button.addEventListener('click', () => this.goTo(parseInt(button.dataset.page, 10)));
+        });
+        this.pager.querySelector('select').addEventListener('change', event => {
+            this.goTo(parseInt(event.target.value, 10));
+        });
+    }
+}
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Veri Dizini ve Anlık Görüntü Kapısı
+app.py ve auto_backup.py aynı DATA_DIR'i çözsün ve aynı kilit protokolünü kullansın diye
+ortak modül. Koleksiyon kilitleri ve thread başına iç içe sayım app.py'de kalır; burada
+sadece dosya kilitleri vardır.
+
+Kilit dosyaları (her veri dizininde .locks/ altında):
+    .snapshot.lock          yazıcılar ilk koleksiyon kilidinden sonuncusuna kadar paylaşımlı
+                            (LOCK_SH) tutar; anlık görüntü özel (LOCK_EX) alır. Böylece iç içe
+                            kilitlerle yapılan çok dosyalı güncelleme ya tamamen görüntüye girer
+                            ya hiç girmez.
+    .snapshot.intent.lock   flock bekleyen özel kilide öncelik vermediği için anlık görüntü önce
+                            bunu özel alır; yeni yazıcılar kapıya girerken buradan kısa süre
+                            paylaşımlı geçer ve bekleyen bir görüntü varken sıraya girer.
+"""
+
+import os
+import tempfile
+from contextlib import contextmanager
+
+try:
+    import fcntl  # Süreçler arası dosya kilidi (Linux/Fly); Windows'ta yok
+except ImportError:
+    fcntl = None
+
+SNAPSHOT_GATE_NAME = '.snapshot.lock'
+SNAPSHOT_INTENT_NAME = '.snapshot.intent.lock'
+
+
+def resolve_data_dir():
+    """DATA_DIR ortam değişkeni, yoksa /data, o da yoksa <geçici dizin>/emisyon_data (None olabilir)"""
+    data_dir = os.environ.get('DATA_DIR')
+    if not data_dir:
+        try:
+            if os.path.isdir('/data'):
+                data_dir = '/data'
+        except Exception:
+            data_dir = None
+    if not data_dir:
+        try:
+            data_dir = os.path.join(tempfile.gettempdir(), 'emisyon_data')
+        except Exception:
+            data_dir = None
+    return data_dir
+
+
+def gate_path(directory, name=SNAPSHOT_GATE_NAME):
+    lock_dir = os.path.join(directory or '.', '.locks')
+    os.makedirs(lock_dir, exist_ok=True)
+    return os.path.join(lock_dir, name)
+
+
+def enter_shared(directory):
+    """Yazıcı olarak kapıya girer; açık kilit dosyası döner, leave_shared ile bırakılır"""
+    gate_fh = open(gate_path(directory), 'a')
+    if fcntl is not None:
+        with open(gate_path(directory, SNAPSHOT_INTENT_NAME), 'a') as intent_fh:
+            fcntl.flock(intent_fh.fileno(), fcntl.LOCK_SH)
+            fcntl.flock(gate_fh.fileno(), fcntl.LOCK_SH)
+    return gate_fh
+
+
+def leave_shared(gate_fh):
+    if fcntl is not None:
+        fcntl.flock(gate_fh.fileno(), fcntl.LOCK_UN)
+    gate_fh.close()
+
+
+@contextmanager
+def exclusive(directory):
+    """Anlık görüntü: devam eden yazımlar biter, yenileri blok bitene kadar bekler"""
+    with open(gate_path(directory, SNAPSHOT_INTENT_NAME), 'a') as intent_fh, \
+            open(gate_path(directory), 'a') as gate_fh:
+        if fcntl is not None:
+            fcntl.flock(intent_fh.fileno(), fcntl.LOCK_EX)
+            fcntl.flock(gate_fh.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(gate_fh.fileno(), fcntl.LOCK_UN)
+                fcntl.flock(intent_fh.fileno(), fcntl.LOCK_UN)
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sentetik Veri Üretici
+firma_kayit, teklif, firma_olcum, baca_bilgileri ve parametre_olcum koleksiyonlarını
+gerçek kayıtlarla aynı alan yapısında, istenen ölçekte (1x, 10x, 100x) üretir.
+
+Kullanım:
+    python synthetic_data.py --scale 10 --out /tmp/emisyon_10x
+    python synthetic_data.py --scale 1 --base-from data-downloaded/data --out /tmp/emisyon_1x
+
+Aynı seed ile her zaman aynı veri üretilir; benchmark.py ve load_test.py bu modülü kullanır.
+"""
+
+import argparse
+import json
+import os
+import random
+import uuid
+from datetime import datetime, timedelta
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 1x ölçek: yaklaşık bir yıllık saha operasyonu. --base-from ile gerçek bir DATA_DIR'in
+# kayıt sayıları taban alınabilir. Baca ve parametre sayıları ölçüm başına ortalamalardır.
+BASE_COUNTS = {
+    'firma_kayit': 60,
+    'teklif': 150,
+    'firma_olcum': 100,
+}
+BACA_PER_OLCUM = (1, 5)
+PARAMETRE_PER_BACA = (2, 6)
+YEARS_BACK = 3
+
+COLLECTIONS = ('firma_kayit', 'teklif', 'firma_olcum', 'baca_bilgileri', 'parametre_olcum')
+
+FIRMA_ON_EKLER = ['AKARE', 'VEGA', 'ANADOLU', 'MARMARA', 'EGE', 'KARADENİZ', 'TOROS', 'YILDIZ',
+                  'ÖZGÜR', 'ÇINAR', 'GÜNEŞ', 'KORFEZ', 'İPEK', 'ŞAHİN', 'DOĞAN', 'ATLAS']
+FIRMA_SEKTORLER = ['ÇELİK', 'DÖKÜM', 'KİMYA', 'ENERJİ', 'GIDA', 'TEKSTİL', 'SERAMİK', 'KAĞIT',
+                   'PLASTİK', 'OTOMOTİV', 'ÇİMENTO', 'CAM', 'METAL', 'BOYA']
+FIRMA_SONEKLER = ['SAN. VE TİC. A.Ş.', 'SANAYİ A.Ş.', 'LTD. ŞTİ.', 'FABRİKA A.Ş', 'ÜRETİM A.Ş.']
+KISI_ADLARI = ['ADEM YILDIRIM', 'ATALAY TOKER', 'HAFİZE KAYA', 'SEMİH ÖZ', 'KAAN SÜZER', 'EMİN ÇELİK',
+               'RESUL DEMİR', 'KAMURAN ŞEN', 'AYŞE GÜL', 'MEHMET İNCE']
+PERSONEL = ['Adem', 'Atalay', 'Kamuran', 'Semih', 'Kaan', 'Emin', 'Resul', 'Hafize']
+PERSONEL_TAM_AD = {'Kaan': 'Kaan Süzer', 'Semih': 'Semih Öz', 'Emin': 'Emin Çelik'}
+BACA_ADLARI = ['ANA ÜRETİM BACASI', 'KAZAN BACASI', 'FÜZYON BACASI', 'FIRIN BACASI', 'BOYAHANE BACASI',
+               'JENERATÖR BACASI', 'KURUTMA BACASI', 'DÖKÜMHANE BACASI', 'KOJENERASYON BACASI']
+TEKLIF_DURUMLARI = ['KABUL', 'BEKLEMEDE', 'BEKLEMEDE', 'RED']
+TEKLIF_TIPLERI = ['KAPSAM İÇİ', 'KAPSAM DIŞI']
+TEKLIF_KALEMLERI = [
+    ('(E) TOZ', 'Epa 5/Epa 17/Ts En 13284-1/Ts 9096', 9400),
+    ('(E) YANMA GAZI', 'So2/No/Co/O2', 5780),
+    ('(E) VOC', 'Ts En 12619', 7350),
+    ('(E) AĞIR METAL', 'Ts En 14385', 11200),
+    ('(E) HCL', 'Ts En 1911', 6400),
+    ('(E) HF', 'Iso 15713', 6400),
+    ('(E) PM10', 'Ts En Iso 23210', 8900),
+    ('(İ) GÜRÜLTÜ', 'Ts 9315', 4100),
+]
+# Parametre adı -> alan adı -> üretici; gerçek saha kayıtlarındaki (parametre_olcum.json) anahtarlar
+PARAMETRE_ALANLARI = {
+    'Toz': ['NOZZLE ÇAP', 'TRAVERS', 'B.HIZ', 'B.SIC', 'B.BAS(KPA)', 'B.NEM(G/M3)', 'B.NEM(%)',
+            'SYC.HAC.', 'SYC.İLK', 'SYC.SON', 'SYC.SIC', 'DEBİ', 'METOT'],
+    'NEM': ['1İMP-İ', '1-İMP-S', '2-İMP-İ', '2-İMP-S', '3-İMP-İ', '3-İMP-S', 'HAC.'],
+    'Yg': ['B.SIC', 'O2', 'CO', 'NO', 'NOX', 'SO2', 'KK1-O2', 'KK1-CO', 'KK1-NO', 'KK1-SO2',
+           'KK2-O2', 'KK2-CO', 'KK2-NO', 'KK2-SO2', 'T90'],
+    'Voc': ['GAZ HAC.', 'GAZ.SIC.', 'SEY.GAZ.HAC', 'SEY.GAZ.SIC'],
+    'Hcl': ['GAZ HAC.', 'GAZ.SIC.', 'İMP.HAC'],
+    'Pm10': ['NOZZLE ÇAP', 'B.HIZ', 'B.SIC', 'SYC.HAC.', 'DEBİ'],
+}
+# KK değerleri parametre yönetimindeki (parameters.json) KK ± sapma aralığında üretilir
+KK_MERKEZ = {'O2': 7.0, 'CO': 500, 'NO': 500, 'SO2': 500}
+
+
+class SyntheticDataGenerator:
+    """Seed'e bağlı, tekrarlanabilir veri üretici"""
+
+    def __init__(self, seed=42, today=None):
+        self.rng = random.Random(seed)
+        self.today = today or datetime(2026, 1, 15)
+        self.iller = self._load_iller()
+        self.baca_paralar = self._load_json('baca_paralar.json', [])
+
+    def _load_json(self, filename, default):
+        try:
+            with open(os.path.join(ROOT_DIR, filename), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return default
+
+    def _load_iller(self):
+        data = self._load_json('il-ilce.json', [])
+        iller = [(il['il_adi'], [i['ilce_adi'] for i in il.get('ilceler', [])]) for il in data if il.get('ilceler')]
+        return iller or [('KOCAELİ', ['KÖRFEZ', 'İZMİT', 'GEBZE'])]
+
+    def uuid(self):
+        return str(uuid.UUID(int=self.rng.getrandbits(128), version=4))
+
+    def tarih(self):
+        return self.today - timedelta(days=self.rng.randint(0, 365 * YEARS_BACK), seconds=self.rng.randint(0, 86399))
+
+    def sayi(self, low, high, digits=1):
+        return f"{self.rng.uniform(low, high):.{digits}f}"
+
+    def seri(self, low, high, digits=1):
+        """Saha formlarındaki tire ile ayrılmış 1 veya 3 okumalı değerler"""
+        if self.rng.random() < 0.5:
+            return self.sayi(low, high, digits)
+        return '-'.join(self.sayi(low, high, digits) for _ in range(3))
+
+    def firma_kayit(self, index):
+        il, ilceler = self.rng.choice(self.iller)
+        ad = f"{self.rng.choice(FIRMA_ON_EKLER)} {self.rng.choice(FIRMA_SEKTORLER)} {self.rng.choice(FIRMA_SONEKLER)}"
+        return {
+            'id': self.uuid(),
+            'firmaAdi': f"{ad} {index + 1:05d}",
+            'adres': f"{self.rng.choice(['ORGANİZE SANAYİ', 'CUMHURİYET', 'ATATÜRK', 'İSTASYON'])} MAH. NO : {self.rng.randint(1, 200)}",
+            'il': il,
+            'ilce': self.rng.choice(ilceler),
+            'vergiDairesi': self.rng.choice(ilceler),
+            'vergiNo': f"{self.rng.randint(0, 9999999999):010d}",
+            'yetkiliAdi': self.rng.choice(KISI_ADLARI),
+            'yetkiliTel': f"05{self.rng.randint(30, 59)} {self.rng.randint(100, 999)} {self.rng.randint(1000, 9999)}",
+            'yetkiliMail': f"yetkili{index + 1}@example.com",
+            'danismanAdi': self.rng.choice(KISI_ADLARI + ['-']),
+            'danismanMail': '-@xxx',
+            'danismanTel': '-',
+            'kayitTarihi': self.tarih().strftime('%d.%m.%Y')
+        }
+
+    def teklif(self, firma, teklif_no, tarih):
+        baca_sayisi = self.rng.randint(1, 8)
+        kalemler = [
+            {'adet': 1, 'birimFiyat': 12750, 'metot': '', 'parametre': 'TABAN FİYAT ( 1-5 ARASI BACA)', 'topFiyat': 12750},
+            {'adet': 100, 'birimFiyat': 15, 'metot': '', 'parametre': 'YOL', 'topFiyat': 1500},
+        ]
+        for parametre, metot, fiyat in self.rng.sample(TEKLIF_KALEMLERI, self.rng.randint(2, 6)):
+            adet = baca_sayisi * self.rng.randint(1, 2)
+            kalemler.append({'adet': adet, 'birimFiyat': fiyat, 'metot': metot, 'parametre': parametre, 'topFiyat': adet * fiyat})
+        rapor = round(sum(k['topFiyat'] for k in kalemler[2:]) * 0.10)
+        kalemler.append({'_autoBirimFiyat': rapor, '_locked': True, '_manual': False, 'adet': 1, 'birimFiyat': rapor,
+                         'metot': 'Taban fiyat ve yol ücreti hariç toplamın %10', 'parametre': 'RAPORLAMA ÜCRETİ', 'topFiyat': rapor})
+        toplam = sum(k['topFiyat'] for k in kalemler)
+        indirim_orani = self.rng.choice([0, 5, 10, 15, 20])
+        indirim = toplam * indirim_orani / 100
+        durum = self.rng.choice(TEKLIF_DURUMLARI)
+        return {
+            'id': self.uuid(),
+            'teklif_tipi': self.rng.choice(TEKLIF_TIPLERI),
+            'firma_adi': firma['firmaAdi'],
+            'teklif_tarihi': tarih.strftime('%Y-%m-%d'),
+            'teklif_no': teklif_no,
+            'indirim_orani': str(indirim_orani),
+            'indirim_tipi': '%',
+            'parametreler': kalemler,
+            'toplam': toplam,
+            'indirim': indirim,
+            'netToplam': toplam - indirim,
+            'teklif_giris_metni': '',
+            'genel_hukumler': '',
+            'teklif_durumu': durum,
+            'created_at': tarih.isoformat(),
+            'updated_at': (tarih + timedelta(days=self.rng.randint(0, 10))).isoformat(),
+            'durum_tarihi': (tarih + timedelta(days=self.rng.randint(0, 10))).strftime('%Y-%m-%d') if durum != 'BEKLEMEDE' else ''
+        }
+
+    def firma_olcum(self, firma, olcum_kodu, tarih):
+        baca_adlari = self.rng.sample(BACA_ADLARI, self.rng.randint(*BACA_PER_OLCUM))
+        return {
+            'id': self.uuid(),
+            'firma_adi': firma['firmaAdi'],
+            'olcum_kodu': olcum_kodu,
+            'baslangic_tarihi': tarih.strftime('%Y-%m-%d'),
+            'bitis_tarihi': (tarih + timedelta(days=self.rng.randint(0, 3))).strftime('%Y-%m-%d'),
+            'il': firma['il'],
+            'ilce': firma['ilce'],
+            'yetkili': firma['yetkiliAdi'].split()[0],
+            'telefon': firma['yetkiliTel'],
+            'durum': 'Aktif',
+            'personel': self.rng.sample(PERSONEL, self.rng.randint(1, 3)),
+            'baca_sayisi': str(len(baca_adlari)),
+            'baca_parametreleri': {
+                baca: self.rng.sample(sorted(PARAMETRE_ALANLARI), self.rng.randint(*PARAMETRE_PER_BACA))
+                for baca in baca_adlari
+            },
+            'notlar': '',
+            'olusturma_tarihi': (tarih - timedelta(days=1)).isoformat()
+        }
+
+    def baca_bilgisi(self, olcum, baca_adi, personel, tarih):
+        degerler = {}
+        for par in self.baca_paralar:
+            secenekler = [s.strip() for s in (par.get('liste_icerigi') or '').split(',') if s.strip()]
+            degerler[par['id']] = self.rng.choice(secenekler) if secenekler else self.sayi(1, 120)
+        return {
+            'id': self.uuid(),
+            'firma_adi': olcum['firma_adi'],
+            'olcum_kodu': olcum['olcum_kodu'],
+            'baca_adi': baca_adi,
+            'baca_bilgileri': degerler,
+            'personel_adi': personel,
+            'photo_path': None,
+            'created_at': tarih.isoformat(),
+            'updated_at': tarih.isoformat()
+        }
+
+    def parametre_verileri(self, parametre_adi, tarih):
+        veriler = {'TARİH': tarih.strftime('%d.%m.%y')}
+        for alan in PARAMETRE_ALANLARI[parametre_adi]:
+            if alan == 'METOT':
+                veriler[alan] = self.rng.choice(['EPA 5', 'EPA 17'])
+            elif alan.startswith('KK'):
+                merkez = KK_MERKEZ[alan.split('-', 1)[1]]
+                veriler[alan] = self.sayi(merkez * 0.95, merkez * 1.05, 2 if merkez < 10 else 0)
+            elif alan in ('O2',):
+                veriler[alan] = self.seri(3, 12)
+            elif alan in ('SYC.İLK', 'SYC.SON'):
+                veriler[alan] = self.seri(400, 460, 3)
+            else:
+                veriler[alan] = self.seri(0, 130)
+        return veriler
+
+    def parametre_olcum(self, baca, parametre_adi, tarih):
+        return {
+            'id': self.uuid(),
+            'firma_adi': baca['firma_adi'],
+            'olcum_kodu': baca['olcum_kodu'],
+            'baca_adi': baca['baca_adi'],
+            'parametre_adi': parametre_adi,
+            'parametre_verileri': self.parametre_verileri(parametre_adi, tarih),
+            'personel_adi': baca['personel_adi'],
+            'created_at': tarih.isoformat(),
+            'updated_at': tarih.isoformat()
+        }
+
+    def generate(self, scale=1, base_counts=None):
+        """Ölçeklenmiş veri seti: {koleksiyon: kayıt listesi}"""
+        counts = {name: max(1, int(round(count * scale))) for name, count in (base_counts or BASE_COUNTS).items()}
+        firmalar = [self.firma_kayit(i) for i in range(counts['firma_kayit'])]
+
+        teklifler = []
+        teklif_tarihleri = sorted(self.tarih() for _ in range(counts['teklif']))
+        sira_by_year = {}
+        for tarih in teklif_tarihleri:
+            sira_by_year[tarih.year] = sira_by_year.get(tarih.year, 0) + 1
+            teklifler.append(self.teklif(self.rng.choice(firmalar), f"{tarih.year}/TE-{sira_by_year[tarih.year]:03d}", tarih))
+
+        olcumler, bacalar, parametreler = [], [], []
+        sira_by_day = {}
+        for tarih in sorted(self.tarih() for _ in range(counts['firma_olcum'])):
+            gun = tarih.strftime('%y%m%d')
+            sira_by_day[gun] = sira_by_day.get(gun, 0) + 1
+            olcum = self.firma_olcum(self.rng.choice(firmalar), f"E-{gun}-{sira_by_day[gun]:02d}", tarih)
+            olcumler.append(olcum)
+            for baca_adi, parametre_adlari in olcum['baca_parametreleri'].items():
+                personel = self.rng.choice(olcum['personel'])
+                olcum_zamani = tarih + timedelta(minutes=self.rng.randint(0, 600))
+                baca = self.baca_bilgisi(olcum, baca_adi, PERSONEL_TAM_AD.get(personel, personel), olcum_zamani)
+                bacalar.append(baca)
+                for parametre_adi in parametre_adlari:
+                    olcum_zamani += timedelta(minutes=self.rng.randint(10, 90))
+                    parametreler.append(self.parametre_olcum(baca, parametre_adi, olcum_zamani))
+
+        return {
+            'firma_kayit': firmalar,
+            'teklif': teklifler,
+            'firma_olcum': olcumler,
+            'baca_bilgileri': bacalar,
+            'parametre_olcum': parametreler
+        }
+
+
+def base_counts_from(data_dir):
+    """Mevcut bir DATA_DIR'deki kayıt sayılarını 1x taban olarak döndürür"""
+    counts = dict(BASE_COUNTS)
+    for name in counts:
+        try:
+            with open(os.path.join(data_dir, f"{name}.json"), 'r', encoding='utf-8') as f:
+                counts[name] = max(1, len(json.load(f)))
+        except (OSError, ValueError):
+            pass
+    return counts
+
+
+def generate_dataset(scale=1, seed=42, base_counts=None):
+    return SyntheticDataGenerator(seed).generate(scale, base_counts)
+
+
+def write_dataset(data_dir, dataset):
+    """Koleksiyonları data_dir'e yazar; teklif numaraları used_teklif_numbers.json'a eklenir"""
+    os.makedirs(data_dir, exist_ok=True)
+    for name, records in dataset.items():
+        with open(os.path.join(data_dir, f"{name}.json"), 'w', encoding='utf-8') as f:
+            json.dump(records, f, ensure_ascii=False, indent=4)
+    with open(os.path.join(data_dir, 'used_teklif_numbers.json'), 'w', encoding='utf-8') as f:
+        json.dump(sorted(t['teklif_no'] for t in dataset['teklif']), f, ensure_ascii=False, indent=4)
+
+
+def dataset_summary(dataset):
+    return {name: len(records) for name, records in dataset.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sentetik emisyon verisi üretir')
+    parser.add_argument('--scale', type=float, default=1, help='Ölçek çarpanı (1, 10, 100)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--base-from', help='1x taban sayıları bu DATA_DIR\'deki kayıtlardan al')
+    parser.add_argument('--out', required=True, help='Çıktı klasörü (DATA_DIR olarak kullanılabilir)')
+    args = parser.parse_args()
+
+    base = base_counts_from(args.base_from) if args.base_from else None
+    dataset = generate_dataset(args.scale, args.seed, base)
+    write_dataset(args.out, dataset)
+    for name, count in dataset_summary(dataset).items():
+        print(f"{name}: {count} kayıt")
+    print(f"Veri seti yazıldı: {args.out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+Koleksiyon kilidi / anlık görüntü kapısı regresyon testi
+
+Senaryo: A thread'i teklif kilidini tutarken (kapı paylaşımlı) bir anlık görüntü başlar ve
+intent kilidini alır; aynı süreçteki B thread'i used_teklif_numbers kilidini ister; ardından A
+da used_teklif_numbers kilidini ister (delete_teklif sırası). Kapıya RLock'tan sonra girilirse
+B, RLock'u tutarken intent kilidinde bekler, A da B'nin RLock'unu bekler: kilitlenme.
+
+Kullanım:
+    python test_storage_locks.py      (veya pytest test_storage_locks.py)
+"""
+
+import os
+import tempfile
+import threading
+import time
+
+os.environ.setdefault('DATA_DIR', tempfile.mkdtemp(prefix='emisyon_lock_test_'))
+
+import app as application  # noqa: E402
+
+TIMEOUT = 10
+
+
+def test_nested_writer_snapshot_second_writer():
+    events = []
+    a_holds_teklif = threading.Event()
+
+    def writer_a():
+        with application.collection_lock(application.TEKLIF_FILE):
+            a_holds_teklif.set()
+            time.sleep(0.5)  # Görüntü intent kilidini alsın, B kilit istesin
+            with application.collection_lock(application.USED_TEKLIF_NUMBERS_FILE):
+                events.append('a')
+
+    def snapshot():
+        with application.storage_snapshot(application.DATA_DIR):
+            events.append('snapshot')
+
+    def writer_b():
+        with application.collection_lock(application.USED_TEKLIF_NUMBERS_FILE):
+            events.append('b')
+
+    thread_a = threading.Thread(target=writer_a, daemon=True)
+    thread_a.start()
+    assert a_holds_teklif.wait(TIMEOUT)
+    thread_snapshot = threading.Thread(target=snapshot, daemon=True)
+    thread_snapshot.start()
+    time.sleep(0.2)
+    thread_b = threading.Thread(target=writer_b, daemon=True)
+    thread_b.start()
+
+    for thread in (thread_a, thread_snapshot, thread_b):
+        thread.join(TIMEOUT)
+        assert not thread.is_alive(), f'Kilitlenme: {thread.name} {TIMEOUT} sn içinde bitmedi ({events})'
+    # Görüntü A'nın iki dosyalı güncellemesinden sonra, B ondan sonra çalışır
+    assert events == ['a', 'snapshot', 'b'], events
+
+
+if __name__ == '__main__':
+    test_nested_writer_snapshot_second_writer()
+    print('OK')